@@ -0,0 +1,55 @@
+import json
+
+import bm
+import bm.utils as utils
+
+from ddtrace.appsec._ddwaf import DDWaf
+from ddtrace.appsec.processor import DEFAULT_RULES
+from ddtrace.appsec.processor import DEFAULT_WAF_TIMEOUT
+from ddtrace.appsec.processor import _transform_headers
+
+
+REQUEST_DATA = {
+    "server.request.uri.raw": utils.PATH,
+    "server.request.method": "POST",
+    "server.request.headers.no_cookies": _transform_headers(
+        {k: v for k, v in utils.COMMON_DJANGO_META.items() if isinstance(v, str)}
+    ),
+    "server.request.cookies": {"csrftoken": "cR8TVoVebF2afssCR16pQeqHcxAlA3867P6zkkUBYDL5Q92kjSGtqptAry1htdlL"},
+    "server.request.query": {"func": "subprocess.run", "cmd": "/bin/echo hello"},
+}
+
+RESPONSE_DATA = {
+    "server.response.status": "200",
+    "server.response.headers.no_cookies": {"content-type": "text/html; charset=utf-8", "content-length": "207"},
+}
+
+
+class AppSecWaf(bm.Scenario):
+    incremental = bm.var_bool()
+    body_size = bm.var(type=int)
+
+    def run(self):
+        with open(DEFAULT_RULES) as f:
+            waf = DDWaf(json.load(f), b"", b"")
+
+        body_data = {"server.request.body": {"key_%d" % i: "value_%d" % i for i in range(self.body_size)}}
+        data = dict(REQUEST_DATA, **body_data)
+        data.update(RESPONSE_DATA)
+
+        def _(loops):
+            if self.incremental:
+                # Addresses are pushed as soon as they become available during
+                # the request, with a single WAF context.
+                for _ in range(loops):
+                    ctx = waf.context()
+                    ctx.run(REQUEST_DATA, DEFAULT_WAF_TIMEOUT)
+                    ctx.run(body_data, DEFAULT_WAF_TIMEOUT)
+                    ctx.run(RESPONSE_DATA, DEFAULT_WAF_TIMEOUT)
+                    ctx.close()
+            else:
+                # All the addresses are pushed at once when the request ends.
+                for _ in range(loops):
+                    waf.run(data, DEFAULT_WAF_TIMEOUT)
+
+        yield _
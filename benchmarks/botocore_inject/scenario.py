@@ -0,0 +1,91 @@
+import json
+
+import bm
+import botocore.session
+from botocore.stub import Stubber
+
+from ddtrace import Pin
+from ddtrace.contrib.botocore.patch import patch
+from ddtrace.filters import TraceFilter
+
+
+class _DropTraces(TraceFilter):
+    def process_trace(self, trace):
+        return
+
+
+def _payload(nkeys):
+    return json.dumps({"key%d" % i: "value%d" % i for i in range(nkeys)})
+
+
+# Build the batch of records and the stubbed response of each operation
+OPERATIONS = {
+    "sqs": (
+        "send_message_batch",
+        lambda nrecords, payload: dict(
+            QueueUrl="https://sqs.us-east-1.amazonaws.com/000000000000/queue",
+            Entries=[{"Id": str(i), "MessageBody": payload} for i in range(nrecords)],
+        ),
+        {"Successful": [], "Failed": []},
+    ),
+    "sns": (
+        "publish_batch",
+        lambda nrecords, payload: dict(
+            TopicArn="arn:aws:sns:us-east-1:000000000000:topic",
+            PublishBatchRequestEntries=[{"Id": str(i), "Message": payload} for i in range(nrecords)],
+        ),
+        {"Successful": [], "Failed": []},
+    ),
+    "events": (
+        "put_events",
+        lambda nrecords, payload: dict(
+            Entries=[{"Source": "source", "DetailType": "type", "Detail": payload} for _ in range(nrecords)],
+        ),
+        {"FailedEntryCount": 0, "Entries": []},
+    ),
+    "kinesis": (
+        "put_records",
+        lambda nrecords, payload: dict(
+            StreamName="stream",
+            Records=[{"Data": payload, "PartitionKey": str(i)} for i in range(nrecords)],
+        ),
+        {"Records": [{"SequenceNumber": "1", "ShardId": "shardId-000000000000"}]},
+    ),
+}
+
+
+class BotocoreInject(bm.Scenario):
+    service = bm.var(type=str)
+    nrecords = bm.var(type=int)
+    payload_keys = bm.var(type=int)
+    distributed_tracing = bm.var_bool()
+
+    def run(self):
+        # configure global tracer to drop traces rather than encoded and sent to
+        # an agent
+        from ddtrace import config
+        from ddtrace import tracer
+
+        tracer.configure(settings={"FILTERS": [_DropTraces()]})
+        patch()
+        config.botocore["distributed_tracing"] = self.distributed_tracing
+
+        session = botocore.session.get_session()
+        session.set_credentials(access_key="access-key", secret_key="secret-key")
+        client = session.create_client(self.service, region_name="us-east-1")
+        Pin(service="aws", tracer=tracer).onto(client)
+
+        method, build_params, response = OPERATIONS[self.service]
+        params = build_params(self.nrecords, _payload(self.payload_keys))
+        batch_key, records = [(k, v) for k, v in params.items() if isinstance(v, list)][0]
+        api_call = getattr(client, method)
+
+        def _(loops):
+            with Stubber(client) as stubber:
+                for _ in range(loops):
+                    stubber.add_response(method, response)
+                    # The trace context is injected in place, so every call needs fresh records
+                    params[batch_key] = [dict(record) for record in records]
+                    api_call(**params)
+
+        yield _
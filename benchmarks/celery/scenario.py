@@ -0,0 +1,55 @@
+import bm
+
+from ddtrace.filters import TraceFilter
+
+
+class _DropTraces(TraceFilter):
+    def process_trace(self, trace):
+        return
+
+
+class CeleryWorker(bm.Scenario):
+    tracer_enabled = bm.var_bool()
+    distributed_tracing = bm.var_bool()
+    ntasks = bm.var(type=int)
+
+    def run(self):
+        if self.tracer_enabled:
+            # configure global tracer to drop traces rather than encoded and sent to
+            # an agent
+            from ddtrace import config
+            from ddtrace import tracer
+            from ddtrace.contrib.celery import patch
+
+            tracer.configure(settings={"FILTERS": [_DropTraces()]})
+            patch()
+            config.celery["distributed_tracing"] = self.distributed_tracing
+
+        import threading
+
+        import celery
+        from celery.contrib.testing.worker import start_worker
+
+        # Publish and consume the tasks in this process through the in-memory transport
+        app = celery.Celery("bm", broker="memory://")
+        app.conf.broker_transport_options = {"polling_interval": 0.001}
+
+        ntasks = self.ntasks
+        done = threading.Event()
+
+        @app.task(ignore_result=True)
+        def task(i):
+            if i == ntasks - 1:
+                done.set()
+
+        with start_worker(app, pool="solo", perform_ping_check=False, shutdown_timeout=10):
+
+            def _(loops):
+                for _ in range(loops):
+                    done.clear()
+                    for i in range(ntasks):
+                        task.delay(i)
+                    # The solo pool runs the tasks in order
+                    done.wait(60)
+
+            yield _
@@ -0,0 +1,52 @@
+import bm
+
+from ddtrace import Pin
+from ddtrace import config
+from ddtrace.contrib.dbapi import FetchTracedCursor
+from ddtrace.contrib.dbapi import TracedCursor
+from ddtrace.filters import TraceFilter
+
+
+class _DropTraces(TraceFilter):
+    def process_trace(self, trace):
+        return
+
+
+class Cursor(object):
+    rowcount = 1
+
+    def execute(self, *args, **kwargs):
+        pass
+
+    def fetchone(self):
+        return (42, "order")
+
+
+class DBAPI(bm.Scenario):
+    ntags = bm.var(type=int)
+    analytics_enabled = bm.var_bool()
+    trace_fetch_methods = bm.var_bool()
+    queries = bm.var(type=int)
+
+    def run(self):
+        # configure global tracer to drop traces rather than encoded and sent to
+        # an agent
+        from ddtrace import tracer
+
+        tracer.configure(settings={"FILTERS": [_DropTraces()]})
+        config.dbapi2.analytics_enabled = self.analytics_enabled
+
+        tags = {"tag%d" % i: "value%d" % i for i in range(self.ntags)}
+        pin = Pin(service="orders-db", tags=tags, tracer=tracer)
+        cursor_cls = FetchTracedCursor if self.trace_fetch_methods else TracedCursor
+        cursor = cursor_cls(Cursor(), pin, None)
+
+        def _(loops):
+            for _ in range(loops):
+                # A request running a batch of queries on the same cursor
+                with tracer.trace("request"):
+                    for _ in range(self.queries):
+                        cursor.execute("SELECT * FROM orders WHERE id = %s", (42,))
+                        cursor.fetchone()
+
+        yield _
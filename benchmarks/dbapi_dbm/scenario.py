@@ -0,0 +1,45 @@
+import bm
+
+from ddtrace import Pin
+from ddtrace import config
+from ddtrace.contrib.dbapi import TracedCursor
+from ddtrace.filters import TraceFilter
+from ddtrace.settings import _database_monitoring
+
+
+class _DropTraces(TraceFilter):
+    def process_trace(self, trace):
+        return
+
+
+class Cursor(object):
+    rowcount = 0
+
+    def execute(self, *args, **kwargs):
+        pass
+
+
+class DBAPIDBM(bm.Scenario):
+    propagation_mode = bm.var(type=str)
+    service = bm.var(type=str)
+
+    def run(self):
+        _database_monitoring.dbm_config.propagation_mode = self.propagation_mode
+        config.service = self.service or None
+        config.env = "staging"
+        config.version = "v7343437-d7ac743"
+
+        # configure global tracer to drop traces rather than encoded and sent to
+        # an agent
+        from ddtrace import tracer
+
+        tracer.configure(settings={"FILTERS": [_DropTraces()]})
+        pin = Pin(service="orders-db", tracer=tracer)
+        config._add("dbapi_dbm", dict(_default_service="db", _dbm_propagation_supported=True))
+        cursor = TracedCursor(Cursor(), pin, config.dbapi_dbm)
+
+        def _(loops):
+            for _ in range(loops):
+                cursor.execute("SELECT * FROM orders WHERE id = %s", (42,))
+
+        yield _
@@ -4,6 +4,8 @@ import sys
 
 import bm
 
+from ddtrace._monkey import PATCH_MODULES
+
 
 class DDtraceRun(bm.Scenario):
     ddtrace_run = bm.var_bool()
@@ -13,12 +15,17 @@ class DDtraceRun(bm.Scenario):
     profiling = bm.var_bool()
     appsec = bm.var_bool()
     tracing = bm.var_bool()
+    lazy_patching = bm.var_bool()
+    all_integrations = bm.var_bool()
 
     def run(self):
         # setup subprocess environment variables
         env = os.environ.copy()
         env["DD_RUNTIME_METRICS_ENABLED"] = str(self.runtimemetrics)
         env["DD_APPSEC_ENABLED"] = str(self.appsec)
+        env["DD_TRACE_LAZY_PATCHING_ENABLED"] = str(self.lazy_patching)
+        if self.all_integrations:
+            env["DD_PATCH_MODULES"] = ",".join("%s:true" % _ for _ in PATCH_MODULES)
 
         # initialize subprocess args
         subp_cmd = []
@@ -42,6 +49,10 @@ httpretty.register_uri(httpretty.POST, '%s/%s' % (tracer.agent_trace_url, teleme
 httpretty.register_uri(httpretty.POST, '%s/%s' % (tracer.agent_trace_url, 'profiling/v1/input'))
 """
 
+        if self.all_integrations:
+            # only a few of the enabled integrations are used by the application
+            code += "import sqlite3, logging, http.client\n"
+
         if self.telemetry:
             code += "telemetry_writer.enable()\n"
 
@@ -4,6 +4,7 @@ import django
 from django.db import connection
 from django.template import Context
 from django.template import Template
+from django.urls import include
 from django.urls import path
 
 
@@ -79,7 +80,25 @@ def index(request):
     return django.http.HttpResponse(index.render(Context({})))
 
 
+def large_urlpatterns(napps=50):
+    """Return the URL patterns of a realistic project, with namespaced apps and path converters."""
+    patterns = []
+    for i in range(napps):
+        app_name = "app%d" % i
+        app_patterns = [
+            path("", index, name="list"),
+            path("new/", index, name="create"),
+            path("<int:pk>/", index, name="detail"),
+            path("<int:pk>/edit/", index, name="edit"),
+            path("<slug:slug>/items/<int:item_id>/", index, name="item"),
+        ]
+        patterns.append(path(app_name + "/", include((app_patterns, app_name), namespace=app_name)))
+    return patterns
+
+
 urlpatterns = [path("", index)]
+if os.environ.get("PERF_LARGE_URLCONF") == "1":
+    urlpatterns += large_urlpatterns()
 
 if __name__ == "__main__":
     from django.core import management
@@ -5,6 +5,8 @@ import utils
 class DjangoSimple(bm.Scenario):
     tracer_enabled = bm.var_bool()
     profiler_enabled = bm.var_bool()
+    large_urlconf = bm.var_bool()
+    aggregate_middleware = bm.var_bool()
 
     def run(self):
         with utils.server(self) as get_response:
@@ -7,10 +7,12 @@ import tenacity
 
 
 SERVER_URL = "http://0.0.0.0:8000/"
+# A route of the last app of the large urlconf
+LARGE_URLCONF_PATH = "app49/some-slug/items/42/"
 
 
-def _get_response():
-    r = requests.get(SERVER_URL)
+def _get_response(path=""):
+    r = requests.get(SERVER_URL + path)
     r.raise_for_status()
 
 
@@ -25,8 +27,10 @@ def _wait():
 @contextmanager
 def server(scenario):
     env = {
-        "PERF_TRACER_ENABLED": str(scenario.tracer_enabled),
-        "PERF_PROFILER_ENABLED": str(scenario.profiler_enabled),
+        "PERF_TRACER_ENABLED": str(int(scenario.tracer_enabled)),
+        "PERF_PROFILER_ENABLED": str(int(scenario.profiler_enabled)),
+        "PERF_LARGE_URLCONF": str(int(scenario.large_urlconf)),
+        "DD_DJANGO_AGGREGATE_MIDDLEWARE": str(int(scenario.aggregate_middleware)),
     }
     # copy over current environ
     env.update(os.environ)
@@ -42,7 +46,10 @@ def server(scenario):
     assert proc.poll() is None
     try:
         _wait()
-        yield _get_response
+        if scenario.large_urlconf:
+            yield lambda: _get_response(LARGE_URLCONF_PATH)
+        else:
+            yield _get_response
     finally:
         proc.terminate()
         proc.wait()
@@ -9,6 +9,16 @@ from flask import request
 app = Flask(__name__)
 
 
+@app.before_request
+def before_request():
+    pass
+
+
+@app.after_request
+def after_request(response):
+    return response
+
+
 @app.route("/")
 def index():
     rand_numbers = [random.random() for _ in range(20)]
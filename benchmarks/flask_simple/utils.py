@@ -46,6 +46,7 @@ def server(scenario):
         "PERF_PROFILER_ENABLED": str(scenario.profiler_enabled),
         "PERF_APPSEC_ENABLED": str(scenario.appsec_enabled),
         "PERF_IAST_ENABLED": str(scenario.iast_enabled),
+        "DD_FLASK_AGGREGATE_HOOKS": str(scenario.aggregate_hooks),
     }
     # copy over current environ
     env.update(os.environ)
@@ -0,0 +1,61 @@
+import bm
+
+from ddtrace import Pin
+from ddtrace.vendor import wrapt
+
+
+class Client(object):
+    pass
+
+
+class Proxy(wrapt.ObjectProxy):
+    pass
+
+
+class PinnedProxy(wrapt.ObjectProxy):
+    def __init__(self, wrapped, pin):
+        super(PinnedProxy, self).__init__(wrapped)
+        self._self_client = Client()
+        pin.onto(self._self_client)
+
+    def __getddpin__(self):
+        return Pin.get_from(self._self_client)
+
+
+class PinGetFrom(bm.Scenario):
+    target = bm.var(type=str)
+    nfind = bm.var(type=int)
+
+    def run(self):
+        pin = Pin(service="bm-service")
+        if self.target == "instance":
+            obj = Client()
+            pin.onto(obj)
+        elif self.target == "class":
+            # The pin is attached to the class and cloned on the first lookup,
+            # e.g. Redis clients
+            class Klass(Client):
+                pass
+
+            pin.onto(Klass)
+            obj = Klass()
+        elif self.target == "proxy":
+            # e.g. dbapi cursors and connections
+            obj = Proxy(Client())
+            pin.onto(obj)
+        elif self.target == "getddpin":
+            # e.g. pymongo clients
+            obj = PinnedProxy(Client(), pin)
+        else:
+            obj = Proxy(Client())
+
+        # Objects without a pin looked up before the target, e.g. Pin._find(wrapper, instance)
+        objs = [Proxy(Client()) for _ in range(self.nfind)] + [obj]
+
+        def _(loops):
+            for _ in range(loops):
+                pin = Pin._find(*objs) if self.nfind else Pin.get_from(obj)
+                if pin is not None:
+                    pin.enabled()
+
+        yield _
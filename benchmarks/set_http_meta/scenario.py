@@ -19,6 +19,9 @@ class Config(defaultdict):
     def _header_tag_name(self, header_name):
         return self.__header_tag_name.get(header_name)
 
+    def _header_tag_plan(self, request_or_response):
+        return {header_name.lower(): tag_name for header_name, tag_name in self.__header_tag_name.items()}
+
     def __getattr__(self, item):
         return self[item]
 
@@ -53,6 +56,7 @@ class SetHttpMeta(bm.Scenario):
     querystring = bm.var(type=str)
     ip_header = bm.var(type=str)
     ip_disabled = bm.var_bool()
+    unique_urls = bm.var_bool()
 
     def run(self):
         # run scenario to also set tags on spans
@@ -89,7 +93,15 @@ class SetHttpMeta(bm.Scenario):
                     DD_TRACE_CLIENT_IP_HEADER=self.ip_header,
                 )
             ):
-                for _ in range(loops):
-                    set_http_meta(span, config, **data)
+                if self.unique_urls:
+                    # Defeat the caching of the redacted URLs
+                    url = data.pop("url")
+                    separator = "&" if "?" in url else "?"
+                    for i in range(loops):
+                        set_http_meta(span, config, url="%s%sn=%d" % (url, separator, i), **data)
+                    data["url"] = url
+                else:
+                    for _ in range(loops):
+                        set_http_meta(span, config, **data)
 
         yield bm
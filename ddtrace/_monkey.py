@@ -4,10 +4,11 @@ import sys
 import threading
 from typing import TYPE_CHECKING
 
-from ddtrace.vendor.wrapt.importer import when_imported
-
 from .constants import IAST_ENV
+from .internal.compat import PY3
 from .internal.logger import get_logger
+from .internal.module import ModuleWatchdog
+from .internal.module import find_loader
 from .internal.telemetry import telemetry_writer
 from .internal.utils import formats
 from .internal.utils.importlib import require_modules
@@ -88,6 +89,8 @@ PATCH_MODULES = {
 
 _LOCK = threading.Lock()
 _PATCHED_MODULES = set()
+# Integrations waiting for their library to be imported to be patched
+_PENDING_MODULES = set()
 
 # Modules which are patched on first use
 # DEV: These modules are patched when the user first imports them, rather than
@@ -113,6 +116,19 @@ _PATCH_ON_IMPORT = {
     "rq": ("rq",),
 }
 
+# Modules which trigger the patch of an integration when it is loaded lazily
+# DEV: <contrib name> => <list of module names that trigger a patch>, defaults to the contrib name
+_MODULES_FOR_CONTRIB = {
+    "dogpile_cache": ("dogpile.cache",),
+    "futures": ("concurrent.futures",),
+    "httplib": ("http.client" if PY3 else "httplib",),
+    "mysql": ("mysql.connector",),
+    "mysqldb": ("MySQLdb",),
+    "psycopg": ("psycopg2",),
+    "snowflake": ("snowflake.connector",),
+    "vertica": ("vertica_python",),
+}
+
 IAST_PATCH = {
     "weak_hash": True,
     "weak_cipher": True,
@@ -160,6 +176,58 @@ def _on_import_factory(module, raise_errors=True):
     return on_import
 
 
+def _patch_lazily(module, raise_errors=True):
+    # type: (str, bool) -> None
+    """Patch the integration when its library is imported for the first time.
+
+    The integration module is not imported until then. If the library has
+    already been imported, the integration is patched immediately.
+    """
+    if raise_errors:
+        path = "%s.%s" % (DEFAULT_MODULES_PREFIX, module)
+        if find_loader(path) is None:
+            raise ModuleNotFoundException(
+                "integration module %s does not exist, module will not have tracing available" % path
+            )
+
+    libraries = _MODULES_FOR_CONTRIB.get(module, (module,))
+    # DEV: Only look up top-level packages to not import the parent packages
+    available = [m for m in libraries if find_loader(m.partition(".")[0]) is not None]
+    if not available:
+        e = IntegrationNotAvailableException(
+            "missing required module%s: %s" % ("s" if len(libraries) > 1 else "", ",".join(libraries))
+        )
+        if raise_errors:
+            raise e
+        log.debug("integration %s not enabled (%s)", module, str(e))  # noqa: G200
+        return
+
+    with _LOCK:
+        if module in _PATCHED_MODULES:
+            log.debug("already patched: %s.%s", DEFAULT_MODULES_PREFIX, module)
+            return
+
+        # DEV: Report the integration as patched until its library is imported,
+        #      as for the patch-on-import integrations
+        _PATCHED_MODULES.add(module)
+        _PENDING_MODULES.add(module)
+
+    def on_import(hook):
+        # DEV: Only claim the integration under the lock. It is imported and
+        #      patched without it, as this runs while the library is imported.
+        with _LOCK:
+            if module not in _PENDING_MODULES:
+                return
+            _PENDING_MODULES.discard(module)
+            _PATCHED_MODULES.discard(module)
+        # DEV: Errors are logged rather than raised to not fail the import of
+        # the library by the application.
+        _patch_module(module, raise_errors=False)
+
+    for m in libraries:
+        ModuleWatchdog.register_module_hook(m, on_import)
+
+
 def patch_all(**patch_modules):
     # type: (bool) -> None
     """Automatically patches all available modules.
@@ -206,6 +274,11 @@ def patch(raise_errors=True, patch_modules_prefix=DEFAULT_MODULES_PREFIX, **patc
     # type: (bool, str, bool) -> None
     """Patch only a set of given modules.
 
+    The integrations are imported and patched when their library is imported
+    for the first time, or immediately if it has already been imported. Set
+    ``DD_TRACE_LAZY_PATCHING_ENABLED=false`` to import all the integrations
+    and their libraries immediately.
+
     :param bool raise_errors: Raise error if one patch fail.
     :param dict patch_modules: List of modules to patch.
 
@@ -223,11 +296,13 @@ def patch(raise_errors=True, patch_modules_prefix=DEFAULT_MODULES_PREFIX, **patc
                 # Otherwise, add a hook to patch when it is imported for the first time
                 else:
                     # Use factory to create handler to close over `module` and `raise_errors` values from this loop
-                    when_imported(m)(_on_import_factory(module, raise_errors))
+                    ModuleWatchdog.register_module_hook(m, _on_import_factory(module, raise_errors))
 
             # manually add module to patched modules
             with _LOCK:
                 _PATCHED_MODULES.add(module)
+        elif config._lazy_patching and patch_modules_prefix == DEFAULT_MODULES_PREFIX:
+            _patch_lazily(module, raise_errors=raise_errors)
         else:
             _patch_module(module, patch_modules_prefix=patch_modules_prefix, raise_errors=raise_errors)
 
@@ -283,7 +358,13 @@ def _attempt_patch_module(module, patch_modules_prefix=DEFAULT_MODULES_PREFIX):
         if module in _PATCHED_MODULES and module not in _PATCH_ON_IMPORT:
             log.debug("already patched: %s", path)
             return False
+        # DEV: Claim the integration under the lock, but import and patch it
+        #      without holding it, as importing a library runs the import hooks
+        #      which patch other integrations.
+        claimed = module not in _PATCHED_MODULES
+        _PATCHED_MODULES.add(module)
 
+    try:
         try:
             imported_module = importlib.import_module(path)
         except ImportError:
@@ -303,6 +384,11 @@ def _attempt_patch_module(module, patch_modules_prefix=DEFAULT_MODULES_PREFIX):
                 )
 
             imported_module.patch()
-            _PATCHED_MODULES.add(module)
-            telemetry_writer.add_integration(module, PATCH_MODULES.get(module) is True)
-            return True
+    except BaseException:
+        if claimed:
+            with _LOCK:
+                _PATCHED_MODULES.discard(module)
+        raise
+
+    telemetry_writer.add_integration(module, PATCH_MODULES.get(module) is True)
+    return True
@@ -75,6 +75,66 @@ cdef inline object _string_to_bytes(object string, const char **ptr, ssize_t *le
     raise RuntimeError
 
 
+# Arenas of ddwaf objects released by wrappers are kept in a small pool and
+# reused by the next conversions. This saves the allocation, and the
+# reallocations, of the object buffer for every request. Access to the pool is
+# serialized by the GIL.
+DEF ARENA_POOL_SIZE = 8
+# Larger arenas (e.g. the one used by the rules) are not worth retaining.
+DEF ARENA_MAX_OBJECTS = 16384
+
+cdef ddwaf_object *_arena_pool[ARENA_POOL_SIZE]
+cdef ssize_t _arena_pool_sizes[ARENA_POOL_SIZE]
+cdef int _arena_pool_len = 0
+
+
+cdef ddwaf_object *_arena_acquire(ssize_t *size):
+    global _arena_pool_len
+
+    if _arena_pool_len > 0:
+        _arena_pool_len -= 1
+        size[0] = _arena_pool_sizes[_arena_pool_len]
+        return _arena_pool[_arena_pool_len]
+
+    size[0] = 0
+    return NULL
+
+
+cdef void _arena_release(ddwaf_object *ptr, ssize_t size):
+    global _arena_pool_len
+
+    if ptr == NULL:
+        return
+
+    if _arena_pool_len < ARENA_POOL_SIZE and size <= ARENA_MAX_OBJECTS:
+        _arena_pool[_arena_pool_len] = ptr
+        _arena_pool_sizes[_arena_pool_len] = size
+        _arena_pool_len += 1
+    else:
+        PyMem_Free(ptr)
+
+
+cdef ssize_t _estimate_objects(object value):
+    """
+    Estimate the number of objects required to convert a value by looking at
+    its first two levels only. This is cheap and avoids most of the
+    reallocations of the object buffer for typical request data.
+    """
+    cdef ssize_t n = 1
+
+    if isinstance(value, dict):
+        value = (<dict> value).values()
+    elif not isinstance(value, (list, tuple)):
+        return n
+
+    for v in value:
+        n += 1
+        if isinstance(v, (dict, list, tuple)):
+            n += len(v)
+
+    return n
+
+
 cdef class _Wrapper(object):
     """
     Wrapper to convert Python objects to ddwaf objects.
@@ -86,9 +146,11 @@ cdef class _Wrapper(object):
     `max_objects` to `None`.
 
     Under the hood, the wrapper uses an array of `ddwaf_object` allocated as a
-    single buffer. Objects such as maps or arrays refer to other objects that
-    are only part of this buffer. Strings are not copied, they live in the
-    Python heap and are referenced by the wrapper to avoid garbage collection.
+    single buffer, preallocated from an estimate of the size of the value and
+    reused across wrappers. Objects such as maps or arrays refer to other
+    objects that are only part of this buffer. Strings are not copied: the
+    UTF-8 buffer of `str` objects is borrowed whenever CPython allows it, and
+    strings are referenced by the wrapper to avoid garbage collection.
     """
 
     cdef ddwaf_object *_ptr
@@ -97,35 +159,57 @@ cdef class _Wrapper(object):
     cdef readonly ssize_t _next_idx
 
     def __init__(self, value, max_objects=5000):
+        cdef ssize_t estimate
+
         self._string_refs = []
+        self._ptr = _arena_acquire(&self._size)
+
+        estimate = _estimate_objects(value)
+        if max_objects is not None and estimate > max_objects:
+            estimate = max(<ssize_t?> max_objects, 1)
+        if estimate > self._size:
+            self._grow(estimate)
+
         self._convert(value, max_objects)
 
-    cdef ssize_t _reserve_obj(self, ssize_t n=1) except -1:
+    cdef int _grow(self, ssize_t min_size) except -1:
         """
-        Exponentially grows the size of the memory space used for objects.
-        Will stop if too much memory is allocated.
+        Exponentially grows the size of the memory space used for objects
+        until it can accommodate at least `min_size` objects.
         """
-        cdef ssize_t idx, i
+        cdef ssize_t size, i
         cdef ddwaf_object *ptr
         cdef ddwaf_object *obj
 
+        size = self._size
+        while min_size > size:
+            # grow 1.5 the previous size + an initial fixed size
+            size += (size >> 1) + 128
+        ptr = <ddwaf_object *> PyMem_Realloc(self._ptr, size * sizeof(ddwaf_object))
+        if ptr == NULL:
+            raise MemoryError
+        if self._ptr != NULL and ptr != self._ptr:
+            # we need to patch all array objects because they use pointers to other objects
+            for i in range(self._next_idx):
+                obj = ptr + i
+                if (obj.type == DDWAF_OBJ_TYPE.DDWAF_OBJ_MAP or obj.type == DDWAF_OBJ_TYPE.DDWAF_OBJ_ARRAY) and obj.array != NULL:
+                    obj.array = obj.array - self._ptr + ptr
+        self._ptr = ptr
+        self._size = size
+
+    cdef ssize_t _reserve_obj(self, ssize_t n=1) except -1:
+        """
+        Reserve n zeroed objects, growing the memory space if needed. Will stop
+        if too much memory is allocated.
+        """
+        cdef ssize_t idx
+
         idx = self._next_idx
         if idx + n > self._size:
-            while idx + n > self._size:
-                # grow 1.5 the previous size + an initial fixed size until
-                #  it can accommodate at least n new objects
-                self._size += (self._size >> 1) + 128
-            ptr = <ddwaf_object *> PyMem_Realloc(self._ptr, self._size * sizeof(ddwaf_object))
-            if ptr == NULL:
-                raise MemoryError
-            memset(ptr + idx, 0, (self._size - idx) * sizeof(ddwaf_object))
-            if self._ptr != NULL and ptr != self._ptr:
-                # we need to patch all array objects because they use pointers to other objects
-                for i in range(idx):
-                    obj = ptr + i
-                    if (obj.type == DDWAF_OBJ_TYPE.DDWAF_OBJ_MAP or obj.type == DDWAF_OBJ_TYPE.DDWAF_OBJ_ARRAY) and obj.array != NULL:
-                        obj.array = obj.array - self._ptr + ptr
-            self._ptr = ptr
+            self._grow(idx + n)
+        # The buffer might come from the arena pool, so we cannot assume that
+        # it is zeroed.
+        memset(self._ptr + idx, 0, n * sizeof(ddwaf_object))
         self._next_idx += n
         return idx
 
@@ -166,6 +250,18 @@ cdef class _Wrapper(object):
         obj.parameterName = ptr
         obj.parameterNameLength = length
 
+    cdef int _convert_map_items(self, object stack, ssize_t items_idx, object items) except -1:
+        cdef ssize_t j
+
+        for j, (k, v) in enumerate(items):
+            if not isinstance(k, (six.binary_type, six.text_type)):
+                if isinstance(k, (int, float)):
+                    k = str(k)
+                else:
+                    continue
+            self._set_parameter(items_idx + j, k)
+            stack.append((items_idx + j, v))
+
     cdef void _convert(self, value, max_objects) except *:
         cdef object stack
         cdef ssize_t i, j, n, idx, items_idx
@@ -181,20 +277,27 @@ cdef class _Wrapper(object):
             if isinstance(val, (six.binary_type, six.text_type)):
                 self._make_string(idx, val)
 
+            # Fast paths for the builtin containers before the slower ABC checks
+            elif isinstance(val, dict):
+                n = len(val)
+                items_idx = self._reserve_obj(n)
+                self._make_map(idx, items_idx, n)
+                self._convert_map_items(stack, items_idx, (<dict> val).items())
+
+            elif isinstance(val, (list, tuple)):
+                n = len(val)
+                items_idx = self._reserve_obj(n)
+                self._make_array(idx, items_idx, n)
+                for j in range(n):
+                    stack.append((items_idx + j, val[j]))
+
             elif isinstance(val, Mapping):
                 n = len(val)
                 items_idx = self._reserve_obj(n)
                 self._make_map(idx, items_idx, n)
                 # size of val must not change!! should not happen
                 # while holding the GIL?
-                for j, (k, v) in enumerate(six.iteritems(val)):
-                    if not isinstance(k, (six.binary_type, six.text_type)):
-                        if isinstance(k, (int, float)):
-                            k = str(k)
-                        else:
-                            continue
-                    self._set_parameter(items_idx + j, k)
-                    stack.append((items_idx + j, v))
+                self._convert_map_items(stack, items_idx, six.iteritems(val))
 
             elif isinstance(val, Sequence):
                 n = len(val)
@@ -211,7 +314,7 @@ cdef class _Wrapper(object):
         return super(_Wrapper, self).__sizeof__() + self._size * sizeof(ddwaf_object)
 
     def __dealloc__(self):
-        PyMem_Free(self._ptr)
+        _arena_release(self._ptr, self._size)
 
 cdef str _char_to_str(const char* char_value):
     value = ""
@@ -283,6 +386,9 @@ cdef class DDWaf(object):
     cdef ddwaf_handle _handle
     cdef ddwaf_ruleset_info _info
     cdef object _rules
+    # The ruleset info does not change once the rules are loaded so it is
+    # computed only once.
+    cdef readonly dict info
 
     def __init__(self, rules, obfuscation_parameter_key_regexp, obfuscation_parameter_value_regexp):
         cdef ddwaf_object* rule_objects
@@ -306,6 +412,7 @@ cdef class DDWaf(object):
         self._handle = ddwaf_init(rule_objects, &config, &self._info)
         if <void *> self._handle == NULL:
             raise ValueError("invalid rules")
+        self.info = self._ruleset_info()
 
     @property
     def required_data(self):
@@ -318,8 +425,7 @@ cdef class DDWaf(object):
             addresses.append((<bytes> ptr[i]).decode("utf-8"))
         return addresses
 
-    @property
-    def info(self):
+    cdef dict _ruleset_info(self):
         cdef dict result
         cdef dict errors_result = {}
         cdef DDWafObject errors_ob = DDWafObject()
@@ -348,23 +454,85 @@ cdef class DDWaf(object):
                 "version": "",
             }
 
+    def context(self):
+        # type: () -> DDWafContext
+        """Create a new WAF context, to be used for a single request."""
+        return DDWafContext(self)
+
     def run(self, data, timeout_ms=DEFAULT_DDWAF_TIMEOUT_MS):
-        start = time.time()
-        cdef ddwaf_context ctx
-        cdef ddwaf_result result
+        cdef DDWafContext ctx
+
+        ctx = DDWafContext(self)
+        try:
+            return ctx.run(data, timeout_ms)
+        finally:
+            ctx.close()
+
+    def __dealloc__(self):
+        ddwaf_destroy(self._handle)
 
-        ctx = ddwaf_context_init(self._handle, NULL)
-        if <void *> ctx == NULL:
+
+cdef class DDWafContext(object):
+    """
+    A DDWafContext instance holds the WAF state of a single request.
+
+    Addresses can be pushed incrementally with `run`, as soon as they become
+    available. Every run only evaluates the rules that depend on the newly
+    pushed addresses, and only reports the new matches. libddwaf keeps
+    referring to the pushed data until the context is destroyed, so the
+    converted objects are retained until the context is closed.
+    """
+
+    cdef DDWaf _waf
+    cdef ddwaf_context _ctx
+    cdef bint _closed
+    cdef list _wrappers
+    cdef readonly double total_runtime
+    cdef readonly double total_overall_runtime
+
+    def __init__(self, DDWaf waf):
+        # Keep a reference to the WAF to ensure that its handle outlives the
+        # context.
+        self._waf = waf
+        self._wrappers = []
+        self._ctx = ddwaf_context_init(waf._handle, NULL)
+        if <void *> self._ctx == NULL:
+            self._closed = True
             raise RuntimeError
+
+    @property
+    def closed(self):
+        return self._closed
+
+    def run(self, data, timeout_ms=DEFAULT_DDWAF_TIMEOUT_MS):
+        cdef ddwaf_result result
+        cdef _Wrapper wrapper
+
+        if self._closed:
+            raise RuntimeError("WAF context is closed")
+
+        start = time.time()
+        wrapper = _Wrapper(data)
+        self._wrappers.append(wrapper)
+        ddwaf_run(self._ctx, wrapper._ptr, &result, <uint64_t?> timeout_ms * 1000)
         try:
-            wrapper = _Wrapper(data)
-            ddwaf_run(ctx, (<_Wrapper?>wrapper)._ptr, &result, <uint64_t?> timeout_ms * 1000)
+            runtime = result.total_runtime / 1e3
+            overall_runtime = (time.time() - start) * 1e6
+            self.total_runtime += runtime
+            self.total_overall_runtime += overall_runtime
             if result.data != NULL:
-                return (<bytes> result.data).decode("utf-8"), result.total_runtime / 1e3, (time.time() - start) * 1e6
-            return None, result.total_runtime / 1e3, (time.time() - start) * 1e6
+                return (<bytes> result.data).decode("utf-8"), runtime, overall_runtime
+            return None, runtime, overall_runtime
         finally:
             ddwaf_result_free(&result)
-            ddwaf_context_destroy(ctx)
+
+    def close(self):
+        # type: () -> None
+        if not self._closed:
+            ddwaf_context_destroy(self._ctx)
+            self._closed = True
+        self._wrappers = []
 
     def __dealloc__(self):
-        ddwaf_destroy(self._handle)
+        if not self._closed:
+            ddwaf_context_destroy(self._ctx)
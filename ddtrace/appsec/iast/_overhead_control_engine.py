@@ -2,19 +2,68 @@
 The Overhead control engine (OCE) is an element that by design ensures that the overhead does not go over a maximum
 limit. It will measure operations being executed in a request and it will deactivate detection
 (and therefore reduce the overhead to nearly 0) if a certain threshold is reached.
+
+The state of the request being analyzed (its vulnerability quotas and the time spent analyzing it) is stored in a
+context variable, so that concurrent requests served by different threads or asyncio tasks do not share it. Code
+running outside of any request context, like the threads started by a request, uses the last request in flight.
 """
 import os
 import threading
 from typing import TYPE_CHECKING
 
+from ddtrace.internal.compat import contextvars
+
 
 if TYPE_CHECKING:  # pragma: no cover
+    from typing import Dict
+    from typing import List
+    from typing import Optional
     from typing import Set
     from typing import Tuple
     from typing import Type
 
+    from ddtrace.span import Span
+
 MAX_REQUESTS = int(os.environ.get("DD_IAST_MAX_CONCURRENT_REQUESTS", 2))
 MAX_VULNERABILITIES_PER_REQUEST = int(os.environ.get("DD_IAST_VULNERABILITIES_PER_REQUEST", 2))
+REQUEST_SAMPLING = min(max(float(os.environ.get("DD_IAST_REQUEST_SAMPLING", 100)), 0.0), 100.0)
+# The analysis time of a request is not limited by default
+REQUEST_BUDGET_MS = float(os.environ.get("DD_IAST_REQUEST_BUDGET_MS", 0))
+
+
+class _RequestContext(object):
+    """The OCE state of a single request."""
+
+    __slots__ = ("enabled", "depth", "quotas", "reported", "elapsed")
+
+    def __init__(self, enabled):
+        # type: (bool) -> None
+        self.enabled = enabled
+        self.depth = 1
+        self.quotas = {}  # type: Dict[Type[Operation], int]
+        # The locations of the vulnerabilities reported in the request
+        self.reported = {}  # type: Dict[Type[Operation], Set[Tuple[str, int]]]
+        # Time spent analyzing the request, in seconds
+        self.elapsed = 0.0
+
+
+_REQUEST = contextvars.ContextVar(
+    "iast_request", default=None
+)  # type: contextvars.ContextVar[Optional[_RequestContext]]
+# The requests in flight, in the order they started
+_ACTIVE_REQUESTS = []  # type: List[_RequestContext]
+
+
+def _current_request():
+    # type: () -> Optional[_RequestContext]
+    request = _REQUEST.get()
+    if request is not None and request.depth > 0:
+        return request
+    # DEV: Threads do not inherit the context of the request that started them
+    try:
+        return _ACTIVE_REQUESTS[-1]
+    except IndexError:
+        return None
 
 
 class Operation(object):
@@ -22,68 +71,119 @@ class Operation(object):
     from this class. OCE instance calls these methods to control the overhead produced in each request.
     """
 
+    # DEV: Requests can be shared by several threads through a copy of their context
     _lock = threading.Lock()
-    _vulnerability_quota = MAX_VULNERABILITIES_PER_REQUEST
-    _reported_vulnerabilities = set()  # type: Set[Tuple[str, int]]
 
     @classmethod
     def reset(cls):
-        cls._vulnerability_quota = MAX_VULNERABILITIES_PER_REQUEST
-        cls._reported_vulnerabilities = set()
+        # type: () -> None
+        request = _current_request()
+        if request is not None:
+            request.quotas.pop(cls, None)
+            request.reported.pop(cls, None)
 
     @classmethod
     def acquire_quota(cls):
         # type: () -> bool
-        cls._lock.acquire()
-        result = False
-        if cls._vulnerability_quota > 0:
-            cls._vulnerability_quota -= 1
-            result = True
-        cls._lock.release()
-        return result
+        request = _current_request()
+        if request is None:
+            return False
+        with cls._lock:
+            quota = request.quotas.get(cls, MAX_VULNERABILITIES_PER_REQUEST)
+            if quota > 0:
+                request.quotas[cls] = quota - 1
+                return True
+        return False
 
     @classmethod
     def has_quota(cls):
         # type: () -> bool
-        cls._lock.acquire()
-        result = cls._vulnerability_quota > 0
-        cls._lock.release()
-        return result
+        request = _current_request()
+        return request is not None and request.quotas.get(cls, MAX_VULNERABILITIES_PER_REQUEST) > 0
 
     @classmethod
     def is_not_reported(cls, filename, lineno):
         # type: (str, int) -> bool
+        request = _current_request()
+        if request is None:
+            return True
         vulnerability_id = (filename, lineno)
-        if vulnerability_id in cls._reported_vulnerabilities:
-            return False
-
-        cls._reported_vulnerabilities.add(vulnerability_id)
+        with cls._lock:
+            reported = request.reported.setdefault(cls, set())
+            if vulnerability_id in reported:
+                return False
+            reported.add(vulnerability_id)
         return True
 
 
 class OverheadControl(object):
-    _request_quota = MAX_REQUESTS
-    _enabled = False
-    _vulnerabilities = set()  # type: Set[Type[Operation]]
-
-    def acquire_request(self):
-        """Block a request's quota at start of the request.
-
-        TODO: Implement sampling request in this method
+    def __init__(self, max_requests=MAX_REQUESTS, sampling=REQUEST_SAMPLING, budget_ms=REQUEST_BUDGET_MS):
+        # type: (int, float, float) -> None
+        self._lock = threading.Lock()
+        self._max_requests = max_requests
+        self._request_quota = max_requests
+        self._sampling = sampling
+        # The first request is always sampled
+        self._sampling_credit = 100.0 - sampling
+        self._budget = budget_ms / 1e3
+        # The requests acquired with a span, by span id
+        self._span_requests = {}  # type: Dict[int, _RequestContext]
+        self._vulnerabilities = set()  # type: Set[Type[Operation]]
+
+    def _sample(self):
+        # type: () -> bool
+        # Deterministic sampling: a request is analyzed every time the
+        # accumulated sampling percentage reaches 100.
+        self._sampling_credit += self._sampling
+        if self._sampling_credit >= 100.0:
+            self._sampling_credit -= 100.0
+            return True
+        return False
+
+    def acquire_request(self, span=None):
+        # type: (Optional[Span]) -> None
+        """Block a request's quota at start of the request, if the request is sampled.
+
+        Nested requests in the same context share the state of the outermost one. When a span is given, the request
+        can be released with it from another context.
         """
-        if self._request_quota > 0:
-            self._request_quota -= 1
-            self._enabled = True
-
-    def release_request(self):
-        """increment request's quota at end of the request.
-
-        TODO: figure out how to check maximum requests per thread
+        request = _REQUEST.get()
+        with self._lock:
+            if request is not None and request.depth > 0:
+                request.depth += 1
+            else:
+                enabled = self._request_quota > 0 and self._sample()
+                if enabled:
+                    self._request_quota -= 1
+                request = _RequestContext(enabled)
+                _ACTIVE_REQUESTS.append(request)
+                _REQUEST.set(request)
+            if span is not None:
+                self._span_requests[span.span_id] = request
+
+    def release_request(self, span=None):
+        # type: (Optional[Span]) -> bool
+        """Increment request's quota at end of the request.
+
+        Returns whether the request was analyzed.
         """
-        if self._request_quota < MAX_REQUESTS:
-            self._request_quota += 1
-            self._enabled = False
-        self.vulnerabilities_reset_quota()
+        with self._lock:
+            if span is not None:
+                request = self._span_requests.pop(span.span_id, None)
+            else:
+                request = _REQUEST.get()
+            if request is None or request.depth <= 0:
+                return False
+
+            request.depth -= 1
+            if request.depth == 0:
+                if request.enabled and self._request_quota < self._max_requests:
+                    self._request_quota += 1
+                _ACTIVE_REQUESTS.remove(request)
+
+        if request.depth == 0 and _REQUEST.get() is request:
+            _REQUEST.set(None)
+        return request.enabled
 
     def register(self, klass):
         # type: (Type[Operation]) -> Type[Operation]
@@ -94,7 +194,17 @@ class OverheadControl(object):
     @property
     def request_has_quota(self):
         # type: () -> bool
-        return self._enabled
+        request = _current_request()
+        if request is None or not request.enabled:
+            return False
+        return not self._budget or request.elapsed < self._budget
+
+    def add_elapsed(self, elapsed):
+        # type: (float) -> None
+        """Account for the time, in seconds, spent analyzing the current request."""
+        request = _current_request()
+        if request is not None:
+            request.elapsed += elapsed
 
     def vulnerabilities_reset_quota(self):
         # type: () -> None
@@ -28,7 +28,7 @@ class AppSecIastSpanProcessor(SpanProcessor):
         # type: (Span) -> None
         if span.span_type != SpanTypes.WEB:
             return
-        oce.acquire_request()
+        oce.acquire_request(span)
 
     def on_span_finish(self, span):
         # type: (Span) -> None
@@ -42,7 +42,9 @@ class AppSecIastSpanProcessor(SpanProcessor):
         if span.span_type != SpanTypes.WEB:
             return
 
-        span.set_metric(IAST_ENABLED, 1.0)
+        # DEV: The request is released with its span, as the span can finish in another context
+        if oce.release_request(span):
+            span.set_metric(IAST_ENABLED, 1.0)
 
         data = _context.get_item(IAST_CONTEXT_KEY, span=span)
 
@@ -52,5 +54,3 @@ class AppSecIastSpanProcessor(SpanProcessor):
             span.set_tag(MANUAL_KEEP_KEY)
             if span.get_tag(ORIGIN_KEY) is None:
                 span.set_tag_str(ORIGIN_KEY, APPSEC_ORIGIN_VALUE)
-
-        oce.release_request()
@@ -9,6 +9,7 @@ from ddtrace.appsec.iast.reporter import Location
 from ddtrace.appsec.iast.reporter import Vulnerability
 from ddtrace.constants import IAST_CONTEXT_KEY
 from ddtrace.internal import _context
+from ddtrace.internal.compat import monotonic
 from ddtrace.internal.logger import get_logger
 
 
@@ -52,36 +53,48 @@ class VulnerabilityBase(Operation):
         # type: (Text) -> None
         """Build a IastSpanReporter instance to report it in the `AppSecIastSpanProcessor` as a string JSON
 
-        TODO: check deduplications if DD_IAST_DEDUPLICATION_ENABLED is true
+        Vulnerabilities are reported only once per location. The time spent here is accounted to the budget of the
+        current request.
         """
-        if cls.acquire_quota():
-            span = tracer.current_root_span()
-            if not span:
-                log.debug("No root span in the current execution. Skipping IAST taint sink.")
-                return None
+        if not cls.acquire_quota():
+            return None
 
-            frame_info = get_info_frame()
-            if frame_info:
-                file_name, line_number = frame_info
-                if cls.is_not_reported(file_name, line_number):
-                    report = _context.get_item(IAST_CONTEXT_KEY, span=span)
-                    if report:
-                        report.vulnerabilities.add(
+        start = monotonic()
+        try:
+            cls._report(evidence_value)
+        finally:
+            oce.add_elapsed(monotonic() - start)
+
+    @classmethod
+    def _report(cls, evidence_value):
+        # type: (Text) -> None
+        span = tracer.current_root_span()
+        if not span:
+            log.debug("No root span in the current execution. Skipping IAST taint sink.")
+            return None
+
+        frame_info = get_info_frame()
+        if frame_info:
+            file_name, line_number = frame_info
+            if cls.is_not_reported(file_name, line_number):
+                report = _context.get_item(IAST_CONTEXT_KEY, span=span)
+                if report:
+                    report.vulnerabilities.add(
+                        Vulnerability(
+                            type=cls.vulnerability_type,
+                            evidence=Evidence(type=cls.evidence_type, value=evidence_value),
+                            location=Location(path=file_name, line=line_number),
+                        )
+                    )
+
+                else:
+                    report = IastSpanReporter(
+                        vulnerabilities={
                             Vulnerability(
                                 type=cls.vulnerability_type,
                                 evidence=Evidence(type=cls.evidence_type, value=evidence_value),
                                 location=Location(path=file_name, line=line_number),
                             )
-                        )
-
-                    else:
-                        report = IastSpanReporter(
-                            vulnerabilities={
-                                Vulnerability(
-                                    type=cls.vulnerability_type,
-                                    evidence=Evidence(type=cls.evidence_type, value=evidence_value),
-                                    location=Location(path=file_name, line=line_number),
-                                )
-                            }
-                        )
-                    _context.set_item(IAST_CONTEXT_KEY, report, span=span)
+                        }
+                    )
+                _context.set_item(IAST_CONTEXT_KEY, report, span=span)
@@ -2,6 +2,8 @@ import errno
 import json
 import os
 import os.path
+from typing import Any
+from typing import Dict
 from typing import List
 from typing import Set
 from typing import TYPE_CHECKING
@@ -20,6 +22,7 @@ from ddtrace.constants import APPSEC_EVENT_RULE_LOADED
 from ddtrace.constants import APPSEC_EVENT_RULE_VERSION
 from ddtrace.constants import APPSEC_JSON
 from ddtrace.constants import APPSEC_ORIGIN_VALUE
+from ddtrace.constants import APPSEC_WAF_CONTEXT_KEY
 from ddtrace.constants import APPSEC_WAF_DURATION
 from ddtrace.constants import APPSEC_WAF_DURATION_EXT
 from ddtrace.constants import APPSEC_WAF_VERSION
@@ -35,8 +38,11 @@ from ddtrace.internal.rate_limiter import RateLimiter
 
 
 if TYPE_CHECKING:  # pragma: no cover
-    from typing import Dict
+    from typing import Callable
+    from typing import Mapping
+    from typing import Optional
 
+    from ddtrace.appsec._ddwaf import DDWafContext
     from ddtrace.span import Span
 
 ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
@@ -109,6 +115,22 @@ class _Addresses(object):
     SERVER_RESPONSE_HEADERS_NO_COOKIES = "server.response.headers.no_cookies"
 
 
+# Context items set by the integrations (see ``set_http_meta``), with the WAF
+# address they provide and the transformation to apply to their value, if any.
+_CONTEXT_ITEM_ADDRESSES = (
+    ("http.request.query", _Addresses.SERVER_REQUEST_QUERY, None),
+    ("http.request.headers", _Addresses.SERVER_REQUEST_HEADERS_NO_COOKIES, _transform_headers),
+    ("http.request.uri", _Addresses.SERVER_REQUEST_URI_RAW, None),
+    ("http.request.method", _Addresses.SERVER_REQUEST_METHOD, None),
+    ("http.request.path_params", _Addresses.SERVER_REQUEST_PATH_PARAMS, None),
+    ("http.request.cookies", _Addresses.SERVER_REQUEST_COOKIES, None),
+    ("http.response.status", _Addresses.SERVER_RESPONSE_STATUS, None),
+    ("http.response.headers", _Addresses.SERVER_RESPONSE_HEADERS_NO_COOKIES, _transform_headers),
+    ("http.request.body", _Addresses.SERVER_REQUEST_BODY, None),
+)  # type: Tuple[Tuple[str, str, Optional[Callable[[Any], Any]]], ...]
+_CONTEXT_ITEMS = [item for item, _, _ in _CONTEXT_ITEM_ADDRESSES]
+
+
 _COLLECTED_REQUEST_HEADERS = {
     "accept",
     "accept-encoding",
@@ -151,6 +173,74 @@ def _get_waf_timeout():
     return int(os.getenv("DD_APPSEC_WAF_TIMEOUT", DEFAULT_WAF_TIMEOUT))
 
 
+class _WafRequest(object):
+    """The WAF state of a single request.
+
+    Addresses are pushed to the WAF context of the request as soon as the
+    integrations make them available, so that each value is converted and
+    evaluated only once. The WAF matches are accumulated until the request span
+    finishes.
+    """
+
+    __slots__ = ("_processor", "_context", "span_id", "data", "results")
+
+    def __init__(self, processor, context, span_id):
+        # type: (AppSecSpanProcessor, DDWafContext, int) -> None
+        self._processor = processor
+        self._context = context
+        # The ID of the span that owns the request WAF context
+        self.span_id = span_id
+        self.data = {}  # type: Dict[str, Any]
+        self.results = []  # type: List[str]
+
+    @property
+    def total_runtime(self):
+        # type: () -> float
+        return self._context.total_runtime
+
+    @property
+    def total_overall_runtime(self):
+        # type: () -> float
+        return self._context.total_overall_runtime
+
+    @property
+    def closed(self):
+        # type: () -> bool
+        return self._context.closed
+
+    def push(self, items):
+        # type: (Mapping[str, Any]) -> None
+        """Run the WAF on the addresses provided by the given context items
+        that have not been pushed yet, or whose value has changed."""
+        if self._context.closed:
+            return
+
+        data = self._processor._collect_addresses(items, self.data)
+        if not data:
+            return
+
+        log.debug("[DDAS-001-00] Executing AppSec In-App WAF with parameters: %s", data)
+        self.data.update(data)
+        res, _, _ = self._context.run(data, self._processor._waf_timeout)  # res is a serialized json
+        if res is not None:
+            self.results.append(res)
+
+    def triggers(self):
+        # type: () -> Optional[str]
+        """Return all the WAF matches of the request as a serialized JSON array."""
+        if not self.results:
+            return None
+        if len(self.results) == 1:
+            return self.results[0]
+        # Each result is a serialized JSON array. Matches are rare, so decode
+        # and merge them.
+        return json.dumps([match for _ in self.results for match in json.loads(_)], separators=(",", ":"))
+
+    def close(self):
+        # type: () -> None
+        self._context.close()
+
+
 @attr.s(eq=False)
 class AppSecSpanProcessor(SpanProcessor):
 
@@ -161,6 +251,8 @@ class AppSecSpanProcessor(SpanProcessor):
     _addresses_to_keep = attr.ib(type=Set[str], factory=set)
     _rate_limiter = attr.ib(type=RateLimiter, factory=_get_rate_limiter)
     _waf_timeout = attr.ib(type=int, factory=_get_waf_timeout)
+    _ruleset_tags = attr.ib(type=Dict[str, str], factory=dict, init=False)
+    _ruleset_metrics = attr.ib(type=Dict[str, int], factory=dict, init=False)
 
     @property
     def enabled(self):
@@ -198,6 +290,7 @@ class AppSecSpanProcessor(SpanProcessor):
                 # Partial of DDAS-0005-00
                 log.warning("[DDAS-0005-00] WAF initialization failed")
                 raise
+        self._update_ruleset_info()
         for address in self._ddwaf.required_data:
             self._mark_needed(address)
         # we always need the request headers
@@ -205,9 +298,39 @@ class AppSecSpanProcessor(SpanProcessor):
         # we always need the response headers
         self._mark_needed(_Addresses.SERVER_RESPONSE_HEADERS_NO_COOKIES)
 
+    def _update_ruleset_info(self):
+        # type: () -> None
+        """Compute the tags and metrics describing the loaded ruleset.
+
+        They only change when the rules are (re)loaded, so they are computed
+        once here rather than for every request.
+        """
+        info = self._ddwaf.info
+        tags = {
+            APPSEC_EVENT_RULE_VERSION: info["version"],
+            APPSEC_WAF_VERSION: "%s.%s.%s" % version(),
+        }
+        if info["errors"]:
+            tags[APPSEC_EVENT_RULE_ERRORS] = json.dumps(info["errors"])
+        self._ruleset_tags = tags
+        self._ruleset_metrics = {
+            APPSEC_EVENT_RULE_LOADED: info["loaded"],
+            APPSEC_EVENT_RULE_ERROR_COUNT: info["failed"],
+        }
+
     def on_span_start(self, span):
         # type: (Span) -> None
-        pass
+        if span.span_type != SpanTypes.WEB:
+            return
+
+        # Nested web spans share the WAF context of the outermost one.
+        if _context.get_item(APPSEC_WAF_CONTEXT_KEY, span=span) is None:
+            try:
+                waf_context = self._ddwaf.context()
+            except RuntimeError:
+                log.warning("[DDAS-001-00] AppSec In-App WAF context initialization failed")
+                return
+            _context.set_item(APPSEC_WAF_CONTEXT_KEY, _WafRequest(self, waf_context, span.span_id), span=span)
 
     def _mark_needed(self, address):
         # type: (str) -> None
@@ -217,6 +340,27 @@ class AppSecSpanProcessor(SpanProcessor):
         # type: (str) -> bool
         return address in self._addresses_to_keep
 
+    def _collect_addresses(self, items, pushed):
+        # type: (Mapping[str, Any], Mapping[str, Any]) -> Dict[str, Any]
+        """Get the data for the needed WAF addresses provided by the given
+        context items, excluding those that have already been pushed with the
+        same value."""
+        data = {}
+        for item, address, transform in _CONTEXT_ITEM_ADDRESSES:
+            if not self._is_needed(address):
+                continue
+            value = items.get(item)
+            if value is None:
+                continue
+            if transform is not None:
+                value = transform(value)
+            # Integrations can provide more complete values in later calls
+            previous = pushed.get(address)
+            if previous is not None and (previous is value or previous == value):
+                continue
+            data[address] = value
+        return data
+
     def on_span_finish(self, span):
         # type: (Span) -> None
         if span.span_type != SpanTypes.WEB:
@@ -224,70 +368,33 @@ class AppSecSpanProcessor(SpanProcessor):
         span.set_metric(APPSEC_ENABLED, 1.0)
         span.set_tag_str(RUNTIME_FAMILY, "python")
 
-        data = {}
-        if self._is_needed(_Addresses.SERVER_REQUEST_QUERY):
-            request_query = _context.get_item("http.request.query", span=span)
-            if request_query is not None:
-                data[_Addresses.SERVER_REQUEST_QUERY] = request_query
-
-        if self._is_needed(_Addresses.SERVER_REQUEST_HEADERS_NO_COOKIES):
-            request_headers = _context.get_item("http.request.headers", span=span)
-            if request_headers is not None:
-                data[_Addresses.SERVER_REQUEST_HEADERS_NO_COOKIES] = _transform_headers(request_headers)
-
-        if self._is_needed(_Addresses.SERVER_REQUEST_URI_RAW):
-            uri = _context.get_item("http.request.uri", span=span)
-            if uri is not None:
-                data[_Addresses.SERVER_REQUEST_URI_RAW] = uri
-
-        if self._is_needed(_Addresses.SERVER_REQUEST_METHOD):
-            request_method = _context.get_item("http.request.method", span=span)
-            if request_method is not None:
-                data[_Addresses.SERVER_REQUEST_METHOD] = request_method
-
-        if self._is_needed(_Addresses.SERVER_REQUEST_PATH_PARAMS):
-            path_params = _context.get_item("http.request.path_params", span=span)
-            if path_params is not None:
-                data[_Addresses.SERVER_REQUEST_PATH_PARAMS] = path_params
-
-        if self._is_needed(_Addresses.SERVER_REQUEST_COOKIES):
-            cookies = _context.get_item("http.request.cookies", span=span)
-            if cookies is not None:
-                data[_Addresses.SERVER_REQUEST_COOKIES] = cookies
-
-        if self._is_needed(_Addresses.SERVER_RESPONSE_STATUS):
-            status = _context.get_item("http.response.status", span=span)
-            if status is not None:
-                data[_Addresses.SERVER_RESPONSE_STATUS] = status
-
-        if self._is_needed(_Addresses.SERVER_RESPONSE_HEADERS_NO_COOKIES):
-            response_headers = _context.get_item("http.response.headers", span=span)
-            if response_headers is not None:
-                data[_Addresses.SERVER_RESPONSE_HEADERS_NO_COOKIES] = _transform_headers(response_headers)
-
-        if self._is_needed(_Addresses.SERVER_REQUEST_BODY):
-            body = _context.get_item("http.request.body", span=span)
-            if body is not None:
-                data[_Addresses.SERVER_REQUEST_BODY] = body
-
-        log.debug("[DDAS-001-00] Executing AppSec In-App WAF with parameters: %s", data)
-        res, total_runtime, total_overall_runtime = self._ddwaf.run(data, self._waf_timeout)  # res is a serialized json
+        waf_request = _context.get_item(APPSEC_WAF_CONTEXT_KEY, span=span)
+        if waf_request is None or waf_request.closed:
+            # The span was started before the processor was enabled.
+            waf_request = _WafRequest(self, self._ddwaf.context(), span.span_id)
 
         try:
-            info = self._ddwaf.info
-            if info["errors"]:
-                span.set_tag_str(APPSEC_EVENT_RULE_ERRORS, json.dumps(info["errors"]))
-            span.set_tag_str(APPSEC_EVENT_RULE_VERSION, info["version"])
-            span.set_tag_str(APPSEC_WAF_VERSION, "%s.%s.%s" % version())
-
-            span.set_metric(APPSEC_EVENT_RULE_LOADED, info["loaded"])
-            span.set_metric(APPSEC_EVENT_RULE_ERROR_COUNT, info["failed"])
-            span.set_metric(APPSEC_WAF_DURATION, total_runtime)
-            span.set_metric(APPSEC_WAF_DURATION_EXT, total_overall_runtime)
-        except (json.decoder.JSONDecodeError, ValueError):
-            log.warning("Error parsing data AppSec In-App WAF metrics report")
-        except Exception:
-            log.warning("Error executing AppSec In-App WAF metrics report: %s", exc_info=True)
+            # Push any addresses that the integrations have not pushed yet.
+            waf_request.push(dict(zip(_CONTEXT_ITEMS, _context.get_items(_CONTEXT_ITEMS, span=span))))
+            data = waf_request.data
+            # Nested web spans share the WAF context, only its owner reports the matches
+            res = waf_request.triggers() if waf_request.span_id == span.span_id else None
+
+            try:
+                for tag, value in self._ruleset_tags.items():
+                    span.set_tag_str(tag, value)
+                for metric, metric_value in self._ruleset_metrics.items():
+                    span.set_metric(metric, metric_value)
+                span.set_metric(APPSEC_WAF_DURATION, waf_request.total_runtime)
+                span.set_metric(APPSEC_WAF_DURATION_EXT, waf_request.total_overall_runtime)
+            except (json.decoder.JSONDecodeError, ValueError):
+                log.warning("Error parsing data AppSec In-App WAF metrics report")
+            except Exception:
+                log.warning("Error executing AppSec In-App WAF metrics report: %s", exc_info=True)
+        finally:
+            if waf_request.span_id == span.span_id:
+                waf_request.close()
+
         if res is not None:
             # We run the rate limiter only if there is an attack, its goal is to limit the number of collected asm
             # events
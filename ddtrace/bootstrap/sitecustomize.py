@@ -18,14 +18,12 @@ if os.environ.get("DD_GEVENT_PATCH_ALL", "false").lower() in ("true", "1"):
 
 
 from ddtrace import config  # noqa
-from ddtrace.debugging._config import config as debugger_config
 from ddtrace.internal.logger import get_logger  # noqa
-from ddtrace.internal.runtime.runtime_metrics import RuntimeWorker
 from ddtrace.internal.utils.formats import asbool  # noqa
 from ddtrace.internal.utils.formats import parse_tags_str
+from ddtrace.settings.dynamic_instrumentation import DynamicInstrumentationConfig
 from ddtrace.tracer import DD_LOG_FORMAT  # noqa
 from ddtrace.tracer import debug_mode
-from ddtrace.vendor.debtcollector import deprecate
 
 
 if config.logs_injection:
@@ -42,6 +40,8 @@ if config.logs_injection:
 # Debug mode from the tracer will do a basicConfig so only need to do this otherwise
 call_basic_config = asbool(os.environ.get("DD_CALL_BASIC_CONFIG", "false"))
 if not debug_mode and call_basic_config:
+    from ddtrace.vendor.debtcollector import deprecate
+
     deprecate(
         "ddtrace.tracer.logging.basicConfig",
         message="`logging.basicConfig()` should be called in a user's application."
@@ -84,12 +84,16 @@ try:
         log.debug("profiler enabled via environment variable")
         import ddtrace.profiling.auto  # noqa: F401
 
-    if debugger_config.enabled:
+    # DEV: Importing ddtrace.debugging loads the whole debugger, check whether
+    # it is enabled first.
+    if DynamicInstrumentationConfig().enabled:
         from ddtrace.debugging import DynamicInstrumentation
 
         DynamicInstrumentation.enable()
 
     if asbool(os.getenv("DD_RUNTIME_METRICS_ENABLED")):
+        from ddtrace.internal.runtime.runtime_metrics import RuntimeWorker
+
         RuntimeWorker.enable()
 
     opts = {}  # type: Dict[str, Any]
@@ -84,6 +84,14 @@ def main():
         ),
         action="store_true",
     )
+    parser.add_argument(
+        "--startup-report",
+        help=(
+            "print the time spent importing modules when bootstrapping the library, by module and by integration. "
+            "Only reflects configurations made via environment variables. Requires Python 3.7+."
+        ),
+        action="store_true",
+    )
     parser.add_argument("-p", "--profiling", help="enable profiling (disabled by default)", action="store_true")
     parser.add_argument("-v", "--version", action="version", version="%(prog)s " + ddtrace.__version__)
     parser.add_argument("-nc", "--colorless", help="print output of command without color", action="store_true")
@@ -105,6 +113,14 @@ def main():
         print(pretty_collect(ddtrace.tracer, color=not args.colorless))
         sys.exit(0)
 
+    if args.startup_report:
+        # Inline imports for performance.
+        from ddtrace.internal import startup_report
+
+        root = startup_report.collect()
+        print(startup_report.pretty_report(root))
+        sys.exit(0 if root is not None else 1)
+
     root_dir = os.path.dirname(ddtrace.__file__)
     log.debug("ddtrace root: %s", root_dir)
 
@@ -134,14 +134,11 @@ class Context(object):
             return tp or ""
 
         # determine the trace_id value
+        sampled = "01" if self.sampling_priority and self.sampling_priority > 0 else "00"
         if tp:
             # grab the original traceparent trace id, not the converted value
-            trace_id = tp.split("-")[1]
-        else:
-            trace_id = "{:032x}".format(self.trace_id)
-
-        sampled = 1 if self.sampling_priority and self.sampling_priority > 0 else 0
-        return "00-{}-{:016x}-{:02x}".format(trace_id, self.span_id, sampled)
+            return "00-%s-%016x-%s" % (tp.split("-")[1], self.span_id, sampled)
+        return "00-%032x-%016x-%s" % (self.trace_id, self.span_id, sampled)
 
     @property
     def _tracestate(self):
@@ -15,7 +15,6 @@ from ...ext import http
 from ...internal.compat import PYTHON_VERSION_INFO
 from ...internal.utils import ArgumentError
 from ...internal.utils import get_argument_value
-from ...internal.utils.formats import asbool
 from ...internal.utils.formats import deep_getattr
 from ...pin import Pin
 from ..trace_utils import unwrap
@@ -42,14 +41,6 @@ if os.getenv("DD_AWS_TAG_ALL_PARAMS") is not None:
         removal_version="2.0.0",
     )
 
-config._add(
-    "aiobotocore",
-    {
-        "tag_no_params": asbool(os.getenv("DD_AWS_TAG_NO_PARAMS", default=False)),
-        "tag_all_params": asbool(os.getenv("DD_AWS_TAG_ALL_PARAMS", default=False)),
-    },
-)
-
 
 def patch():
     if getattr(aiobotocore.client, "_datadog_patch", False):
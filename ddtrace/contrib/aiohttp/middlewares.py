@@ -6,6 +6,7 @@ from ...constants import SPAN_MEASURED_KEY
 from ...ext import SpanTypes
 from ...ext import http
 from ...internal.compat import stringify
+from ...internal.runtime import event_loop
 from ..asyncio import context_provider
 
 
@@ -26,6 +27,7 @@ async def trace_middleware(app, handler):
     """
 
     async def attach_context(request):
+        event_loop.monitor_running_loop()
         # application configs
         tracer = app[CONFIG_KEY]["tracer"]
         service = app[CONFIG_KEY]["service"]
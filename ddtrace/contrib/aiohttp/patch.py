@@ -1,11 +1,8 @@
-import os
-
 from yarl import URL
 
 from ddtrace import config
 from ddtrace.internal.logger import get_logger
 from ddtrace.internal.utils import get_argument_value
-from ddtrace.internal.utils.formats import asbool
 from ddtrace.vendor import wrapt
 
 from ...ext import SpanTypes
@@ -24,18 +21,6 @@ log = get_logger(__name__)
 
 
 # Server config
-config._add(
-    "aiohttp",
-    dict(distributed_tracing=True),
-)
-
-config._add(
-    "aiohttp_client",
-    dict(
-        distributed_tracing=asbool(os.getenv("DD_AIOHTTP_CLIENT_DISTRIBUTED_TRACING", True)),
-        default_http_tag_query_string=os.getenv("DD_HTTP_CLIENT_TAG_QUERY_STRING", "true"),
-    ),
-)
 
 
 class _WrappedConnectorClass(wrapt.ObjectProxy):
@@ -1,5 +1,4 @@
 from ddtrace import Pin
-from ddtrace import config
 
 from ...ext import SpanTypes
 from ...internal.utils import get_argument_value
@@ -8,12 +7,6 @@ from ..trace_utils import with_traced_module
 from ..trace_utils import wrap
 
 
-config._add(
-    "aiohttp_jinja2",
-    dict(),
-)
-
-
 @with_traced_module
 def traced_render_template(aiohttp_jinja2, pin, func, instance, args, kwargs):
     # original signature:
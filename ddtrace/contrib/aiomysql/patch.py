@@ -14,11 +14,6 @@ from ...ext import db
 from ...ext import net
 
 
-config._add(
-    "aiomysql",
-    dict(_default_service="mysql"),
-)
-
 CONN_ATTR_BY_TAG = {
     net.TARGET_HOST: "host",
     net.TARGET_PORT: "port",
@@ -24,7 +24,6 @@ try:
 except ImportError:
     _RedisBuffer = None
 
-config._add("aioredis", dict(_default_service="redis"))
 
 aioredis_version_str = getattr(aioredis, "__version__", "0.0.0")
 aioredis_version = tuple([int(i) for i in aioredis_version_str.split(".")])
@@ -18,9 +18,6 @@ try:
     from algoliasearch.version import VERSION
 
     algoliasearch_version = tuple([int(i) for i in VERSION.split(".")])
-
-    # Default configuration
-    config._add("algoliasearch", dict(_default_service=SERVICE_NAME, collect_query_text=False))
 except ImportError:
     algoliasearch_version = (0, 0)
 
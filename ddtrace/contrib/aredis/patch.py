@@ -10,9 +10,6 @@ from ..redis.util import _trace_redis_cmd
 from ..redis.util import _trace_redis_execute_pipeline
 
 
-config._add("aredis", dict(_default_service="redis"))
-
-
 def patch():
     """Patch the instrumented methods"""
     if getattr(aredis, "_datadog_patch", False):
@@ -10,6 +10,7 @@ from ddtrace.ext import http
 from .. import trace_utils
 from ...internal.compat import reraise
 from ...internal.logger import get_logger
+from ...internal.runtime import event_loop
 from .utils import guarantee_single_callable
 
 
@@ -101,6 +102,8 @@ class TraceMiddleware:
         if scope["type"] != "http":
             return await self.app(scope, receive, send)
 
+        event_loop.monitor_running_loop()
+
         try:
             headers = _extract_headers(scope)
         except Exception:
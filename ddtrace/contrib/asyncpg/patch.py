@@ -25,14 +25,6 @@ if TYPE_CHECKING:  # pragma: no cover
     from asyncpg.prepared_stmt import PreparedStatement
 
 
-config._add(
-    "asyncpg",
-    dict(
-        _default_service="postgres",
-    ),
-)
-
-
 log = get_logger(__name__)
 
 
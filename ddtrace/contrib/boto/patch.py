@@ -15,7 +15,6 @@ from ddtrace.vendor import debtcollector
 from ddtrace.vendor import wrapt
 
 from ...internal.utils import get_argument_value
-from ...internal.utils.formats import asbool
 
 
 # Original boto client class
@@ -42,14 +41,6 @@ if os.getenv("DD_AWS_TAG_ALL_PARAMS") is not None:
         removal_version="2.0.0",
     )
 
-config._add(
-    "boto",
-    {
-        "tag_no_params": asbool(os.getenv("DD_AWS_TAG_NO_PARAMS", default=False)),
-        "tag_all_params": asbool(os.getenv("DD_AWS_TAG_ALL_PARAMS", default=False)),
-    },
-)
-
 
 def patch():
     if getattr(boto.connection, "_datadog_patch", False):
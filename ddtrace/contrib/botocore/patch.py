@@ -2,7 +2,6 @@
 Trace queries to aws api done via botocore client
 """
 import base64
-import collections
 import json
 import os
 import typing
@@ -16,7 +15,6 @@ import botocore.client
 import botocore.exceptions
 
 from ddtrace import config
-from ddtrace.settings.config import Config
 from ddtrace.vendor import debtcollector
 from ddtrace.vendor import wrapt
 
@@ -25,9 +23,9 @@ from ...constants import SPAN_MEASURED_KEY
 from ...ext import SpanTypes
 from ...ext import aws
 from ...ext import http
+from ...internal.compat import string_type
 from ...internal.logger import get_logger
 from ...internal.utils import get_argument_value
-from ...internal.utils.formats import asbool
 from ...internal.utils.formats import deep_getattr
 from ...pin import Pin
 from ...propagation.http import HTTPPropagator
@@ -60,16 +58,6 @@ if os.getenv("DD_AWS_TAG_ALL_PARAMS") is not None:
 
 
 # Botocore default settings
-config._add(
-    "botocore",
-    {
-        "distributed_tracing": asbool(os.getenv("DD_BOTOCORE_DISTRIBUTED_TRACING", default=True)),
-        "invoke_with_legacy_context": asbool(os.getenv("DD_BOTOCORE_INVOKE_WITH_LEGACY_CONTEXT", default=False)),
-        "operations": collections.defaultdict(Config._HTTPServerConfig),
-        "tag_no_params": asbool(os.getenv("DD_AWS_TAG_NO_PARAMS", default=False)),
-        "tag_all_params": asbool(os.getenv("DD_AWS_TAG_ALL_PARAMS", default=False)),
-    },
-)
 
 
 class TraceInjectionSizeExceed(Exception):
@@ -89,6 +77,11 @@ def inject_trace_data_to_message_attributes(trace_data, entry, endpoint=None):
 
     Inject trace headers into the an SQS or SNS record's MessageAttributes
     """
+    _inject_trace_json_to_message_attributes(json.dumps(trace_data), entry, endpoint)
+
+
+def _inject_trace_json_to_message_attributes(trace_json, entry, endpoint=None):
+    # type: (str, Dict[str, Any], Optional[str]) -> None
     if "MessageAttributes" not in entry:
         entry["MessageAttributes"] = {}
     # Max of 10 message attributes.
@@ -96,12 +89,12 @@ def inject_trace_data_to_message_attributes(trace_data, entry, endpoint=None):
         if endpoint == "sqs":
             # Use String since changing this to Binary would be a breaking
             # change as other tracers expect this to be a String.
-            entry["MessageAttributes"]["_datadog"] = {"DataType": "String", "StringValue": json.dumps(trace_data)}
+            entry["MessageAttributes"]["_datadog"] = {"DataType": "String", "StringValue": trace_json}
         elif endpoint == "sns":
             # Use Binary since SNS subscription filter policies fail silently
             # with JSON strings https://github.com/DataDog/datadog-lambda-js/pull/269
             # AWS will encode our value if it sees "Binary"
-            entry["MessageAttributes"]["_datadog"] = {"DataType": "Binary", "BinaryValue": json.dumps(trace_data)}
+            entry["MessageAttributes"]["_datadog"] = {"DataType": "Binary", "BinaryValue": trace_json}
         else:
             log.warning("skipping trace injection, endpoint is not SNS or SQS")
     else:
@@ -120,13 +113,15 @@ def inject_trace_to_sqs_or_sns_batch_message(params, span, endpoint=None):
     """
     trace_data = {}
     HTTPPropagator.inject(span.context, trace_data)
+    # The trace headers are the same for every record of the batch
+    trace_json = json.dumps(trace_data)
 
     # An entry here is an SNS or SQS record, and depending on how it was published,
     # it could either show up under Entries (in case of PutRecords),
     # or PublishBatchRequestEntries (in case of PublishBatch).
     entries = params.get("Entries", params.get("PublishBatchRequestEntries", []))
     for entry in entries:
-        inject_trace_data_to_message_attributes(trace_data, entry, endpoint)
+        _inject_trace_json_to_message_attributes(trace_json, entry, endpoint)
 
 
 def inject_trace_to_sqs_or_sns_message(params, span, endpoint=None):
@@ -157,18 +152,20 @@ def inject_trace_to_eventbridge_detail(params, span):
         log.warning("Unable to inject context. The Event Bridge event had no Entries.")
         return
 
+    trace_data = {}
+    HTTPPropagator.inject(span.context, trace_data)
+    trace_json = json.dumps(trace_data)
+
     for entry in params["Entries"]:
-        detail = {}
         if "Detail" in entry:
             try:
                 detail = json.loads(entry["Detail"])
             except ValueError:
                 log.warning("Detail is not a valid JSON string")
                 continue
-
-        detail["_datadog"] = {}
-        HTTPPropagator.inject(span.context, detail["_datadog"])
-        detail_json = json.dumps(detail)
+            detail_json = _add_trace_json(entry["Detail"], detail, trace_json, trace_data)
+        else:
+            detail_json = '{"_datadog": %s}' % trace_json
 
         # check if detail size will exceed max size with headers
         detail_size = len(detail_json)
@@ -179,6 +176,32 @@ def inject_trace_to_eventbridge_detail(params, span):
         entry["Detail"] = detail_json
 
 
+def _add_trace_json(data_str, data_obj, trace_json, trace_data):
+    # type: (str, Any, str, Dict[str, str]) -> str
+    """
+    :data_str: a JSON string
+    :data_obj: the object decoded from ``data_str``
+    :trace_json: the serialized trace headers
+    :trace_data: the trace headers
+
+    Return ``data_str`` with the trace headers stored under its ``_datadog`` key.
+    """
+    if not isinstance(data_str, string_type) or not isinstance(data_obj, dict) or "_datadog" in data_obj:
+        data_obj["_datadog"] = trace_data
+        data_json = json.dumps(data_obj)
+        # if original string had a line break, add it back
+        if data_str.endswith(LINE_BREAK):
+            data_json += LINE_BREAK
+        return data_json
+
+    # DEV: data_str is a valid JSON object, so the trace headers can be added
+    # before its closing brace instead of encoding the whole object again.
+    end = data_str.rindex("}")
+    return "".join(
+        (data_str[:end].rstrip(), ', "_datadog": ' if data_obj else '"_datadog": ', trace_json, data_str[end:])
+    )
+
+
 def get_json_from_str(data_str):
     # type: (str) -> Tuple[str, Optional[Dict[str, Any]]]
     data_obj = json.loads(data_str)
@@ -199,17 +222,25 @@ def get_kinesis_data_object(data):
     - base64 encoded json string
     If it's neither of these, then we leave the message as it is.
     """
+    data_str, data_obj = _get_kinesis_data_object(data)
+    if data_str.endswith(LINE_BREAK):
+        return LINE_BREAK, data_obj
+    return "", data_obj
+
 
+def _get_kinesis_data_object(data):
+    # type: (Any) -> Tuple[str, Any]
+    """Same as ``get_kinesis_data_object`` but return the decoded JSON string instead of its line break"""
     # check if data is a json string
     try:
-        return get_json_from_str(data)
+        return data, json.loads(data)
     except ValueError:
         pass
 
     # check if data is a base64 encoded json string
     try:
         data_str = base64.b64decode(data).decode("ascii")
-        return get_json_from_str(data_str)
+        return data_str, json.loads(data_str)
     except ValueError:
         raise TraceInjectionDecodingError("Unable to parse kinesis streams data string")
 
@@ -229,14 +260,10 @@ def inject_trace_to_kinesis_stream_data(record, span):
         return
 
     data = record["Data"]
-    line_break, data_obj = get_kinesis_data_object(data)
-    data_obj["_datadog"] = {}
-    HTTPPropagator.inject(span.context, data_obj["_datadog"])
-    data_json = json.dumps(data_obj)
-
-    # if original string had a line break, add it back
-    if line_break:
-        data_json += line_break
+    data_str, data_obj = _get_kinesis_data_object(data)
+    trace_data = {}
+    HTTPPropagator.inject(span.context, trace_data)
+    data_json = _add_trace_json(data_str, data_obj, json.dumps(trace_data), trace_data)
 
     # check if data size will exceed max size with headers
     data_size = len(data_json)
@@ -3,6 +3,8 @@ from ddtrace import config
 
 # Celery Context key
 CTX_KEY = "__dd_task_span"
+# Task key of the span templates
+TEMPLATES_KEY = "__dd_task_span_templates"
 
 # Span names
 PRODUCER_ROOT_SPAN = "celery.apply"
@@ -1,25 +1,10 @@
-import os
-
 import celery
 
-from ddtrace import config
-from ddtrace.internal.utils.formats import asbool
-
 from .app import patch_app
 from .app import unpatch_app
-from .constants import PRODUCER_SERVICE
-from .constants import WORKER_SERVICE
 
 
 # Celery default settings
-config._add(
-    "celery",
-    {
-        "distributed_tracing": asbool(os.getenv("DD_CELERY_DISTRIBUTED_TRACING", default=False)),
-        "producer_service_name": os.getenv("DD_CELERY_PRODUCER_SERVICE_NAME", default=PRODUCER_SERVICE),
-        "worker_service_name": os.getenv("DD_CELERY_WORKER_SERVICE_NAME", default=WORKER_SERVICE),
-    },
-)
 
 
 def patch():
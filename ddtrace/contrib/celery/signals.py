@@ -1,17 +1,16 @@
-from celery import registry
+from celery import current_app
 
 from ddtrace import Pin
 from ddtrace import config
 
 from . import constants as c
 from .. import trace_utils
-from ...constants import ANALYTICS_SAMPLE_RATE_KEY
-from ...constants import SPAN_MEASURED_KEY
 from ...ext import SpanTypes
 from ...internal.logger import get_logger
 from ...propagation.http import HTTPPropagator
 from .utils import attach_span
 from .utils import detach_span
+from .utils import get_span_template
 from .utils import retrieve_span
 from .utils import retrieve_task_id
 from .utils import set_tags_from_context
@@ -37,18 +36,17 @@ def trace_prerun(*args, **kwargs):
         log.debug("no pin found on task or task.app task_id=%s", task_id)
         return
 
-    request_headers = task.request.get("headers", {})
-    trace_utils.activate_distributed_headers(pin.tracer, int_config=config.celery, request_headers=request_headers)
+    if trace_utils.distributed_tracing_enabled(config.celery):
+        request_headers = task.request.get("headers", {})
+        trace_utils.activate_distributed_headers(pin.tracer, int_config=config.celery, request_headers=request_headers)
 
     # propagate the `Span` in the current task Context
-    service = config.celery["worker_service_name"]
-    span = pin.tracer.trace(c.WORKER_ROOT_SPAN, service=service, resource=task.name, span_type=SpanTypes.WORKER)
-    # set analytics sample rate
-    rate = config.celery.get_analytics_sample_rate()
-    if rate is not None:
-        span.set_tag(ANALYTICS_SAMPLE_RATE_KEY, rate)
-
-    span.set_tag(SPAN_MEASURED_KEY)
+    template = get_span_template(task, task.name)
+    span = pin.tracer.trace(
+        c.WORKER_ROOT_SPAN, service=template.service, resource=template.resource, span_type=SpanTypes.WORKER
+    )
+    # set analytics sample rate and measured tags
+    template.apply(span)
     attach_span(task, task_id, span)
 
 
@@ -63,7 +61,7 @@ def trace_postrun(*args, **kwargs):
         return
 
     # retrieve and finish the Span
-    span = retrieve_span(task, task_id)
+    span = detach_span(task, task_id)
     if span is None:
         log.warning("no existing span found for task_id=%s", task_id)
         return
@@ -73,7 +71,6 @@ def trace_postrun(*args, **kwargs):
         set_tags_from_context(span, kwargs)
         set_tags_from_context(span, task.request.__dict__)
         span.finish()
-        detach_span(task, task_id)
 
 
 def trace_before_publish(*args, **kwargs):
@@ -82,7 +79,7 @@ def trace_before_publish(*args, **kwargs):
     # `Task` instance **does not** include any information about the current
     # execution, so it **must not** be used to retrieve `request` data.
     task_name = kwargs.get("sender")
-    task = registry.tasks.get(task_name)
+    task = current_app.tasks.get(task_name)
     task_id = retrieve_task_id(kwargs)
     # safe-guard to avoid crashes in case the signals API
     # changes in Celery
@@ -97,15 +94,10 @@ def trace_before_publish(*args, **kwargs):
 
     # apply some tags here because most of the data is not available
     # in the task_after_publish signal
-    service = config.celery["producer_service_name"]
-    span = pin.tracer.trace(c.PRODUCER_ROOT_SPAN, service=service, resource=task_name)
-    # set analytics sample rate
-    rate = config.celery.get_analytics_sample_rate()
-    if rate is not None:
-        span.set_tag(ANALYTICS_SAMPLE_RATE_KEY, rate)
-
-    span.set_tag(SPAN_MEASURED_KEY)
-    span.set_tag_str(c.TASK_TAG_KEY, c.TASK_APPLY_ASYNC)
+    template = get_span_template(task, task_name, is_publish=True)
+    span = pin.tracer.trace(c.PRODUCER_ROOT_SPAN, service=template.service, resource=template.resource)
+    # set analytics sample rate, measured and action tags
+    template.apply(span)
     span.set_tag_str("celery.id", task_id)
     set_tags_from_context(span, kwargs)
 
@@ -115,21 +107,17 @@ def trace_before_publish(*args, **kwargs):
     attach_span(task, task_id, span, is_publish=True)
 
     if config.celery["distributed_tracing"]:
-        trace_headers = {}
-        propagator.inject(span.context, trace_headers)
-
         # This weirdness is due to yet another Celery bug concerning
         # how headers get propagated in async flows
         # https://github.com/celery/celery/issues/4875
         task_headers = kwargs.get("headers") or {}
-        task_headers.setdefault("headers", {})
-        task_headers["headers"].update(trace_headers)
+        propagator.inject(span.context, task_headers.setdefault("headers", {}))
         kwargs["headers"] = task_headers
 
 
 def trace_after_publish(*args, **kwargs):
     task_name = kwargs.get("sender")
-    task = registry.tasks.get(task_name)
+    task = current_app.tasks.get(task_name)
     task_id = retrieve_task_id(kwargs)
     # safe-guard to avoid crashes in case the signals API
     # changes in Celery
@@ -138,12 +126,11 @@ def trace_after_publish(*args, **kwargs):
         return
 
     # retrieve and finish the Span
-    span = retrieve_span(task, task_id, is_publish=True)
+    span = detach_span(task, task_id, is_publish=True)
     if span is None:
         return
     else:
         span.finish()
-        detach_span(task, task_id, is_publish=True)
 
 
 def trace_failure(*args, **kwargs):
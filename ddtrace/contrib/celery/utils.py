@@ -2,10 +2,16 @@ from typing import Any
 from typing import Dict
 from weakref import WeakValueDictionary
 
+from ddtrace import config
+from ddtrace.constants import ANALYTICS_SAMPLE_RATE_KEY
+from ddtrace.constants import SPAN_MEASURED_KEY
 from ddtrace.contrib.trace_utils import set_flattened_tags
+from ddtrace.internal.compat import string_type
 from ddtrace.span import Span
 
+from . import constants as c
 from .constants import CTX_KEY
+from .constants import TEMPLATES_KEY
 
 
 TAG_KEYS = frozenset(
@@ -56,15 +62,67 @@ def set_tags_from_context(span, context):
     # type: (Span, Dict[str, Any]) -> None
     """Helper to extract meta values from a Celery Context"""
 
-    context_tags = []
     for key, tag_name in TAG_KEYS:
         value = context.get(key)
-        if should_skip_context_value(key, value):
+        # DEV: Most keys are not set, skip them before calling the helper
+        if value is None or should_skip_context_value(key, value):
             continue
 
-        context_tags.append((tag_name, value))
+        if isinstance(value, string_type):
+            span.set_tag_str(tag_name, value)
+        elif isinstance(value, dict):
+            set_flattened_tags(span, [(tag_name, value)])
+        else:
+            span.set_tag(tag_name, value)
 
-    set_flattened_tags(span, context_tags)
+
+class _SpanTemplate(object):
+    """The service, resource and tags of the spans of a task.
+
+    They only depend on the task name and on the integration configuration, so they are computed once per task and
+    applied in bulk to each span.
+    """
+
+    __slots__ = ["config_version", "service", "resource", "meta", "metrics"]
+
+    def __init__(self, task_name, is_publish):
+        # type: (str, bool) -> None
+        self.config_version = config.celery._version
+        self.service = config.celery["producer_service_name" if is_publish else "worker_service_name"]
+        self.resource = task_name
+
+        # Let a span convert the tags to meta and metrics
+        span = Span(None)
+        rate = config.celery.get_analytics_sample_rate()
+        if rate is not None:
+            span.set_tag(ANALYTICS_SAMPLE_RATE_KEY, rate)
+        span.set_tag(SPAN_MEASURED_KEY)
+        if is_publish:
+            span.set_tag_str(c.TASK_TAG_KEY, c.TASK_APPLY_ASYNC)
+        self.meta = span._meta
+        self.metrics = span._metrics
+
+    def apply(self, span):
+        # type: (Span) -> None
+        span._meta.update(self.meta)
+        span._metrics.update(self.metrics)
+
+
+def get_span_template(task, task_name, is_publish=False):
+    # type: (Any, str, bool) -> _SpanTemplate
+    """Return the template of the run or publish spans of a task, computed
+    again when the integration configuration changes.
+    """
+    templates = getattr(task, TEMPLATES_KEY, None)
+    if templates is None:
+        templates = [None, None]
+        setattr(task, TEMPLATES_KEY, templates)
+
+    template = templates[is_publish]
+    # DEV: The templates can be inherited from the class of another task
+    if template is None or template.config_version != config.celery._version or template.resource != task_name:
+        template = templates[is_publish] = _SpanTemplate(task_name, is_publish)
+    return template
 
 
 def attach_span(task, task_id, span, is_publish=False):
@@ -97,16 +155,15 @@ def attach_span(task, task_id, span, is_publish=False):
 def detach_span(task, task_id, is_publish=False):
     """Helper to remove a `Span` in a Celery task when it's propagated.
     This function handles tasks where the `Span` is not attached.
+
+    Return the detached `Span`, if any.
     """
     weak_dict = getattr(task, CTX_KEY, None)
     if weak_dict is None:
-        return
+        return None
 
     # DEV: See note in `attach_span` for key info
-    try:
-        del weak_dict[(task_id, is_publish)]
-    except KeyError:
-        pass
+    return weak_dict.pop((task_id, is_publish), None)
 
 
 def retrieve_span(task, task_id, is_publish=False):
@@ -8,6 +8,10 @@ import six
 from ddtrace import config
 
 from ...constants import ANALYTICS_SAMPLE_RATE_KEY
+from ...constants import MANUAL_DROP_KEY
+from ...constants import MANUAL_KEEP_KEY
+from ...constants import SERVICE_KEY
+from ...constants import SERVICE_VERSION_KEY
 from ...constants import SPAN_MEASURED_KEY
 from ...ext import SpanTypes
 from ...ext import sql
@@ -17,6 +21,7 @@ from ...internal.utils import ArgumentError
 from ...internal.utils import get_argument_value
 from ...pin import Pin
 from ...settings import _database_monitoring
+from ...span import Span
 from ...vendor import wrapt
 from ..trace_utils import ext_service
 from ..trace_utils import iswrapped
@@ -24,6 +29,8 @@ from ..trace_utils import iswrapped
 
 if TYPE_CHECKING:
     from typing import Any
+    from typing import List
+    from typing import Optional
     from typing import Tuple
 
 
@@ -40,6 +47,49 @@ config._add(
 )
 
 
+# Tags which are not only stored in the meta of a span
+_SPAN_TAGS = frozenset([MANUAL_DROP_KEY, MANUAL_KEEP_KEY, SERVICE_KEY, SERVICE_VERSION_KEY])
+
+
+class _SpanTemplate(object):
+    """The service, tags and metrics of the spans of a cursor.
+
+    They only depend on the pin and on the integration configuration, so they are computed once and applied in bulk
+    to each span.
+    """
+
+    __slots__ = ["pin", "pin_config_version", "config_version", "service", "tags", "meta", "metrics"]
+
+    def __init__(self, pin, cfg, measured, analytics):
+        # type: (Pin, Any, bool, bool) -> None
+        self.pin = pin
+        self.pin_config_version = getattr(pin._config, "_version", None)
+        self.config_version = getattr(cfg, "_version", None)
+        self.service = ext_service(pin, cfg)
+
+        # Let a span convert the tags to meta and metrics
+        span = Span(None)
+        if measured:
+            span.set_tag(SPAN_MEASURED_KEY)
+        # Tags that change the span itself, and not only its meta, are set on each span
+        self.tags = pin.tags if pin.tags and not _SPAN_TAGS.isdisjoint(pin.tags) else None
+        if self.tags is None:
+            span.set_tags(pin.tags)
+        if analytics:
+            span.set_tag(ANALYTICS_SAMPLE_RATE_KEY, cfg.get_analytics_sample_rate())
+        self.meta = span._meta
+        self.metrics = span._metrics
+
+    def apply(self, span):
+        # type: (Span) -> None
+        if self.tags is not None:
+            span.set_tags(self.tags)
+        if self.meta:
+            span._meta.update(self.meta)
+        if self.metrics:
+            span._metrics.update(self.metrics)
+
+
 class TracedCursor(wrapt.ObjectProxy):
     """TracedCursor wraps a psql cursor and traces its queries."""
 
@@ -56,6 +106,8 @@ class TracedCursor(wrapt.ObjectProxy):
         self._self_last_execute_operation = None
         self._self_config = cfg or config.dbapi2
         self._self_dbm_propagation_supported = getattr(self._self_config, "_dbm_propagation_supported", False)
+        # The templates of the measured and non measured spans
+        self._self_span_templates = [None, None]  # type: List[Optional[_SpanTemplate]]
 
     def __iter__(self):
         return self.__wrapped__.__iter__()
@@ -84,22 +136,14 @@ class TracedCursor(wrapt.ObjectProxy):
         pin = Pin.get_from(self)
         if not pin or not pin.enabled():
             return method(*args, **kwargs)
-        measured = name == self._self_datadog_name
+        template = self._get_span_template(pin, name == self._self_datadog_name)
 
-        with pin.tracer.trace(
-            name, service=ext_service(pin, self._self_config), resource=resource, span_type=SpanTypes.SQL
-        ) as s:
-            if measured:
-                s.set_tag(SPAN_MEASURED_KEY)
+        with pin.tracer.trace(name, service=template.service, resource=resource, span_type=SpanTypes.SQL) as s:
             # No reason to tag the query since it is set as the resource by the agent. See:
             # https://github.com/DataDog/datadog-trace-agent/blob/bda1ebbf170dd8c5879be993bdd4dbae70d10fda/obfuscate/sql.go#L232
-            s.set_tags(pin.tags)
+            template.apply(s)
             s.set_tags(extra_tags)
 
-            # set analytics sample rate if enabled but only for non-FetchTracedCursor
-            if not isinstance(self, FetchTracedCursor):
-                s.set_tag(ANALYTICS_SAMPLE_RATE_KEY, self._self_config.get_analytics_sample_rate())
-
             if dbm_operation:
                 args = self._propagate_dbm_context(s, args)
 
@@ -109,6 +153,23 @@ class TracedCursor(wrapt.ObjectProxy):
                 # Try to fetch custom properties that were passed by the specific Database implementation
                 self._set_post_execute_tags(s)
 
+    def _get_span_template(self, pin, measured):
+        # type: (Pin, bool) -> _SpanTemplate
+        """Return the template of the spans, computed again when the pin or the configuration change."""
+        templates = self._self_span_templates
+        template = templates[measured]
+        if (
+            template is None
+            or template.pin is not pin
+            or template.pin_config_version != getattr(pin._config, "_version", None)
+            or template.config_version != getattr(self._self_config, "_version", None)
+        ):
+            # set analytics sample rate if enabled but only for non-FetchTracedCursor
+            template = templates[measured] = _SpanTemplate(
+                pin, self._self_config, measured, not isinstance(self, FetchTracedCursor)
+            )
+        return template
+
     def executemany(self, query, *args, **kwargs):
         """Wraps the cursor.executemany method"""
         self._self_last_execute_operation = query
@@ -94,6 +94,17 @@ Configuration
 
    Default: ``True``
 
+.. py:data:: ddtrace.config.django['aggregate_middleware']
+
+   Whether to time middleware without creating a span for each middleware hook.
+   The time spent in each hook is instead added, in seconds, to the
+   ``django.middleware.duration.<middleware path>.<hook>`` metric of the request
+   span, which makes the traces smaller and cheaper to create.
+
+   Can also be enabled with the ``DD_DJANGO_AGGREGATE_MIDDLEWARE`` environment variable.
+
+   Default: ``False``
+
 .. py:data:: ddtrace.config.django['instrument_templates']
 
    Whether or not to instrument template rendering.
@@ -9,7 +9,6 @@ specific Django apps like Django Rest Framework (DRF).
 from inspect import getmro
 from inspect import isclass
 from inspect import isfunction
-import os
 import sys
 
 from ddtrace import Pin
@@ -22,7 +21,6 @@ from ddtrace.ext import http
 from ddtrace.ext import sql as sqlx
 from ddtrace.internal.compat import maybe_stringify
 from ddtrace.internal.logger import get_logger
-from ddtrace.internal.utils.formats import asbool
 from ddtrace.settings.integration import IntegrationConfig
 from ddtrace.vendor import wrapt
 
@@ -33,31 +31,6 @@ from ...internal.utils import get_argument_value
 
 log = get_logger(__name__)
 
-config._add(
-    "django",
-    dict(
-        _default_service="django",
-        cache_service_name=os.getenv("DD_DJANGO_CACHE_SERVICE_NAME", default="django"),
-        database_service_name_prefix=os.getenv("DD_DJANGO_DATABASE_SERVICE_NAME_PREFIX", default=""),
-        database_service_name=os.getenv("DD_DJANGO_DATABASE_SERVICE_NAME", default=""),
-        trace_fetch_methods=asbool(os.getenv("DD_DJANGO_TRACE_FETCH_METHODS", default=False)),
-        distributed_tracing_enabled=True,
-        instrument_middleware=asbool(os.getenv("DD_DJANGO_INSTRUMENT_MIDDLEWARE", default=True)),
-        instrument_templates=asbool(os.getenv("DD_DJANGO_INSTRUMENT_TEMPLATES", default=True)),
-        instrument_databases=asbool(os.getenv("DD_DJANGO_INSTRUMENT_DATABASES", default=True)),
-        instrument_caches=asbool(os.getenv("DD_DJANGO_INSTRUMENT_CACHES", default=True)),
-        analytics_enabled=None,  # None allows the value to be overridden by the global config
-        analytics_sample_rate=None,
-        trace_query_string=None,  # Default to global config
-        include_user_name=asbool(os.getenv("DD_DJANGO_INCLUDE_USER_NAME", default=True)),
-        use_handler_with_url_name_resource_format=asbool(
-            os.getenv("DD_DJANGO_USE_HANDLER_WITH_URL_NAME_RESOURCE_FORMAT", default=False)
-        ),
-        use_handler_resource_format=asbool(os.getenv("DD_DJANGO_USE_HANDLER_RESOURCE_FORMAT", default=False)),
-        use_legacy_resource_format=asbool(os.getenv("DD_DJANGO_USE_LEGACY_RESOURCE_FORMAT", default=False)),
-    ),
-)
-
 
 def patch_conn(django, conn):
     def cursor(django, pin, func, instance, args, kwargs):
@@ -238,6 +211,22 @@ def traced_process_exception(django, name, resource=None):
     return trace_utils.with_traced_module(wrapped)(django)
 
 
+def timed_func(django, metric):
+    """Returns a function to time Django functions with a metric on the root span instead of a span."""
+
+    def wrapped(django, pin, func, instance, args, kwargs):
+        return trace_utils._timed_call(pin.tracer, metric, func, args, kwargs)
+
+    return trace_utils.with_traced_module(wrapped)(django)
+
+
+def traced_middleware(django, resource, aggregate=False):
+    """Returns a function to trace a Django middleware hook, or to time it if ``aggregate`` is set."""
+    if aggregate:
+        return timed_func(django, "django.middleware.duration." + resource)
+    return traced_func(django, "django.middleware", resource=resource)
+
+
 @trace_utils.with_traced_module
 def traced_load_middleware(django, pin, func, instance, args, kwargs):
     """Patches django.core.handlers.base.BaseHandler.load_middleware to instrument all middlewares."""
@@ -248,6 +237,8 @@ def traced_load_middleware(django, pin, func, instance, args, kwargs):
     if getattr(django.conf.settings, "MIDDLEWARE_CLASSES", None):
         settings_middleware += django.conf.settings.MIDDLEWARE_CLASSES
 
+    aggregate = config.django.aggregate_middleware
+
     # Iterate over each middleware provided in settings.py
     # Each middleware can either be a function or a class
     for mw_path in settings_middleware:
@@ -271,10 +262,7 @@ def traced_load_middleware(django, pin, func, instance, args, kwargs):
                     # r is the middleware handler function returned from the factory
                     r = func(*args, **kwargs)
                     if r:
-                        return wrapt.FunctionWrapper(
-                            r,
-                            traced_func(django, "django.middleware", resource=resource),
-                        )
+                        return wrapt.FunctionWrapper(r, traced_middleware(django, resource, aggregate))
                     # If r is an empty middleware function (i.e. returns None), don't wrap since
                     # NoneType cannot be called
                     else:
@@ -294,15 +282,16 @@ def traced_load_middleware(django, pin, func, instance, args, kwargs):
                 "__call__",
             ]:
                 if hasattr(mw, hook) and not trace_utils.iswrapped(mw, hook):
-                    trace_utils.wrap(
-                        mw, hook, traced_func(django, "django.middleware", resource=mw_path + ".{0}".format(hook))
-                    )
+                    trace_utils.wrap(mw, hook, traced_middleware(django, mw_path + ".{0}".format(hook), aggregate))
             # Do a little extra for `process_exception`
             if hasattr(mw, "process_exception") and not trace_utils.iswrapped(mw, "process_exception"):
                 res = mw_path + ".{0}".format("process_exception")
-                trace_utils.wrap(
-                    mw, "process_exception", traced_process_exception(django, "django.middleware", resource=res)
-                )
+                if aggregate:
+                    trace_utils.wrap(mw, "process_exception", traced_middleware(django, res, aggregate))
+                else:
+                    trace_utils.wrap(
+                        mw, "process_exception", traced_process_exception(django, "django.middleware", resource=res)
+                    )
 
     return func(*args, **kwargs)
 
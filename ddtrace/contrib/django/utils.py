@@ -3,6 +3,7 @@ from typing import Any
 from typing import Dict
 from typing import List
 from typing import Text
+from typing import Tuple
 from typing import Union
 
 import django
@@ -19,6 +20,7 @@ from ddtrace.contrib import func_name
 from ddtrace.ext import SpanTypes
 from ddtrace.ext import user as _user
 from ddtrace.propagation._utils import from_wsgi_header
+from ddtrace.span import Span
 
 from .. import trace_utils
 from ...internal.logger import get_logger
@@ -173,9 +175,52 @@ def get_request_uri(request):
     return "".join((urlparts["scheme"], "://", urlparts["netloc"], urlparts["path"]))
 
 
+def _build_resolver_tags(key):
+    # type: (Tuple[Any, ...]) -> Tuple[Text, Dict[str, Text]]
+    """Return the resource name and the tags of the requests matching a URL pattern."""
+    method, func, route, url_name, view_name, namespaces, app_names, _, _ = key
+    handler = func_name(func)
+    resource = method
+
+    # Let a span convert the tags to text
+    span = Span(None)
+    if config.django.use_handler_resource_format:
+        resource = " ".join((method, handler))
+    elif config.django.use_legacy_resource_format:
+        resource = handler
+    else:
+        # In Django >= 2.2.0 we can access the original route or regex pattern
+        # TODO: Validate if `resolver.pattern.regex.pattern` is available on django<2.2
+        if DJANGO22:
+            if route:
+                resource = " ".join((method, route))
+                span.set_tag_str("http.route", route)
+        else:
+            if config.django.use_handler_with_url_name_resource_format:
+                # Append url name in order to distinguish different routes of the same ViewSet
+                if url_name:
+                    handler = ".".join([handler, url_name])
+
+            resource = " ".join((method, handler))
+
+    span.set_tag_str("django.view", view_name)
+    set_tag_array(span, "django.namespace", namespaces)
+    set_tag_array(span, "django.app", app_names)
+
+    return resource, span._meta
+
+
+# The configuration, the resource and the tags of the requests, by matched URL pattern, request method and
+# configuration version
+# DEV: They only depend on the key, so they are computed once per route.
+_RESOLVER_TAGS = {}  # type: Dict[Tuple[Any, ...], Tuple[Any, Text, Dict[str, Text]]]
+_RESOLVER_TAGS_MAX_SIZE = 1024
+
+
 def _set_resolver_tags(pin, span, request):
     # Default to just the HTTP method when we cannot determine a reasonable resource
     resource = request.method
+    django_config = config.django
 
     try:
         # Get resolver match result and build resource name pieces
@@ -184,36 +229,32 @@ def _set_resolver_tags(pin, span, request):
             # The request quite likely failed (e.g. 404) so we do the resolution anyway.
             resolver = get_resolver(getattr(request, "urlconf", None))
             resolver_match = resolver.resolve(request.path_info)
-        handler = func_name(resolver_match[0])
-
-        if config.django.use_handler_resource_format:
-            resource = " ".join((request.method, handler))
-        elif config.django.use_legacy_resource_format:
-            resource = handler
-        else:
-            # In Django >= 2.2.0 we can access the original route or regex pattern
-            # TODO: Validate if `resolver.pattern.regex.pattern` is available on django<2.2
-            if DJANGO22:
-                # Determine the resolver and resource name for this request
-                route = get_django_2_route(request, resolver_match)
-                if route:
-                    resource = " ".join((request.method, route))
-                    span.set_tag_str("http.route", route)
-            else:
-                if config.django.use_handler_with_url_name_resource_format:
-                    # Append url name in order to distinguish different routes of the same ViewSet
-                    url_name = resolver_match.url_name
-                    if url_name:
-                        handler = ".".join([handler, url_name])
 
-                resource = " ".join((request.method, handler))
-
-        span.set_tag_str("django.view", resolver_match.view_name)
-        set_tag_array(span, "django.namespace", resolver_match.namespaces)
-
-        # Django >= 2.0.0
-        if hasattr(resolver_match, "app_names"):
-            set_tag_array(span, "django.app", resolver_match.app_names)
+        key = (
+            request.method,
+            resolver_match.func,
+            get_django_2_route(request, resolver_match) if DJANGO22 else None,
+            resolver_match.url_name,
+            resolver_match.view_name,
+            tuple(resolver_match.namespaces),
+            # Django >= 2.0.0
+            tuple(getattr(resolver_match, "app_names", ())),
+            # DEV: The configuration can be replaced by a new one with the same version
+            id(django_config),
+            django_config._version,
+        )
+        try:
+            cached = _RESOLVER_TAGS.get(key)
+            # DEV: The id of a replaced configuration can be reused by a new one
+            if cached is None or cached[0] is not django_config:
+                if len(_RESOLVER_TAGS) >= _RESOLVER_TAGS_MAX_SIZE:
+                    _RESOLVER_TAGS.clear()
+                cached = _RESOLVER_TAGS[key] = (django_config,) + _build_resolver_tags(key)
+            _, resource, tags = cached
+        except TypeError:
+            # The view is not hashable
+            resource, tags = _build_resolver_tags(key)
+        span._meta.update(tags)
 
     except Resolver404:
         # Normalize all 404 requests into a single resource name
@@ -15,14 +15,6 @@ from ...pin import Pin
 from .quantize import quantize
 
 
-config._add(
-    "elasticsearch",
-    {
-        "_default_service": "elasticsearch",
-    },
-)
-
-
 def _es_modules():
     module_names = (
         "elasticsearch",
@@ -1,12 +1,9 @@
-import os
-
 import falcon
 
 from ddtrace import config
 from ddtrace import tracer
 from ddtrace.vendor import wrapt
 
-from ...internal.utils.formats import asbool
 from ...internal.utils.version import parse_version
 from .middleware import TraceMiddleware
 
@@ -14,14 +11,6 @@ from .middleware import TraceMiddleware
 FALCON_VERSION = parse_version(falcon.__version__)
 
 
-config._add(
-    "falcon",
-    dict(
-        distributed_tracing=asbool(os.getenv("DD_FALCON_DISTRIBUTED_TRACING", default=True)),
-    ),
-)
-
-
 def patch():
     """
     Patch falcon.API to include contrib.falcon.TraceMiddleware
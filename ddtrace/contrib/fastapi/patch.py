@@ -17,16 +17,6 @@ from ddtrace.vendor.wrapt import wrap_function_wrapper as _w
 
 log = get_logger(__name__)
 
-config._add(
-    "fastapi",
-    dict(
-        _default_service="fastapi",
-        request_span_name="fastapi.request",
-        distributed_tracing=True,
-        aggregate_resources=True,
-    ),
-)
-
 
 @removals.remove(removal_version="2.0.0", category=DDTraceDeprecationWarning)
 def span_modifier(span, scope):
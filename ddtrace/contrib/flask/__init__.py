@@ -63,6 +63,18 @@ Configuration
 
    Default: ``True``
 
+.. py:data:: ddtrace.config.flask['aggregate_hooks']
+
+   Whether to time Flask hooks and signal receivers without creating a span for
+   each of them. The time spent in each hook is instead added, in seconds, to the
+   ``flask.hook.duration.<function name>`` metric of the request span, and the
+   time spent in each signal receiver to the
+   ``flask.signal.duration.<signal>.<function name>`` metric.
+
+   Can also be enabled with the ``DD_FLASK_AGGREGATE_HOOKS`` environment variable.
+
+   Default: ``False``
+
 
 Example::
 
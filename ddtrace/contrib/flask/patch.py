@@ -27,11 +27,13 @@ from ...ext import SpanTypes
 from ...internal.compat import maybe_stringify
 from ...internal.logger import get_logger
 from ...internal.utils import get_argument_value
+from ...internal.utils.importlib import func_name
 from ...internal.utils.version import parse_version
 from ..trace_utils import unwrap as _u
 from .helpers import get_current_app
 from .helpers import simple_tracer
 from .helpers import with_instance_pin
+from .wrappers import time_function
 from .wrappers import wrap_function
 from .wrappers import wrap_signal
 
@@ -51,19 +53,6 @@ FLASK_URL_RULE = "flask.url_rule"
 FLASK_VERSION = "flask.version"
 _BODY_METHODS = {"POST", "PUT", "DELETE", "PATCH"}
 
-# Configure default configuration
-config._add(
-    "flask",
-    dict(
-        # Flask service configuration
-        _default_service="flask",
-        collect_view_args=True,
-        distributed_tracing_enabled=True,
-        template_default_name="<memory>",
-        trace_signals=True,
-    ),
-)
-
 
 if _HAS_JSON_MIXIN:
 
@@ -473,6 +462,8 @@ def traced_endpoint(wrapped, instance, args, kwargs):
 def traced_flask_hook(wrapped, instance, args, kwargs):
     """Wrapper for hook functions (before_request, after_request, etc) are properly traced"""
     func = get_argument_value(args, kwargs, 0, "f")
+    if config.flask.aggregate_hooks:
+        return wrapped(time_function(instance, func, "flask.hook.duration." + func_name(func)))
     return wrapped(wrap_function(instance, func))
 
 
@@ -573,6 +564,10 @@ def traced_signal_receivers_for(signal):
         app = None
         if isinstance(sender, flask.Flask):
             app = sender
+        if config.flask.aggregate_hooks:
+            for receiver in wrapped(*args, **kwargs):
+                yield time_function(app, receiver, "flask.signal.duration.%s.%s" % (signal, func_name(receiver)))
+            return
         for receiver in wrapped(*args, **kwargs):
             yield wrap_signal(app, signal, receiver)
 
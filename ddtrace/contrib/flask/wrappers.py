@@ -46,3 +46,20 @@ def wrap_signal(app, signal, func):
             return wrapped(*args, **kwargs)
 
     return trace_func(func)
+
+
+def time_function(instance, func, metric):
+    """
+    Helper used to time flask.app.Flask hooks and signal handlers without creating a span
+
+    The time spent in the function is added to the ``metric`` metric of the request span
+    """
+
+    @function_wrapper
+    def time_func(wrapped, _instance, args, kwargs):
+        pin = Pin._find(wrapped, _instance, instance, get_current_app())
+        if not pin or not pin.enabled():
+            return wrapped(*args, **kwargs)
+        return trace_utils._timed_call(pin.tracer, metric, wrapped, args, kwargs)
+
+    return time_func(func)
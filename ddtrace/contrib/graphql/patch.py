@@ -1,4 +1,3 @@
-import os
 import re
 import sys
 from typing import TYPE_CHECKING
@@ -29,7 +28,6 @@ from ddtrace.internal.compat import stringify
 from ddtrace.internal.utils import ArgumentError
 from ddtrace.internal.utils import get_argument_value
 from ddtrace.internal.utils import set_argument_value
-from ddtrace.internal.utils.formats import asbool
 from ddtrace.internal.utils.version import parse_version
 from ddtrace.internal.wrapping import unwrap
 from ddtrace.internal.wrapping import wrap
@@ -47,14 +45,6 @@ else:
     from graphql.language.ast import DocumentNode as Document
 
 
-config._add(
-    "graphql",
-    dict(
-        _default_service="graphql",
-        resolvers_enabled=asbool(os.getenv("DD_TRACE_GRAPHQL_RESOLVERS_ENABLED", default=False)),
-    ),
-)
-
 _GRAPHQL_SOURCE = "graphql.source"
 _GRAPHQL_OPERATION_TYPE = "graphql.operation.type"
 _GRAPHQL_OPERATION_NAME = "graphql.operation.name"
@@ -37,6 +37,21 @@ Global Configuration
 
    Default: ``"grpc-server"``
 
+.. py:data:: ddtrace.config.grpc["stream_metrics"]
+
+   Whether to record the number of messages, the number of bytes and the
+   intervals between the messages of streaming RPCs on the client and server
+   spans, under the ``grpc.stream.sent.*`` and ``grpc.stream.received.*``
+   metrics. The counters are only set on the spans when the stream ends. The
+   50th and 99th percentiles of the intervals are the upper bounds of power of
+   two buckets of nanoseconds.
+
+   The option is also available for the ``grpc_server``, ``grpc_aio_client``
+   and ``grpc_aio_server`` configurations. It can be set for all of them with
+   the ``DD_GRPC_STREAM_METRICS`` environment variable.
+
+   Default: ``False``
+
 
 Instance Configuration
 ~~~~~~~~~~~~~~~~~~~~~~
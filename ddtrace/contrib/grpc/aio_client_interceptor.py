@@ -1,6 +1,7 @@
 import asyncio
 import functools
 from typing import Callable
+from typing import Optional
 from typing import Tuple
 from typing import Union
 
@@ -36,6 +37,24 @@ def create_aio_client_interceptors(pin, host, port):
     )
 
 
+async def _count_messages(request_iterator, stats):
+    # type: (RequestIterableType, utils._StreamStats) -> RequestIterableType
+    add_message = stats.add_message
+    async for message in request_iterator:
+        add_message(message)
+        yield message
+
+
+def _count_request_messages(request_iterator, stats):
+    # type: (Optional[RequestIterableType], utils._StreamStats) -> Optional[RequestIterableType]
+    # DEV: the requests can also be sent with call.write() in which case they are not counted
+    if request_iterator is None:
+        return None
+    if hasattr(request_iterator, "__aiter__"):
+        return _count_messages(request_iterator, stats)
+    return utils.count_messages(request_iterator, stats)
+
+
 def _done_callback(span, code, details):
     # type: (Span, grpc.StatusCode, str) -> Callable[[aio.Call], None]
     def func(call):
@@ -137,11 +156,23 @@ class _ClientInterceptor:
         self,
         call,  # type: Union[aio.StreamStreamCall, aio.UnaryStreamCall]
         span,  # type: Span
+        sent=None,  # type: Optional[utils._StreamStats]
     ):
         # type: (...) -> ResponseIterableType
+        received = None
         try:
-            async for response in call:
-                yield response
+            if config.grpc_aio_client.stream_metrics:
+                received = utils._StreamStats()
+                add_message = received.add_message
+                try:
+                    async for response in call:
+                        add_message(response)
+                        yield response
+                finally:
+                    utils.set_stream_metrics(span, received, sent)
+            else:
+                async for response in call:
+                    yield response
             code = await call.code()
             details = await call.details()
             # NOTE: The callback is registered after the iteration is done,
@@ -163,12 +194,14 @@ class _ClientInterceptor:
         self,
         continuation,  # type: Callable[[], Union[aio.StreamUnaryCall, aio.UnaryUnaryCall]]
         span,  # type: Span
+        sent=None,  # type: Optional[utils._StreamStats]
     ):
         # type: (...) -> Union[aio.StreamUnaryCall, aio.UnaryUnaryCall]
         try:
             call = await continuation()
             code = await call.code()
             details = await call.details()
+            utils.set_stream_metrics(span, None, sent)
             # NOTE: As both `code` and `details` are available after the RPC is done (= we get `call` object),
             # and we can't call awaitable functions inside the non-async callback,
             # there is no other way but to register the callback here.
@@ -178,6 +211,7 @@ class _ClientInterceptor:
             # NOTE: `AioRpcError` is raised in `await continuation(...)`
             # and `call` object is not assigned yet in that case.
             # So we can't handle the error in done callbacks.
+            utils.set_stream_metrics(span, None, sent)
             _handle_rpc_error(span, rpc_error)
             raise
 
@@ -226,8 +260,12 @@ class _StreamUnaryClientInterceptor(aio.StreamUnaryClientInterceptor, _ClientInt
             constants.GRPC_METHOD_KIND_CLIENT_STREAMING,
             client_call_details,
         )
+        sent = None
+        if config.grpc_aio_client.stream_metrics:
+            sent = utils._StreamStats()
+            request_iterator = _count_request_messages(request_iterator, sent)
         continuation_with_args = functools.partial(continuation, client_call_details, request_iterator)
-        return await self._wrap_unary_response(continuation_with_args, span)
+        return await self._wrap_unary_response(continuation_with_args, span, sent)
 
 
 class _StreamStreamClientInterceptor(aio.StreamStreamClientInterceptor, _ClientInterceptor):
@@ -242,5 +280,9 @@ class _StreamStreamClientInterceptor(aio.StreamStreamClientInterceptor, _ClientI
             constants.GRPC_METHOD_KIND_BIDI_STREAMING,
             client_call_details,
         )
+        sent = None
+        if config.grpc_aio_client.stream_metrics:
+            sent = utils._StreamStats()
+            request_iterator = _count_request_messages(request_iterator, sent)
         call = await continuation(client_call_details, request_iterator)
-        return self._wrap_stream_response(call, span)
+        return self._wrap_stream_response(call, span, sent)
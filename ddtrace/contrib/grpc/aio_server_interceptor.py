@@ -15,7 +15,6 @@ from grpc.aio._typing import ResponseType
 from ddtrace import Pin
 from ddtrace import Span
 from ddtrace import config
-from ddtrace.vendor import wrapt
 
 from .. import trace_utils
 from ...constants import ANALYTICS_SAMPLE_RATE_KEY
@@ -25,6 +24,7 @@ from ...constants import SPAN_MEASURED_KEY
 from ...ext import SpanTypes
 from ...internal.compat import to_unicode
 from ..grpc import constants
+from ..grpc.utils import _StreamMetricsMethodHandler
 from ..grpc.utils import set_grpc_method_meta
 
 
@@ -91,6 +91,7 @@ async def _wrap_aio_stream_response(
     request_or_iterator,  # type: Union[RequestIterableType, RequestType]
     servicer_context,  # type: aio.ServicerContext
     span,  # type: Span
+    method_handler,  # type: _StreamMetricsMethodHandler
 ):
     # type: (...) -> ResponseIterableType
     try:
@@ -102,6 +103,7 @@ async def _wrap_aio_stream_response(
         _handle_server_exception(servicer_context, span)
         raise
     finally:
+        method_handler._set_stream_metrics(span)
         span.finish()
 
 
@@ -110,6 +112,7 @@ async def _wrap_aio_unary_response(
     request_or_iterator,  # type: Union[RequestIterableType, RequestType]
     servicer_context,  # type: aio.ServicerContext
     span,  # type: Span
+    method_handler,  # type: _StreamMetricsMethodHandler
 ):
     # type: (...) -> ResponseType
     try:
@@ -119,6 +122,7 @@ async def _wrap_aio_unary_response(
         _handle_server_exception(servicer_context, span)
         raise
     finally:
+        method_handler._set_stream_metrics(span)
         span.finish()
 
 
@@ -127,6 +131,7 @@ def _wrap_stream_response(
     request_or_iterator,  # type: Any
     servicer_context,  # type: grpc.ServicerContext
     span,  # type: Span
+    method_handler,  # type: _StreamMetricsMethodHandler
 ):
     # type: (...) -> Iterable[Any]
     try:
@@ -137,6 +142,7 @@ def _wrap_stream_response(
         _handle_server_exception(servicer_context, span)
         raise
     finally:
+        method_handler._set_stream_metrics(span)
         span.finish()
 
 
@@ -145,6 +151,7 @@ def _wrap_unary_response(
     request_or_iterator,  # type: Any
     servicer_context,  # type: grpc.ServicerContext
     span,  # type: Span
+    method_handler,  # type: _StreamMetricsMethodHandler
 ):
     # type: (...) -> Any
     try:
@@ -154,6 +161,7 @@ def _wrap_unary_response(
         _handle_server_exception(servicer_context, span)
         raise
     finally:
+        method_handler._set_stream_metrics(span)
         span.finish()
 
 
@@ -185,66 +193,64 @@ def _create_span(pin, handler_call_details, method_kind):
     return span
 
 
-class _TracedAioRpcMethodHandler(wrapt.ObjectProxy):
+class _TracedAioRpcMethodHandler(_StreamMetricsMethodHandler):
     def __init__(self, pin, handler_call_details, wrapped):
         # type: (Pin, grpc.HandlerCallDetails, grpc.RpcMethodHandler) -> None
-        super(_TracedAioRpcMethodHandler, self).__init__(wrapped)
+        super(_TracedAioRpcMethodHandler, self).__init__(wrapped, config.grpc_aio_server.stream_metrics)
         self._pin = pin
         self._handler_call_details = handler_call_details
 
     async def unary_unary(self, request, context):
         # type: (RequestType, aio.ServicerContext) -> ResponseType
         span = _create_span(self._pin, self._handler_call_details, constants.GRPC_METHOD_KIND_UNARY)
-        return await _wrap_aio_unary_response(self.__wrapped__.unary_unary, request, context, span)
+        return await _wrap_aio_unary_response(self.__wrapped__.unary_unary, request, context, span, self)
 
     async def unary_stream(self, request, context):
         # type: (RequestType, aio.ServicerContext) -> ResponseIterableType
         span = _create_span(self._pin, self._handler_call_details, constants.GRPC_METHOD_KIND_SERVER_STREAMING)
-        async for response in _wrap_aio_stream_response(self.__wrapped__.unary_stream, request, context, span):
+        async for response in _wrap_aio_stream_response(self.__wrapped__.unary_stream, request, context, span, self):
             yield response
 
     async def stream_unary(self, request_iterator, context):
         # type: (RequestIterableType, aio.ServicerContext) -> ResponseType
         span = _create_span(self._pin, self._handler_call_details, constants.GRPC_METHOD_KIND_CLIENT_STREAMING)
-        return await _wrap_aio_unary_response(self.__wrapped__.stream_unary, request_iterator, context, span)
+        return await _wrap_aio_unary_response(self.__wrapped__.stream_unary, request_iterator, context, span, self)
 
     async def stream_stream(self, request_iterator, context):
         # type: (RequestIterableType, aio.ServicerContext) -> ResponseIterableType
         span = _create_span(self._pin, self._handler_call_details, constants.GRPC_METHOD_KIND_BIDI_STREAMING)
         async for response in _wrap_aio_stream_response(
-            self.__wrapped__.stream_stream, request_iterator, context, span
+            self.__wrapped__.stream_stream, request_iterator, context, span, self
         ):
             yield response
 
 
-class _TracedRpcMethodHandler(wrapt.ObjectProxy):
+class _TracedRpcMethodHandler(_StreamMetricsMethodHandler):
     def __init__(self, pin, handler_call_details, wrapped):
         # type: (Pin, grpc.HandlerCallDetails, grpc.RpcMethodHandler) -> None
-        super(_TracedRpcMethodHandler, self).__init__(wrapped)
+        super(_TracedRpcMethodHandler, self).__init__(wrapped, config.grpc_aio_server.stream_metrics)
         self._pin = pin
         self._handler_call_details = handler_call_details
 
     def unary_unary(self, request, context):
         # type: (Any, grpc.ServicerContext) -> Any
         span = _create_span(self._pin, self._handler_call_details, constants.GRPC_METHOD_KIND_UNARY)
-        return _wrap_unary_response(self.__wrapped__.unary_unary, request, context, span)
+        return _wrap_unary_response(self.__wrapped__.unary_unary, request, context, span, self)
 
     def unary_stream(self, request, context):
         # type: (Any, grpc.ServicerContext) -> Iterable[Any]
         span = _create_span(self._pin, self._handler_call_details, constants.GRPC_METHOD_KIND_SERVER_STREAMING)
-        for response in _wrap_stream_response(self.__wrapped__.unary_stream, request, context, span):
-            yield response
+        return _wrap_stream_response(self.__wrapped__.unary_stream, request, context, span, self)
 
     def stream_unary(self, request_iterator, context):
         # type: (Iterable[Any], grpc.ServicerContext) -> Any
         span = _create_span(self._pin, self._handler_call_details, constants.GRPC_METHOD_KIND_CLIENT_STREAMING)
-        return _wrap_unary_response(self.__wrapped__.stream_unary, request_iterator, context, span)
+        return _wrap_unary_response(self.__wrapped__.stream_unary, request_iterator, context, span, self)
 
     def stream_stream(self, request_iterator, context):
         # type: (Iterable[Any], grpc.ServicerContext) -> Iterable[Any]
         span = _create_span(self._pin, self._handler_call_details, constants.GRPC_METHOD_KIND_BIDI_STREAMING)
-        for response in _wrap_stream_response(self.__wrapped__.stream_stream, request_iterator, context, span):
-            yield response
+        return _wrap_stream_response(self.__wrapped__.stream_stream, request_iterator, context, span, self)
 
 
 class _ServerInterceptor(aio.ServerInterceptor):
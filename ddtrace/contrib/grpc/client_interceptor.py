@@ -1,9 +1,13 @@
 import collections
+import threading
+import time
 
 import grpc
 
 from ddtrace import config
 from ddtrace.ext import SpanTypes
+from ddtrace.internal import forksafe
+from ddtrace.internal.compat import monotonic
 from ddtrace.internal.compat import stringify
 from ddtrace.internal.compat import to_unicode
 from ddtrace.vendor import wrapt
@@ -22,6 +26,10 @@ from ...propagation.http import HTTPPropagator
 
 log = get_logger(__name__)
 
+# Seconds given to the application to consume the responses received once the
+# RPC has ended, before the span is finished with the messages counted so far
+_STREAM_METRICS_GRACE_PERIOD = 1.0
+
 # DEV: Follows Python interceptors RFC laid out in
 # https://github.com/grpc/proposal/blob/master/L13-python-interceptors.md
 
@@ -53,7 +61,7 @@ class _ClientCallDetails(
     pass
 
 
-def _future_done_callback(span):
+def _future_done_callback(span, finish=None):
     def func(response):
         try:
             # pull out response code from gRPC response to use both for `grpc.status.code`
@@ -66,17 +74,28 @@ def _future_done_callback(span):
             if response_code != grpc.StatusCode.OK:
                 _handle_error(span, response, status_code)
         finally:
-            span.finish()
+            if finish is None:
+                span.finish()
+            else:
+                finish()
 
     return func
 
 
-def _handle_response(span, response):
+def _stream_metrics_finish(span, received, sent):
+    def finish(finish_time=None):
+        utils.set_stream_metrics(span, received, sent)
+        span.finish(finish_time)
+
+    return finish
+
+
+def _handle_response(span, response, finish=None):
     # use duck-typing to support future-like response as in the case of
     # google-api-core which has its own future base class
     # https://github.com/googleapis/python-api-core/blob/49c6755a21215bbb457b60db91bab098185b77da/google/api_core/future/base.py#L23
     if hasattr(response, "add_done_callback"):
-        response.add_done_callback(_future_done_callback(span))
+        response.add_done_callback(_future_done_callback(span, finish))
 
 
 def _handle_error(span, response_error, status_code):
@@ -153,9 +172,128 @@ class _WrappedResponseCallFuture(wrapt.ObjectProxy):
             self._span.finish()
             raise
 
-    def __next__(self):
-        return self._next()
+    __next__ = _next
+    next = __next__
+
+
+class _GracePeriodScheduler(object):
+    """Finish the response streams left unconsumed after the grace period.
+
+    A single thread serves all the RPCs. As the grace period is the same for
+    all of them, the streams are finished in the order they are scheduled.
+    """
+
+    def __init__(self):
+        self._reset()
+        forksafe.register(self._reset)
+
+    def _reset(self):
+        self._cond = threading.Condition(threading.Lock())
+        self._pending = collections.deque()
+        self._thread = None
+
+    def schedule(self, end):
+        with self._cond:
+            self._pending.append((monotonic() + _STREAM_METRICS_GRACE_PERIOD, end))
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="ddtrace.grpc.stream_metrics")
+                self._thread.daemon = True
+                self._thread.start()
+            self._cond.notify()
+
+    def _run(self):
+        while True:
+            with self._cond:
+                if not self._pending:
+                    self._cond.wait()
+                    continue
+                deadline, end = self._pending[0]
+                delay = deadline - monotonic()
+                if delay > 0:
+                    self._cond.wait(delay)
+                    continue
+                self._pending.popleft()
+            try:
+                end._finish_once()
+            except Exception:
+                log.debug("failed to finish the span of a response stream", exc_info=True)
+
+
+_grace_period_scheduler = _GracePeriodScheduler()
+
+
+class _ResponseStreamEnd(object):
+    """Finish the span of a response stream with its metrics.
+
+    The span ends with the RPC. It is finished once the iteration of the
+    responses has ended too, so that the messages received before the end of
+    the RPC but consumed after it are counted, or after a grace period with
+    the messages counted so far if the responses are not consumed.
+    """
+
+    # DEV: Kept apart from the responses iterator, which the callback registered
+    # on the call would otherwise keep alive and with it the call.
+
+    def __init__(self, finish):
+        self._finish = finish
+        self._lock = threading.Lock()
+        self._iterating = True
+        self._finished = False
+        self._finish_time = None
+
+    def _finish_once(self):
+        with self._lock:
+            if self._finished:
+                return
+            self._finished = True
+        self._finish(self._finish_time)
+
+    def end_rpc(self):
+        with self._lock:
+            self._finish_time = time.time()
+            if self._iterating:
+                # Wait for the responses received to be consumed
+                _grace_period_scheduler.schedule(self)
+                return
+        self._finish_once()
+
+    def end_iteration(self):
+        with self._lock:
+            if not self._iterating:
+                return
+            self._iterating = False
+            if self._finish_time is None:
+                # The span is finished when the RPC ends
+                return
+        self._finish_once()
+
+
+class _StreamMetricsResponseCallFuture(_WrappedResponseCallFuture):
+    """Response iterator counting the messages received."""
+
+    def __init__(self, wrapped, span, sent=None):
+        super(_WrappedResponseCallFuture, self).__init__(wrapped)
+        self._span = span
+        self._self_received = utils._StreamStats()
+        self._self_end = _ResponseStreamEnd(_stream_metrics_finish(span, self._self_received, sent))
+        _handle_response(span, wrapped, self._self_end.end_rpc)
+
+    def _next(self):
+        try:
+            response = next(self.__wrapped__)
+        except (StopIteration, grpc.RpcError):
+            # The callback registered on the call handles the status code
+            self._self_end.end_iteration()
+            raise
+        except Exception:
+            log.debug("unexpected non-grpc exception raised, closing open span", exc_info=True)
+            self._span.set_traceback()
+            self._self_end.end_iteration()
+            raise
+        self._self_received.add_message(response)
+        return response
 
+    __next__ = _next
     next = __next__
 
 
@@ -235,22 +373,28 @@ class _ClientInterceptor(
             client_call_details,
         )
         response_iterator = continuation(client_call_details, request)
-        response_iterator = _WrappedResponseCallFuture(response_iterator, span)
-        return response_iterator
+        if config.grpc.stream_metrics:
+            return _StreamMetricsResponseCallFuture(response_iterator, span)
+        return _WrappedResponseCallFuture(response_iterator, span)
 
     def intercept_stream_unary(self, continuation, client_call_details, request_iterator):
         span, client_call_details = self._intercept_client_call(
             constants.GRPC_METHOD_KIND_CLIENT_STREAMING,
             client_call_details,
         )
+        finish = None
+        if config.grpc.stream_metrics:
+            sent = utils._StreamStats()
+            request_iterator = utils.count_messages(request_iterator, sent)
+            finish = _stream_metrics_finish(span, None, sent)
         try:
             response = continuation(client_call_details, request_iterator)
-            _handle_response(span, response)
+            _handle_response(span, response, finish)
         except grpc.RpcError as rpc_error:
             # DEV: grpcio<1.18.0 grpc.RpcError is raised rather than returned as response
             # https://github.com/grpc/grpc/commit/8199aff7a66460fbc4e9a82ade2e95ef076fd8f9
             # handle as a response
-            _handle_response(span, rpc_error)
+            _handle_response(span, rpc_error, finish)
             raise
 
         return response
@@ -260,6 +404,9 @@ class _ClientInterceptor(
             constants.GRPC_METHOD_KIND_BIDI_STREAMING,
             client_call_details,
         )
+        if config.grpc.stream_metrics:
+            sent = utils._StreamStats()
+            response_iterator = continuation(client_call_details, utils.count_messages(request_iterator, sent))
+            return _StreamMetricsResponseCallFuture(response_iterator, span, sent)
         response_iterator = continuation(client_call_details, request_iterator)
-        response_iterator = _WrappedResponseCallFuture(response_iterator, span)
-        return response_iterator
+        return _WrappedResponseCallFuture(response_iterator, span)
@@ -24,3 +24,5 @@ GRPC_SERVICE_SERVER = "grpc-server"
 GRPC_AIO_SERVICE_SERVER = "grpc-aio-server"
 GRPC_SERVICE_CLIENT = "grpc-client"
 GRPC_AIO_SERVICE_CLIENT = "grpc-aio-client"
+GRPC_STREAM_SENT_PREFIX_KEY = "grpc.stream.sent."
+GRPC_STREAM_RECEIVED_PREFIX_KEY = "grpc.stream.received."
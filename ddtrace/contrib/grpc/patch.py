@@ -1,7 +1,6 @@
 import grpc
 
 from ddtrace import Pin
-from ddtrace import config
 from ddtrace.vendor.wrapt import wrap_function_wrapper as _w
 
 from . import constants
@@ -32,44 +31,6 @@ except ImportError:
     GRPC_AIO_PIN_MODULE_CLIENT = None
 
 
-config._add(
-    "grpc_server",
-    dict(
-        _default_service=constants.GRPC_SERVICE_SERVER,
-        distributed_tracing_enabled=True,
-    ),
-)
-
-
-# TODO[tbutt]: keeping name for client config unchanged to maintain backwards
-# compatibility but should change in future
-config._add(
-    "grpc",
-    dict(
-        _default_service=constants.GRPC_SERVICE_CLIENT,
-        distributed_tracing_enabled=True,
-    ),
-)
-
-
-if HAS_GRPC_AIO:
-    config._add(
-        "grpc_aio_server",
-        dict(
-            _default_service=constants.GRPC_AIO_SERVICE_SERVER,
-            distributed_tracing_enabled=True,
-        ),
-    )
-
-    config._add(
-        "grpc_aio_client",
-        dict(
-            _default_service=constants.GRPC_AIO_SERVICE_CLIENT,
-            distributed_tracing_enabled=True,
-        ),
-    )
-
-
 def patch():
     _patch_client()
     _patch_server()
@@ -2,7 +2,6 @@ import grpc
 
 from ddtrace import config
 from ddtrace.internal.compat import to_unicode
-from ddtrace.vendor import wrapt
 
 from . import constants
 from .. import trace_utils
@@ -11,6 +10,7 @@ from ...constants import ERROR_MSG
 from ...constants import ERROR_TYPE
 from ...constants import SPAN_MEASURED_KEY
 from ...ext import SpanTypes
+from .utils import _StreamMetricsMethodHandler
 from .utils import set_grpc_method_meta
 
 
@@ -42,7 +42,7 @@ def _handle_server_exception(server_context, span):
         span.set_tag_str(ERROR_TYPE, code)
 
 
-def _wrap_response_iterator(response_iterator, server_context, span):
+def _wrap_response_iterator(response_iterator, server_context, span, method_handler):
     try:
         for response in response_iterator:
             yield response
@@ -51,12 +51,13 @@ def _wrap_response_iterator(response_iterator, server_context, span):
         _handle_server_exception(server_context, span)
         raise
     finally:
+        method_handler._set_stream_metrics(span)
         span.finish()
 
 
-class _TracedRpcMethodHandler(wrapt.ObjectProxy):
+class _TracedRpcMethodHandler(_StreamMetricsMethodHandler):
     def __init__(self, pin, handler_call_details, wrapped):
-        super(_TracedRpcMethodHandler, self).__init__(wrapped)
+        super(_TracedRpcMethodHandler, self).__init__(wrapped, config.grpc_server.stream_metrics)
         self._pin = pin
         self._handler_call_details = handler_call_details
 
@@ -92,13 +93,14 @@ class _TracedRpcMethodHandler(wrapt.ObjectProxy):
             response_or_iterator = behavior(*args, **kwargs)
 
             if self.__wrapped__.response_streaming:
-                response_or_iterator = _wrap_response_iterator(response_or_iterator, server_context, span)
+                response_or_iterator = _wrap_response_iterator(response_or_iterator, server_context, span, self)
         except Exception:
             span.set_traceback()
             _handle_server_exception(server_context, span)
             raise
         finally:
             if not self.__wrapped__.response_streaming:
+                self._set_stream_metrics(span)
                 span.finish()
 
         return response_or_iterator
@@ -1,6 +1,8 @@
 import logging
 
+from ddtrace.internal.compat import monotonic_ns
 from ddtrace.internal.compat import parse
+from ddtrace.vendor import wrapt
 
 from . import constants
 
@@ -37,6 +39,148 @@ def set_grpc_method_meta(span, method, method_kind):
         span.set_tag_str(constants.GRPC_METHOD_KIND_KEY, method_kind)
 
 
+def _message_size(message):
+    try:
+        return len(message)
+    except TypeError:
+        return 0
+
+
+class _StreamStats(object):
+    """Counters of the messages sent or received by a streaming RPC.
+
+    The intervals between consecutive messages are counted in power of two
+    buckets of nanoseconds so that the memory used does not depend on the
+    number of messages; the percentiles are the upper bounds of these buckets.
+    """
+
+    __slots__ = ("messages", "bytes", "last", "max_interval", "intervals")
+
+    def __init__(self):
+        self.messages = 0
+        self.bytes = 0
+        self.last = 0
+        self.max_interval = 0
+        self.intervals = [0] * 64
+
+    def add(self, size):
+        now = monotonic_ns()
+        if self.messages:
+            interval = now - self.last
+            self.intervals[interval.bit_length()] += 1
+            if interval > self.max_interval:
+                self.max_interval = interval
+        self.last = now
+        self.messages += 1
+        self.bytes += size
+
+    def add_message(self, message):
+        try:
+            # protobuf messages
+            size = message.ByteSize()
+        except AttributeError:
+            size = _message_size(message)
+        self.add(size)
+
+    def serializer(self, serialize):
+        """Return the given response serializer counting the serialized messages."""
+        add = self.add
+
+        if serialize is None:
+
+            def _(message):
+                add(len(message))
+                return message
+
+        else:
+
+            def _(message):
+                data = serialize(message)
+                add(len(data))
+                return data
+
+        return _
+
+    def deserializer(self, deserialize):
+        """Return the given request deserializer counting the received messages."""
+        add = self.add
+
+        if deserialize is None:
+
+            def _(data):
+                add(len(data))
+                return data
+
+        else:
+
+            def _(data):
+                add(len(data))
+                return deserialize(data)
+
+        return _
+
+    def _percentile(self, percentile):
+        # type: (float) -> int
+        rank = int(round(percentile * (self.messages - 2)))
+        for bucket, count in enumerate(self.intervals):
+            rank -= count
+            if rank < 0:
+                return min((1 << bucket) - 1, self.max_interval)
+        return self.max_interval
+
+    def set_metrics(self, span, prefix):
+        """Set the message counters on the span, with their keys starting with the given prefix."""
+        span.set_metric(prefix + "messages", self.messages)
+        span.set_metric(prefix + "bytes", self.bytes)
+        if self.messages > 1:
+            span.set_metric(prefix + "interval.p50", self._percentile(0.5) / 1e9)
+            span.set_metric(prefix + "interval.p99", self._percentile(0.99) / 1e9)
+            span.set_metric(prefix + "interval.max", self.max_interval / 1e9)
+
+
+class _StreamMetricsMethodHandler(wrapt.ObjectProxy):
+    """Server method handler counting the messages of the streaming requests and responses.
+
+    The messages are counted when grpc deserializes the requests and serializes
+    the responses, so no further work is done for each message.
+    """
+
+    def __init__(self, wrapped, stream_metrics):
+        super(_StreamMetricsMethodHandler, self).__init__(wrapped)
+        self._self_received = _StreamStats() if stream_metrics and wrapped.request_streaming else None
+        self._self_sent = _StreamStats() if stream_metrics and wrapped.response_streaming else None
+
+    @property
+    def request_deserializer(self):
+        if self._self_received is None:
+            return self.__wrapped__.request_deserializer
+        return self._self_received.deserializer(self.__wrapped__.request_deserializer)
+
+    @property
+    def response_serializer(self):
+        if self._self_sent is None:
+            return self.__wrapped__.response_serializer
+        return self._self_sent.serializer(self.__wrapped__.response_serializer)
+
+    def _set_stream_metrics(self, span):
+        set_stream_metrics(span, self._self_received, self._self_sent)
+
+
+def set_stream_metrics(span, received, sent):
+    if received is not None:
+        received.set_metrics(span, constants.GRPC_STREAM_RECEIVED_PREFIX_KEY)
+    if sent is not None:
+        sent.set_metrics(span, constants.GRPC_STREAM_SENT_PREFIX_KEY)
+
+
+def count_messages(iterator, stats):
+    """Yield the messages of the given iterator, counting them with the given stats."""
+    add_message = stats.add_message
+    for message in iterator:
+        add_message(message)
+        yield message
+
+
 def set_grpc_client_meta(span, host, port):
     if host:
         span.set_tag_str(constants.GRPC_HOST_KEY, host)
@@ -1,4 +1,3 @@
-import os
 import sys
 
 import six
@@ -13,7 +12,6 @@ from ...internal.compat import PY2
 from ...internal.compat import httplib
 from ...internal.compat import parse
 from ...internal.logger import get_logger
-from ...internal.utils.formats import asbool
 from ...pin import Pin
 from ...propagation.http import HTTPPropagator
 from ..trace_utils import unwrap as _u
@@ -24,15 +22,6 @@ span_name = "httplib.request" if PY2 else "http.client.request"
 log = get_logger(__name__)
 
 
-config._add(
-    "httplib",
-    {
-        "distributed_tracing": asbool(os.getenv("DD_HTTPLIB_DISTRIBUTED_TRACING", default=True)),
-        "default_http_tag_query_string": os.getenv("DD_HTTP_CLIENT_TAG_QUERY_STRING", "true"),
-    },
-)
-
-
 def _wrap_init(func, instance, args, kwargs):
     Pin(service=None, _config=config.httplib).onto(instance)
     return func(*args, **kwargs)
@@ -1,4 +1,3 @@
-import os
 import typing
 
 import httpx
@@ -13,7 +12,6 @@ from ddtrace.contrib.trace_utils import ext_service
 from ddtrace.contrib.trace_utils import set_http_meta
 from ddtrace.ext import SpanTypes
 from ddtrace.internal.utils import get_argument_value
-from ddtrace.internal.utils.formats import asbool
 from ddtrace.internal.utils.wrappers import unwrap as _u
 from ddtrace.pin import Pin
 from ddtrace.propagation.http import HTTPPropagator
@@ -26,15 +24,6 @@ if typing.TYPE_CHECKING:  # pragma: no cover
 
 HTTPX_VERSION = tuple(map(int, httpx.__version__.split(".")))
 
-config._add(
-    "httpx",
-    {
-        "distributed_tracing": asbool(os.getenv("DD_HTTPX_DISTRIBUTED_TRACING", default=True)),
-        "split_by_domain": asbool(os.getenv("DD_HTTPX_SPLIT_BY_DOMAIN", default=False)),
-        "default_http_tag_query_string": os.getenv("DD_HTTP_CLIENT_TAG_QUERY_STRING", "true"),
-    },
-)
-
 
 def _url_to_str(url):
     # type: (httpx.URL) -> str
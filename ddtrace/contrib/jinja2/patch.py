@@ -1,5 +1,3 @@
-import os
-
 import jinja2
 
 from ddtrace import config
@@ -16,12 +14,6 @@ from .constants import DEFAULT_TEMPLATE_NAME
 
 
 # default settings
-config._add(
-    "jinja2",
-    {
-        "service_name": os.getenv("DD_JINJA2_SERVICE_NAME"),
-    },
-)
 
 
 def patch():
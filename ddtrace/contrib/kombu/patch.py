@@ -26,12 +26,6 @@ from .utils import get_routing_key_from_args
 
 # kombu default settings
 
-config._add(
-    "kombu",
-    {
-        "service_name": config.service or os.getenv("DD_KOMBU_SERVICE_NAME", default=DEFAULT_SERVICE),
-    },
-)
 
 propagator = HTTPPropagator
 
@@ -18,13 +18,6 @@ RECORD_ATTR_VALUE_ZERO = "0"
 RECORD_ATTR_VALUE_EMPTY = ""
 _LOG_SPAN_KEY = "__datadog_log_span"
 
-ddtrace.config._add(
-    "logging",
-    dict(
-        tracer=None,
-    ),
-)  # by default, override here for custom tracer
-
 
 @attr.s(slots=True)
 class DDLogRecord(object):
@@ -1,5 +1,3 @@
-import os
-
 import mariadb
 
 from ddtrace import Pin
@@ -7,21 +5,10 @@ from ddtrace import config
 from ddtrace.contrib.dbapi import TracedConnection
 from ddtrace.ext import db
 from ddtrace.ext import net
-from ddtrace.internal.utils.formats import asbool
 from ddtrace.internal.utils.wrappers import unwrap
 from ddtrace.vendor import wrapt
 
 
-config._add(
-    "mariadb",
-    dict(
-        trace_fetch_methods=asbool(os.getenv("DD_MARIADB_TRACE_FETCH_METHODS", default=False)),
-        _default_service="mariadb",
-        _dbapi_span_name_prefix="mariadb",
-    ),
-)
-
-
 def patch():
     if getattr(mariadb, "_datadog_patch", False):
         return
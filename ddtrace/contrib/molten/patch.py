@@ -1,5 +1,3 @@
-import os
-
 import molten
 
 from ddtrace.vendor import wrapt
@@ -12,7 +10,6 @@ from ...constants import ANALYTICS_SAMPLE_RATE_KEY
 from ...constants import SPAN_MEASURED_KEY
 from ...ext import SpanTypes
 from ...internal.compat import urlencode
-from ...internal.utils.formats import asbool
 from ...internal.utils.importlib import func_name
 from ...internal.utils.version import parse_version
 from ..trace_utils import unwrap as _u
@@ -26,13 +23,6 @@ from .wrappers import WrapperRouter
 MOLTEN_VERSION = parse_version(molten.__version__)
 
 # Configure default configuration
-config._add(
-    "molten",
-    dict(
-        _default_service="molten",
-        distributed_tracing=asbool(os.getenv("DD_MOLTEN_DISTRIBUTED_TRACING", default=True)),
-    ),
-)
 
 
 def patch():
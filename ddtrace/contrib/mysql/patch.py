@@ -1,5 +1,3 @@
-import os
-
 import mysql.connector
 
 from ddtrace import Pin
@@ -9,17 +7,7 @@ from ddtrace.vendor import wrapt
 
 from ...ext import db
 from ...ext import net
-from ...internal.utils.formats import asbool
-
 
-config._add(
-    "mysql",
-    dict(
-        _default_service="mysql",
-        _dbapi_span_name_prefix="mysql",
-        trace_fetch_methods=asbool(os.getenv("DD_MYSQL_TRACE_FETCH_METHODS", default=False)),
-    ),
-)
 
 CONN_ATTR_BY_TAG = {
     net.TARGET_HOST: "server_host",
@@ -1,5 +1,3 @@
-import os
-
 import MySQLdb
 
 from ddtrace import Pin
@@ -12,20 +10,9 @@ from ddtrace.vendor.wrapt import wrap_function_wrapper as _w
 from ...ext import SpanTypes
 from ...ext import db
 from ...ext import net
-from ...internal.utils.formats import asbool
 from ...internal.utils.wrappers import unwrap as _u
 
 
-config._add(
-    "mysqldb",
-    dict(
-        _default_service="mysql",
-        _dbapi_span_name_prefix="mysql",
-        trace_fetch_methods=asbool(os.getenv("DD_MYSQLDB_TRACE_FETCH_METHODS", default=False)),
-        trace_connect=asbool(os.getenv("DD_MYSQLDB_TRACE_CONNECT", default=False)),
-    ),
-)
-
 KWPOS_BY_TAG = {
     net.TARGET_HOST: ("host", 0),
     db.USER: ("user", 1),
@@ -1,5 +1,3 @@
-import os
-
 import psycopg2
 from psycopg2.sql import Composable
 
@@ -14,21 +12,9 @@ from ddtrace.ext import net
 from ddtrace.ext import sql
 from ddtrace.vendor import wrapt
 
-from ...internal.utils.formats import asbool
 from ...internal.utils.version import parse_version
 
 
-config._add(
-    "psycopg",
-    dict(
-        _default_service="postgres",
-        _dbapi_span_name_prefix="postgres",
-        trace_fetch_methods=asbool(os.getenv("DD_PSYCOPG_TRACE_FETCH_METHODS", default=False)),
-        trace_connect=asbool(os.getenv("DD_PSYCOPG_TRACE_CONNECT", default=False)),
-        _dbm_propagation_supported=True,
-    ),
-)
-
 # Original connect method
 _connect = psycopg2.connect
 
@@ -1,5 +1,3 @@
-import os
-
 import pylons.wsgiapp
 
 from ddtrace import Pin
@@ -7,19 +5,10 @@ from ddtrace import config
 from ddtrace import tracer
 from ddtrace.vendor import wrapt
 
-from ...internal.utils.formats import asbool
 from ...internal.utils.wrappers import unwrap as _u
 from .middleware import PylonsTraceMiddleware
 
 
-config._add(
-    "pylons",
-    dict(
-        distributed_tracing=asbool(os.getenv("DD_PYLONS_DISTRIBUTED_TRACING", default=True)),
-    ),
-)
-
-
 def patch():
     """Instrument Pylons applications"""
     if getattr(pylons.wsgiapp, "_datadog_patch", False):
@@ -14,14 +14,6 @@ from .client import TracedMongoClient
 from .client import set_address_tags
 
 
-config._add(
-    "pymongo",
-    dict(
-        _default_service="pymongo",
-    ),
-)
-
-
 # Original Client class
 _MongoClient = pymongo.MongoClient
 
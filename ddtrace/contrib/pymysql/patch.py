@@ -1,5 +1,3 @@
-import os
-
 import pymysql
 
 from ddtrace import Pin
@@ -9,18 +7,7 @@ from ddtrace.vendor import wrapt
 
 from ...ext import db
 from ...ext import net
-from ...internal.utils.formats import asbool
-
-
-config._add(
-    "pymysql",
-    dict(
-        # TODO[v1.0] this should be "mysql"
-        _default_service="pymysql",
-        _dbapi_span_name_prefix="pymysql",
-        trace_fetch_methods=asbool(os.getenv("DD_PYMYSQL_TRACE_FETCH_METHODS", default=False)),
-    ),
-)
+
 
 CONN_ATTR_BY_TAG = {
     net.TARGET_HOST: "host",
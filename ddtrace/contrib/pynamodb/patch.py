@@ -21,13 +21,6 @@ from ..trace_utils import unwrap
 # Pynamodb connection class
 _PynamoDB_client = pynamodb.connection.base.Connection
 
-config._add(
-    "pynamodb",
-    {
-        "_default_service": "pynamodb",
-    },
-)
-
 
 def patch():
     if getattr(pynamodb.connection.base, "_datadog_patch", False):
@@ -1,26 +1,13 @@
-import os
-
 import pyodbc
 
 from ... import Pin
 from ... import config
-from ...internal.utils.formats import asbool
 from ..dbapi import TracedConnection
 from ..dbapi import TracedCursor
 from ..trace_utils import unwrap
 from ..trace_utils import wrap
 
 
-config._add(
-    "pyodbc",
-    dict(
-        _default_service="pyodbc",
-        _dbapi_span_name_prefix="pyodbc",
-        trace_fetch_methods=asbool(os.getenv("DD_PYODBC_TRACE_FETCH_METHODS", default=False)),
-    ),
-)
-
-
 def patch():
     if getattr(pyodbc, "_datadog_patch", False):
         return
@@ -14,13 +14,6 @@ from .trace import DD_TWEEN_NAME
 from .trace import trace_pyramid
 
 
-config._add(
-    "pyramid",
-    dict(
-        distributed_tracing=asbool(os.getenv("DD_PYRAMID_DISTRIBUTED_TRACING", default=True)),
-    ),
-)
-
 DD_PATCH = "_datadog_patch"
 
 
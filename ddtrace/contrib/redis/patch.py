@@ -11,9 +11,6 @@ from .util import _trace_redis_cmd
 from .util import _trace_redis_execute_pipeline
 
 
-config._add("redis", dict(_default_service="redis"))
-
-
 def patch():
     """Patch the instrumented methods
 
@@ -31,6 +31,22 @@ def _extract_conn_tags(conn_kwargs):
         return {}
 
 
+def _get_conn_tags(connection_pool):
+    """Return the conn tags of a connection pool, computed once for each pool"""
+    conn_kwargs = connection_pool.connection_kwargs
+    cached = getattr(connection_pool, "_datadog_conn_tags", None)
+    # Recompute the tags if the connection kwargs have been replaced
+    if cached is not None and cached[0] is conn_kwargs:
+        return cached[1]
+
+    conn_tags = _extract_conn_tags(conn_kwargs)
+    try:
+        connection_pool._datadog_conn_tags = (conn_kwargs, conn_tags)
+    except AttributeError:
+        pass
+    return conn_tags
+
+
 @contextmanager
 def _trace_redis_cmd(pin, config_integration, instance, args):
     """Create a span for the execute command method and tag it"""
@@ -45,7 +61,7 @@ def _trace_redis_cmd(pin, config_integration, instance, args):
             span.set_tags(pin.tags)
         # some redis clients do not have a connection_pool attribute (ex. aioredis v1.3)
         if hasattr(instance, "connection_pool"):
-            span.set_tags(_extract_conn_tags(instance.connection_pool.connection_kwargs))
+            span.set_tags(_get_conn_tags(instance.connection_pool))
         span.set_metric(redisx.ARGS_LEN, len(args))
         # set analytics sample rate if enabled
         span.set_tag(ANALYTICS_SAMPLE_RATE_KEY, config_integration.get_analytics_sample_rate())
@@ -63,7 +79,7 @@ def _trace_redis_execute_pipeline(pin, config_integration, resource, instance):
     ) as span:
         span.set_tag(SPAN_MEASURED_KEY)
         span.set_tag_str(redisx.RAWCMD, resource)
-        span.set_tags(_extract_conn_tags(instance.connection_pool.connection_kwargs))
+        span.set_tags(_get_conn_tags(instance.connection_pool))
         span.set_metric(redisx.PIPELINE_LEN, len(instance.command_stack))
         # set analytics sample rate if enabled
         span.set_tag(ANALYTICS_SAMPLE_RATE_KEY, config_integration.get_analytics_sample_rate())
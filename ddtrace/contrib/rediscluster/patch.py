@@ -21,8 +21,6 @@ from .. import trace_utils
 #      but in `1.x.x` `__version__` is a tuple annd `VERSION` does not exist
 REDISCLUSTER_VERSION = getattr(rediscluster, "VERSION", rediscluster.__version__)
 
-config._add("rediscluster", dict(_default_service="rediscluster"))
-
 
 def patch():
     """Patch the instrumented methods"""
@@ -76,7 +76,6 @@ Global Configuration
 .. __: https://python-rq.org/
 
 """
-import os
 
 from ddtrace import Pin
 from ddtrace import config
@@ -84,7 +83,6 @@ from ddtrace import config
 from .. import trace_utils
 from ...ext import SpanTypes
 from ...internal.utils import get_argument_value
-from ...internal.utils.formats import asbool
 from ...propagation.http import HTTPPropagator
 
 
@@ -94,23 +92,6 @@ __all__ = [
 ]
 
 
-config._add(
-    "rq",
-    dict(
-        distributed_tracing_enabled=asbool(os.environ.get("DD_RQ_DISTRIBUTED_TRACING_ENABLED", True)),
-        _default_service="rq",
-    ),
-)
-
-config._add(
-    "rq_worker",
-    dict(
-        distributed_tracing_enabled=asbool(os.environ.get("DD_RQ_DISTRIBUTED_TRACING_ENABLED", True)),
-        _default_service="rq-worker",
-    ),
-)
-
-
 @trace_utils.with_traced_module
 def traced_queue_enqueue_job(rq, pin, func, instance, args, kwargs):
     job = get_argument_value(args, kwargs, 0, "f")
@@ -17,7 +17,6 @@ from ...internal.logger import get_logger
 
 log = get_logger(__name__)
 
-config._add("sanic", dict(_default_service="sanic", distributed_tracing=True))
 
 SANIC_VERSION = (0, 0, 0)
 
@@ -1,32 +1,14 @@
-import os
-
 from ddtrace import Pin
 from ddtrace import config
 from ddtrace.vendor import wrapt
 
 from ...ext import db
 from ...ext import net
-from ...internal.utils.formats import asbool
 from ..dbapi import TracedConnection
 from ..dbapi import TracedCursor
 from ..trace_utils import unwrap
 
 
-config._add(
-    "snowflake",
-    dict(
-        _default_service="snowflake",
-        # FIXME: consistent prefix span names with other dbapi integrations
-        # The snowflake integration was introduced following a different pattern
-        # than all other dbapi-compliant integrations. It sets span names to
-        # `sql.query` whereas other dbapi-compliant integrations are set to
-        # `<integration>.query`.
-        _dbapi_span_name_prefix="sql",
-        trace_fetch_methods=asbool(os.getenv("DD_SNOWFLAKE_TRACE_FETCH_METHODS", default=False)),
-    ),
-)
-
-
 class _SFTracedCursor(TracedCursor):
     def _set_post_execute_tags(self, span):
         super(_SFTracedCursor, self)._set_post_execute_tags(span)
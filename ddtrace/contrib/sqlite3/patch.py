@@ -1,4 +1,3 @@
-import os
 import sqlite3
 import sqlite3.dbapi2
 import sys
@@ -9,22 +8,12 @@ from ddtrace.vendor import wrapt
 from ...contrib.dbapi import FetchTracedCursor
 from ...contrib.dbapi import TracedConnection
 from ...contrib.dbapi import TracedCursor
-from ...internal.utils.formats import asbool
 from ...pin import Pin
 
 
 # Original connect method
 _connect = sqlite3.connect
 
-config._add(
-    "sqlite",
-    dict(
-        _default_service="sqlite",
-        _dbapi_span_name_prefix="sqlite",
-        trace_fetch_methods=asbool(os.getenv("DD_SQLITE_TRACE_FETCH_METHODS", default=False)),
-    ),
-)
-
 
 def patch():
     wrapped = wrapt.FunctionWrapper(_connect, traced_connect)
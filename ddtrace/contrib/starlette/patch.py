@@ -22,16 +22,6 @@ from ddtrace.vendor.wrapt import wrap_function_wrapper as _w
 
 log = get_logger(__name__)
 
-config._add(
-    "starlette",
-    dict(
-        _default_service="starlette",
-        request_span_name="starlette.request",
-        distributed_tracing=True,
-        aggregate_resources=True,
-    ),
-)
-
 
 @removals.remove(removal_version="2.0.0", category=DDTraceDeprecationWarning)
 def get_resource(scope):
@@ -4,7 +4,6 @@ This module contains utility functions for writing ddtrace integrations.
 from collections import deque
 import ipaddress
 import os
-import re
 from typing import Any
 from typing import Callable
 from typing import Dict
@@ -20,14 +19,15 @@ from typing import cast
 
 from ddtrace import Pin
 from ddtrace import config
+from ddtrace.constants import APPSEC_WAF_CONTEXT_KEY
 from ddtrace.ext import http
 from ddtrace.ext import user
 from ddtrace.internal import _context
+from ddtrace.internal.compat import monotonic_ns
 from ddtrace.internal.compat import six
 from ddtrace.internal.logger import get_logger
-from ddtrace.internal.utils.cache import cached
-from ddtrace.internal.utils.http import normalize_header_name
-from ddtrace.internal.utils.http import redact_url
+from ddtrace.internal.utils.http import cached_redact_url
+from ddtrace.internal.utils.http import header_tag_name
 from ddtrace.internal.utils.http import strip_query_string
 import ddtrace.internal.utils.wrappers
 from ddtrace.propagation.http import HTTPPropagator
@@ -49,11 +49,6 @@ iswrapped = ddtrace.internal.utils.wrappers.iswrapped
 REQUEST = "request"
 RESPONSE = "response"
 
-# Tag normalization based on: https://docs.datadoghq.com/tagging/#defining-tags
-# With the exception of '.' in header names which are replaced with '_' to avoid
-# starting a "new object" on the UI.
-NORMALIZE_PATTERN = re.compile(r"([^a-z0-9_\-:/]){1}")
-
 # Possible User Agent header.
 USER_AGENT_PATTERNS = ("http-user-agent", "user-agent")
 
@@ -70,12 +65,6 @@ IP_PATTERNS = (
 )
 
 
-@cached()
-def _normalized_header_name(header_name):
-    # type: (str) -> str
-    return NORMALIZE_PATTERN.sub("_", normalize_header_name(header_name))
-
-
 def _get_header_value_case_insensitive(headers, keyname):
     # type: (Mapping[str, str], str) -> Optional[str]
     """
@@ -115,8 +104,7 @@ def _normalize_tag_name(request_or_response, header_name):
     #   - any letter is converted to lowercase
     #   - any digit is left unchanged
     #   - any block of any length of different ASCII chars is converted to a single underscore '_'
-    normalized_name = _normalized_header_name(header_name)
-    return "http.{}.headers.{}".format(request_or_response, normalized_name)
+    return header_tag_name(request_or_response, header_name)
 
 
 def _store_headers(headers, span, integration_config, request_or_response):
@@ -129,7 +117,7 @@ def _store_headers(headers, span, integration_config, request_or_response):
     :param integration_config: An integration specific config object.
     :type integration_config: ddtrace.settings.IntegrationConfig
     """
-    if not isinstance(headers, dict):
+    if not hasattr(headers, "keys"):
         try:
             headers = dict(headers)
         except Exception:
@@ -139,14 +127,18 @@ def _store_headers(headers, span, integration_config, request_or_response):
         log.debug("Skipping headers tracing as no integration config was provided")
         return
 
-    for header_name, header_value in headers.items():
-        """config._header_tag_name gets an element of the dictionary in config.http._header_tags
-        which gets the value from DD_TRACE_HEADER_TAGS environment variable."""
-        tag_name = integration_config._header_tag_name(header_name)
-        if tag_name is None:
-            continue
-        # An empty tag defaults to a http.<request or response>.headers.<header name> tag
-        span.set_tag_str(tag_name or _normalize_tag_name(request_or_response, header_name), header_value)
+    # The plan maps the normalized name of each traced header to its tag. It is
+    # compiled from config.http._header_tags, which gets the value from the
+    # DD_TRACE_HEADER_TAGS environment variable, and from the integration ones.
+    plan = integration_config._header_tag_plan(request_or_response)
+    if not plan:
+        return
+
+    for header_name in headers.keys():
+        # DEV: Same normalization as normalize_header_name, without the cache lookup
+        tag_name = plan.get(header_name.strip().lower())
+        if tag_name is not None:
+            span.set_tag_str(tag_name, headers[header_name])
 
 
 def _get_request_header_user_agent(headers, headers_are_case_sensitive=False):
@@ -314,6 +306,25 @@ def with_traced_module(func):
     return with_mod
 
 
+def _timed_call(tracer, metric, func, args, kwargs):
+    # type: (Tracer, str, Callable[..., Any], Any, Any) -> Any
+    """Call ``func`` and add the time it took, in seconds, to the ``metric``
+    metric of the root span of the current trace.
+
+    This is used in place of a span for the functions that are called on every
+    request, like middleware, to reduce the size of the traces.
+    """
+    span = tracer.current_root_span()
+    if span is None:
+        return func(*args, **kwargs)
+
+    start = monotonic_ns()
+    try:
+        return func(*args, **kwargs)
+    finally:
+        span._metrics[metric] = span._metrics.get(metric, 0) + (monotonic_ns() - start) / 1e9
+
+
 def distributed_tracing_enabled(int_config, default=False):
     # type: (IntegrationConfig, bool) -> bool
     """Returns whether distributed tracing is enabled for this integration config"""
@@ -421,7 +432,7 @@ def set_http_meta(
             if config.global_query_string_obfuscation_disabled:  # No redacting of query strings
                 span.set_tag_str(http.URL, url)
             else:  # Redact query strings
-                span.set_tag_str(http.URL, redact_url(url, config._obfuscation_query_string_pattern, query))
+                span.set_tag_str(http.URL, cached_redact_url(url, config._obfuscation_query_string_pattern, query))
         else:  # Not tagging query string in http.url
             span.set_tag_str(http.URL, strip_query_string(url))
 
@@ -459,10 +470,10 @@ def set_http_meta(
             """We should store both http.<request_or_response>.headers.<header_name> and
             http.<key>. The last one
             is the DD standardized tag for user-agent"""
-            _store_request_headers(dict(request_headers), span, integration_config)
+            _store_request_headers(request_headers, span, integration_config)
 
     if response_headers is not None and integration_config.is_header_tracing_configured:
-        _store_response_headers(dict(response_headers), span, integration_config)
+        _store_response_headers(response_headers, span, integration_config)
 
     if retries_remain is not None:
         span.set_tag_str(http.RETRIES_REMAIN, str(retries_remain))
@@ -470,25 +481,32 @@ def set_http_meta(
     if config._appsec_enabled:
         status_code = str(status_code) if status_code is not None else None
 
-        _context.set_items(
-            {
-                k: v
-                for k, v in [
-                    ("http.request.uri", raw_uri),
-                    ("http.request.method", method),
-                    ("http.request.cookies", request_cookies),
-                    ("http.request.query", parsed_query),
-                    ("http.request.headers", request_headers),
-                    ("http.response.headers", response_headers),
-                    ("http.response.status", status_code),
-                    ("http.request.path_params", request_path_params),
-                    ("http.request.body", request_body),
-                    ("http.request.remote_ip", ip),
-                ]
-                if v is not None
-            },
-            span=span,
-        )
+        items = {
+            k: v
+            for k, v in [
+                ("http.request.uri", raw_uri),
+                ("http.request.method", method),
+                ("http.request.cookies", request_cookies),
+                ("http.request.query", parsed_query),
+                ("http.request.headers", request_headers),
+                ("http.response.headers", response_headers),
+                ("http.response.status", status_code),
+                ("http.request.path_params", request_path_params),
+                ("http.request.body", request_body),
+                ("http.request.remote_ip", ip),
+            ]
+            if v is not None
+        }
+        _context.set_items(items, span=span)
+
+        # Push the new addresses to the WAF as soon as they are available.
+        waf_request = _context.get_item(APPSEC_WAF_CONTEXT_KEY, span=span)
+        if waf_request is not None:
+            try:
+                waf_request.push(items)
+            except Exception:
+                # The remaining addresses are pushed again when the span finishes
+                log.debug("failed to run the AppSec In-App WAF", exc_info=True)
 
     if route is not None:
         span.set_tag_str(http.ROUTE, route)
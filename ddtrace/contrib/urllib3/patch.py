@@ -1,5 +1,3 @@
-import os
-
 import urllib3
 
 from ddtrace import config
@@ -12,7 +10,6 @@ from ...ext import SpanTypes
 from ...internal.compat import parse
 from ...internal.utils import ArgumentError
 from ...internal.utils import get_argument_value
-from ...internal.utils.formats import asbool
 from ...internal.utils.wrappers import unwrap as _u
 from ...propagation.http import HTTPPropagator
 
@@ -21,15 +18,6 @@ from ...propagation.http import HTTPPropagator
 DROP_PORTS = (80, 443)
 
 # Initialize the default config vars
-config._add(
-    "urllib3",
-    {
-        "_default_service": "urllib3",
-        "distributed_tracing": asbool(os.getenv("DD_URLLIB3_DISTRIBUTED_TRACING", default=True)),
-        "default_http_tag_query_string": os.getenv("DD_HTTP_CLIENT_TAG_QUERY_STRING", "true"),
-        "split_by_domain": asbool(os.getenv("DD_URLLIB3_SPLIT_BY_DOMAIN", default=False)),
-    },
-)
 
 
 def patch():
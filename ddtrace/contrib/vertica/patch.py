@@ -57,8 +57,6 @@ def cursor_span_end(instance, cursor, _, conf, *args, **kwargs):
 config._add(
     "vertica",
     {
-        "_default_service": "vertica",
-        "_dbapi_span_name_prefix": "vertica",
         "patch": {
             "vertica_python.vertica.connection.Connection": {
                 "routines": {
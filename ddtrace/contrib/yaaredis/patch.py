@@ -10,9 +10,6 @@ from ..redis.util import _trace_redis_cmd
 from ..redis.util import _trace_redis_execute_pipeline
 
 
-config._add("yaaredis", dict(_default_service="redis"))
-
-
 def patch():
     """Patch the instrumented methods"""
     if getattr(yaaredis, "_datadog_patch", False):
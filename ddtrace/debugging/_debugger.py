@@ -1,4 +1,5 @@
 from collections import defaultdict
+from contextlib import contextmanager
 from inspect import currentframe
 from itertools import chain
 import sys
@@ -9,6 +10,7 @@ from types import ModuleType
 from typing import Any
 from typing import Dict
 from typing import Iterable
+from typing import Iterator
 from typing import List
 from typing import Optional
 from typing import Set
@@ -51,6 +53,7 @@ from ddtrace.internal.module import origin
 from ddtrace.internal.rate_limiter import BudgetRateLimiterWithJitter as RateLimiter
 from ddtrace.internal.rate_limiter import RateLimitExceeded
 from ddtrace.internal.remoteconfig import RemoteConfig
+from ddtrace.internal.remoteconfig.client import ConfigMetadata
 from ddtrace.internal.safety import _isinstance
 from ddtrace.internal.service import Service
 from ddtrace.internal.wrapping import Wrapper
@@ -229,6 +232,11 @@ class Debugger(Service):
 
         self._function_store = FunctionStore(extra_attrs=["__dd_wrappers__"])
 
+        # Line probes whose hooks are still to be ejected from the given
+        # function. This is only set while a configuration update is being
+        # processed (see _probe_update).
+        self._pending_ejections = None  # type: Optional[Dict[FullyNamedWrappedFunction, List[LineProbe]]]
+
         log_limiter = RateLimiter(limit_rate=1.0, raise_on_exceed=False)
         self._global_rate_limiter = RateLimiter(
             limit_rate=config.global_rate_limit,  # TODO: Make it configurable. Note that this is per-process!
@@ -238,7 +246,8 @@ class Debugger(Service):
         )
 
         # Register the debugger with the RCM client.
-        RemoteConfig.register("LIVE_DEBUGGING", self.__rc_adapter__(self._on_configuration))
+        self._rc_adapter = self.__rc_adapter__(self._on_configuration)
+        RemoteConfig.register("LIVE_DEBUGGING", self._on_remote_config)
 
         log.debug("%s initialized (service name: %s)", self.__class__.__name__, service_name)
 
@@ -389,17 +398,36 @@ class Debugger(Service):
             for function in (cast(FullyNamedWrappedFunction, _) for _ in functions):
                 probes_for_function[function].append(probe)
 
+        pending_ejections = self._pending_ejections
         for function, probes in probes_for_function.items():
-            failed = self._function_store.inject_hooks(
-                function, [(self._dd_debugger_hook, probe.line, probe) for probe in probes]  # type: ignore[misc]
-            )
-            for probe in probes:
-                if probe.probe_id in failed:
-                    self._probe_registry.set_error(probe, "Failed to inject")
-                    log.error("Failed to inject %r", probe)
-                else:
-                    self._probe_registry.set_installed(probe)
-                    log.debug("Injected probes %r in %r", [probe.probe_id for probe in probes], function)
+            # Apply any pending ejections for the same function with the same
+            # code rewrite.
+            to_eject = pending_ejections.pop(function, []) if pending_ejections is not None else []
+            self._update_function_probes(function, to_eject, probes)
+
+    def _update_function_probes(self, function, to_eject, to_inject):
+        # type: (FullyNamedWrappedFunction, List[LineProbe], List[LineProbe]) -> None
+        """Eject and inject line probe hooks with a single function rewrite."""
+        hook = self._dd_debugger_hook
+        failed_eject, failed_inject = self._function_store.update_hooks(
+            function,
+            [(hook, probe.line, probe) for probe in to_eject if probe.line is not None],  # type: ignore[misc]
+            [(hook, probe.line, probe) for probe in to_inject],  # type: ignore[misc]
+        )
+
+        for probe in to_eject:
+            if probe.probe_id in failed_eject:
+                log.error("Failed to eject %r from %r", probe, function)
+            else:
+                log.debug("Ejected %r from %r", probe, function)
+
+        for probe in to_inject:
+            if probe.probe_id in failed_inject:
+                self._probe_registry.set_error(probe, "Failed to inject")
+                log.error("Failed to inject %r", probe)
+            else:
+                self._probe_registry.set_installed(probe)
+                log.debug("Injected probes %r in %r", [probe.probe_id for probe in to_inject], function)
 
     def _inject_probes(self, probes):
         # type: (List[LineProbe]) -> None
@@ -436,8 +464,6 @@ class Debugger(Service):
 
     def _eject_probes(self, probes_to_eject):
         # type: (List[LineProbe]) -> None
-        # TODO[perf]: Bulk-collect probes as for injection. This is lower
-        # priority as probes are normally removed manually by users.
         unregistered_probes = []  # type: List[LineProbe]
         for probe in probes_to_eject:
             if probe not in self._probe_registry:
@@ -467,16 +493,17 @@ class Debugger(Service):
                     for function in (cast(FullyNamedWrappedFunction, _) for _ in functions):
                         probes_for_function[function].append(probe)
 
+                pending_ejections = self._pending_ejections
                 for function, ps in probes_for_function.items():
-                    failed = self._function_store.eject_hooks(
-                        cast(FunctionType, function),
-                        [(self._dd_debugger_hook, probe.line, probe) for probe in ps if probe.line is not None],
-                    )
-                    for probe in ps:
-                        if probe.probe_id in failed:
-                            log.error("Failed to eject %r from %r", probe, function)
-                        else:
-                            log.debug("Ejected %r from %r", probe, function)
+                    if pending_ejections is not None:
+                        # Defer the ejection until the end of the configuration
+                        # update. Deactivated probes are ignored by the hook in
+                        # the meantime.
+                        for probe in ps:
+                            probe.deactivate()
+                        pending_ejections[function].extend(ps)
+                    else:
+                        self._update_function_probes(function, ps, [])
 
             if not self._probe_registry.has_probes(resolved_source):
                 try:
@@ -572,6 +599,36 @@ class Debugger(Service):
                 except ValueError:
                     log.error("Cannot unregister wrapping import hook for module %r", module_name, exc_info=True)
 
+    @contextmanager
+    def _probe_update(self):
+        # type: () -> Iterator[None]
+        """Batch the line probe changes requested within the context.
+
+        Line probe ejections are deferred so that they can be applied together
+        with any injections into the same function, with a single rewrite of
+        the function code. Any ejections still pending at the end of the
+        context are applied in bulk, one rewrite per function.
+        """
+        if self._pending_ejections is not None:
+            # Nested update. The outermost one applies the pending ejections.
+            yield
+            return
+
+        self._pending_ejections = pending_ejections = defaultdict(list)
+        try:
+            yield
+        finally:
+            self._pending_ejections = None
+            for function, probes in pending_ejections.items():
+                self._update_function_probes(function, probes, [])
+
+    def _on_remote_config(self, metadata, data):
+        # type: (Optional[ConfigMetadata], Any) -> None
+        # All the probe events generated by a configuration update are processed
+        # as a batch, so that each function is re-patched at most once.
+        with self._probe_update():
+            self._rc_adapter(metadata, data)
+
     def _on_configuration(self, event, probes):
         # type: (ProbePollerEventType, Iterable[Probe]) -> None
         log.debug("Received poller event %r with probes %r", event, probes)
@@ -6,6 +6,7 @@ from typing import Dict
 from typing import List
 from typing import Optional
 from typing import Set
+from typing import Tuple
 from typing import cast
 
 from ddtrace.debugging._function.discovery import FullyNamed
@@ -13,6 +14,7 @@ from ddtrace.internal.injection import HookInfoType
 from ddtrace.internal.injection import HookType
 from ddtrace.internal.injection import eject_hooks
 from ddtrace.internal.injection import inject_hooks
+from ddtrace.internal.injection import update_hooks
 from ddtrace.internal.wrapping import WrappedFunction
 from ddtrace.internal.wrapping import Wrapper
 from ddtrace.internal.wrapping import unwrap
@@ -58,6 +60,23 @@ class FunctionStore(object):
         if function not in self._code_map:
             self._code_map[function] = function.__code__
 
+    def update_hooks(self, function, eject, inject):
+        # type: (FullyNamedWrappedFunction, List[HookInfoType], List[HookInfoType]) -> Tuple[Set[str], Set[str]]
+        """Bulk-eject and bulk-inject hooks with a single rewrite of the
+        function code.
+
+        Returns the sets of probe IDs for those probes that failed to eject and
+        inject, respectively.
+        """
+        try:
+            return self.update_hooks(cast(FullyNamedWrappedFunction, function.__dd_wrapped__), eject, inject)
+        except AttributeError:
+            f = cast(FunctionType, function)
+            if inject:
+                self._store(f)
+            failed_eject, failed_inject = update_hooks(f, eject, inject)
+            return {p.probe_id for _, _, p in failed_eject}, {p.probe_id for _, _, p in failed_inject}
+
     def inject_hooks(self, function, hooks):
         # type: (FullyNamedWrappedFunction, List[HookInfoType]) -> Set[str]
         """Bulk-inject hooks into a function.
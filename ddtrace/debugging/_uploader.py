@@ -1,15 +1,13 @@
 from typing import Optional
 
-import tenacity
-
 from ddtrace.debugging._config import config
 from ddtrace.debugging._encoding import BufferedEncoder
 from ddtrace.debugging._metrics import metrics
-from ddtrace.internal import compat
 from ddtrace.internal.logger import get_logger
 from ddtrace.internal.periodic import AwakeablePeriodicService
 from ddtrace.internal.runtime import container
-from ddtrace.internal.utils.http import connector
+from ddtrace.internal.transport import fibonacci_retry
+from ddtrace.internal.transport import get_transport
 
 
 log = get_logger(__name__)
@@ -44,15 +42,8 @@ class LogsIntakeUploaderV1(AwakeablePeriodicService):
 
         if config._tags_in_qs and config.tags:
             self.ENDPOINT += "?ddtags=" + config.tags
-        self._connect = connector(config._snapshot_intake_url, timeout=config.upload_timeout)
-        self._retry_upload = tenacity.Retrying(
-            # Retry RETRY_ATTEMPTS times within the first half of the processing
-            # interval, using a Fibonacci policy with jitter
-            wait=tenacity.wait_random_exponential(
-                multiplier=0.618 * self.interval / (1.618 ** self.RETRY_ATTEMPTS) / 2, exp_base=1.618
-            ),
-            stop=tenacity.stop_after_attempt(self.RETRY_ATTEMPTS),
-        )
+        self._transport = get_transport(config._snapshot_intake_url)
+        self._retry_upload = fibonacci_retry(self.RETRY_ATTEMPTS, self.interval)
 
         log.debug(
             "Logs intake uploader initialized (url: %s, endpoint: %s, interval: %f)",
@@ -64,21 +55,14 @@ class LogsIntakeUploaderV1(AwakeablePeriodicService):
     def _write(self, payload):
         # type: (str) -> None
         try:
-            with self._connect() as conn:
-                conn.request(
-                    "POST",
-                    self.ENDPOINT,
-                    payload,
-                    headers=self._headers,
-                )
-                resp = compat.get_connection_response(conn)
-                if resp.status != 200:
-                    log.error("Failed to upload snapshot: [%d] %r", resp.status, resp.read())
-                    meter.increment("upload.error", tags={"status": str(resp.status)})
-                else:
-                    meter.increment("upload.success")
-                    meter.distribution("upload.size", len(payload))
-                    log.debug("Snapshot uploaded: %s", payload)
+            resp = self._transport.request("POST", self.ENDPOINT, payload, self._headers, timeout=config.upload_timeout)
+            if resp.status != 200:
+                log.error("Failed to upload snapshot: [%d] %r", resp.status, resp.body)
+                meter.increment("upload.error", tags={"status": str(resp.status)})
+            else:
+                meter.increment("upload.success")
+                meter.distribution("upload.size", len(payload))
+                log.debug("Snapshot uploaded: %s", payload)
         except Exception:
             log.error("Failed to write payload", exc_info=True)
             meter.increment("error")
@@ -88,28 +88,50 @@ def _function_with_new_code(f, abstract_code):
     return f
 
 
-def inject_hooks(f, hooks):
-    # type: (FunctionType, List[HookInfoType]) -> List[HookInfoType]
-    """Bulk-inject a list of hooks into a function.
+def update_hooks(f, eject, inject):
+    # type: (FunctionType, List[HookInfoType], List[HookInfoType]) -> Tuple[List[HookInfoType], List[HookInfoType]]
+    """Bulk-eject and bulk-inject hooks with a single code object rewrite.
 
-    Hooks are specified via a list of tuples, where each tuple contains the hook
-    itself, the line number and the identifying argument passed to the hook.
+    The hooks to eject are removed before the new ones are injected, so that a
+    hook can be moved to a different line within the same function. The
+    function code is decompiled and recompiled at most once, regardless of the
+    number of hooks involved.
 
-    Returns the list of hooks that failed to be injected.
+    Returns the lists of hooks that failed to be ejected and injected,
+    respectively.
     """
     abstract_code = Bytecode.from_code(f.__code__)
 
-    failed = []
-    for hook, line, arg in hooks:
+    failed_eject = []
+    for hook, line, arg in eject:
+        try:
+            _eject_hook(abstract_code, hook, line, arg)
+        except InvalidLine:
+            failed_eject.append((hook, line, arg))
+
+    failed_inject = []
+    for hook, line, arg in inject:
         try:
             _inject_hook(abstract_code, hook, line, arg)
         except InvalidLine:
-            failed.append((hook, line, arg))
+            failed_inject.append((hook, line, arg))
 
-    if len(failed) < len(hooks):
+    if len(failed_eject) + len(failed_inject) < len(eject) + len(inject):
         _function_with_new_code(f, abstract_code)
 
-    return failed
+    return failed_eject, failed_inject
+
+
+def inject_hooks(f, hooks):
+    # type: (FunctionType, List[HookInfoType]) -> List[HookInfoType]
+    """Bulk-inject a list of hooks into a function.
+
+    Hooks are specified via a list of tuples, where each tuple contains the hook
+    itself, the line number and the identifying argument passed to the hook.
+
+    Returns the list of hooks that failed to be injected.
+    """
+    return update_hooks(f, [], hooks)[1]
 
 
 def eject_hooks(f, hooks):
@@ -121,19 +143,7 @@ def eject_hooks(f, hooks):
 
     Returns the list of hooks that failed to be ejected.
     """
-    abstract_code = Bytecode.from_code(f.__code__)
-
-    failed = []
-    for hook, line, arg in hooks:
-        try:
-            _eject_hook(abstract_code, hook, line, arg)
-        except InvalidLine:
-            failed.append((hook, line, arg))
-
-    if len(failed) < len(hooks):
-        _function_with_new_code(f, abstract_code)
-
-    return failed
+    return update_hooks(f, hooks, [])[0]
 
 
 def inject_hook(f, hook, line, arg):
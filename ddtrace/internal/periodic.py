@@ -1,4 +1,7 @@
 # -*- encoding: utf-8 -*-
+import heapq
+import itertools
+import os
 import sys
 import threading
 import time
@@ -8,10 +11,16 @@ import attr
 
 from ddtrace.internal import nogevent
 from ddtrace.internal import service
+from ddtrace.internal.compat import monotonic
+from ddtrace.internal.logger import get_logger
+from ddtrace.internal.utils.formats import asbool
 
 from . import forksafe
 
 
+log = get_logger(__name__)
+
+
 class PeriodicThread(threading.Thread):
     """Periodic thread.
 
@@ -290,6 +299,308 @@ def AwakeablePeriodicRealThreadClass():
     return _GeventAwakeablePeriodicThread if nogevent.is_module_patched("threading") else AwakeablePeriodicThread
 
 
+class _SchedulerThread(threading.Thread):
+    """The thread running the tasks of a :class:`PeriodicScheduler`."""
+
+    _ddtrace_profiling_ignore = True
+
+
+class PeriodicTask(object):
+    """A periodic function run by a :class:`PeriodicScheduler`.
+
+    This class exposes the same interface as ``AwakeablePeriodicThread``, so that a ``PeriodicService`` can use either
+    one as its worker.
+    """
+
+    def __init__(
+        self,
+        scheduler,  # type: PeriodicScheduler
+        interval,  # type: float
+        target,  # type: typing.Callable[[], typing.Any]
+        name=None,  # type: typing.Optional[str]
+        on_shutdown=None,  # type: typing.Optional[typing.Callable[[], typing.Any]]
+        run_first=False,  # type: bool
+    ):
+        # type: (...) -> None
+        """Create a periodic task.
+
+        :param scheduler: The scheduler that runs the task.
+        :param interval: The interval in seconds to wait between execution of the periodic function.
+        :param target: The periodic function to execute every interval.
+        :param name: The name of the task.
+        :param on_shutdown: The function to call when the task is stopped.
+        :param run_first: Whether to execute the periodic function as soon as the task is started.
+        """
+        self.scheduler = scheduler
+        self.interval = interval
+        self.name = name
+        self._target = target
+        self._on_shutdown = on_shutdown
+        self._run_first = run_first
+        # Scheduler state, protected by the scheduler lock
+        self._generation = None  # type: typing.Optional[int]
+        self._entry = None  # type: typing.Optional[int]
+        self._stopping = False
+        self._finished = False
+        self._awake_requested = 0
+        self._awake_served = 0
+        self._done = threading.Event()
+        # Metrics
+        self.runs = 0
+        self.overruns = 0
+        self.max_delay = 0.0
+        self.busy = 0.0
+
+    @property
+    def ident(self):
+        # type: () -> typing.Optional[int]
+        return self.scheduler.ident
+
+    def start(self):
+        # type: () -> None
+        """Schedule the task."""
+        self.scheduler.add(self)
+
+    def stop(self):
+        # type: () -> None
+        """Stop the task. The shutdown function is executed by the scheduler."""
+        self.scheduler.cancel(self)
+
+    def is_alive(self):
+        # type: () -> bool
+        return self.scheduler.is_scheduled(self)
+
+    def join(self, timeout=None):
+        # type: (typing.Optional[float]) -> None
+        """Wait for the task to be stopped."""
+        # The task cannot wait for itself to finish when stopped from one of
+        # the functions run by the scheduler: its shutdown function is
+        # executed right after the current function returns.
+        if self.is_alive() and not self.scheduler.is_current_thread():
+            self._done.wait(timeout)
+
+    def awake(self):
+        # type: () -> None
+        """Run the periodic function now and wait for it to complete."""
+        self.scheduler.awake(self)
+
+    def get_metrics(self):
+        # type: () -> typing.Dict[str, float]
+        return {"runs": self.runs, "overruns": self.overruns, "max_delay": self.max_delay, "busy": self.busy}
+
+
+class PeriodicScheduler(object):
+    """Run many periodic tasks on a single thread.
+
+    Tasks are kept in a heap ordered by deadline, and the thread sleeps until the earliest deadline. The thread is only
+    started when a task is added, and exits when there are no more tasks to run. As with ``PeriodicThread``, the next
+    deadline of a task is computed from the end of its last run. A run that takes longer than the interval of the task
+    is counted as an overrun, and the delay between the deadline of a task and the actual start of its run (e.g.
+    because another task was running) is tracked as well.
+    """
+
+    def __init__(self, name):
+        # type: (str) -> None
+        self.name = name
+        self._reset()
+
+    def _reset(self):
+        # type: () -> None
+        self._cond = threading.Condition(threading.Lock())
+        self._heap = []  # type: typing.List[typing.Tuple[float, int, PeriodicTask]]
+        self._seq = itertools.count()
+        self._thread = None  # type: typing.Optional[threading.Thread]
+        self._tasks = []  # type: typing.List[PeriodicTask]
+        self._generation = getattr(self, "_generation", -1) + 1
+
+    @property
+    def ident(self):
+        # type: () -> typing.Optional[int]
+        thread = self._thread
+        return thread.ident if thread is not None else None
+
+    def is_current_thread(self):
+        # type: () -> bool
+        return self._thread is not None and self._thread is threading.current_thread()
+
+    def is_scheduled(self, task):
+        # type: (PeriodicTask) -> bool
+        return task._generation == self._generation and not task._finished
+
+    def _push(self, task, deadline):
+        # type: (PeriodicTask, float) -> None
+        # Any previous entry of the task in the heap becomes stale and is
+        # skipped when popped.
+        entry = next(self._seq)
+        task._entry = entry
+        heapq.heappush(self._heap, (deadline, entry, task))
+        # Wake up the scheduler thread, which might be waiting alongside
+        # threads awaking tasks.
+        self._cond.notify_all()
+
+    def add(self, task):
+        # type: (PeriodicTask) -> None
+        """Schedule a task."""
+        with self._cond:
+            if task._generation is not None:
+                raise RuntimeError("tasks can only be started once")
+            task._generation = self._generation
+            self._tasks.append(task)
+            now = monotonic()
+            self._push(task, now if task._run_first else now + task.interval)
+            if self._thread is None:
+                self._thread = _SchedulerThread(target=self._run, name=self.name)
+                self._thread.daemon = True
+                self._thread.start()
+
+    def cancel(self, task):
+        # type: (PeriodicTask) -> None
+        """Stop a task. Its shutdown function is executed by the scheduler thread."""
+        with self._cond:
+            if not self.is_scheduled(task) or task._stopping:
+                return
+            task._stopping = True
+            if task._entry is not None:
+                # The task is not running: shut it down right away
+                self._push(task, 0.0)
+
+    def awake(self, task):
+        # type: (PeriodicTask) -> None
+        """Run a task now and wait for the run to complete."""
+        if self.is_current_thread():
+            task._target()
+            return
+
+        with self._cond:
+            if not self.is_scheduled(task) or task._stopping:
+                return
+            task._awake_requested += 1
+            request = task._awake_requested
+            if task._entry is not None:
+                # Otherwise the task is running and is rescheduled right away
+                # when the run completes.
+                self._push(task, 0.0)
+            while task._awake_served < request and self.is_scheduled(task):
+                self._cond.wait()
+
+    def get_metrics(self):
+        # type: () -> typing.Dict[str, typing.Dict[str, float]]
+        """Return the metrics of each scheduled task."""
+        with self._cond:
+            tasks = list(self._tasks)
+        return {task.name or repr(task): task.get_metrics() for task in tasks}
+
+    def _finish(self, task):
+        # type: (PeriodicTask) -> None
+        task._finished = True
+        task._entry = None
+        self._tasks.remove(task)
+        self._cond.notify_all()
+        task._done.set()
+
+    def _next(self):
+        # type: () -> typing.Optional[typing.Tuple[float, PeriodicTask]]
+        """Wait for the next task to run, or return ``None`` if there are no more tasks."""
+        with self._cond:
+            while True:
+                if self._thread is not threading.current_thread():
+                    # The scheduler has been reset
+                    return None
+                while self._heap and self._heap[0][1] != self._heap[0][2]._entry:
+                    heapq.heappop(self._heap)
+                if not self._heap:
+                    # No more tasks: let the thread exit, a new one is started
+                    # when a task is added.
+                    self._thread = None
+                    return None
+                deadline, _, task = self._heap[0]
+                timeout = deadline - monotonic()
+                if timeout <= 0:
+                    heapq.heappop(self._heap)
+                    task._entry = None
+                    return deadline, task
+                self._cond.wait(timeout)
+
+    def _run(self):
+        # type: () -> None
+        while True:
+            item = self._next()
+            if item is None:
+                return
+            deadline, task = item
+
+            if task._stopping:
+                self._shutdown(task)
+                continue
+
+            with self._cond:
+                served = task._awake_requested
+
+            start = monotonic()
+            if deadline:
+                task.max_delay = max(task.max_delay, start - deadline)
+            try:
+                task._target()
+            except Exception:
+                log.error("Periodic task %s failed", task.name, exc_info=True)
+                with self._cond:
+                    self._finish(task)
+                continue
+            end = monotonic()
+            task.runs += 1
+            task.busy += end - start
+            if end - start > task.interval:
+                task.overruns += 1
+
+            with self._cond:
+                task._awake_served = served
+                self._cond.notify_all()
+                if task._stopping:
+                    self._push(task, 0.0)
+                elif task._awake_requested > served:
+                    self._push(task, 0.0)
+                else:
+                    self._push(task, end + task.interval)
+
+    def _shutdown(self, task):
+        # type: (PeriodicTask) -> None
+        try:
+            if task._on_shutdown is not None:
+                task._on_shutdown()
+        except Exception:
+            log.error("Shutdown of periodic task %s failed", task.name, exc_info=True)
+        finally:
+            with self._cond:
+                self._finish(task)
+
+
+_scheduler_enabled = asbool(os.getenv("DD_PERIODIC_SCHEDULER_ENABLED", default=False))
+
+# Tasks that need to run on a real thread, like the profiler collectors, do
+# not share a thread with the others, so that a slow task (e.g. a flush to the
+# agent) does not delay them.
+_scheduler = PeriodicScheduler("ddtrace.internal.periodic:PeriodicScheduler")
+_real_thread_scheduler = PeriodicScheduler("ddtrace.internal.periodic:PeriodicScheduler(real_thread)")
+
+
+def get_scheduler_metrics():
+    # type: () -> typing.Dict[str, typing.Dict[str, float]]
+    """Return the metrics of the tasks run by the periodic schedulers."""
+    metrics = _scheduler.get_metrics()
+    metrics.update(_real_thread_scheduler.get_metrics())
+    return metrics
+
+
+@forksafe.register
+def _reset_schedulers():
+    # type: () -> None
+    # The scheduler threads are gone in the child process. The tasks of the
+    # parent process are not rescheduled: the services restart themselves
+    # after fork, and the scheduler threads are started again only if needed.
+    _scheduler._reset()
+    _real_thread_scheduler._reset()
+
+
 @attr.s(eq=False)
 class PeriodicService(service.Service):
     """A service that runs periodically."""
@@ -324,6 +635,18 @@ class PeriodicService(service.Service):
     ):
         # type: (...) -> None
         """Start the periodic service."""
+        if _scheduler_enabled and not nogevent.is_module_patched("threading"):
+            self._worker = PeriodicTask(
+                _real_thread_scheduler if self._real_thread else _scheduler,
+                self.interval,
+                target=self.periodic,
+                name="%s:%s" % (self.__class__.__module__, self.__class__.__name__),
+                on_shutdown=self.on_shutdown,
+                run_first=isinstance(self, AwakeablePeriodicService),
+            )
+            self._worker.start()
+            return
+
         real_class, python_class = self.__thread_class__
         periodic_thread_class = real_class() if self._real_thread else python_class
         self._worker = periodic_thread_class(
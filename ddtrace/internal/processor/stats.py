@@ -15,13 +15,13 @@ from ddtrace.span import _is_top_level
 from . import SpanProcessor
 from ...constants import SPAN_MEASURED_KEY
 from .._encoding import packb
-from ..agent import get_connection
-from ..compat import get_connection_response
-from ..compat import httplib
 from ..forksafe import Lock
 from ..hostname import get_hostname
 from ..logger import get_logger
 from ..periodic import PeriodicService
+from ..transport import PRIORITY_STATS
+from ..transport import fibonacci_retry
+from ..transport import get_transport
 from ..writer import _human_size
 
 
@@ -113,14 +113,8 @@ class SpanStatsProcessorV06(PeriodicService, SpanProcessor):
         self._hostname = six.ensure_text(get_hostname())
         self._lock = Lock()
         self._enabled = True
-        self._retry_request = tenacity.Retrying(
-            # Use a Fibonacci policy with jitter, same as AgentWriter.
-            wait=tenacity.wait_random_exponential(
-                multiplier=0.618 * self.interval / (1.618 ** retry_attempts) / 2, exp_base=1.618
-            ),
-            stop=tenacity.stop_after_attempt(retry_attempts),
-            retry=tenacity.retry_if_exception_type((httplib.HTTPException, OSError, IOError)),
-        )
+        self._transport = get_transport(self._agent_url)
+        self._retry_request = fibonacci_retry(retry_attempts, self.interval)
         self.start()
 
     def on_span_start(self, span):
@@ -202,9 +196,9 @@ class SpanStatsProcessorV06(PeriodicService, SpanProcessor):
     def _flush_stats(self, payload):
         # type: (bytes) -> None
         try:
-            conn = get_connection(self._agent_url, self._timeout)
-            conn.request("PUT", self._endpoint, payload, self._headers)
-            resp = get_connection_response(conn)
+            resp = self._transport.request(
+                "PUT", self._endpoint, payload, self._headers, timeout=self._timeout, priority=PRIORITY_STATS
+            )
         except Exception:
             log.error("failed to submit span stats to the Datadog agent at %s", self._agent_endpoint, exc_info=True)
             raise
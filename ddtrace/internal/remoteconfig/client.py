@@ -21,6 +21,7 @@ import ddtrace
 from ddtrace.appsec.utils import _appsec_rc_capabilities
 from ddtrace.internal import agent
 from ddtrace.internal import runtime
+from ddtrace.internal import transport
 from ddtrace.internal.runtime import container
 from ddtrace.internal.utils.time import parse_isoformat
 
@@ -141,8 +142,12 @@ def _load_json(data):
     return json.loads(data)
 
 
-def _extract_target_file(payload, target, config):
-    # type: (AgentPayload, str, ConfigMetadata) -> Optional[Mapping[str, Any]]
+def _extract_target_file(payload, target, config, cache=None):
+    # type: (AgentPayload, str, ConfigMetadata, Optional[Dict[str, Mapping[str, Any]]]) -> Optional[Mapping[str, Any]]
+    if cache is not None and config.sha256_hash in cache:
+        # The content of the target file has already been decoded and verified
+        return cache[config.sha256_hash]
+
     candidates = [item.raw for item in payload.target_files if item.path == target]
     if len(candidates) != 1 or candidates[0] is None:
         log.debug("invalid target_files for %r", target)
@@ -160,10 +165,14 @@ def _extract_target_file(payload, target, config):
         )
 
     try:
-        return _load_json(raw)
+        content = _load_json(raw)
     except Exception:
         raise RemoteConfigError("invalid JSON content for target {!r}".format(target))
 
+    if cache is not None:
+        cache[computed_hash] = content
+    return content
+
 
 def _parse_target(target, metadata):
     # type: (str, TargetDesc) -> ConfigMetadata
@@ -190,7 +199,8 @@ class RemoteConfigClient(object):
         # type: () -> None
         self.id = str(uuid.uuid4())
         self.agent_url = agent_url = agent.get_trace_url()
-        self._conn = agent.get_connection(agent_url, timeout=agent.get_trace_agent_timeout())
+        self._transport = transport.get_transport(agent_url)
+        self._timeout = agent.get_trace_agent_timeout()
         self._headers = {"content-type": "application/json"}
 
         container_info = container.get_container_info()
@@ -234,6 +244,15 @@ class RemoteConfigClient(object):
         self._last_targets_version = 0
         self._last_error = None  # type: Optional[str]
         self._backend_state = None  # type: Optional[str]
+        # Raw targets and client configurations of the last payload that was
+        # fully applied, to skip processing the following identical ones.
+        self._last_targets = None  # type: Optional[str]
+        self._last_client_configs = set()  # type: Set[str]
+        self._targets_expires = None  # type: Optional[datetime]
+        # Decoded target files, by sha256 hash
+        self._target_files_cache = dict()  # type: Dict[str, Mapping[str, Any]]
+        # Encoded request payload, rebuilt only when the client state changes
+        self._payload = None  # type: Optional[Tuple[str, str]]
 
     def register_product(self, product_name, func=None):
         # type: (str, Optional[ProductCallback]) -> None
@@ -241,15 +260,19 @@ class RemoteConfigClient(object):
             self._products[product_name] = func
         else:
             self._products.pop(product_name, None)
+        self._payload = None
 
     def _send_request(self, payload):
         # type: (str) -> Optional[Mapping[str, Any]]
-        try:
-            self._conn.request("POST", "v0.7/config", payload, self._headers)
-            resp = self._conn.getresponse()
-            data = resp.read()
-        finally:
-            self._conn.close()
+        resp = self._transport.request(
+            "POST",
+            "v0.7/config",
+            payload,
+            self._headers,
+            timeout=self._timeout,
+            priority=transport.PRIORITY_REMOTE_CONFIG,
+        )
+        data = resp.body
 
         if resp.status == 404:
             # Remote configuration is not enabled or unsupported by the agent
@@ -275,6 +298,34 @@ class RemoteConfigClient(object):
             cached_target_files=self.cached_target_files,
         )
 
+    def _get_payload(self):
+        # type: () -> str
+        """Return the encoded request payload, which is only rebuilt when the client state has changed."""
+        capabilities = _appsec_rc_capabilities()
+        if self._payload is None or self._payload[0] != capabilities:
+            payload = self._build_payload(self._build_state())
+            self._payload = (capabilities, json.dumps(payload, separators=(",", ":")))
+        return self._payload[1]
+
+    def _set_error(self, error):
+        # type: (Optional[str]) -> None
+        if error != self._last_error:
+            self._last_error = error
+            self._payload = None
+
+    def _is_unchanged(self, data):
+        # type: (Mapping[str, Any]) -> bool
+        """Whether the agent sent the same targets as the last applied ones, with no new target files."""
+        return (
+            self._last_targets is not None
+            and data.get("targets") == self._last_targets
+            and not data.get("roots")
+            and not data.get("target_files")
+            and set(data.get("client_configs") or ()) == self._last_client_configs
+            and self._targets_expires is not None
+            and self._targets_expires > datetime.utcnow()
+        )
+
     def _build_state(self):
         # type: () -> Mapping[str, Any]
         has_error = self._last_error is not None
@@ -315,6 +366,11 @@ class RemoteConfigClient(object):
 
     def _process_response(self, data):
         # type: (Mapping[str, Any]) -> None
+        if self._is_unchanged(data):
+            log.debug("Targets version %d unchanged", self._last_targets_version)
+            return
+
+        self._last_targets = None
         try:
             # log.debug("response payload: %r", data)
             payload = self.converter.structure_attrs_fromdict(data, AgentPayload)
@@ -367,7 +423,7 @@ class RemoteConfigClient(object):
             if applied_config == config:
                 continue
 
-            config_content = _extract_target_file(payload, target, config)
+            config_content = _extract_target_file(payload, target, config, self._target_files_cache)
             if config_content is None:
                 continue
 
@@ -383,6 +439,20 @@ class RemoteConfigClient(object):
         self._last_targets_version = last_targets_version
         self._applied_configs = applied_configs
         self._backend_state = backend_state
+        self._payload = None
+
+        # Only keep the target files of the applied configurations
+        cache = self._target_files_cache
+        self._target_files_cache = {
+            c.sha256_hash: cache[c.sha256_hash] for c in applied_configs.values() if c.sha256_hash in cache
+        }
+
+        if set(applied_configs) == set(client_configs):
+            # Otherwise, the configurations that failed to load are retried
+            # with the next payload.
+            self._last_targets = data.get("targets")
+            self._last_client_configs = set(payload.client_configs)
+            self._targets_expires = payload.targets.signed.expires  # type: ignore[union-attr]
 
         if self._applied_configs:
             cached_data = []
@@ -401,17 +471,16 @@ class RemoteConfigClient(object):
     def request(self):
         # type: () -> None
         try:
-            state = self._build_state()
-            payload = json.dumps(self._build_payload(state), indent=2)
+            payload = self._get_payload()
             # log.debug("request payload: %r", payload)
             response = self._send_request(payload)
             if response is None:
                 return
             self._process_response(response)
         except RemoteConfigError as e:
-            self._last_error = str(e)
+            self._set_error(str(e))
             log.warning("remote configuration client reported an error", exc_info=True)
         except Exception:
             log.warning("Unexpected error", exc_info=True)
         else:
-            self._last_error = None
+            self._set_error(None)
@@ -1,8 +1,13 @@
+import gc
+
+
 GC_COUNT_GEN0 = "runtime.python.gc.count.gen0"
 GC_COUNT_GEN1 = "runtime.python.gc.count.gen1"
 GC_COUNT_GEN2 = "runtime.python.gc.count.gen2"
+GC_PAUSE_TIME = "runtime.python.gc.pause_time"
 
 THREAD_COUNT = "runtime.python.thread_count"
+FD_COUNT = "runtime.python.fd_count"
 MEM_RSS = "runtime.python.mem.rss"
 # `runtime.python.cpu.time.sys` metric is used to auto-enable runtime metrics dashboards in DD backend
 CPU_TIME_SYS = "runtime.python.cpu.time.sys"
@@ -11,14 +16,45 @@ CPU_PERCENT = "runtime.python.cpu.percent"
 CTX_SWITCH_VOLUNTARY = "runtime.python.cpu.ctx_switch.voluntary"
 CTX_SWITCH_INVOLUNTARY = "runtime.python.cpu.ctx_switch.involuntary"
 
+EVENT_LOOP_LAG_P50 = "runtime.python.event_loop.lag.p50"
+EVENT_LOOP_LAG_P99 = "runtime.python.event_loop.lag.p99"
+EVENT_LOOP_LAG_MAX = "runtime.python.event_loop.lag.max"
+EVENT_LOOP_CALLBACKS = "runtime.python.event_loop.callbacks"
+EVENT_LOOP_SLOW_CALLBACKS = "runtime.python.event_loop.slow_callbacks"
+EVENT_LOOP_READY_QUEUE_MAX = "runtime.python.event_loop.ready_queue.max"
+
 GC_RUNTIME_METRICS = set([GC_COUNT_GEN0, GC_COUNT_GEN1, GC_COUNT_GEN2])
+if hasattr(gc, "callbacks"):
+    # GC pauses can only be timed with Python 3
+    GC_RUNTIME_METRICS.add(GC_PAUSE_TIME)
 
 PSUTIL_RUNTIME_METRICS = set(
-    [THREAD_COUNT, MEM_RSS, CTX_SWITCH_VOLUNTARY, CTX_SWITCH_INVOLUNTARY, CPU_TIME_SYS, CPU_TIME_USER, CPU_PERCENT]
+    [
+        THREAD_COUNT,
+        FD_COUNT,
+        MEM_RSS,
+        CTX_SWITCH_VOLUNTARY,
+        CTX_SWITCH_INVOLUNTARY,
+        CPU_TIME_SYS,
+        CPU_TIME_USER,
+        CPU_PERCENT,
+    ]
 )
 
 DEFAULT_RUNTIME_METRICS = GC_RUNTIME_METRICS | PSUTIL_RUNTIME_METRICS
 
+# Only reported when event loops are monitored
+EVENT_LOOP_RUNTIME_METRICS = set(
+    [
+        EVENT_LOOP_LAG_P50,
+        EVENT_LOOP_LAG_P99,
+        EVENT_LOOP_LAG_MAX,
+        EVENT_LOOP_CALLBACKS,
+        EVENT_LOOP_SLOW_CALLBACKS,
+        EVENT_LOOP_READY_QUEUE_MAX,
+    ]
+)
+
 SERVICE = "service"
 ENV = "env"
 LANG_INTERPRETER = "lang_interpreter"
@@ -0,0 +1,376 @@
+"""
+Monitoring of asyncio event loops.
+
+An ``EventLoopMonitor`` measures the lag of an event loop by scheduling a probe callback at regular intervals: the lag
+is the delay between the time the probe was due and the time it actually ran. The monitor also times every callback
+run by the loop, and reports the ones that take longer than ``slow_callback_duration``, which block the loop. A
+watchdog thread captures the stack of the loop thread while such a callback is still running, so that the code
+blocking the loop can be found.
+
+Slow callbacks are passed to the registered listeners, like the profiler.
+"""
+from collections import deque
+import os
+import sys
+import threading
+from typing import List
+from typing import Optional
+from typing import TYPE_CHECKING
+from typing import Tuple
+import weakref
+
+import attr
+
+from ddtrace.internal import forksafe
+from ddtrace.internal import periodic
+from ddtrace.internal.compat import monotonic
+from ddtrace.internal.logger import get_logger
+from ddtrace.internal.utils.formats import asbool
+
+from .constants import EVENT_LOOP_CALLBACKS
+from .constants import EVENT_LOOP_LAG_MAX
+from .constants import EVENT_LOOP_LAG_P50
+from .constants import EVENT_LOOP_LAG_P99
+from .constants import EVENT_LOOP_READY_QUEUE_MAX
+from .constants import EVENT_LOOP_SLOW_CALLBACKS
+
+
+try:
+    import asyncio
+except ImportError:
+    asyncio = None  # type: ignore[assignment]
+
+
+if TYPE_CHECKING:  # pragma: no cover
+    from typing import Any
+    from typing import Callable
+    from typing import Deque
+
+
+# (filename, line number, function name, class name), as in the profiler events
+FrameType = Tuple[str, int, str, str]
+
+
+log = get_logger(__name__)
+
+available = asyncio is not None
+
+enabled = available and asbool(os.getenv("DD_RUNTIME_METRICS_EVENT_LOOP_ENABLED", default=False))
+
+SLOW_CALLBACK_DURATION = float(os.getenv("DD_RUNTIME_METRICS_EVENT_LOOP_SLOW_CALLBACK_DURATION", default=0.1))
+PROBE_INTERVAL = 0.1
+MAX_LAG_SAMPLES = 1024
+MAX_NFRAMES = 64
+
+
+@attr.s(slots=True)
+class SlowCallback(object):
+    """A callback that blocked an event loop for too long."""
+
+    callback = attr.ib(type=str)
+    duration = attr.ib(type=float)
+    thread_id = attr.ib(type=int)
+    thread_name = attr.ib(type=Optional[str])
+    task_id = attr.ib(type=Optional[int])
+    task_name = attr.ib(type=Optional[str])
+    frames = attr.ib(type=List[FrameType])
+    nframes = attr.ib(type=int)
+
+
+_slow_callback_listeners = []  # type: List[Callable[[SlowCallback], None]]
+
+
+def add_slow_callback_listener(listener):
+    # type: (Callable[[SlowCallback], None]) -> None
+    _slow_callback_listeners.append(listener)
+
+
+def remove_slow_callback_listener(listener):
+    # type: (Callable[[SlowCallback], None]) -> None
+    _slow_callback_listeners.remove(listener)
+
+
+def _extract_frames(frame):
+    # type: (Any) -> Tuple[List[FrameType], int]
+    frames = []  # type: List[FrameType]
+    nframes = 0
+    while frame is not None:
+        if nframes < MAX_NFRAMES:
+            code = frame.f_code
+            frames.append((code.co_filename, frame.f_lineno, code.co_name, ""))
+        nframes += 1
+        frame = frame.f_back
+    return frames, nframes
+
+
+def _describe_callback(handle):
+    # type: (Any) -> Tuple[str, List[FrameType], Optional[Any]]
+    """Return a description, the location and the task of the callback of a handle."""
+    callback = getattr(handle, "_callback", None)
+    task = getattr(callback, "__self__", None)
+    if not isinstance(task, asyncio.Task):
+        task = None
+    code = getattr(getattr(callback, "__func__", callback), "__code__", None)
+    if task is not None:
+        coro = getattr(task, "_coro", None)
+        code = getattr(coro, "cr_code", None) or getattr(coro, "gi_code", None)
+    frames = [(code.co_filename, code.co_firstlineno, code.co_name, "")] if code is not None else []
+    return repr(task if task is not None else callback), frames, task
+
+
+class EventLoopMonitor(object):
+    """Monitor the lag and the callbacks of an event loop."""
+
+    def __init__(self, loop, slow_callback_duration=SLOW_CALLBACK_DURATION, probe_interval=PROBE_INTERVAL):
+        # type: (asyncio.AbstractEventLoop, float, float) -> None
+        self.slow_callback_duration = slow_callback_duration
+        self.probe_interval = probe_interval
+        # The loop keeps a reference to the monitor through the probe, not
+        # the other way around.
+        self._loop = weakref.ref(loop)
+        self._thread_id = None  # type: Optional[int]
+        self._lock = threading.Lock()
+        self._lag = deque(maxlen=MAX_LAG_SAMPLES)  # type: Deque[float]
+        self._callbacks = 0
+        self._slow_callbacks = 0
+        self._ready_queue_max = 0
+        # The callback being run, and the stack captured by the watchdog if
+        # it is blocking the loop
+        self._current = None  # type: Optional[Any]
+        self._started = 0.0
+        self._blocked = None  # type: Optional[Tuple[Any, List[FrameType], int]]
+
+    def start(self):
+        # type: () -> None
+        loop = self._loop()
+        if loop is not None:
+            loop.call_soon_threadsafe(self._probe, None)
+
+    def _probe(self, due):
+        # type: (Optional[float]) -> None
+        loop = self._loop()
+        if loop is None:
+            return
+        now = loop.time()
+        if due is None:
+            self._thread_id = threading.current_thread().ident
+        else:
+            ready = len(getattr(loop, "_ready", ()))
+            with self._lock:
+                self._lag.append(max(now - due, 0.0))
+                if ready > self._ready_queue_max:
+                    self._ready_queue_max = ready
+        loop.call_at(now + self.probe_interval, self._probe, now + self.probe_interval)
+
+    def _callback_done(self, handle, duration):
+        # type: (Any, float) -> None
+        self._callbacks += 1
+        if duration < self.slow_callback_duration:
+            return
+
+        self._slow_callbacks += 1
+        description, frames, task = _describe_callback(handle)
+        nframes = len(frames)
+        blocked, self._blocked = self._blocked, None
+        if blocked is not None and blocked[0] is handle:
+            # The watchdog caught the callback blocking the loop
+            _, frames, nframes = blocked
+
+        log.debug("Executing %s took %.3f seconds", description, duration)
+        if not _slow_callback_listeners:
+            return
+
+        thread = threading.current_thread()
+        slow_callback = SlowCallback(
+            callback=description,
+            duration=duration,
+            thread_id=thread.ident,
+            thread_name=thread.name,
+            task_id=id(task) if task is not None else None,
+            task_name=_task_get_name(task) if task is not None else None,
+            frames=frames,
+            nframes=nframes,
+        )
+        for listener in list(_slow_callback_listeners):
+            try:
+                listener(slow_callback)
+            except Exception:
+                log.debug("Slow callback listener %r failed", listener, exc_info=True)
+
+    def _check_blocked(self, now, current_frames):
+        # type: (float, Callable[[], Any]) -> None
+        """Capture the stack of the loop thread if the current callback is blocking the loop."""
+        handle = self._current
+        if (
+            handle is None
+            or now - self._started < self.slow_callback_duration
+            or (self._blocked is not None and self._blocked[0] is handle)
+        ):
+            return
+        frame = current_frames().get(self._thread_id)
+        if frame is not None and self._current is handle:
+            frames, nframes = _extract_frames(frame)
+            self._blocked = (handle, frames, nframes)
+
+    def collect(self):
+        # type: () -> Tuple[List[float], int, int, int]
+        """Return and reset the lag samples, the number of callbacks and slow callbacks, and the ready queue depth."""
+        with self._lock:
+            lag, self._lag = list(self._lag), deque(maxlen=MAX_LAG_SAMPLES)
+            ready_queue_max, self._ready_queue_max = self._ready_queue_max, 0
+        callbacks, self._callbacks = self._callbacks, 0
+        slow_callbacks, self._slow_callbacks = self._slow_callbacks, 0
+        return lag, callbacks, slow_callbacks, ready_queue_max
+
+
+_monitors = weakref.WeakKeyDictionary()  # type: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, EventLoopMonitor]
+_monitors_lock = threading.Lock()
+_watchdog = None  # type: Optional[_Watchdog]
+_original_handle_run = None
+
+
+def _task_get_name(task):
+    # type: (Any) -> str
+    get_name = getattr(task, "get_name", None)
+    return get_name() if get_name is not None else "Task-%d" % id(task)
+
+
+def _handle_run(self):
+    monitor = getattr(self._loop, "_ddtrace_loop_monitor", None)
+    if monitor is None:
+        return _original_handle_run(self)
+
+    monitor._current = self
+    monitor._started = start = monotonic()
+    try:
+        return _original_handle_run(self)
+    finally:
+        monitor._current = None
+        monitor._callback_done(self, monotonic() - start)
+
+
+class _Watchdog(periodic.PeriodicService):
+    """Capture the stacks of the loops blocked by a callback."""
+
+    def periodic(self):
+        # type: () -> None
+        now = monotonic()
+        for monitor in list(_monitors.values()):
+            monitor._check_blocked(now, sys._current_frames)
+
+
+def monitor_loop(loop, slow_callback_duration=SLOW_CALLBACK_DURATION):
+    # type: (asyncio.AbstractEventLoop, float) -> EventLoopMonitor
+    """Start monitoring an event loop. Return the existing monitor if the loop is already monitored."""
+    global _original_handle_run, _watchdog
+
+    with _monitors_lock:
+        monitor = _monitors.get(loop)
+        if monitor is not None:
+            return monitor
+
+        if _original_handle_run is None:
+            _original_handle_run = asyncio.events.Handle._run
+            asyncio.events.Handle._run = _handle_run  # type: ignore[assignment]
+
+        monitor = _monitors[loop] = EventLoopMonitor(loop, slow_callback_duration)
+        try:
+            loop._ddtrace_loop_monitor = monitor  # type: ignore[attr-defined]
+        except AttributeError:
+            # Loops like uvloop do not run their callbacks through asyncio
+            # handles: only the lag is measured.
+            pass
+        monitor.start()
+
+        if _watchdog is None:
+            _watchdog = _Watchdog(slow_callback_duration / 2.0)
+            _watchdog.start()
+
+    return monitor
+
+
+def monitor_running_loop():
+    # type: () -> Optional[EventLoopMonitor]
+    """Start monitoring the event loop running in the current thread, if event loop monitoring is enabled.
+
+    This is meant to be called by the integrations of asynchronous web frameworks when handling a request.
+    """
+    if not enabled:
+        return None
+    loop = asyncio._get_running_loop()
+    if loop is None:
+        return None
+    monitor = getattr(loop, "_ddtrace_loop_monitor", None)
+    if monitor is not None:
+        return monitor
+    return monitor_loop(loop)
+
+
+def stop_monitoring():
+    # type: () -> None
+    """Stop monitoring all the event loops."""
+    global _original_handle_run, _watchdog
+
+    with _monitors_lock:
+        for loop in list(_monitors.keys()):
+            try:
+                del loop._ddtrace_loop_monitor
+            except AttributeError:
+                pass
+        _monitors.clear()
+        if _original_handle_run is not None:
+            asyncio.events.Handle._run = _original_handle_run  # type: ignore[assignment]
+            _original_handle_run = None
+        if _watchdog is not None:
+            _watchdog.stop()
+            _watchdog = None
+
+
+def _percentile(values, percentile):
+    # type: (List[float], float) -> float
+    return values[int(round(percentile * (len(values) - 1)))]
+
+
+def collect_metrics():
+    # type: () -> List[Tuple[str, float]]
+    """Return the metrics of all the monitored event loops since the last call."""
+    if not _monitors:
+        return []
+
+    lag = []  # type: List[float]
+    callbacks = slow_callbacks = ready_queue_max = 0
+    for monitor in list(_monitors.values()):
+        m_lag, m_callbacks, m_slow_callbacks, m_ready_queue_max = monitor.collect()
+        lag.extend(m_lag)
+        callbacks += m_callbacks
+        slow_callbacks += m_slow_callbacks
+        ready_queue_max = max(ready_queue_max, m_ready_queue_max)
+
+    metrics = [
+        (EVENT_LOOP_CALLBACKS, callbacks),
+        (EVENT_LOOP_SLOW_CALLBACKS, slow_callbacks),
+        (EVENT_LOOP_READY_QUEUE_MAX, ready_queue_max),
+    ]  # type: List[Tuple[str, float]]
+    if lag:
+        lag.sort()
+        metrics.extend(
+            [
+                (EVENT_LOOP_LAG_P50, _percentile(lag, 0.5)),
+                (EVENT_LOOP_LAG_P99, _percentile(lag, 0.99)),
+                (EVENT_LOOP_LAG_MAX, lag[-1]),
+            ]
+        )
+    return metrics
+
+
+@forksafe.register
+def _reset_watchdog():
+    # type: () -> None
+    global _watchdog, _monitors_lock
+
+    # The watchdog thread is gone in the child process. The loops are still
+    # monitored, so start a new one if needed.
+    _monitors_lock = threading.Lock()
+    if _watchdog is not None:
+        _watchdog = _Watchdog(_watchdog.interval)
+        _watchdog.start()
@@ -1,33 +1,71 @@
 import os
+import sys
 from typing import List
+from typing import Optional
 from typing import Tuple
 
+from . import event_loop
+from ..compat import monotonic
 from .collector import ValueCollector
 from .constants import CPU_PERCENT
 from .constants import CPU_TIME_SYS
 from .constants import CPU_TIME_USER
 from .constants import CTX_SWITCH_INVOLUNTARY
 from .constants import CTX_SWITCH_VOLUNTARY
+from .constants import FD_COUNT
 from .constants import GC_COUNT_GEN0
 from .constants import GC_COUNT_GEN1
 from .constants import GC_COUNT_GEN2
+from .constants import GC_PAUSE_TIME
 from .constants import MEM_RSS
 from .constants import THREAD_COUNT
 
 
+try:
+    import resource
+except ImportError:
+    resource = None  # type: ignore[assignment]
+
+
 class RuntimeMetricCollector(ValueCollector):
     value = []  # type: List[Tuple[str, str]]
     periodic = True
 
 
+class _GCPauseTimer(object):
+    """Garbage collector callback accumulating the time spent in collections."""
+
+    def __init__(self):
+        # type: () -> None
+        self.total = 0.0
+        self._start = None  # type: Optional[float]
+
+    def __call__(self, phase, info):
+        if phase == "start":
+            self._start = monotonic()
+        elif self._start is not None:
+            self.total += monotonic() - self._start
+            self._start = None
+
+
+_gc_pause_timer = _GCPauseTimer()
+
+
 class GCRuntimeMetricCollector(RuntimeMetricCollector):
-    """Collector for garbage collection generational counts
+    """Collector for garbage collection generational counts and pause time
 
     More information at https://docs.python.org/3/library/gc.html
     """
 
     required_modules = ["gc"]
 
+    def _on_modules_load(self):
+        gc = self.modules["gc"]
+        self._timed = hasattr(gc, "callbacks")
+        if self._timed and _gc_pause_timer not in gc.callbacks:
+            gc.callbacks.append(_gc_pause_timer)
+        self._last_pause_time = _gc_pause_timer.total
+
     def collect_fn(self, keys):
         gc = self.modules.get("gc")
 
@@ -38,6 +76,12 @@ class GCRuntimeMetricCollector(RuntimeMetricCollector):
             (GC_COUNT_GEN2, counts[2]),
         ]
 
+        if self._timed:
+            # only return the time spent in collections since the last call
+            pause_time = _gc_pause_timer.total
+            metrics.append((GC_PAUSE_TIME, pause_time - self._last_pause_time))
+            self._last_pause_time = pause_time
+
         return metrics
 
 
@@ -91,4 +135,100 @@ class PSUtilRuntimeMetricCollector(RuntimeMetricCollector):
                 (CPU_PERCENT, self.proc.cpu_percent()),
             ]
 
+            if hasattr(self.proc, "num_fds"):
+                metrics.append((FD_COUNT, self.proc.num_fds()))
+
             return metrics
+
+
+class ProcRuntimeMetricCollector(RuntimeMetricCollector):
+    """Collector for the same process metrics as ``PSUtilRuntimeMetricCollector``, reading them directly from procfs.
+
+    Only available on Linux. Each collection reads ``/proc/self/stat`` and ``/proc/self/statm`` once, from file
+    descriptors that are kept open, and gets the context switches from ``getrusage``.
+    """
+
+    available = sys.platform.startswith("linux") and resource is not None and os.path.exists("/proc/self/stat")
+
+    # Indexes of the fields of /proc/self/stat, after the command name
+    STAT_UTIME = 11
+    STAT_STIME = 12
+    STAT_NUM_THREADS = 17
+
+    def __init__(self, *args, **kwargs):
+        self._pid = None  # type: Optional[int]
+        self._stat_fd = self._statm_fd = -1
+        super(ProcRuntimeMetricCollector, self).__init__(*args, **kwargs)
+        if self.enabled and not self.available:
+            self.enabled = False
+            return
+        self._clock_ticks = float(os.sysconf("SC_CLK_TCK"))
+        self._page_size = resource.getpagesize()
+        # Totals of the last collection: cpu time sys and user, voluntary and
+        # involuntary context switches, and wall time
+        self._last = [0.0, 0.0, 0, 0, None]  # type: List[Optional[float]]
+
+    def __del__(self):
+        self._close()
+
+    def _close(self):
+        # type: () -> None
+        for fd in (self._stat_fd, self._statm_fd):
+            if fd >= 0:
+                os.close(fd)
+        self._stat_fd = self._statm_fd = -1
+
+    @staticmethod
+    def _read(fd):
+        # type: (int) -> bytes
+        os.lseek(fd, 0, os.SEEK_SET)
+        return os.read(fd, 4096)
+
+    def collect_fn(self, keys):
+        pid = os.getpid()
+        if pid != self._pid:
+            # /proc/self resolves to the process that opened the files
+            self._close()
+            self._stat_fd = os.open("/proc/self/stat", os.O_RDONLY)
+            self._statm_fd = os.open("/proc/self/statm", os.O_RDONLY)
+            self._pid = pid
+
+        # The command name might contain spaces and parentheses
+        stat = self._read(self._stat_fd).rpartition(b")")[2].split()
+        rss = int(self._read(self._statm_fd).split()[1]) * self._page_size
+        usage = resource.getrusage(resource.RUSAGE_SELF)
+        now = monotonic()
+
+        last = self._last
+        cpu_time_sys_total = int(stat[self.STAT_STIME]) / self._clock_ticks
+        cpu_time_user_total = int(stat[self.STAT_UTIME]) / self._clock_ticks
+        cpu_time_sys = cpu_time_sys_total - last[0]
+        cpu_time_user = cpu_time_user_total - last[1]
+        # Same as psutil: the first call returns 0, then the percentage of cpu
+        # time since the last call
+        cpu_percent = (cpu_time_sys + cpu_time_user) / (now - last[4]) * 100 if last[4] else 0.0
+
+        metrics = [
+            (THREAD_COUNT, int(stat[self.STAT_NUM_THREADS])),
+            (MEM_RSS, rss),
+            (CTX_SWITCH_VOLUNTARY, usage.ru_nvcsw - last[2]),
+            (CTX_SWITCH_INVOLUNTARY, usage.ru_nivcsw - last[3]),
+            (CPU_TIME_SYS, cpu_time_sys),
+            (CPU_TIME_USER, cpu_time_user),
+            (CPU_PERCENT, cpu_percent),
+            # Do not count the file descriptors of the collector
+            (FD_COUNT, len(os.listdir("/proc/self/fd")) - 2),
+        ]
+
+        last[:] = cpu_time_sys_total, cpu_time_user_total, usage.ru_nvcsw, usage.ru_nivcsw, now
+
+        return metrics
+
+
+class EventLoopRuntimeMetricCollector(RuntimeMetricCollector):
+    """Collector for the lag and callbacks of the monitored asyncio event loops."""
+
+    enabled = event_loop.available
+
+    def collect_fn(self, keys):
+        return event_loop.collect_metrics()
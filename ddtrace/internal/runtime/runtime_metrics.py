@@ -19,8 +19,11 @@ from ..dogstatsd import get_dogstatsd_client
 from ..logger import get_logger
 from .constants import DEFAULT_RUNTIME_METRICS
 from .constants import DEFAULT_RUNTIME_TAGS
+from .constants import EVENT_LOOP_RUNTIME_METRICS
+from .metric_collectors import EventLoopRuntimeMetricCollector
 from .metric_collectors import GCRuntimeMetricCollector
 from .metric_collectors import PSUtilRuntimeMetricCollector
+from .metric_collectors import ProcRuntimeMetricCollector
 from .tag_collectors import PlatformTagCollector
 from .tag_collectors import TracerTagCollector
 
@@ -54,10 +57,11 @@ class RuntimeTags(RuntimeCollectorsIterable):
 
 
 class RuntimeMetrics(RuntimeCollectorsIterable):
-    ENABLED = DEFAULT_RUNTIME_METRICS
+    ENABLED = DEFAULT_RUNTIME_METRICS | EVENT_LOOP_RUNTIME_METRICS
     COLLECTORS = [
         GCRuntimeMetricCollector,
-        PSUtilRuntimeMetricCollector,
+        ProcRuntimeMetricCollector if ProcRuntimeMetricCollector.available else PSUtilRuntimeMetricCollector,
+        EventLoopRuntimeMetricCollector,
     ]
 
 
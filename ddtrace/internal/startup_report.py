@@ -0,0 +1,172 @@
+"""Report of the time spent importing modules when bootstrapping ``ddtrace-run``.
+
+The bootstrap is run in a new interpreter with ``-X importtime`` (Python 3.7+),
+and the import times it reports are aggregated by module and by integration.
+"""
+from collections import defaultdict
+import os
+import re
+import subprocess
+import sys
+from typing import DefaultDict
+from typing import Dict
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+import attr
+
+import ddtrace
+
+
+_IMPORT_TIME_RE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \| ( *)(\S+)\s*$")
+_CONTRIB_PREFIX = "ddtrace.contrib."
+
+
+@attr.s(slots=True)
+class ImportTime(object):
+    """Time spent importing a module, in microseconds."""
+
+    name = attr.ib(type=str)
+    self_us = attr.ib(type=int)
+    cumulative_us = attr.ib(type=int)
+    children = attr.ib(factory=list, type=List["ImportTime"])
+
+    def walk(self):
+        # type: () -> Iterator[ImportTime]
+        yield self
+        for child in self.children:
+            for _ in child.walk():
+                yield _
+
+
+def parse_import_times(output):
+    # type: (str) -> List[ImportTime]
+    """Parse the output of ``python -X importtime`` into trees of imports.
+
+    Return the imports that were not triggered by other imports.
+    """
+    # DEV: A module is reported after the modules it imports, which are
+    # indented by two more spaces.
+    pending = defaultdict(list)  # type: DefaultDict[int, List[ImportTime]]
+    roots = []  # type: List[ImportTime]
+    for line in output.splitlines():
+        match = _IMPORT_TIME_RE.match(line)
+        if match is None:
+            continue
+
+        self_us, cumulative_us, indent, name = match.groups()
+        depth = len(indent) // 2
+        node = ImportTime(name, int(self_us), int(cumulative_us), pending.pop(depth + 1, []))
+        if depth == 0:
+            roots.append(node)
+        else:
+            pending[depth].append(node)
+
+    # Imports might be left without a parent if the output was truncated
+    for depth in sorted(pending):
+        roots.extend(pending[depth])
+    return roots
+
+
+def integration_import_times(root):
+    # type: (ImportTime) -> Dict[str, int]
+    """Return the cumulative import time of each integration imported by ``root``."""
+    times = defaultdict(int)  # type: DefaultDict[str, int]
+    nodes = [root]
+    while nodes:
+        node = nodes.pop()
+        if node.name.startswith(_CONTRIB_PREFIX):
+            integration = node.name[len(_CONTRIB_PREFIX) :].partition(".")[0]
+            times[integration] += node.cumulative_us
+            continue
+        nodes.extend(node.children)
+    return dict(times)
+
+
+# DEV: -X importtime only reports the modules imported with the import
+# statement, so importlib.import_module, used to load the integrations, is
+# routed through it. The bootstrap module is then imported explicitly, in place
+# of any sitecustomize module imported by site.
+_BOOTSTRAP_CODE = """
+import importlib
+import sys
+
+_import_module = importlib.import_module
+
+
+def import_module(name, package=None):
+    if name.startswith("."):
+        return _import_module(name, package)
+    __import__(name)
+    return sys.modules[name]
+
+
+importlib.import_module = import_module
+sys.modules.pop("sitecustomize", None)
+sys.path.insert(0, %r)
+import sitecustomize
+"""
+
+
+def collect(executable=None, env=None):
+    # type: (Optional[str], Optional[Dict[str, str]]) -> Optional[ImportTime]
+    """Bootstrap ``ddtrace-run`` in a new interpreter and return its import times.
+
+    Return ``None`` if the bootstrap import times could not be collected.
+    """
+    bootstrap_dir = os.path.join(os.path.dirname(ddtrace.__file__), "bootstrap")
+    process = subprocess.Popen(
+        [executable or sys.executable, "-X", "importtime", "-c", _BOOTSTRAP_CODE % bootstrap_dir],
+        env=env,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+    )
+    _, stderr = process.communicate()
+
+    for root in parse_import_times(stderr.decode("utf-8", errors="replace")):
+        if root.name == "sitecustomize":
+            return root
+    return None
+
+
+def _format_times(title, times, limit):
+    # type: (str, List[Tuple[str, int]], int) -> List[str]
+    lines = ["", title]
+    for name, time_us in sorted(times, key=lambda _: _[1], reverse=True)[:limit]:
+        lines.append("  %9.1f ms  %s" % (time_us / 1e3, name))
+    return lines
+
+
+def pretty_report(root, limit=20):
+    # type: (Optional[ImportTime], int) -> str
+    """Format the startup report of the given bootstrap import times."""
+    if root is None:
+        return "ddtrace-run: could not collect the import times, Python 3.7+ is required for the startup report."
+
+    lines = [
+        "ddtrace-run startup report",
+        "Total import time: %.1f ms" % (root.cumulative_us / 1e3),
+    ]
+    lines.extend(
+        _format_times(
+            "Imports by module (cumulative):",
+            [(_.name, _.cumulative_us) for _ in root.children],
+            limit,
+        )
+    )
+
+    integrations = integration_import_times(root)
+    if integrations:
+        lines.extend(_format_times("Imports by integration (cumulative):", list(integrations.items()), limit))
+
+    lines.extend(
+        _format_times(
+            "Slowest modules (self):",
+            [(_.name, _.self_us) for _ in root.walk() if _ is not root],
+            limit,
+        )
+    )
+
+    return "\n".join(lines)
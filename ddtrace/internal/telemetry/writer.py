@@ -1,21 +1,26 @@
+import gzip
+from io import BytesIO
 import os
 import time
+from typing import Any
 from typing import Dict
 from typing import List
 from typing import Optional
+from typing import Set
 
 from ...internal import atexit
 from ...internal import forksafe
 from ...settings import _config as config
-from ..agent import get_connection
 from ..agent import get_trace_url
-from ..compat import get_connection_response
-from ..compat import httplib
 from ..encoding import JSONEncoderV2
 from ..logger import get_logger
 from ..periodic import PeriodicService
 from ..runtime import get_runtime_id
 from ..service import ServiceStatus
+from ..transport import PRIORITY_TELEMETRY
+from ..transport import Response
+from ..transport import get_transport
+from ..utils.formats import asbool
 from ..utils.formats import parse_tags_str
 from ..utils.time import StopWatch
 from .data import get_application
@@ -31,6 +36,17 @@ def _get_interval_or_default():
     return float(os.getenv("DD_TELEMETRY_HEARTBEAT_INTERVAL", default=60))
 
 
+def _gzip_compress(data):
+    # type: (bytes) -> bytes
+    if hasattr(gzip, "compress"):
+        return gzip.compress(data)
+    # Python 2
+    buf = BytesIO()
+    with gzip.GzipFile(fileobj=buf, mode="wb") as f:
+        f.write(data)
+    return buf.getvalue()
+
+
 class TelemetryWriter(PeriodicService):
     """
     Periodic service which sends Telemetry request payloads to the agent.
@@ -48,14 +64,18 @@ class TelemetryWriter(PeriodicService):
         # after the config has been processed
         self._enabled = None  # type: Optional[bool]
         self._agent_url = agent_url or get_trace_url()
+        self._transport = get_transport(self._agent_url)
 
         self._encoder = JSONEncoderV2()
         self._events_queue = []  # type: List[Dict]
         self._integrations_queue = []  # type: List[Dict]
         self._lock = forksafe.Lock()  # type: forksafe.ResetObject
         self._forked = False  # type: bool
+        # Names of the integrations sent (or about to be sent) to the agent
+        self._reported_integrations = set()  # type: Set[str]
         forksafe.register(self._fork_writer)
 
+        self._compression = asbool(os.getenv("DD_TELEMETRY_COMPRESSION_ENABLED", default=False))
         self._headers = {
             "Content-type": "application/json",
             "DD-Telemetry-API-Version": "v1",
@@ -72,26 +92,32 @@ class TelemetryWriter(PeriodicService):
         return "%s/%s" % (self._agent_url, self.ENDPOINT)
 
     def _send_request(self, request):
-        # type: (Dict) -> httplib.HTTPResponse
+        # type: (Dict) -> Response
         """Sends a telemetry request to the trace agent"""
         with StopWatch() as sw:
-            try:
-                conn = get_connection(self._agent_url)
-                rb_json = self._encoder.encode(request)
-                conn.request("POST", self.ENDPOINT, rb_json, self._create_headers(request["request_type"]))
-
-                resp = get_connection_response(conn)
-                log.debug(
-                    "sent %d in %.5fs to %s/%s. response: %s",
-                    len(rb_json),
-                    sw.elapsed(),
-                    self._agent_url,
-                    self.ENDPOINT,
-                    resp.status,
-                )
-                return resp
-            finally:
-                conn.close()
+            rb_json = self._encoder.encode(request)
+            if not isinstance(rb_json, bytes):
+                rb_json = rb_json.encode("utf-8")
+            headers = self._create_headers(request["request_type"])
+            if self._compression:
+                rb_json = _gzip_compress(rb_json)
+                headers["Content-Encoding"] = "gzip"
+            resp = self._transport.request(
+                "POST",
+                self.ENDPOINT,
+                rb_json,
+                headers,
+                priority=PRIORITY_TELEMETRY,
+            )
+            log.debug(
+                "sent %d in %.5fs to %s/%s. response: %s",
+                len(rb_json),
+                sw.elapsed(),
+                self._agent_url,
+                self.ENDPOINT,
+                resp.status,
+            )
+            return resp
 
     def _flush_integrations_queue(self):
         # type: () -> List[Dict]
@@ -109,6 +135,24 @@ class TelemetryWriter(PeriodicService):
             self._events_queue = []
         return requests
 
+    def _batch_requests(self, requests):
+        # type: (List[Dict]) -> List[Dict]
+        """Combine the queued telemetry requests into as few requests as possible.
+
+        ``app-started`` must be the first event received for a runtime, so it is always sent on its own. The other
+        events are sent in a single ``message-batch`` request.
+        """
+        started = [r for r in requests if r["request_type"] == "app-started"]
+        others = [r for r in requests if r["request_type"] != "app-started"]
+        if len(others) < 2:
+            return started + others
+
+        payload = [{"request_type": r["request_type"], "payload": r["payload"]} for r in others]
+        with self._lock:
+            batch = self._create_telemetry_request(payload, "message-batch", self._sequence)
+            self._sequence += 1
+        return started + [batch]
+
     def reset_queues(self):
         # type: () -> None
         with self._lock:
@@ -124,7 +168,7 @@ class TelemetryWriter(PeriodicService):
             # Optimization: only queue heartbeat if no other events are queued
             self.app_heartbeat_event()
 
-        telemetry_requests = self._flush_events_queue()
+        telemetry_requests = self._batch_requests(self._flush_events_queue())
 
         for telemetry_request in telemetry_requests:
             try:
@@ -187,6 +231,11 @@ class TelemetryWriter(PeriodicService):
             if self._enabled is not None and not self._enabled:
                 return
 
+            if self._forked and integration_name in self._reported_integrations:
+                # Already reported by the parent process
+                return
+            self._reported_integrations.add(integration_name)
+
             integration = {
                 "name": integration_name,
                 "version": "",
@@ -247,7 +296,7 @@ class TelemetryWriter(PeriodicService):
         return headers
 
     def _create_telemetry_request(self, payload, payload_type, sequence_id):
-        # type: (Dict, str, int) -> Dict
+        # type: (Any, str, int) -> Dict
         """Initializes the required fields for a generic Telemetry Intake Request"""
         return {
             "tracer_time": int(time.time()),
@@ -264,7 +313,8 @@ class TelemetryWriter(PeriodicService):
         # type: () -> None
         self._forked = True
         # Avoid sending duplicate events.
-        # Queued events should be sent in the main process.
+        # Queued events should be sent in the main process, and the
+        # integrations it reported are not reported again by the children.
         self.reset_queues()
 
     def disable(self):
@@ -0,0 +1,385 @@
+"""Shared HTTP transport to the Datadog agent.
+
+All the services that talk to the agent (or to an intake) go through a
+transport for the target URL. A transport keeps a pool of keep-alive
+connections, limits the number of concurrent requests (serving the waiting
+ones by priority, e.g. traces before telemetry) and collects byte and latency
+metrics for each endpoint.
+"""
+from collections import defaultdict
+import heapq
+import itertools
+from json import loads
+import threading
+from typing import TYPE_CHECKING
+import weakref
+
+import tenacity
+
+from ddtrace.internal import compat
+from ddtrace.internal import forksafe
+from ddtrace.internal.agent import DEFAULT_TIMEOUT
+from ddtrace.internal.agent import get_connection
+from ddtrace.internal.compat import monotonic
+from ddtrace.internal.logger import get_logger
+
+
+if TYPE_CHECKING:  # pragma: no cover
+    from typing import Any
+    from typing import Dict
+    from typing import List
+    from typing import Optional
+    from typing import Tuple
+
+    from ddtrace.internal.agent import ConnectionType
+
+
+log = get_logger(__name__)
+
+# Requests with a lower value are sent first
+PRIORITY_TRACES = 0
+PRIORITY_STATS = 1
+PRIORITY_DEFAULT = 2
+# DEV: Remote configuration is polled periodically, so a delayed poll only
+#      postpones a configuration change. It still goes before telemetry.
+PRIORITY_REMOTE_CONFIG = 3
+PRIORITY_TELEMETRY = 4
+
+# Maximum number of idle connections kept for each URL
+DEFAULT_POOL_SIZE = 4
+# Maximum number of concurrent requests for each URL
+DEFAULT_MAX_CONCURRENT_REQUESTS = 4
+# Idle connections older than this are not reused, as the agent might have
+# closed them already
+DEFAULT_IDLE_TIMEOUT = 10.0
+
+RETRYABLE_ERRORS = (compat.httplib.HTTPException, OSError, IOError)
+
+
+def fibonacci_retry(attempts, interval, **kwargs):
+    # type: (int, float, Any) -> tenacity.Retrying
+    """Return the retry policy shared by the services that talk to the agent.
+
+    Retry ``attempts`` times within the first half of the given interval,
+    using a Fibonacci policy with jitter. Extra keyword arguments are passed to
+    ``tenacity.Retrying``.
+    """
+    kwargs.setdefault("retry", tenacity.retry_if_exception_type(RETRYABLE_ERRORS))
+    return tenacity.Retrying(
+        wait=tenacity.wait_random_exponential(multiplier=0.618 * interval / (1.618 ** attempts) / 2, exp_base=1.618),
+        stop=tenacity.stop_after_attempt(attempts),
+        **kwargs
+    )
+
+
+class Response(object):
+    """
+    Custom API Response object to represent a response from calling the API.
+
+    We do this to ensure we know expected properties will exist, and so we
+    can call `resp.read()` and load the body once into an instance before we
+    close the HTTPConnection used for the request.
+    """
+
+    __slots__ = ["status", "body", "reason", "msg"]
+
+    def __init__(self, status=None, body=None, reason=None, msg=None):
+        self.status = status
+        self.body = body
+        self.reason = reason
+        self.msg = msg
+
+    @classmethod
+    def from_http_response(cls, resp):
+        """
+        Build a ``Response`` from the provided ``HTTPResponse`` object.
+
+        This function will call `.read()` to consume the body of the ``HTTPResponse`` object.
+
+        :param resp: ``HTTPResponse`` object to build the ``Response`` from
+        :type resp: ``HTTPResponse``
+        :rtype: ``Response``
+        :returns: A new ``Response``
+        """
+        return cls(
+            status=resp.status,
+            body=resp.read(),
+            reason=getattr(resp, "reason", None),
+            msg=getattr(resp, "msg", None),
+        )
+
+    def read(self):
+        # type: () -> Any
+        """Return the body of the response, like ``HTTPResponse.read``."""
+        return self.body
+
+    def get_json(self):
+        """Helper to parse the body of this request as JSON"""
+        try:
+            body = self.body
+            if not body:
+                log.debug("Empty reply from Datadog Agent, %r", self)
+                return
+
+            if not isinstance(body, str) and hasattr(body, "decode"):
+                body = body.decode("utf-8")
+
+            if hasattr(body, "startswith") and body.startswith("OK"):
+                # This typically happens when using a priority-sampling enabled
+                # library with an outdated agent. It still works, but priority sampling
+                # will probably send too many traces, so the next step is to upgrade agent.
+                log.debug(
+                    "Cannot parse Datadog Agent response. "
+                    "This occurs because Datadog agent is out of date or DATADOG_PRIORITY_SAMPLING=false is set"
+                )
+                return
+
+            return loads(body)
+        except (ValueError, TypeError):
+            log.debug("Unable to parse Datadog Agent JSON response: %r", body, exc_info=True)
+
+    def __repr__(self):
+        return "{0}(status={1!r}, body={2!r}, reason={3!r}, msg={4!r})".format(
+            self.__class__.__name__,
+            self.status,
+            self.body,
+            self.reason,
+            self.msg,
+        )
+
+
+class EndpointMetrics(object):
+    """Metrics of the requests sent to an endpoint."""
+
+    __slots__ = ["requests", "errors", "sent_bytes", "received_bytes", "latency"]
+
+    def __init__(self):
+        # type: () -> None
+        self.requests = 0
+        self.errors = 0
+        self.sent_bytes = 0
+        self.received_bytes = 0
+        # Total time spent in requests, in seconds
+        self.latency = 0.0
+
+    def to_dict(self):
+        # type: () -> Dict[str, float]
+        return {_: getattr(self, _) for _ in self.__slots__}
+
+
+class _PriorityGate(object):
+    """Limit the number of concurrent requests, letting the waiting ones with
+    the highest priority through first."""
+
+    def __init__(self, size):
+        # type: (int) -> None
+        self._size = size
+        self._in_flight = 0
+        self._waiters = []  # type: List[Tuple[int, int]]
+        self._seq = itertools.count()
+        self._cond = threading.Condition(threading.Lock())
+
+    def acquire(self, priority):
+        # type: (int) -> None
+        with self._cond:
+            if self._in_flight < self._size and not self._waiters:
+                self._in_flight += 1
+                return
+
+            waiter = (priority, next(self._seq))
+            heapq.heappush(self._waiters, waiter)
+            while self._in_flight >= self._size or self._waiters[0] != waiter:
+                self._cond.wait()
+            heapq.heappop(self._waiters)
+            self._in_flight += 1
+            if self._waiters and self._in_flight < self._size:
+                # Let the next waiter in line check whether it can go through
+                self._cond.notify_all()
+
+    def release(self):
+        # type: () -> None
+        with self._cond:
+            self._in_flight -= 1
+            self._cond.notify_all()
+
+
+class AgentTransport(object):
+    """HTTP transport to a URL, with a pool of keep-alive connections."""
+
+    def __init__(
+        self,
+        url,  # type: str
+        pool_size=DEFAULT_POOL_SIZE,  # type: int
+        max_concurrent_requests=DEFAULT_MAX_CONCURRENT_REQUESTS,  # type: int
+        idle_timeout=DEFAULT_IDLE_TIMEOUT,  # type: float
+    ):
+        # type: (...) -> None
+        self.url = url
+        self._pool_size = pool_size
+        self._max_concurrent_requests = max_concurrent_requests
+        self._idle_timeout = idle_timeout
+        self._lock = threading.Lock()
+        self._pool = []  # type: List[Tuple[ConnectionType, float]]
+        self._gate = _PriorityGate(max_concurrent_requests)
+        self._metrics = defaultdict(EndpointMetrics)  # type: Dict[str, EndpointMetrics]
+
+    def _after_fork(self):
+        # type: () -> None
+        # The connections are shared with the parent process, so they cannot
+        # be used. Closing them only releases the file descriptors of the
+        # child, the parent can keep using its connections.
+        pool, self._pool = self._pool, []
+        for conn, _ in pool:
+            try:
+                conn.close()
+            except Exception:
+                log.debug("failed to close connection to %s after fork", self.url, exc_info=True)
+        self._lock = threading.Lock()
+        self._gate = _PriorityGate(self._max_concurrent_requests)
+        self._metrics = defaultdict(EndpointMetrics)
+
+    def _acquire_connection(self, timeout):
+        # type: (float) -> Tuple[ConnectionType, bool]
+        now = monotonic()
+        with self._lock:
+            while self._pool:
+                conn, last_used = self._pool.pop()
+                if now - last_used < self._idle_timeout:
+                    conn.timeout = timeout
+                    try:
+                        if conn.sock is not None:
+                            conn.sock.settimeout(timeout)
+                    except (OSError, IOError):
+                        conn.close()
+                        continue
+                    return conn, True
+                conn.close()
+
+        log.debug("creating new connection to %s with timeout %d", self.url, timeout)
+        return get_connection(self.url, timeout), False
+
+    def _release_connection(self, conn):
+        # type: (ConnectionType) -> None
+        with self._lock:
+            if len(self._pool) < self._pool_size:
+                self._pool.append((conn, monotonic()))
+                return
+        conn.close()
+
+    def close(self):
+        # type: () -> None
+        """Close all the idle connections."""
+        with self._lock:
+            pool, self._pool = self._pool, []
+        for conn, _ in pool:
+            conn.close()
+
+    def _send(self, conn, method, path, body, headers):
+        # type: (ConnectionType, str, str, Optional[bytes], Dict[str, str]) -> Tuple[Response, bool]
+        conn.request(method, path, body, headers)
+        resp = compat.get_connection_response(conn)
+        response = Response.from_http_response(resp)
+        return response, resp.will_close
+
+    def request(
+        self,
+        method,  # type: str
+        path,  # type: str
+        body=None,  # type: Optional[bytes]
+        headers=None,  # type: Optional[Dict[str, str]]
+        timeout=DEFAULT_TIMEOUT,  # type: float
+        priority=PRIORITY_DEFAULT,  # type: int
+        reuse=True,  # type: bool
+    ):
+        # type: (...) -> Response
+        """Send a request and return the response, with its body already read.
+
+        The connection is returned to the pool after the request, unless
+        ``reuse`` is false. Errors are not retried, but for a failure to use a
+        pooled connection which the agent might have closed in the meantime.
+        """
+        headers = headers or {}
+        self._gate.acquire(priority)
+        start = monotonic()
+        received_bytes = 0
+        error = True
+        try:
+            conn, reused = self._acquire_connection(timeout)
+            try:
+                try:
+                    response, will_close = self._send(conn, method, path, body, headers)
+                except RETRYABLE_ERRORS:
+                    if not reused:
+                        raise
+                    conn.close()
+                    conn = get_connection(self.url, timeout)
+                    response, will_close = self._send(conn, method, path, body, headers)
+            except Exception:
+                # Always reset the connection when an exception occurs
+                conn.close()
+                raise
+
+            if reuse and not will_close:
+                self._release_connection(conn)
+            else:
+                conn.close()
+
+            if response.body:
+                received_bytes = len(response.body)
+            error = response.status >= 400
+            return response
+        finally:
+            latency = monotonic() - start
+            self._gate.release()
+            # DEV: The metrics are updated by the threads of all the services
+            with self._lock:
+                metrics = self._metrics[path]
+                metrics.requests += 1
+                if body is not None:
+                    metrics.sent_bytes += len(body)
+                metrics.received_bytes += received_bytes
+                if error:
+                    metrics.errors += 1
+                metrics.latency += latency
+
+    def get_metrics(self):
+        # type: () -> Dict[str, Dict[str, float]]
+        """Return the metrics of each endpoint."""
+        with self._lock:
+            return {path: m.to_dict() for path, m in self._metrics.items()}
+
+
+_transports = weakref.WeakValueDictionary()  # type: weakref.WeakValueDictionary[str, AgentTransport]
+_transports_lock = threading.Lock()
+
+
+def get_transport(url):
+    # type: (str) -> AgentTransport
+    """Return the transport shared by all the services for the given URL.
+
+    The URL is only validated when a request is made, which then raises a
+    ``ValueError`` if the URL is not supported.
+    """
+    with _transports_lock:
+        transport = _transports.get(url)
+        if transport is None:
+            transport = _transports[url] = AgentTransport(url)
+        return transport
+
+
+def get_metrics():
+    # type: () -> Dict[str, Dict[str, Dict[str, float]]]
+    """Return the metrics of each endpoint, for each URL."""
+    with _transports_lock:
+        transports = list(_transports.values())
+    return {t.url: t.get_metrics() for t in transports}
+
+
+@forksafe.register
+def _reset_transports():
+    # type: () -> None
+    global _transports_lock
+
+    _transports_lock = threading.Lock()
+    for transport in list(_transports.values()):
+        transport._after_fork()
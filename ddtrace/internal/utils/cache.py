@@ -1,3 +1,5 @@
+from collections import OrderedDict
+from threading import Lock
 from threading import RLock
 from typing import Any
 from typing import Callable
@@ -62,6 +64,94 @@ class LFUCache(dict):
             return value
 
 
+class LRUCache(OrderedDict):
+    """Simple LRU cache implementation.
+
+    This cache is designed for memoizing functions with a single hashable
+    argument. The eviction policy is LRU, i.e. the least recently used value is
+    evicted when the cache is full.
+    """
+
+    def __init__(self, maxsize=256):
+        # type: (int) -> None
+        super(LRUCache, self).__init__()
+        self.maxsize = maxsize
+        self.lock = Lock()
+
+    def get(self, key, f):  # type: ignore[override]
+        # type: (T, F) -> Any
+        """Get a value from the cache.
+
+        If the value with the given key is not in the cache, the expensive
+        function ``f`` is called on the key to generate it. The return value is
+        then stored in the cache and returned to the caller.
+        """
+        with self.lock:
+            value = self.pop(key, miss)
+            if value is not miss:
+                # Mark the value as the most recently used one
+                self[key] = value
+                return value
+
+        # DEV: The lock is not held while the value is generated so that
+        # other threads can still get the cached values.
+        value = f(key)
+
+        with self.lock:
+            self[key] = value
+            if len(self) > self.maxsize:
+                self.popitem(last=False)
+
+        return value
+
+
+class VersionedDict(dict):
+    """Dictionary that counts its changes.
+
+    The ``_version`` attribute is incremented by every change of the
+    dictionary, so that values derived from its content can be cached and
+    computed again only when the version changes.
+    """
+
+    def __init__(self, *args, **kwargs):
+        # DEV: By-pass any `__setattr__` override of the subclasses
+        object.__setattr__(self, "_version", 0)
+        super(VersionedDict, self).__init__(*args, **kwargs)
+
+    def _changed(self):
+        # type: () -> None
+        object.__setattr__(self, "_version", self._version + 1)
+
+    def __setitem__(self, key, value):
+        super(VersionedDict, self).__setitem__(key, value)
+        self._changed()
+
+    def __delitem__(self, key):
+        super(VersionedDict, self).__delitem__(key)
+        self._changed()
+
+    def update(self, *args, **kwargs):
+        super(VersionedDict, self).update(*args, **kwargs)
+        self._changed()
+
+    def setdefault(self, key, default=None):
+        if key not in self:
+            self._changed()
+        return super(VersionedDict, self).setdefault(key, default)
+
+    def pop(self, *args):
+        self._changed()
+        return super(VersionedDict, self).pop(*args)
+
+    def popitem(self):
+        self._changed()
+        return super(VersionedDict, self).popitem()
+
+    def clear(self):
+        super(VersionedDict, self).clear()
+        self._changed()
+
+
 def cached(maxsize=256):
     # type: (int) -> Callable[[F], F]
     """Decorator for memoizing functions of a single argument (LFU policy)."""
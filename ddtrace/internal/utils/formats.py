@@ -18,6 +18,8 @@ VALUE_PLACEHOLDER = "?"
 VALUE_MAX_LEN = 100
 VALUE_TOO_LONG_MARK = "..."
 CMD_MAX_LEN = 1000
+# The maximum length of the UTF-8 encoding of VALUE_MAX_LEN characters
+_MAX_ENCODED_VALUE_LEN = 4 * VALUE_MAX_LEN
 
 
 T = TypeVar("T")
@@ -140,8 +142,13 @@ def stringify_cache_args(args):
     out = []  # type: List[Text]
     for arg in args:
         try:
-            if isinstance(arg, (binary_type, text_type)):
-                cmd = ensure_text(arg, errors="backslashreplace")
+            if isinstance(arg, binary_type):
+                # Only decode what can end up in the output: a character takes
+                # at most 4 bytes, so the first VALUE_MAX_LEN characters are the
+                # same as those of the whole value.
+                cmd = ensure_text(arg[: _MAX_ENCODED_VALUE_LEN + 1], errors="backslashreplace")
+            elif isinstance(arg, text_type):
+                cmd = arg[: VALUE_MAX_LEN + 1]
             else:
                 cmd = stringify(arg)
 
@@ -13,13 +13,24 @@ import six
 
 from ddtrace.constants import USER_ID_KEY
 from ddtrace.internal import compat
+from ddtrace.internal.constants import DD_TRACE_OBFUSCATION_QUERY_STRING_PATTERN_DEFAULT
+from ddtrace.internal.constants import DD_TRACE_OBFUSCATION_QUERY_STRING_PATTERN_DEFAULT_KEYWORDS
 from ddtrace.internal.constants import W3C_TRACESTATE_ORIGIN_KEY
 from ddtrace.internal.constants import W3C_TRACESTATE_SAMPLING_PRIORITY_KEY
 from ddtrace.internal.sampling import SAMPLING_DECISION_TRACE_TAG_KEY
+from ddtrace.internal.utils.cache import LRUCache
 from ddtrace.internal.utils.cache import cached
 
 
 _W3C_TRACESTATE_INVALID_CHARS_REGEX = r",|;|:|[^\x20-\x7E]+"
+# Tag normalization based on: https://docs.datadoghq.com/tagging/#defining-tags
+# With the exception of '.' in header names which are replaced with '_' to avoid
+# starting a "new object" on the UI.
+_HEADER_TAG_NORMALIZE_PATTERN = re.compile(r"([^a-z0-9_\-:/]){1}")
+_DEFAULT_OBFUSCATION_PATTERN = DD_TRACE_OBFUSCATION_QUERY_STRING_PATTERN_DEFAULT.encode("ascii")
+_DEFAULT_OBFUSCATION_KEYWORDS = re.compile(
+    b"|".join(re.escape(_) for _ in DD_TRACE_OBFUSCATION_QUERY_STRING_PATTERN_DEFAULT_KEYWORDS)
+)
 
 
 Connector = Callable[[], ContextManager[compat.httplib.HTTPConnection]]
@@ -41,6 +52,31 @@ def normalize_header_name(header_name):
     return header_name.strip().lower() if header_name is not None else None
 
 
+@cached()
+def normalize_header_tag_name(header_name):
+    # type: (str) -> str
+    """
+    Normalizes an header name for use in a tag name, e.g. 'Content.Type' gives 'content_type'.
+    :param header_name: the header name to normalize
+    :type header_name: str
+    :return: the normalized header name
+    :rtype: str
+    """
+    return _HEADER_TAG_NORMALIZE_PATTERN.sub("_", normalize_header_name(header_name))
+
+
+def header_tag_name(request_or_response, header_name):
+    # type: (str, str) -> str
+    """
+    Returns the default tag name of a request or response header, e.g. 'http.request.headers.content-type'.
+    :param request_or_response: The context of the header: request|response
+    :param header_name: The header's name
+    :type header_name: str
+    :rtype: str
+    """
+    return "http.{}.headers.{}".format(request_or_response, normalize_header_tag_name(header_name))
+
+
 def strip_query_string(url):
     # type: (str) -> str
     """
@@ -61,6 +97,15 @@ def redact_query_string(query_string, query_string_obfuscation_pattern):
         return query_string
 
     bytes_query = query_string if isinstance(query_string, bytes) else query_string.encode("utf-8")
+
+    # The default pattern cannot match a query string without any of its keywords,
+    # which is cheaper to check than running the pattern.
+    if (
+        query_string_obfuscation_pattern.pattern == _DEFAULT_OBFUSCATION_PATTERN
+        and _DEFAULT_OBFUSCATION_KEYWORDS.search(bytes_query.lower()) is None
+    ):
+        return bytes_query
+
     return query_string_obfuscation_pattern.sub(b"<redacted>", bytes_query)
 
 
@@ -88,6 +133,25 @@ def redact_url(url, query_string_obfuscation_pattern, query_string=None):
     return url
 
 
+_REDACTED_URLS = LRUCache(maxsize=256)
+
+
+def cached_redact_url(url, query_string_obfuscation_pattern, query_string=None):
+    # type: (str, re.Pattern, Optional[str]) -> Union[str,bytes]
+    """Same as ``redact_url``, with the results for the most recently used URLs cached."""
+    if query_string_obfuscation_pattern is None:
+        return url
+
+    # DEV: Hashing a compiled pattern hashes its whole compiled code, so the
+    # key is made of the source and the flags of the pattern instead.
+    key = (url, query_string, query_string_obfuscation_pattern.pattern, query_string_obfuscation_pattern.flags)
+    try:
+        return _REDACTED_URLS.get(key, lambda _: redact_url(url, query_string_obfuscation_pattern, query_string))
+    except TypeError:
+        # The URL or the query string are not hashable
+        return redact_url(url, query_string_obfuscation_pattern, query_string)
+
+
 def urlunsplit(components, original_url):
     # type: (Tuple[bytes, ...], str) -> bytes
     """
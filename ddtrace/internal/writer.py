@@ -1,11 +1,9 @@
 import abc
 import binascii
 from collections import defaultdict
-from json import loads
 import logging
 import os
 import sys
-import threading
 from typing import Dict
 from typing import List
 from typing import Optional
@@ -32,19 +30,20 @@ from ..sampler import BasePrioritySampler
 from ..sampler import BaseSampler
 from ._encoding import BufferFull
 from ._encoding import BufferItemTooLarge
-from .agent import get_connection
 from .encoding import JSONEncoderV2
 from .encoding import MSGPACK_ENCODERS
 from .logger import get_logger
 from .runtime import container
 from .sma import SimpleMovingAverage
+from .transport import PRIORITY_TRACES
+from .transport import Response
+from .transport import fibonacci_retry
+from .transport import get_transport
 
 
 if TYPE_CHECKING:  # pragma: no cover
     from ddtrace import Span
 
-    from .agent import ConnectionType
-
 
 log = get_logger(__name__)
 
@@ -93,77 +92,6 @@ def _human_size(nbytes):
     return "%s%s" % (f, suffixes[i])
 
 
-class Response(object):
-    """
-    Custom API Response object to represent a response from calling the API.
-
-    We do this to ensure we know expected properties will exist, and so we
-    can call `resp.read()` and load the body once into an instance before we
-    close the HTTPConnection used for the request.
-    """
-
-    __slots__ = ["status", "body", "reason", "msg"]
-
-    def __init__(self, status=None, body=None, reason=None, msg=None):
-        self.status = status
-        self.body = body
-        self.reason = reason
-        self.msg = msg
-
-    @classmethod
-    def from_http_response(cls, resp):
-        """
-        Build a ``Response`` from the provided ``HTTPResponse`` object.
-
-        This function will call `.read()` to consume the body of the ``HTTPResponse`` object.
-
-        :param resp: ``HTTPResponse`` object to build the ``Response`` from
-        :type resp: ``HTTPResponse``
-        :rtype: ``Response``
-        :returns: A new ``Response``
-        """
-        return cls(
-            status=resp.status,
-            body=resp.read(),
-            reason=getattr(resp, "reason", None),
-            msg=getattr(resp, "msg", None),
-        )
-
-    def get_json(self):
-        """Helper to parse the body of this request as JSON"""
-        try:
-            body = self.body
-            if not body:
-                log.debug("Empty reply from Datadog Agent, %r", self)
-                return
-
-            if not isinstance(body, str) and hasattr(body, "decode"):
-                body = body.decode("utf-8")
-
-            if hasattr(body, "startswith") and body.startswith("OK"):
-                # This typically happens when using a priority-sampling enabled
-                # library with an outdated agent. It still works, but priority sampling
-                # will probably send too many traces, so the next step is to upgrade agent.
-                log.debug(
-                    "Cannot parse Datadog Agent response. "
-                    "This occurs because Datadog agent is out of date or DATADOG_PRIORITY_SAMPLING=false is set"
-                )
-                return
-
-            return loads(body)
-        except (ValueError, TypeError):
-            log.debug("Unable to parse Datadog Agent JSON response: %r", body, exc_info=True)
-
-    def __repr__(self):
-        return "{0}(status={1!r}, body={2!r}, reason={3!r}, msg={4!r})".format(
-            self.__class__.__name__,
-            self.status,
-            self.body,
-            self.reason,
-            self.msg,
-        )
-
-
 class TraceWriter(six.with_metaclass(abc.ABCMeta)):
     @abc.abstractmethod
     def recreate(self):
@@ -330,20 +258,8 @@ class AgentWriter(periodic.PeriodicService, TraceWriter):
         self._metrics_reset()
         self._drop_sma = SimpleMovingAverage(DEFAULT_SMA_WINDOW)
         self._sync_mode = sync_mode
-        self._conn = None  # type: Optional[ConnectionType]
-        # The connection has to be locked since there exists a race between
-        # the periodic thread of AgentWriter and other threads that might
-        # force a flush with `flush_queue()`.
-        self._conn_lck = threading.RLock()  # type: threading.RLock
-        self._retry_upload = tenacity.Retrying(
-            # Retry RETRY_ATTEMPTS times within the first half of the processing
-            # interval, using a Fibonacci policy with jitter
-            wait=tenacity.wait_random_exponential(
-                multiplier=0.618 * self.interval / (1.618 ** self.RETRY_ATTEMPTS) / 2, exp_base=1.618
-            ),
-            stop=tenacity.stop_after_attempt(self.RETRY_ATTEMPTS),
-            retry=tenacity.retry_if_exception_type((compat.httplib.HTTPException, OSError, IOError)),
-        )
+        self._transport = get_transport(self.agent_url)
+        self._retry_upload = fibonacci_retry(self.RETRY_ATTEMPTS, self.interval)
         self._log_error_payloads = asbool(os.environ.get("_DD_TRACE_WRITER_LOG_ERROR_PAYLOADS", False))
         self._reuse_connections = get_writer_reuse_connections() if reuse_connections is None else reuse_connections
 
@@ -398,40 +314,26 @@ class AgentWriter(periodic.PeriodicService, TraceWriter):
             api_version=self._api_version,
         )
 
-    def _reset_connection(self):
-        # type: () -> None
-        with self._conn_lck:
-            if self._conn:
-                self._conn.close()
-                self._conn = None
-
     def _put(self, data, headers):
         # type: (bytes, Dict[str, str]) -> Response
         sw = StopWatch()
         sw.start()
-        with self._conn_lck:
-            if self._conn is None:
-                log.debug("creating new agent connection to %s with timeout %d", self.agent_url, self._timeout)
-                self._conn = get_connection(self.agent_url, self._timeout)
-            try:
-                self._conn.request("PUT", self._endpoint, data, headers)
-                resp = compat.get_connection_response(self._conn)
-                t = sw.elapsed()
-                if t >= self.interval:
-                    log_level = logging.WARNING
-                else:
-                    log_level = logging.DEBUG
-                log.log(log_level, "sent %s in %.5fs to %s", _human_size(len(data)), t, self._agent_endpoint)
-            except Exception:
-                # Always reset the connection when an exception occurs
-                self._reset_connection()
-                raise
-            else:
-                return Response.from_http_response(resp)
-            finally:
-                # Reset the connection if reusing connections is disabled.
-                if not self._reuse_connections:
-                    self._reset_connection()
+        response = self._transport.request(
+            "PUT",
+            self._endpoint,
+            data,
+            headers,
+            timeout=self._timeout,
+            priority=PRIORITY_TRACES,
+            reuse=self._reuse_connections,
+        )
+        t = sw.elapsed()
+        if t >= self.interval:
+            log_level = logging.WARNING
+        else:
+            log_level = logging.DEBUG
+        log.log(log_level, "sent %s in %.5fs to %s", _human_size(len(data)), t, self._agent_endpoint)
+        return response
 
     def _downgrade(self, payload, response):
         if self._endpoint == "v0.5/traces":
@@ -625,7 +527,4 @@ class AgentWriter(periodic.PeriodicService, TraceWriter):
         self.join(timeout=timeout)
 
     def on_shutdown(self):
-        try:
-            self.periodic()
-        finally:
-            self._reset_connection()
+        self.periodic()
@@ -1,4 +1,5 @@
 from typing import Any
+from typing import Callable
 from typing import Dict
 from typing import Optional
 from typing import TYPE_CHECKING
@@ -6,6 +7,7 @@ from typing import TYPE_CHECKING
 import ddtrace
 
 from .internal.logger import get_logger
+from .internal.utils.cache import VersionedDict
 from .vendor import wrapt
 
 
@@ -21,6 +23,12 @@ log = get_logger(__name__)
 _DD_PIN_NAME = "_datadog_pin"
 _DD_PIN_PROXY_NAME = "_self_" + _DD_PIN_NAME
 
+# The __getddpin__ method of each type the pins were looked up on, if any
+# DEV: A failed attribute lookup is slow, especially on wrapt proxies which
+# forward it to the wrapped object, so it is done once per type.
+_GETDDPIN = {}  # type: Dict[type, Optional[Callable[[Any], Optional[Pin]]]]
+_GETDDPIN_MAX_SIZE = 1024
+
 
 class Pin(object):
     """Pin (a.k.a Patch INfo) is a small class which is used to
@@ -50,7 +58,9 @@ class Pin(object):
         self._target = None  # type: Optional[int]
         # keep the configuration attribute internal because the
         # public API to access it is not the Pin class
-        self._config = _config or {}  # type: Dict[str, Any]
+        # DEV: The configuration can be changed in place, e.g. with `config.get_from`,
+        # so values derived from it are cached with the `_version` of a `VersionedDict`.
+        self._config = _config or VersionedDict()  # type: Dict[str, Any]
         # [Backward compatibility]: service argument updates the `Pin` config
         self._config["service_name"] = service
         self._initialized = True
@@ -106,8 +116,15 @@ class Pin(object):
         :rtype: :class:`ddtrace.pin.Pin`, None
         :returns: :class:`ddtrace.pin.Pin` associated with the object, or None if none was found
         """
-        if hasattr(obj, "__getddpin__"):
-            return obj.__getddpin__()
+        cls = type(obj)
+        try:
+            getddpin = _GETDDPIN[cls]
+        except KeyError:
+            if len(_GETDDPIN) >= _GETDDPIN_MAX_SIZE:
+                _GETDDPIN.clear()
+            getddpin = _GETDDPIN[cls] = getattr(cls, "__getddpin__", None)
+        if getddpin is not None:
+            return getddpin(obj)
 
         pin_name = _DD_PIN_PROXY_NAME if isinstance(obj, wrapt.ObjectProxy) else _DD_PIN_NAME
         pin = getattr(obj, pin_name, None)
@@ -197,7 +214,7 @@ class Pin(object):
         #
         # copy: 0.00654911994934082
         # deepcopy: 0.2787208557128906
-        config = self._config.copy()
+        config = VersionedDict(self._config)
 
         return Pin(
             service=service or self.service,
@@ -2,6 +2,8 @@ import typing
 
 import attr
 
+from ddtrace.internal.runtime import event_loop
+
 from . import _lock
 from .. import collector
 from .. import event
@@ -17,6 +19,14 @@ class AsyncioLockReleaseEvent(_lock.LockReleaseEvent):
     """An asyncio.Lock has been released."""
 
 
+@event.event_class
+class AsyncioSlowCallbackEvent(event.StackBasedEvent):
+    """An asyncio event loop callback blocked the loop for too long."""
+
+    callback = attr.ib(default=None, type=typing.Optional[str])
+    duration_ns = attr.ib(default=0, type=int)
+
+
 class _ProfiledAsyncioLock(_lock._ProfiledLock):
 
     ACQUIRE_EVENT_CLASS = AsyncioLockAcquireEvent
@@ -48,3 +58,35 @@ class AsyncioLockCollector(_lock.LockCollector):
     ):
         # type: (...) -> None
         self._asyncio_module.Lock = value  # type: ignore[misc]
+
+
+@attr.s
+class AsyncioSlowCallbackCollector(collector.Collector):
+    """Record the callbacks blocking the monitored asyncio event loops."""
+
+    def _start_service(self):
+        # type: (...) -> None
+        if not event_loop.available:
+            raise collector.CollectorUnavailable("asyncio is not available")
+        event_loop.add_slow_callback_listener(self._on_slow_callback)
+
+    def _stop_service(self):
+        # type: (...) -> None
+        event_loop.remove_slow_callback_listener(self._on_slow_callback)
+
+    def _on_slow_callback(
+        self, slow_callback  # type: event_loop.SlowCallback
+    ):
+        # type: (...) -> None
+        self.recorder.push_event(
+            AsyncioSlowCallbackEvent(
+                thread_id=slow_callback.thread_id,
+                thread_name=slow_callback.thread_name,
+                task_id=slow_callback.task_id,
+                task_name=slow_callback.task_name,
+                frames=slow_callback.frames,
+                nframes=slow_callback.nframes,
+                callback=slow_callback.callback,
+                duration_ns=int(slow_callback.duration * 1e9),
+            )
+        )
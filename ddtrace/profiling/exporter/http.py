@@ -16,6 +16,7 @@ import tenacity
 import ddtrace
 from ddtrace.internal import agent
 from ddtrace.internal import runtime
+from ddtrace.internal import transport
 from ddtrace.internal.runtime import container
 from ddtrace.internal.utils import attr as attr_utils
 from ddtrace.internal.utils.formats import parse_tags_str
@@ -210,7 +211,7 @@ class PprofHTTPExporter(pprof.PprofExporter):
         )
         headers["Content-Type"] = content_type
 
-        client = agent.get_connection(self.endpoint, self.timeout)
+        client = transport.get_transport(self.endpoint)
         self._upload(client, self.endpoint_path, body, headers)
 
         return profile, libs
@@ -219,12 +220,7 @@ class PprofHTTPExporter(pprof.PprofExporter):
         self._retry_upload(self._upload_once, client, path, body, headers)
 
     def _upload_once(self, client, path, body, headers):
-        try:
-            client.request("POST", path, body=body, headers=headers)
-            response = client.getresponse()
-            response.read()  # reading is mandatory
-        finally:
-            client.close()
+        response = client.request("POST", path, body=body, headers=headers, timeout=self.timeout)
 
         if 200 <= response.status < 300:
             return
@@ -4,6 +4,7 @@ from typing import Any
 from ddtrace.profiling import exporter
 from ddtrace.profiling import recorder as recorder
 from ddtrace.profiling.collector import _lock
+from ddtrace.profiling.collector import asyncio as collector_asyncio
 from ddtrace.profiling.collector import memalloc
 from ddtrace.profiling.collector import stack_event
 from ddtrace.profiling.collector import threading as threading
@@ -84,6 +85,17 @@ class _PprofConverter:
         events: typing.List[memalloc.MemoryAllocSampleEvent],
     ) -> None: ...
     def convert_memalloc_heap_event(self, event: memalloc.MemoryHeapSampleEvent) -> None: ...
+    def convert_asyncio_slow_callback_event(
+        self,
+        thread_id: str,
+        thread_native_id: str,
+        thread_name: str,
+        task_id: str,
+        task_name: str,
+        frames: HashableStackTraceType,
+        nframes: int,
+        events: typing.List[collector_asyncio.AsyncioSlowCallbackEvent],
+    ) -> None: ...
     def convert_lock_acquire_event(
         self,
         lock_name: str,
@@ -15,6 +15,7 @@ from ddtrace.profiling import event
 from ddtrace.profiling import exporter
 from ddtrace.profiling import recorder
 from ddtrace.profiling.collector import _lock
+from ddtrace.profiling.collector import asyncio as collector_asyncio
 from ddtrace.profiling.collector import memalloc
 from ddtrace.profiling.collector import stack_event
 from ddtrace.profiling.exporter import _packages
@@ -343,6 +344,31 @@ class _PprofConverter(object):
 
         self._location_values[location_key]["heap-space"] += event.size
 
+    def convert_asyncio_slow_callback_event(
+        self,
+        thread_id: str,
+        thread_native_id: str,
+        thread_name: str,
+        task_id: str,
+        task_name: str,
+        frames: HashableStackTraceType,
+        nframes: int,
+        events: typing.List[collector_asyncio.AsyncioSlowCallbackEvent],
+    ) -> None:
+        location_key = (
+            self._to_locations(frames, nframes),
+            (
+                ("thread id", thread_id),
+                ("thread native id", thread_native_id),
+                ("thread name", thread_name),
+                ("task id", task_id),
+                ("task name", task_name),
+            ),
+        )
+
+        self._location_values[location_key]["event-loop-slow-callbacks"] = len(events)
+        self._location_values[location_key]["event-loop-slow-callback-time"] = sum(e.duration_ns for e in events)
+
     def convert_lock_acquire_event(
         self,
         lock_name,  # type: str
@@ -792,6 +818,34 @@ class PprofExporter(exporter.Exporter):
                 list(typing.cast(typing.Iterator[stack_event.StackExceptionSampleEvent], se_events)),
             )
 
+        slow_callback_events = events.get(collector_asyncio.AsyncioSlowCallbackEvent, [])  # type: ignore[call-overload]
+        for (
+            (
+                thread_id,
+                thread_native_id,
+                thread_name,
+                task_id,
+                task_name,
+                local_root_span_id,
+                span_id,
+                trace_resource,
+                trace_type,
+                frames,
+                nframes,
+            ),
+            sc_events,
+        ) in self._group_stack_events(slow_callback_events):
+            converter.convert_asyncio_slow_callback_event(
+                thread_id,
+                thread_native_id,
+                thread_name,
+                task_id,
+                task_name,
+                frames,
+                nframes,
+                list(typing.cast(typing.Iterator[collector_asyncio.AsyncioSlowCallbackEvent], sc_events)),
+            )
+
         if memalloc._memalloc:
             for (
                 (
@@ -843,6 +897,12 @@ class PprofExporter(exporter.Exporter):
             ("alloc-space", "bytes"),
             ("heap-space", "bytes"),
         )
+        if slow_callback_events:
+            # Only added when needed, as most applications do not monitor event loops
+            sample_types += (
+                ("event-loop-slow-callbacks", "count"),
+                ("event-loop-slow-callback-time", "nanoseconds"),
+            )
 
         profile = converter._build_profile(
             start_time_ns=start_time_ns,
@@ -207,6 +207,7 @@ class _ProfilerInstance(service.Service):
         ]
         if _asyncio.asyncio_available:
             self._collectors.append(asyncio.AsyncioLockCollector(r, tracer=self.tracer))
+            self._collectors.append(asyncio.AsyncioSlowCallbackCollector(r))
 
         if self._memory_collector_enabled:
             self._collectors.append(memalloc.MemoryCollector(r))
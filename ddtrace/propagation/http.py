@@ -29,6 +29,7 @@ from ..internal.constants import _PROPAGATION_STYLE_NONE
 from ..internal.constants import _PROPAGATION_STYLE_W3C_TRACECONTEXT
 from ..internal.logger import get_logger
 from ..internal.sampling import validate_sampling_decision
+from ..internal.utils.cache import cached
 from ..span import _MetaDictType
 from ._utils import get_wsgi_header
 
@@ -90,13 +91,45 @@ _TRACEPARENT_HEX_REGEX = re.compile(
 )
 
 
-def _extract_header_value(possible_header_names, headers, default=None):
-    # type: (FrozenSet[str], Dict[str, str], Optional[str]) -> Optional[str]
-    for header in possible_header_names:
-        if header in headers:
-            return ensure_str(headers[header], errors="backslashreplace")
-
-    return default
+# Map the lower-cased possible names of the headers used by all the extraction
+# styles, plain or WSGI style, to their plain name.
+_EXTRACT_HEADER_NAMES = {}  # type: Dict[str, str]
+for _header in (
+    HTTP_HEADER_TRACE_ID,
+    HTTP_HEADER_PARENT_ID,
+    HTTP_HEADER_SAMPLING_PRIORITY,
+    HTTP_HEADER_ORIGIN,
+    _HTTP_HEADER_TAGS,
+    _HTTP_HEADER_B3_SINGLE,
+    _HTTP_HEADER_B3_TRACE_ID,
+    _HTTP_HEADER_B3_SPAN_ID,
+    _HTTP_HEADER_B3_SAMPLED,
+    _HTTP_HEADER_B3_FLAGS,
+    _HTTP_HEADER_TRACEPARENT,
+    _HTTP_HEADER_TRACESTATE,
+):
+    for _name in _possible_header(_header):
+        _EXTRACT_HEADER_NAMES[_name] = _header
+del _header, _name
+
+_TRACESTATE_INVALID_CHARS_RE = re.compile(r"[^\x20-\x7E]+")
+
+
+def _extract_propagation_headers(headers):
+    # type: (Dict[str, str]) -> Dict[str, str]
+    """Return the headers used for context propagation found in ``headers``.
+
+    The headers are picked in a single pass, without building a normalized copy
+    of all the request headers. The returned dictionary is keyed by the plain
+    lower-cased names of the headers, e.g. ``x-datadog-trace-id``.
+    """
+    extracted = {}  # type: Dict[str, str]
+    for name, value in headers.items():
+        header = _EXTRACT_HEADER_NAMES.get(name.lower())
+        if header is None:
+            continue
+        extracted[header] = ensure_str(value, errors="backslashreplace")
+    return extracted
 
 
 def _hex_id_to_dd_id(hex_id):
@@ -146,6 +179,24 @@ class _DatadogMultiHeader:
     def _is_valid_datadog_trace_tag_key(key):
         return key.startswith("_dd.p.")
 
+    @staticmethod
+    @cached()
+    def _decode_tags(tags_value):
+        # type: (str) -> Dict[str, str]
+        """Decode the propagated trace tags of a ``x-datadog-tags`` header value.
+
+        Services usually receive the same few values over and over, so the
+        results are cached. They must not be mutated.
+        """
+        return {
+            k: v
+            for (k, v) in decode_tagset_string(tags_value).items()
+            if (
+                k not in _DatadogMultiHeader._X_DATADOG_TAGS_EXTRACT_REJECT
+                and _DatadogMultiHeader._is_valid_datadog_trace_tag_key(k)
+            )
+        }
+
     @staticmethod
     def _inject(span_context, headers):
         # type: (Context, Dict[str, str]) -> None
@@ -196,44 +247,21 @@ class _DatadogMultiHeader:
     @staticmethod
     def _extract(headers):
         # type: (Dict[str, str]) -> Optional[Context]
-        trace_id = _extract_header_value(
-            POSSIBLE_HTTP_HEADER_TRACE_IDS,
-            headers,
-        )
+        trace_id = headers.get(HTTP_HEADER_TRACE_ID)
         if trace_id is None:
             return None
 
-        parent_span_id = _extract_header_value(
-            POSSIBLE_HTTP_HEADER_PARENT_IDS,
-            headers,
-            default="0",
-        )
-        sampling_priority = _extract_header_value(
-            POSSIBLE_HTTP_HEADER_SAMPLING_PRIORITIES,
-            headers,
-        )
-        origin = _extract_header_value(
-            POSSIBLE_HTTP_HEADER_ORIGIN,
-            headers,
-        )
+        parent_span_id = headers.get(HTTP_HEADER_PARENT_ID, "0")
+        sampling_priority = headers.get(HTTP_HEADER_SAMPLING_PRIORITY)
+        origin = headers.get(HTTP_HEADER_ORIGIN)
 
         meta = None
-        tags_value = _extract_header_value(
-            _POSSIBLE_HTTP_HEADER_TAGS,
-            headers,
-            default="",
-        )
+        tags_value = headers.get(_HTTP_HEADER_TAGS, "")
         if tags_value:
             # Do not fail if the tags are malformed
             try:
-                meta = {
-                    k: v
-                    for (k, v) in decode_tagset_string(tags_value).items()
-                    if (
-                        k not in _DatadogMultiHeader._X_DATADOG_TAGS_EXTRACT_REJECT
-                        and _DatadogMultiHeader._is_valid_datadog_trace_tag_key(k)
-                    )
-                }
+                # DEV: The decoded tags are cached, copy them as the context owns its meta
+                meta = dict(_DatadogMultiHeader._decode_tags(tags_value))
             except TagsetMaxSizeDecodeError:
                 meta = {
                     "_dd.propagation_error": "extract_max_size",
@@ -341,25 +369,13 @@ class _B3MultiHeader:
     @staticmethod
     def _extract(headers):
         # type: (Dict[str, str]) -> Optional[Context]
-        trace_id_val = _extract_header_value(
-            _POSSIBLE_HTTP_HEADER_B3_TRACE_IDS,
-            headers,
-        )
+        trace_id_val = headers.get(_HTTP_HEADER_B3_TRACE_ID)
         if trace_id_val is None:
             return None
 
-        span_id_val = _extract_header_value(
-            _POSSIBLE_HTTP_HEADER_B3_SPAN_IDS,
-            headers,
-        )
-        sampled = _extract_header_value(
-            _POSSIBLE_HTTP_HEADER_B3_SAMPLEDS,
-            headers,
-        )
-        flags = _extract_header_value(
-            _POSSIBLE_HTTP_HEADER_B3_FLAGS,
-            headers,
-        )
+        span_id_val = headers.get(_HTTP_HEADER_B3_SPAN_ID)
+        sampled = headers.get(_HTTP_HEADER_B3_SAMPLED)
+        flags = headers.get(_HTTP_HEADER_B3_FLAGS)
 
         # Try to parse values into their expected types
         try:
@@ -457,7 +473,7 @@ class _B3SingleHeader:
     @staticmethod
     def _extract(headers):
         # type: (Dict[str, str]) -> Optional[Context]
-        single_header = _extract_header_value(_POSSIBLE_HTTP_HEADER_B3_SINGLE_HEADER, headers)
+        single_header = headers.get(_HTTP_HEADER_B3_SINGLE)
         if not single_header:
             return None
 
@@ -606,8 +622,11 @@ class _TraceContext:
         return trace_id, span_id, sampling_priority
 
     @staticmethod
+    @cached()
     def _get_tracestate_values(ts):
         # type: (str) -> Tuple[Optional[int], Dict[str, str], Optional[str]]
+        # DEV: The results are cached as services usually receive the same few
+        # tracestate values, they must not be mutated.
 
         # tracestate parsing, example: dd=s:2;o:rum;t.dm:-4;t.usr.id:baz64,congo=t61rcWkgMzE
         dd = None
@@ -663,7 +682,7 @@ class _TraceContext:
         # type: (Dict[str, str]) -> Optional[Context]
 
         try:
-            tp = _extract_header_value(_POSSIBLE_HTTP_HEADER_TRACEPARENT, headers)
+            tp = headers.get(_HTTP_HEADER_TRACEPARENT)
             if tp is None:
                 log.debug("no traceparent header")
                 return None
@@ -674,11 +693,11 @@ class _TraceContext:
         origin = None
         meta = {W3C_TRACEPARENT_KEY: tp}  # type: _MetaDictType
 
-        ts = _extract_header_value(_POSSIBLE_HTTP_HEADER_TRACESTATE, headers)
+        ts = headers.get(_HTTP_HEADER_TRACESTATE)
         if ts:
             # the value MUST contain only ASCII characters in the
             # range of 0x20 to 0x7E
-            if re.search(r"[^\x20-\x7E]+", ts):
+            if _TRACESTATE_INVALID_CHARS_RE.search(ts):
                 log.debug("received invalid tracestate header: %r", ts)
             else:
                 # store tracestate so we keep other vendor data for injection, even if dd ends up being invalid
@@ -802,7 +821,9 @@ class HTTPPropagator(object):
             return Context()
 
         try:
-            normalized_headers = {name.lower(): v for name, v in headers.items()}
+            normalized_headers = _extract_propagation_headers(headers)
+            if not normalized_headers:
+                return Context()
 
             # loop through the extract propagation styles specified in order
             for prop_style in config._propagation_style_extract:
@@ -3,6 +3,7 @@ from typing import TYPE_CHECKING
 from envier import En
 from envier import validators
 
+from ddtrace.internal.utils.cache import cached
 from ddtrace.vendor.sqlcommenter import generate_sql_comment as _generate_sql_comment
 
 from . import _config as dd_config
@@ -10,6 +11,7 @@ from . import _config as dd_config
 
 if TYPE_CHECKING:
     from typing import Optional
+    from typing import Tuple
 
     from ddtrace import Span
 
@@ -36,25 +38,40 @@ class DatabaseMonitoringConfig(En):
 dbm_config = DatabaseMonitoringConfig()
 
 
+@cached()
+def _get_service_comments(tags):
+    # type: (Tuple[Optional[str], Optional[str], Optional[str], Optional[str]]) -> Tuple[str, str]
+    """Return the service mode comment, and the prefix of the full mode comment, for the given service tags.
+
+    The keys are sorted in the generated comments, so the traceparent is always the last one.
+    """
+    service, env, version, db_service = tags
+    comment = _generate_sql_comment(
+        **{
+            DBM_PARENT_SERVICE_NAME_KEY: service,
+            DBM_ENVIRONMENT_KEY: env,
+            DBM_VERSION_KEY: version,
+            DBM_DATABASE_SERVICE_NAME_KEY: db_service,
+        }
+    )
+    body = comment[3:-2]
+    return comment, " /*%s%s='" % (body + "," if body else "", DBM_TRACE_PARENT_KEY)
+
+
 def _get_dbm_comment(db_span):
     # type: (Span) -> Optional[str]
     """Generate DBM trace injection comment and updates span tags
     This method will set the ``_dd.dbm_trace_injected: "true"`` tag
     on ``db_span`` if the configured injection mode is ``"full"``.
     """
-    if dbm_config.propagation_mode == "disabled":
+    mode = dbm_config.propagation_mode
+    if mode == "disabled":
         return None
 
-    # set the following tags if DBM injection mode is full or service
-    dbm_tags = {
-        DBM_PARENT_SERVICE_NAME_KEY: dd_config.service,
-        DBM_ENVIRONMENT_KEY: dd_config.env,
-        DBM_VERSION_KEY: dd_config.version,
-        DBM_DATABASE_SERVICE_NAME_KEY: db_span.service,
-    }
-
-    if dbm_config.propagation_mode == "full":
-        db_span.set_tag_str(DBM_TRACE_INJECTED_TAG, "true")
-        dbm_tags[DBM_TRACE_PARENT_KEY] = db_span.context._traceparent
+    # The comment only depends on the service tags, unless the traceparent is injected too
+    comment, full_prefix = _get_service_comments((dd_config.service, dd_config.env, dd_config.version, db_span.service))
+    if mode != "full":
+        return comment
 
-    return _generate_sql_comment(**dbm_tags)
+    db_span.set_tag_str(DBM_TRACE_INJECTED_TAG, "true")
+    return full_prefix + db_span.context._traceparent + "'*/"
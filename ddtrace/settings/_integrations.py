@@ -0,0 +1,326 @@
+"""Default settings of the integrations.
+
+The settings of an integration are registered the first time they are
+accessed, with ``config.<integration>``. They are kept here rather than in
+the integrations, which import their library, so that they are available
+before the library is imported and patched.
+"""
+from collections import defaultdict
+import os
+from typing import TYPE_CHECKING
+
+from ..internal.utils.formats import asbool
+
+
+if TYPE_CHECKING:  # pragma: no cover
+    from typing import Any
+    from typing import Callable
+    from typing import Dict
+    from typing import Optional
+
+    from .config import Config
+
+
+def _aws(config):
+    # type: (Config) -> Dict[str, Any]
+    return {
+        "tag_no_params": asbool(os.getenv("DD_AWS_TAG_NO_PARAMS", default=False)),
+        "tag_all_params": asbool(os.getenv("DD_AWS_TAG_ALL_PARAMS", default=False)),
+    }
+
+
+def _aiohttp_client(config):
+    # type: (Config) -> Dict[str, Any]
+    return dict(
+        distributed_tracing=asbool(os.getenv("DD_AIOHTTP_CLIENT_DISTRIBUTED_TRACING", True)),
+        default_http_tag_query_string=os.getenv("DD_HTTP_CLIENT_TAG_QUERY_STRING", "true"),
+    )
+
+
+def _botocore(config):
+    # type: (Config) -> Dict[str, Any]
+    settings = {
+        "distributed_tracing": asbool(os.getenv("DD_BOTOCORE_DISTRIBUTED_TRACING", default=True)),
+        "invoke_with_legacy_context": asbool(os.getenv("DD_BOTOCORE_INVOKE_WITH_LEGACY_CONTEXT", default=False)),
+        "operations": defaultdict(config._HTTPServerConfig),
+    }
+    settings.update(_aws(config))
+    return settings
+
+
+def _bottle(config):
+    # type: (Config) -> Dict[str, Any]
+    return dict(
+        distributed_tracing=asbool(os.getenv("DD_BOTTLE_DISTRIBUTED_TRACING", default=True)),
+    )
+
+
+def _celery(config):
+    # type: (Config) -> Dict[str, Any]
+    return {
+        "distributed_tracing": asbool(os.getenv("DD_CELERY_DISTRIBUTED_TRACING", default=False)),
+        "producer_service_name": os.getenv(
+            "DD_CELERY_PRODUCER_SERVICE_NAME", default=config._get_service(default="celery-producer")
+        ),
+        "worker_service_name": os.getenv(
+            "DD_CELERY_WORKER_SERVICE_NAME", default=config._get_service(default="celery-worker")
+        ),
+    }
+
+
+def _django(config):
+    # type: (Config) -> Dict[str, Any]
+    return dict(
+        _default_service="django",
+        cache_service_name=os.getenv("DD_DJANGO_CACHE_SERVICE_NAME", default="django"),
+        database_service_name_prefix=os.getenv("DD_DJANGO_DATABASE_SERVICE_NAME_PREFIX", default=""),
+        database_service_name=os.getenv("DD_DJANGO_DATABASE_SERVICE_NAME", default=""),
+        trace_fetch_methods=asbool(os.getenv("DD_DJANGO_TRACE_FETCH_METHODS", default=False)),
+        distributed_tracing_enabled=True,
+        instrument_middleware=asbool(os.getenv("DD_DJANGO_INSTRUMENT_MIDDLEWARE", default=True)),
+        aggregate_middleware=asbool(os.getenv("DD_DJANGO_AGGREGATE_MIDDLEWARE", default=False)),
+        instrument_templates=asbool(os.getenv("DD_DJANGO_INSTRUMENT_TEMPLATES", default=True)),
+        instrument_databases=asbool(os.getenv("DD_DJANGO_INSTRUMENT_DATABASES", default=True)),
+        instrument_caches=asbool(os.getenv("DD_DJANGO_INSTRUMENT_CACHES", default=True)),
+        analytics_enabled=None,  # None allows the value to be overridden by the global config
+        analytics_sample_rate=None,
+        trace_query_string=None,  # Default to global config
+        include_user_name=asbool(os.getenv("DD_DJANGO_INCLUDE_USER_NAME", default=True)),
+        use_handler_with_url_name_resource_format=asbool(
+            os.getenv("DD_DJANGO_USE_HANDLER_WITH_URL_NAME_RESOURCE_FORMAT", default=False)
+        ),
+        use_handler_resource_format=asbool(os.getenv("DD_DJANGO_USE_HANDLER_RESOURCE_FORMAT", default=False)),
+        use_legacy_resource_format=asbool(os.getenv("DD_DJANGO_USE_LEGACY_RESOURCE_FORMAT", default=False)),
+    )
+
+
+def _falcon(config):
+    # type: (Config) -> Dict[str, Any]
+    return dict(
+        distributed_tracing=asbool(os.getenv("DD_FALCON_DISTRIBUTED_TRACING", default=True)),
+    )
+
+
+def _asgi_framework(name):
+    # type: (str) -> Callable[[Config], Dict[str, Any]]
+    def get(config):
+        # type: (Config) -> Dict[str, Any]
+        return dict(
+            _default_service=name,
+            request_span_name="%s.request" % name,
+            distributed_tracing=True,
+            aggregate_resources=True,
+        )
+
+    return get
+
+
+def _flask(config):
+    # type: (Config) -> Dict[str, Any]
+    return dict(
+        # Flask service configuration
+        _default_service="flask",
+        collect_view_args=True,
+        distributed_tracing_enabled=True,
+        template_default_name="<memory>",
+        trace_signals=True,
+        aggregate_hooks=asbool(os.getenv("DD_FLASK_AGGREGATE_HOOKS", default=False)),
+    )
+
+
+def _graphql(config):
+    # type: (Config) -> Dict[str, Any]
+    return dict(
+        _default_service="graphql",
+        resolvers_enabled=asbool(os.getenv("DD_TRACE_GRAPHQL_RESOLVERS_ENABLED", default=False)),
+    )
+
+
+def _grpc(service):
+    # type: (str) -> Callable[[Config], Dict[str, Any]]
+    def get(config):
+        # type: (Config) -> Dict[str, Any]
+        return dict(
+            _default_service=service,
+            distributed_tracing_enabled=True,
+            stream_metrics=asbool(os.getenv("DD_GRPC_STREAM_METRICS", default=False)),
+        )
+
+    return get
+
+
+def _httplib(config):
+    # type: (Config) -> Dict[str, Any]
+    return {
+        "distributed_tracing": asbool(os.getenv("DD_HTTPLIB_DISTRIBUTED_TRACING", default=True)),
+        "default_http_tag_query_string": os.getenv("DD_HTTP_CLIENT_TAG_QUERY_STRING", "true"),
+    }
+
+
+def _httpx(config):
+    # type: (Config) -> Dict[str, Any]
+    return {
+        "distributed_tracing": asbool(os.getenv("DD_HTTPX_DISTRIBUTED_TRACING", default=True)),
+        "split_by_domain": asbool(os.getenv("DD_HTTPX_SPLIT_BY_DOMAIN", default=False)),
+        "default_http_tag_query_string": os.getenv("DD_HTTP_CLIENT_TAG_QUERY_STRING", "true"),
+    }
+
+
+def _jinja2(config):
+    # type: (Config) -> Dict[str, Any]
+    return {
+        "service_name": os.getenv("DD_JINJA2_SERVICE_NAME"),
+    }
+
+
+def _kombu(config):
+    # type: (Config) -> Dict[str, Any]
+    return {
+        "service_name": config.service or os.getenv("DD_KOMBU_SERVICE_NAME", default="kombu"),
+    }
+
+
+def _molten(config):
+    # type: (Config) -> Dict[str, Any]
+    return dict(
+        _default_service="molten",
+        distributed_tracing=asbool(os.getenv("DD_MOLTEN_DISTRIBUTED_TRACING", default=True)),
+    )
+
+
+def _dbapi(name, service=None, prefix=None, trace_connect=False, **extra):
+    # type: (str, Optional[str], Optional[str], bool, Any) -> Callable[[Config], Dict[str, Any]]
+    """Return the default settings of a DB-API integration."""
+
+    def get(config):
+        # type: (Config) -> Dict[str, Any]
+        settings = dict(
+            _default_service=service or name,
+            _dbapi_span_name_prefix=prefix or service or name,
+            trace_fetch_methods=asbool(os.getenv("DD_%s_TRACE_FETCH_METHODS" % name.upper(), default=False)),
+        )
+        if trace_connect:
+            settings["trace_connect"] = asbool(os.getenv("DD_%s_TRACE_CONNECT" % name.upper(), default=False))
+        settings.update(extra)
+        return settings
+
+    return get
+
+
+def _pylons(config):
+    # type: (Config) -> Dict[str, Any]
+    return dict(
+        distributed_tracing=asbool(os.getenv("DD_PYLONS_DISTRIBUTED_TRACING", default=True)),
+    )
+
+
+def _pyramid(config):
+    # type: (Config) -> Dict[str, Any]
+    return dict(
+        distributed_tracing=asbool(os.getenv("DD_PYRAMID_DISTRIBUTED_TRACING", default=True)),
+    )
+
+
+def _requests(config):
+    # type: (Config) -> Dict[str, Any]
+    return {
+        "distributed_tracing": asbool(os.getenv("DD_REQUESTS_DISTRIBUTED_TRACING", default=True)),
+        "split_by_domain": asbool(os.getenv("DD_REQUESTS_SPLIT_BY_DOMAIN", default=False)),
+        "default_http_tag_query_string": os.getenv("DD_HTTP_CLIENT_TAG_QUERY_STRING", "true"),
+        "_default_service": "requests",
+    }
+
+
+def _rq(service):
+    # type: (str) -> Callable[[Config], Dict[str, Any]]
+    def get(config):
+        # type: (Config) -> Dict[str, Any]
+        return dict(
+            distributed_tracing_enabled=asbool(os.environ.get("DD_RQ_DISTRIBUTED_TRACING_ENABLED", True)),
+            _default_service=service,
+        )
+
+    return get
+
+
+def _urllib3(config):
+    # type: (Config) -> Dict[str, Any]
+    return {
+        "_default_service": "urllib3",
+        "distributed_tracing": asbool(os.getenv("DD_URLLIB3_DISTRIBUTED_TRACING", default=True)),
+        "default_http_tag_query_string": os.getenv("DD_HTTP_CLIENT_TAG_QUERY_STRING", "true"),
+        "split_by_domain": asbool(os.getenv("DD_URLLIB3_SPLIT_BY_DOMAIN", default=False)),
+    }
+
+
+def _static(**settings):
+    # type: (Any) -> Callable[[Config], Dict[str, Any]]
+    def get(config):
+        # type: (Config) -> Dict[str, Any]
+        return dict(settings)
+
+    return get
+
+
+# DEV: <config name> => <callable returning the default settings>
+INTEGRATION_DEFAULTS = {
+    "aiobotocore": _aws,
+    "aiohttp": _static(distributed_tracing=True),
+    "aiohttp_client": _aiohttp_client,
+    "aiohttp_jinja2": _static(),
+    "aiomysql": _static(_default_service="mysql"),
+    "aioredis": _static(_default_service="redis"),
+    "algoliasearch": _static(_default_service="algoliasearch", collect_query_text=False),
+    "aredis": _static(_default_service="redis"),
+    "asyncpg": _static(_default_service="postgres"),
+    "boto": _aws,
+    "botocore": _botocore,
+    "bottle": _bottle,
+    "celery": _celery,
+    "django": _django,
+    "elasticsearch": _static(_default_service="elasticsearch"),
+    "falcon": _falcon,
+    "fastapi": _asgi_framework("fastapi"),
+    "flask": _flask,
+    "graphql": _graphql,
+    # TODO[tbutt]: keeping name for client config unchanged to maintain backwards
+    # compatibility but should change in future
+    "grpc": _grpc("grpc-client"),
+    "grpc_server": _grpc("grpc-server"),
+    "grpc_aio_client": _grpc("grpc-aio-client"),
+    "grpc_aio_server": _grpc("grpc-aio-server"),
+    "httplib": _httplib,
+    "httpx": _httpx,
+    "jinja2": _jinja2,
+    "kombu": _kombu,
+    "logging": _static(tracer=None),
+    "mariadb": _dbapi("mariadb"),
+    "molten": _molten,
+    "mysql": _dbapi("mysql"),
+    "mysqldb": _dbapi("mysqldb", service="mysql", trace_connect=True),
+    "psycopg": _dbapi("psycopg", service="postgres", trace_connect=True, _dbm_propagation_supported=True),
+    "pylons": _pylons,
+    "pymongo": _static(_default_service="pymongo"),
+    # TODO[v1.0] this should be "mysql"
+    "pymysql": _dbapi("pymysql"),
+    "pynamodb": _static(_default_service="pynamodb"),
+    "pyodbc": _dbapi("pyodbc"),
+    "pyramid": _pyramid,
+    "redis": _static(_default_service="redis"),
+    "rediscluster": _static(_default_service="rediscluster"),
+    "requests": _requests,
+    "rq": _rq("rq"),
+    "rq_worker": _rq("rq-worker"),
+    "sanic": _static(_default_service="sanic", distributed_tracing=True),
+    # FIXME: consistent prefix span names with other dbapi integrations
+    # The snowflake integration was introduced following a different pattern
+    # than all other dbapi-compliant integrations. It sets span names to
+    # `sql.query` whereas other dbapi-compliant integrations are set to
+    # `<integration>.query`.
+    "snowflake": _dbapi("snowflake", prefix="sql"),
+    "sqlite": _dbapi("sqlite"),
+    "starlette": _asgi_framework("starlette"),
+    "urllib3": _urllib3,
+    "vertica": _static(_default_service="vertica", _dbapi_span_name_prefix="vertica"),
+    "yaaredis": _static(_default_service="redis"),
+}  # type: Dict[str, Callable[[Config], Dict[str, Any]]]
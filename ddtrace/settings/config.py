@@ -1,6 +1,7 @@
 from copy import deepcopy
 import os
 import re
+from typing import Dict
 from typing import List
 from typing import Optional
 from typing import Tuple
@@ -11,6 +12,7 @@ from ddtrace.internal.utils.cache import cachedmethod
 from ddtrace.internal.utils.deprecations import DDTraceDeprecationWarning
 from ddtrace.vendor.debtcollector import deprecate
 
+from ..internal.constants import DD_TRACE_OBFUSCATION_QUERY_STRING_PATTERN_DEFAULT
 from ..internal.constants import PROPAGATION_STYLE_ALL
 from ..internal.constants import PROPAGATION_STYLE_B3
 from ..internal.constants import _PROPAGATION_STYLE_DEFAULT
@@ -18,6 +20,7 @@ from ..internal.logger import get_logger
 from ..internal.utils.formats import asbool
 from ..internal.utils.formats import parse_tags_str
 from ..pin import Pin
+from ._integrations import INTEGRATION_DEFAULTS
 from .http import HttpConfig
 from .integration import IntegrationConfig
 
@@ -25,18 +28,6 @@ from .integration import IntegrationConfig
 log = get_logger(__name__)
 
 
-DD_TRACE_OBFUSCATION_QUERY_STRING_PATTERN_DEFAULT = (
-    r"(?i)(?:p(?:ass)?w(?:or)?d|pass(?:_?phrase)?|secret|(?:api_?|"
-    r"private_?|public_?|access_?|secret_?)key(?:_?id)?|token|consumer_?(?:id|key|secret)|"
-    r'sign(?:ed|ature)?|auth(?:entication|orization)?)(?:(?:\s|%20)*(?:=|%3D)[^&]+|(?:"|%22)'
-    r'(?:\s|%20)*(?::|%3A)(?:\s|%20)*(?:"|%22)(?:%2[^2]|%[^2]|[^"%])+(?:"|%22))|bearer(?:\s|%20)'
-    r"+[a-z0-9\._\-]|token(?::|%3A)[a-z0-9]{13}|gh[opsu]_[0-9a-zA-Z]{36}|ey[I-L](?:[\w=-]|%3D)+\.ey[I-L]"
-    r"(?:[\w=-]|%3D)+(?:\.(?:[\w.+\/=-]|%3D|%2F|%2B)+)?|[\-]{5}BEGIN(?:[a-z\s]|%20)+"
-    r"PRIVATE(?:\s|%20)KEY[\-]{5}[^\-]+[\-]{5}END(?:[a-z\s]|%20)+PRIVATE(?:\s|%20)KEY|"
-    r"ssh-rsa(?:\s|%20)*(?:[a-z0-9\/\.+]|%2F|%5C|%2B){100,}"
-)
-
-
 def _parse_propagation_styles(name, default):
     # type: (str, Optional[str]) -> Optional[List[str]]
     """Helper to parse http propagation extract/inject styles via env variables.
@@ -253,6 +244,8 @@ class Config(object):
         )
         self._appsec_enabled = asbool(os.getenv(APPSEC_ENV, False))
         self._iast_enabled = asbool(os.getenv(IAST_ENV, False))
+        # Load the integrations only when their library is imported
+        self._lazy_patching = asbool(os.getenv("DD_TRACE_LAZY_PATCHING_ENABLED", default=True))
 
         dd_trace_obfuscation_query_string_pattern = os.getenv(
             "DD_TRACE_OBFUSCATION_QUERY_STRING_PATTERN", DD_TRACE_OBFUSCATION_QUERY_STRING_PATTERN_DEFAULT
@@ -273,6 +266,11 @@ class Config(object):
     def __getattr__(self, name):
         if name not in self._config:
             self._config[name] = IntegrationConfig(self, name)
+            # Register the default settings of the integration, which does not
+            # require its library to be imported
+            defaults = INTEGRATION_DEFAULTS.get(name)
+            if defaults is not None:
+                self._add(name, defaults(self))
 
         return self._config[name]
 
@@ -315,6 +313,11 @@ class Config(object):
             # >>> config.requests['split_by_domain']
             # True
             self._config[integration] = IntegrationConfig(self, integration, _deepmerge(existing, settings))
+            # Keep the hooks and the HTTP settings set before the integration was loaded
+            # DEV: Integrations are loaded when their library is imported, which can be after
+            #   the application configured them
+            object.__setattr__(self._config[integration], "hooks", existing.hooks)
+            object.__setattr__(self._config[integration], "http", existing.http)
         else:
             self._config[integration] = IntegrationConfig(self, integration, settings)
 
@@ -344,6 +347,10 @@ class Config(object):
         # type: (str) -> Optional[str]
         return self.http._header_tag_name(header_name)
 
+    def _header_tag_plan(self, request_or_response):
+        # type: (str) -> Dict[str, str]
+        return self.http._header_tag_plan(request_or_response)
+
     def _get_service(self, default=None):
         """
         Returns the globally configured service or the default if none is configured.
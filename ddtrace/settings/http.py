@@ -1,3 +1,4 @@
+from typing import Dict
 from typing import List
 from typing import Mapping
 from typing import Optional
@@ -7,6 +8,7 @@ import six
 
 from ..internal.logger import get_logger
 from ..internal.utils.cache import cachedmethod
+from ..internal.utils.http import header_tag_name
 from ..internal.utils.http import normalize_header_name
 
 
@@ -24,9 +26,25 @@ class HttpConfig(object):
         self._header_tags = {normalize_header_name(k): v for k, v in header_tags.items()} if header_tags else {}
         self.trace_query_string = None
 
+    @property
+    def _header_tags(self):
+        # type: () -> Dict[str, str]
+        return self.__header_tags
+
+    @_header_tags.setter
+    def _header_tags(self, value):
+        # type: (Dict[str, str]) -> None
+        self.__header_tags = value
+        self._header_tags_changed()
+
+    def _header_tags_changed(self):
+        # type: () -> None
+        self._header_tag_plans = {}  # type: Dict[str, Dict[str, str]]
+        # Mypy can't catch cached method's invalidate()
+        self._header_tag_name.invalidate()  # type: ignore[attr-defined]
+
     def _reset(self):
         self._header_tags = {}
-        self._header_tag_name.invalidate()
 
     @cachedmethod()
     def _header_tag_name(self, header_name):
@@ -40,6 +58,21 @@ class HttpConfig(object):
         )
         return self._header_tags.get(normalized_header_name)
 
+    def _header_tag_plan(self, request_or_response):
+        # type: (str) -> Dict[str, str]
+        """
+        Returns the tag name of each traced header, by normalized header name, for
+        either the request or the response headers. Headers traced without a tag
+        name get the default ``http.<request or response>.headers.<header>`` tag.
+        """
+        plan = self._header_tag_plans.get(request_or_response)
+        if plan is None:
+            plan = self._header_tag_plans[request_or_response] = {
+                header_name: tag_name or header_tag_name(request_or_response, header_name)
+                for header_name, tag_name in self._header_tags.items()
+            }
+        return plan
+
     @property
     def is_header_tracing_configured(self):
         # type: () -> bool
@@ -66,8 +99,7 @@ class HttpConfig(object):
             #  Host on the request defaults to http.request.headers.host
             self._header_tags.setdefault(normalized_header_name, "")
 
-        # Mypy can't catch cached method's invalidate()
-        self._header_tag_name.invalidate()  # type: ignore[attr-defined]
+        self._header_tags_changed()
 
         return self
 
@@ -1,14 +1,16 @@
 import os
+from typing import Dict
 from typing import Optional
 from typing import Tuple
 
 from .._hooks import Hooks
 from ..internal.utils.attrdict import AttrDict
+from ..internal.utils.cache import VersionedDict
 from ..internal.utils.formats import asbool
 from .http import HttpConfig
 
 
-class IntegrationConfig(AttrDict):
+class IntegrationConfig(AttrDict, VersionedDict):
     """
     Integration specific configuration object.
 
@@ -39,6 +41,7 @@ class IntegrationConfig(AttrDict):
         object.__setattr__(self, "integration_name", name)
         object.__setattr__(self, "hooks", Hooks())
         object.__setattr__(self, "http", HttpConfig())
+        object.__setattr__(self, "_header_tag_plans", {})
 
         analytics_enabled, analytics_sample_rate = self._get_analytics_settings()
         self.setdefault("analytics_enabled", analytics_enabled)
@@ -122,6 +125,28 @@ class IntegrationConfig(AttrDict):
             return self.global_config._header_tag_name(header_name)
         return tag_name
 
+    def _header_tag_plan(self, request_or_response):
+        # type: (str) -> Dict[str, str]
+        """Returns the header tag plan of the integration merged with the global one.
+
+        The tags configured for the integration take precedence over the global ones.
+        """
+        plan = self.http._header_tag_plan(request_or_response)
+        global_plan = self.global_config.http._header_tag_plan(request_or_response)
+        if not global_plan:
+            return plan
+        if not plan:
+            return global_plan
+
+        # DEV: The plans are compiled again when their headers change, and the
+        #   merged plan is kept with the plans it was merged from.
+        merged = self._header_tag_plans.get(request_or_response)
+        if merged is None or merged[0] is not plan or merged[1] is not global_plan:
+            merged_plan = dict(global_plan)
+            merged_plan.update(plan)
+            merged = self._header_tag_plans[request_or_response] = (plan, global_plan, merged_plan)
+        return merged[2]
+
     def _is_analytics_enabled(self, use_global_config):
         # DEV: analytics flag can be None which should not be taken as
         # enabled when global flag is disabled
@@ -1,4 +1,5 @@
 import sys
+import threading
 from time import sleep
 
 import pytest
@@ -6,6 +7,7 @@ import pytest
 from ddtrace.appsec.iast import oce
 from ddtrace.appsec.iast._overhead_control_engine import MAX_REQUESTS
 from ddtrace.appsec.iast._overhead_control_engine import MAX_VULNERABILITIES_PER_REQUEST
+from ddtrace.appsec.iast._overhead_control_engine import OverheadControl
 from ddtrace.constants import IAST_CONTEXT_KEY
 from ddtrace.internal import _context
 
@@ -76,8 +78,6 @@ def test_oce_reset_vulnerabilities_report(iast_span_defaults):
 
 
 def test_oce_max_requests(tracer, iast_span_defaults):
-    import threading
-
     results = []
     num_requests = 5
     total_vulnerabilities = 0
@@ -126,3 +126,121 @@ def test_oce_max_requests_py3(tracer, iast_span_defaults):
     assert len(results) == num_requests * 3
     assert len(spans) == num_requests * 3
     assert total_vulnerabilities == MAX_REQUESTS
+
+
+@pytest.mark.skipif(sys.version_info < (3, 0, 0), reason="threading.Barrier exists in Python 3")
+def test_oce_concurrent_requests():
+    from ddtrace.appsec.iast.taint_sinks.weak_hash import WeakHash
+
+    num_requests = MAX_REQUESTS + 2
+    started = threading.Barrier(num_requests)
+    analyzed = threading.Barrier(num_requests)
+    results = []
+
+    def request():
+        oce.acquire_request()
+        # Wait for all the requests to be in flight
+        started.wait()
+        acquired = 0
+        if oce.request_has_quota:
+            while WeakHash.acquire_quota():
+                acquired += 1
+        results.append(acquired)
+        analyzed.wait()
+        oce.release_request()
+
+    threads = [threading.Thread(target=request) for _ in range(num_requests)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # Only MAX_REQUESTS requests are analyzed, each with its own vulnerability quota
+    assert sorted(results, reverse=True) == [MAX_VULNERABILITIES_PER_REQUEST] * MAX_REQUESTS + [0] * 2
+    assert oce._request_quota == MAX_REQUESTS
+    assert not oce.request_has_quota
+
+
+def test_oce_nested_requests():
+    oce.acquire_request()
+    oce.acquire_request()
+    assert oce.request_has_quota
+    oce.release_request()
+    assert oce.request_has_quota
+    oce.release_request()
+    assert not oce.request_has_quota
+    assert oce._request_quota == MAX_REQUESTS
+
+
+def test_oce_request_sampling():
+    control = OverheadControl(sampling=30.0)
+
+    sampled = 0
+    for _ in range(100):
+        control.acquire_request()
+        sampled += control.request_has_quota
+        control.release_request()
+
+    assert sampled == 30
+
+
+def test_oce_request_no_budget():
+    control = OverheadControl()
+
+    control.acquire_request()
+    control.add_elapsed(1.0)
+    assert control.request_has_quota
+    control.release_request()
+
+
+def test_oce_request_budget():
+    control = OverheadControl(budget_ms=1.0)
+
+    control.acquire_request()
+    assert control.request_has_quota
+    control.add_elapsed(0.002)
+    assert not control.request_has_quota
+    control.release_request()
+
+    # The budget is per request
+    control.acquire_request()
+    assert control.request_has_quota
+    control.release_request()
+
+
+def test_oce_reported_vulnerabilities_per_request():
+    from ddtrace.appsec.iast.taint_sinks.weak_hash import WeakHash
+
+    oce.acquire_request()
+    assert WeakHash.is_not_reported("a.py", 1)
+    assert not WeakHash.is_not_reported("a.py", 1)
+    assert WeakHash.is_not_reported("a.py", 2)
+    oce.release_request()
+
+    # The locations are reported again in the next request
+    oce.acquire_request()
+    assert WeakHash.is_not_reported("a.py", 1)
+    oce.release_request()
+
+
+def test_oce_release_request_span(tracer):
+    control = OverheadControl()
+
+    with tracer.trace("request") as span:
+        control.acquire_request(span)
+
+    # The span can be finished from another context
+    results = []
+    thread = threading.Thread(target=lambda: results.append(control.release_request(span)))
+    thread.start()
+    thread.join()
+
+    assert results == [True]
+    assert control._request_quota == MAX_REQUESTS
+    assert not control.request_has_quota
+
+    # The next request in the context of the first one is a new request
+    control.acquire_request()
+    assert control.request_has_quota
+    assert control._request_quota == MAX_REQUESTS - 1
+    control.release_request()
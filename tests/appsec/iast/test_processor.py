@@ -1,10 +1,13 @@
 import json
 
+import mock
 import pytest
 
 from ddtrace._monkey import IAST_PATCH
 from ddtrace._monkey import patch_iast
+from ddtrace.appsec.iast import oce
 from ddtrace.constants import IAST_CONTEXT_KEY
+from ddtrace.constants import IAST_ENABLED
 from ddtrace.constants import IAST_JSON
 from ddtrace.constants import SAMPLING_PRIORITY_KEY
 from ddtrace.constants import USER_KEEP
@@ -41,6 +44,21 @@ def test_appsec_iast_processor():
 
         assert len(span_report.vulnerabilities) == 1
         assert len(json.loads(result)["vulnerabilities"]) == 1
+        assert span.get_metric(IAST_ENABLED) == 1.0
+
+
+def test_appsec_iast_processor_request_disabled():
+    with override_env(dict(DD_IAST_ENABLED="true")):
+        patch_iast(**IAST_PATCH)
+
+        tracer = DummyTracer(iast_enabled=True)
+
+        # No request can be analyzed
+        with mock.patch.object(oce, "_request_quota", 0):
+            span = traced_function(tracer)
+
+        assert span.get_metric(IAST_ENABLED) is None
+        assert span.get_tag(IAST_JSON) is None
 
 
 @pytest.mark.parametrize("sampling_rate", ["0.0", "0.5", "1.0"])
@@ -25,6 +25,15 @@ def test_ddwaf_objects_wrapper(obj, kwargs):
     del obj
 
 
+@given(first=PYTHON_OBJECTS, second=PYTHON_OBJECTS)
+def test_ddwaf_objects_wrapper_reuse(first, second):
+    # The second wrapper might reuse the memory released by the first one
+    expected = _Wrapper(second, max_objects=None)._next_idx
+    wrapper = _Wrapper(first, max_objects=None)
+    del wrapper
+    assert _Wrapper(second, max_objects=None)._next_idx == expected
+
+
 if __name__ == "__main__":
     import atheris
 
@@ -1,6 +1,7 @@
 import json
 import os.path
 
+import mock
 import pytest
 from six import ensure_binary
 
@@ -11,10 +12,16 @@ from ddtrace.appsec.processor import DEFAULT_APPSEC_OBFUSCATION_PARAMETER_VALUE_
 from ddtrace.appsec.processor import DEFAULT_RULES
 from ddtrace.appsec.processor import DEFAULT_WAF_TIMEOUT
 from ddtrace.appsec.processor import _transform_headers
+from ddtrace.constants import APPSEC_EVENT_RULE_ERRORS
+from ddtrace.constants import APPSEC_EVENT_RULE_ERROR_COUNT
+from ddtrace.constants import APPSEC_EVENT_RULE_LOADED
+from ddtrace.constants import APPSEC_EVENT_RULE_VERSION
 from ddtrace.constants import APPSEC_JSON
+from ddtrace.constants import APPSEC_WAF_CONTEXT_KEY
 from ddtrace.constants import USER_KEEP
 from ddtrace.contrib.trace_utils import set_http_meta
 from ddtrace.ext import SpanTypes
+from ddtrace.internal import _context
 from tests.utils import override_env
 from tests.utils import override_global_config
 from tests.utils import snapshot
@@ -392,6 +399,114 @@ def test_ddwaf_run():
         assert total_overall_runtime > total_time
 
 
+def test_ddwaf_context_run():
+    with open(RULES_GOOD_PATH) as rules:
+        rules_json = json.loads(rules.read())
+        _ddwaf = DDWaf(rules_json, b"", b"")
+        ctx = _ddwaf.context()
+        try:
+            res, total_time, _ = ctx.run(
+                {"server.request.headers.no_cookies": {"user-agent": "werkzeug/2.1.2", "host": "localhost"}},
+                DEFAULT_WAF_TIMEOUT,
+            )
+            assert res is None
+
+            # Only the rules that depend on the new addresses report matches
+            res, _, _ = ctx.run({"server.request.cookies": {"attack": "1' or '1' = '1'"}}, DEFAULT_WAF_TIMEOUT)
+            assert res.startswith('[{"rule":{"id":"crs-942-100"')
+
+            assert ctx.total_runtime > 0
+            assert ctx.total_overall_runtime > ctx.total_runtime
+        finally:
+            ctx.close()
+
+        assert ctx.closed
+        with pytest.raises(RuntimeError):
+            ctx.run({}, DEFAULT_WAF_TIMEOUT)
+
+
+def test_incremental_address_push(tracer_appsec):
+    tracer = tracer_appsec
+
+    with tracer.trace("test", span_type=SpanTypes.WEB) as span:
+        set_http_meta(span, Config(), request_headers={"User-Agent": "Arachni/v1"})
+        # The request headers have already been evaluated
+        waf_request = span._get_ctx_item(APPSEC_WAF_CONTEXT_KEY)
+        assert waf_request.results
+        assert "server.request.headers.no_cookies" in waf_request.data
+
+        set_http_meta(span, Config(), parsed_query={"q": "1' or '1' = '1'"})
+        assert "server.request.query" in waf_request.data
+
+    assert waf_request.closed
+
+    rules = {_["rule"]["id"] for _ in json.loads(span.get_tag(APPSEC_JSON))["triggers"]}
+    assert rules >= {"ua0-600-12x", "crs-942-100"}
+
+
+def test_address_push_changed_value(tracer_appsec):
+    tracer = tracer_appsec
+
+    with tracer.trace("test", span_type=SpanTypes.WEB) as span:
+        set_http_meta(span, Config(), request_headers={"Host": "localhost"})
+        waf_request = span._get_ctx_item(APPSEC_WAF_CONTEXT_KEY)
+        assert not waf_request.results
+
+        # The same value is not evaluated again
+        set_http_meta(span, Config(), request_headers={"Host": "localhost"})
+        assert len(waf_request.data) == 1
+
+        # A more complete value is
+        set_http_meta(span, Config(), request_headers={"Host": "localhost", "User-Agent": "Arachni/v1"})
+        assert waf_request.data["server.request.headers.no_cookies"]["user-agent"] == "Arachni/v1"
+        assert waf_request.results
+
+    rules = {_["rule"]["id"] for _ in json.loads(span.get_tag(APPSEC_JSON))["triggers"]}
+    assert rules == {"ua0-600-12x"}
+
+
+def test_address_push_error(tracer_appsec):
+    tracer = tracer_appsec
+
+    with tracer.trace("test", span_type=SpanTypes.WEB) as span:
+        waf_request = span._get_ctx_item(APPSEC_WAF_CONTEXT_KEY)
+        with mock.patch.object(type(waf_request), "push", side_effect=RuntimeError("WAF context is closed")):
+            # The request is not interrupted
+            set_http_meta(span, Config(), request_headers={"User-Agent": "Arachni/v1"}, status_code=200)
+        assert not waf_request.data
+
+    # The addresses are pushed when the span finishes
+    assert span.get_tag("http.status_code") == "200"
+    assert "triggers" in json.loads(span.get_tag(APPSEC_JSON))
+
+
+def test_waf_request_triggers(tracer_appsec):
+    tracer = tracer_appsec
+
+    with tracer.trace("test", span_type=SpanTypes.WEB) as span:
+        waf_request = span._get_ctx_item(APPSEC_WAF_CONTEXT_KEY)
+        waf_request.results.extend(['[{"rule":{"id":"a"}}]', "[]", '[{"rule":{"id":"b"}},{"rule":{"id":"c"}}]'])
+        assert json.loads(waf_request.triggers()) == [
+            {"rule": {"id": "a"}},
+            {"rule": {"id": "b"}},
+            {"rule": {"id": "c"}},
+        ]
+        del waf_request.results[:]
+
+
+def test_nested_web_spans_triggers(tracer_appsec):
+    tracer = tracer_appsec
+
+    with tracer.trace("outer", span_type=SpanTypes.WEB) as outer:
+        with tracer.trace("inner", span_type=SpanTypes.WEB) as inner:
+            set_http_meta(inner, Config(), request_headers={"User-Agent": "Arachni/v1"})
+        assert _context.get_item(APPSEC_WAF_CONTEXT_KEY, span=inner) is outer._get_ctx_item(APPSEC_WAF_CONTEXT_KEY)
+
+    # Only the span that owns the WAF context reports the matches
+    assert inner.get_tag(APPSEC_JSON) is None
+    assert "triggers" in json.loads(outer.get_tag(APPSEC_JSON))
+
+
 def test_ddwaf_info():
     with open(RULES_GOOD_PATH) as rules:
         rules_json = json.loads(rules.read())
@@ -429,3 +544,16 @@ def test_ddwaf_info_with_3_errors():
         assert info["loaded"] == 1
         assert info["failed"] == 2
         assert info["errors"] == {"missing key 'name'": ["crs-942-100", "crs-913-120"]}
+
+
+def test_ruleset_info_tags():
+    with open(os.path.join(ROOT_DIR, "rules-with-2-errors.json")) as rules:
+        _ddwaf = DDWaf(json.loads(rules.read()), b"", b"")
+
+    # The ruleset info is computed once when the rules are loaded
+    assert _ddwaf.info is _ddwaf.info
+
+    processor = AppSecSpanProcessor(ddwaf=_ddwaf)
+    assert processor._ruleset_tags[APPSEC_EVENT_RULE_VERSION] == "5.5.5"
+    assert json.loads(processor._ruleset_tags[APPSEC_EVENT_RULE_ERRORS]) == _ddwaf.info["errors"]
+    assert processor._ruleset_metrics == {APPSEC_EVENT_RULE_LOADED: 1, APPSEC_EVENT_RULE_ERROR_COUNT: 2}
@@ -494,3 +494,19 @@ def test_no_args():
     p.wait()
     assert p.returncode == 1
     assert six.b("usage:") in p.stdout.read()
+
+
+@pytest.mark.skipif(sys.version_info < (3, 7), reason="-X importtime requires Python 3.7+")
+def test_startup_report():
+    p = subprocess.Popen(
+        ["ddtrace-run", "--startup-report"],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+    )
+    out, _ = p.communicate()
+    assert p.returncode == 0, out
+    assert out.startswith(b"ddtrace-run startup report\nTotal import time: ")
+    assert b"Imports by module (cumulative):" in out
+    assert b"Imports by integration (cumulative):" in out
+    assert b"Slowest modules (self):" in out
+    assert b"  ddtrace\n" in out
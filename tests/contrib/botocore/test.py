@@ -991,6 +991,61 @@ class BotocoreTest(TracerTestCase):
             # assert headers[HTTP_HEADER_TRACE_ID] == str(span.trace_id)
             # assert headers[HTTP_HEADER_PARENT_ID] == str(span.span_id)
 
+    @unittest.skipIf(BOTOCORE_VERSION < (1, 9, 0), "Skipping for older versions of botocore without Stubber")
+    def test_eventbridge_batch_trace_injection_stubbed(self):
+        from botocore.stub import Stubber
+
+        bridge = self.session.create_client("events", region_name="us-east-1", endpoint_url="http://localhost:4566")
+        Pin(service=self.TEST_SERVICE, tracer=self.tracer).onto(bridge)
+
+        entries = [
+            {"Source": "some-event-source", "DetailType": "some-event-detail-type", "Detail": '{"foo": "bar"}'},
+            {"Source": "some-event-source", "DetailType": "some-event-detail-type", "Detail": '{ "foo" : [1, 2] }\n'},
+            {"Source": "some-event-source", "DetailType": "some-event-detail-type", "Detail": "{}"},
+            {"Source": "some-event-source", "DetailType": "some-event-detail-type"},
+            {"Source": "some-event-source", "DetailType": "some-event-detail-type", "Detail": '{"_datadog": "foo"}'},
+            {"Source": "some-event-source", "DetailType": "some-event-detail-type", "Detail": "not json"},
+        ]
+        with Stubber(bridge) as stubber:
+            stubber.add_response("put_events", {"FailedEntryCount": 0, "Entries": [{"EventId": "1"}] * len(entries)})
+            bridge.put_events(Entries=entries)
+
+        span = self.get_spans()[0]
+        headers = {HTTP_HEADER_TRACE_ID: str(span.trace_id), HTTP_HEADER_PARENT_ID: str(span.span_id)}
+
+        # The original JSON is kept as it is
+        assert entries[0]["Detail"].startswith('{"foo": "bar", "_datadog": {')
+        assert entries[1]["Detail"].startswith('{ "foo" : [1, 2], "_datadog": {')
+        assert entries[1]["Detail"].endswith("}\n")
+        assert json.loads(entries[0]["Detail"])["foo"] == "bar"
+        assert json.loads(entries[1]["Detail"])["foo"] == [1, 2]
+        for entry in entries[:5]:
+            detail = json.loads(entry["Detail"])
+            assert set(detail) <= {"foo", "_datadog"}
+            for header, value in headers.items():
+                assert detail["_datadog"][header] == value
+        assert entries[5]["Detail"] == "not json"
+
+    @unittest.skipIf(BOTOCORE_VERSION < (1, 9, 0), "Skipping for older versions of botocore without Stubber")
+    def test_sqs_send_message_batch_trace_injection_stubbed(self):
+        from botocore.stub import Stubber
+
+        sqs = self.session.create_client("sqs", region_name="us-east-1", endpoint_url="http://localhost:4566")
+        Pin(service=self.TEST_SERVICE, tracer=self.tracer).onto(sqs)
+
+        entries = [{"Id": str(i), "MessageBody": "ironmaiden"} for i in range(10)]
+        with Stubber(sqs) as stubber:
+            stubber.add_response("send_message_batch", {"Successful": [], "Failed": []})
+            sqs.send_message_batch(QueueUrl="http://localhost:4566/000000000000/Test", Entries=entries)
+
+        span = self.get_spans()[0]
+        trace_json = entries[0]["MessageAttributes"]["_datadog"]["StringValue"]
+        headers = json.loads(trace_json)
+        assert headers[HTTP_HEADER_TRACE_ID] == str(span.trace_id)
+        assert headers[HTTP_HEADER_PARENT_ID] == str(span.span_id)
+        for entry in entries:
+            assert entry["MessageAttributes"]["_datadog"] == {"DataType": "String", "StringValue": trace_json}
+
     @mock_kms
     def test_kms_client(self):
         # DEV: We can ignore the params tags as none currently exists. Test all params for deprecated exclusion.
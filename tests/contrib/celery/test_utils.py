@@ -2,6 +2,7 @@ import gc
 
 from ddtrace.contrib.celery.utils import attach_span
 from ddtrace.contrib.celery.utils import detach_span
+from ddtrace.contrib.celery.utils import get_span_template
 from ddtrace.contrib.celery.utils import retrieve_span
 from ddtrace.contrib.celery.utils import retrieve_task_id
 from ddtrace.contrib.celery.utils import set_tags_from_context
@@ -98,6 +99,45 @@ class CeleryTagsTest(CeleryBaseTestCase):
         detach_span(fn_task, task_id)
         assert weak_dict.get((task_id, False)) is None
 
+    def test_span_detach_returns_span(self):
+        # ensure the helper returns the detached Span only once
+        @self.app.task
+        def fn_task():
+            return 42
+
+        task_id = "7c6731af-9533-40c3-83a9-25b58f0d837f"
+        span = self.tracer.trace("celery.run")
+        attach_span(fn_task, task_id, span)
+        assert detach_span(fn_task, task_id, is_publish=True) is None
+        assert detach_span(fn_task, task_id) is span
+        assert detach_span(fn_task, task_id) is None
+
+    def test_span_template(self):
+        # ensure the span templates are cached per task and updated with the configuration
+        @self.app.task
+        def fn_task():
+            return 42
+
+        template = get_span_template(fn_task, fn_task.name)
+        assert template is get_span_template(fn_task, fn_task.name)
+        assert template.service == "celery-worker"
+        assert template.resource == fn_task.name
+        assert template.meta == {}
+        assert template.metrics == {"_dd.measured": 1}
+
+        publish_template = get_span_template(fn_task, fn_task.name, is_publish=True)
+        assert publish_template is not template
+        assert publish_template.service == "celery-producer"
+        assert publish_template.meta == {"celery.action": "apply_async"}
+
+        with self.override_config("celery", dict(worker_service_name="worker-notify", analytics_enabled=True)):
+            new_template = get_span_template(fn_task, fn_task.name)
+            assert new_template is not template
+            assert new_template.service == "worker-notify"
+            assert new_template.metrics == {"_dd.measured": 1, "_dd1.sr.eausr": 1.0}
+
+        assert get_span_template(fn_task, "other_task").resource == "other_task"
+
     def test_span_delete_empty(self):
         # ensure the helper works even if the Task doesn't have
         # a propagation
@@ -2,6 +2,7 @@ import mock
 import pytest
 
 from ddtrace import Pin
+from ddtrace import config
 from ddtrace.constants import ANALYTICS_SAMPLE_RATE_KEY
 from ddtrace.contrib.dbapi import FetchTracedCursor
 from ddtrace.contrib.dbapi import TracedConnection
@@ -288,6 +289,60 @@ class TestTracedCursor(TracerTestCase):
         span = self.pop_spans()[0]
         self.assertIsNone(span.get_metric(ANALYTICS_SAMPLE_RATE_KEY))
 
+    def test_span_template(self):
+        cursor = self.cursor
+        cursor.rowcount = 0
+        cfg = IntegrationConfig(Config(), "db-test", service="cfg-service")
+        traced_cursor = TracedCursor(cursor, Pin(None, tracer=self.tracer, tags={"pin1": "value_pin1", "pin2": 2}), cfg)
+
+        traced_cursor.execute("__query__")
+        traced_cursor.execute("__query__")
+        span1, span2 = self.pop_spans()
+        for span in (span1, span2):
+            assert_is_measured(span)
+            assert span.service == "cfg-service"
+            assert span.get_tag("pin1") == "value_pin1"
+            assert span.get_metric("pin2") == 2
+            assert span.get_metric(ANALYTICS_SAMPLE_RATE_KEY) is None
+        # The template is computed once for the cursor
+        template = traced_cursor._self_span_templates[True]
+        traced_cursor.execute("__query__")
+        assert traced_cursor._self_span_templates[True] is template
+        self.pop_spans()
+
+        # Changes of the configuration are picked up
+        cfg.service = "other-service"
+        cfg.analytics_enabled = True
+        traced_cursor.execute("__query__")
+        (span,) = self.pop_spans()
+        assert span.service == "other-service"
+        assert span.get_metric(ANALYTICS_SAMPLE_RATE_KEY) == 1.0
+
+        # Changes of the pin are picked up
+        Pin.override(traced_cursor, service="pin-service", tags={"pin3": "value_pin3"})
+        traced_cursor.execute("__query__")
+        (span,) = self.pop_spans()
+        assert span.service == "pin-service"
+        assert span.get_tag("pin3") == "value_pin3"
+        assert span.get_tag("pin1") is None
+
+        # Changes of the configuration of the pin are picked up
+        config.get_from(traced_cursor)["service_name"] = "pin-config-service"
+        traced_cursor.execute("__query__")
+        (span,) = self.pop_spans()
+        assert span.service == "pin-config-service"
+
+    def test_span_template_service_tag(self):
+        cursor = self.cursor
+        cursor.rowcount = 0
+        pin = Pin("pin-service", tracer=self.tracer, tags={"service.name": "tag-service", "pin1": "value_pin1"})
+        traced_cursor = TracedCursor(cursor, pin, {})
+
+        traced_cursor.execute("__query__")
+        (span,) = self.pop_spans()
+        assert span.service == "tag-service"
+        assert span.get_tag("pin1") == "value_pin1"
+
 
 class TestFetchTracedCursor(TracerTestCase):
     def setUp(self):
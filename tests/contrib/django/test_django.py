@@ -23,7 +23,9 @@ from ddtrace.constants import ERROR_STACK
 from ddtrace.constants import ERROR_TYPE
 from ddtrace.constants import SAMPLING_PRIORITY_KEY
 from ddtrace.constants import USER_KEEP
+from ddtrace.contrib.django import utils as django_utils
 from ddtrace.contrib.django.patch import instrument_view
+from ddtrace.contrib.django.utils import _RESOLVER_TAGS
 from ddtrace.contrib.django.utils import get_request_uri
 from ddtrace.ext import http
 from ddtrace.ext import user
@@ -34,6 +36,7 @@ from ddtrace.propagation._utils import get_wsgi_header
 from ddtrace.propagation.http import HTTP_HEADER_PARENT_ID
 from ddtrace.propagation.http import HTTP_HEADER_SAMPLING_PRIORITY
 from ddtrace.propagation.http import HTTP_HEADER_TRACE_ID
+from ddtrace.settings import IntegrationConfig
 from ddtrace.vendor import wrapt
 from tests.opentracer.utils import init_tracer
 from tests.utils import assert_dict_issuperset
@@ -299,6 +302,43 @@ def test_v2XX_middleware(client, test_spans):
     assert first_middleware.parent_id == root_span.span_id
 
 
+def test_django_aggregate_middleware(run_python_code_in_subprocess):
+    """
+    When middleware are aggregated
+        We time the middleware hooks on the request span instead of creating spans
+    """
+    code = """
+import django
+from django.test import Client
+
+from ddtrace import Pin
+from ddtrace.contrib.django import patch
+from tests.utils import DummyTracer
+
+patch()
+django.setup()
+tracer = DummyTracer()
+Pin.override(django, tracer=tracer)
+
+assert Client().get("/").status_code == 200
+
+spans = tracer.pop()
+assert not [s for s in spans if s.name == "django.middleware"]
+root = [s for s in spans if s.name == "django.request"][0]
+for resource in (
+    "django.contrib.sessions.middleware.SessionMiddleware.__call__",
+    "django.contrib.sessions.middleware.SessionMiddleware.process_request",
+    "tests.contrib.django.middleware.fn_middleware",
+    "tests.contrib.django.middleware.EverythingMiddleware.process_view",
+):
+    assert root.get_metric("django.middleware.duration." + resource) > 0, resource
+"""
+    env = os.environ.copy()
+    env["DD_DJANGO_AGGREGATE_MIDDLEWARE"] = "true"
+    out, err, status, _ = run_python_code_in_subprocess(code, env=env)
+    assert status == 0, (out, err)
+
+
 def test_django_request_not_found(client, test_spans):
     """
     When making a request to a Django app
@@ -1563,6 +1603,37 @@ def test_django_use_handler_resource_format(client, test_spans):
         root.assert_matches(resource=resource, parent_id=None, span_type="web")
 
 
+def test_django_resolver_tags_cached(client, test_spans):
+    """
+    Test that the resource and the tags of a route are computed once and follow the configuration.
+    """
+    # DEV: The tags of the namespaces and of the apps are set on each build
+    with mock.patch("ddtrace.contrib.django.utils.set_tag_array", wraps=django_utils.set_tag_array) as set_tag_array:
+        _RESOLVER_TAGS.clear()
+        for _ in range(3):
+            assert client.get("/").status_code == 200
+        assert set_tag_array.call_count == 2
+
+        with override_config("django", dict(use_handler_resource_format=True)):
+            assert client.get("/").status_code == 200
+        assert set_tag_array.call_count == 4
+
+        # A configuration replacing the previous one is used even with the same version
+        django_config = IntegrationConfig(config, "django", dict(config.django, use_handler_resource_format=True))
+        object.__setattr__(django_config, "_version", config.django._version)
+        with mock.patch.dict(config._config, django=django_config):
+            assert client.get("/").status_code == 200
+        assert set_tag_array.call_count == 6
+
+    roots = [s for s in test_spans.spans if s.parent_id is None]
+    assert len(roots) == 5
+    for root in roots[:3]:
+        assert root.resource == roots[0].resource
+        assert root.get_tag("django.view") == "tests.contrib.django.views.index"
+    assert roots[3].resource == "GET tests.contrib.django.views.index"
+    assert roots[4].resource == "GET tests.contrib.django.views.index"
+
+
 def test_django_use_handler_with_url_name_resource_format(client, test_spans):
     """
     Test that the specified format is used over the default.
@@ -1,4 +1,5 @@
 from flask import Blueprint
+from flask import request_started
 
 from ddtrace.contrib.flask.patch import flask_version
 from ddtrace.ext import http
@@ -56,6 +57,43 @@ class FlaskHookTestCase(BaseFlaskTestCase):
         # Assert correct parent span
         self.assertEqual(parent.name, "flask.preprocess_request")
 
+    def test_aggregate_hooks(self):
+        """
+        When hooks are aggregated
+            We time the hooks and signal receivers on the request span instead of creating spans
+        """
+
+        def on_request_started(sender, **extra):
+            pass
+
+        with self.override_config("flask", dict(aggregate_hooks=True)):
+
+            @self.app.before_request
+            def before_request():
+                pass
+
+            request_started.connect(on_request_started, self.app)
+            try:
+                req = self.client.get("/")
+            finally:
+                request_started.disconnect(on_request_started, self.app)
+        self.assertEqual(req.status_code, 200)
+
+        spans = self.get_spans()
+        self.assertIsNone(
+            self.find_span_by_name(spans, "tests.contrib.flask.test_hooks.before_request", required=False)
+        )
+        self.assertIsNone(
+            self.find_span_by_name(spans, "tests.contrib.flask.test_hooks.on_request_started", required=False)
+        )
+
+        root = self.find_span_by_name(spans, "flask.request")
+        self.assertGreater(root.get_metric("flask.hook.duration.tests.contrib.flask.test_hooks.before_request"), 0)
+        self.assertGreater(
+            root.get_metric("flask.signal.duration.request_started.tests.contrib.flask.test_hooks.on_request_started"),
+            0,
+        )
+
     def test_before_request_return(self):
         """
         When Flask before_request hook is registered
@@ -5,6 +5,7 @@ import time
 import grpc
 from grpc._grpcio_metadata import __version__ as _GRPC_VERSION
 from grpc.framework.foundation import logging_pool
+import mock
 import pytest
 import six
 
@@ -241,7 +242,7 @@ class GrpcTestCase(TracerTestCase):
         assert spans[1].get_metric(ANALYTICS_SAMPLE_RATE_KEY) == 1.0
 
     def test_server_stream(self):
-        # use an event to signal when the callbacks have been called from the response
+        # use a semaphore to signal when the callbacks have been called from the responses
         callback_called = threading.Event()
 
         def callback(response):
@@ -260,7 +261,7 @@ class GrpcTestCase(TracerTestCase):
         self._check_server_span(server_span, "grpc-server", "SayHelloTwice", "server_streaming")
 
     def test_server_stream_once(self):
-        # use an event to signal when the callbacks have been called from the response
+        # use a semaphore to signal when the callbacks have been called from the responses
         callback_called = threading.Event()
 
         def callback(response):
@@ -293,7 +294,7 @@ class GrpcTestCase(TracerTestCase):
         self._check_server_span(server_span, "grpc-server", "SayHelloLast", "client_streaming")
 
     def test_bidi_stream(self):
-        # use an event to signal when the callbacks have been called from the response
+        # use a semaphore to signal when the callbacks have been called from the responses
         callback_called = threading.Event()
 
         def callback(response):
@@ -314,6 +315,117 @@ class GrpcTestCase(TracerTestCase):
         self._check_client_span(client_span, "grpc-client", "SayHelloRepeatedly", "bidi_streaming")
         self._check_server_span(server_span, "grpc-server", "SayHelloRepeatedly", "bidi_streaming")
 
+    def test_bidi_stream_metrics(self):
+        # use a semaphore to signal when the callbacks have been called from the responses
+        callback_called = threading.Event()
+
+        def callback(response):
+            callback_called.set()
+
+        requests = [HelloRequest(name=name) for name in ["first", "second", "third", "fourth", "fifth"]]
+
+        with self.override_config("grpc", dict(stream_metrics=True)):
+            with self.override_config("grpc_server", dict(stream_metrics=True)):
+                with grpc.insecure_channel("localhost:%d" % (_GRPC_PORT)) as channel:
+                    stub = HelloStub(channel)
+                    responses_iterator = stub.SayHelloRepeatedly(iter(requests))
+                    responses_iterator.add_done_callback(callback)
+                    responses = list(responses_iterator)
+                    callback_called.wait(timeout=1)
+
+        spans = self.get_spans_with_sync_and_assert(size=2)
+        client_span, server_span = spans
+        self._check_client_span(client_span, "grpc-client", "SayHelloRepeatedly", "bidi_streaming")
+        self._check_server_span(server_span, "grpc-server", "SayHelloRepeatedly", "bidi_streaming")
+
+        requests_bytes = sum(r.ByteSize() for r in requests)
+        responses_bytes = sum(r.ByteSize() for r in responses)
+        assert client_span.get_metric("grpc.stream.sent.messages") == 5
+        assert client_span.get_metric("grpc.stream.sent.bytes") == requests_bytes
+        assert client_span.get_metric("grpc.stream.received.messages") == 3
+        assert client_span.get_metric("grpc.stream.received.bytes") == responses_bytes
+        assert server_span.get_metric("grpc.stream.received.messages") == 5
+        assert server_span.get_metric("grpc.stream.received.bytes") == requests_bytes
+        assert server_span.get_metric("grpc.stream.sent.messages") == 3
+        assert server_span.get_metric("grpc.stream.sent.bytes") == responses_bytes
+        for span in spans:
+            for direction in ("sent", "received"):
+                p50 = span.get_metric("grpc.stream.%s.interval.p50" % direction)
+                p99 = span.get_metric("grpc.stream.%s.interval.p99" % direction)
+                assert 0 <= p50 <= p99 <= span.get_metric("grpc.stream.%s.interval.max" % direction)
+
+    def test_server_stream_metrics(self):
+        # use a semaphore to signal when the callbacks have been called from the responses
+        callback_called = threading.Event()
+
+        def callback(response):
+            callback_called.set()
+
+        with self.override_config("grpc", dict(stream_metrics=True)):
+            with self.override_config("grpc_server", dict(stream_metrics=True)):
+                with grpc.insecure_channel("localhost:%d" % (_GRPC_PORT)) as channel:
+                    stub = HelloStub(channel)
+                    responses_iterator = stub.SayHelloTwice(HelloRequest(name="test"))
+                    responses_iterator.add_done_callback(callback)
+                    assert len(list(responses_iterator)) == 2
+                    callback_called.wait(timeout=1)
+
+        spans = self.get_spans_with_sync_and_assert(size=2)
+        client_span, server_span = spans
+        assert client_span.get_metric("grpc.stream.received.messages") == 2
+        assert server_span.get_metric("grpc.stream.sent.messages") == 2
+        # Unary requests are not counted
+        assert client_span.get_metric("grpc.stream.sent.messages") is None
+        assert server_span.get_metric("grpc.stream.received.messages") is None
+
+    def test_stream_metrics_responses_not_consumed(self):
+        num_rpcs = 3
+        # use a semaphore to signal when the callbacks have been called from the responses
+        callbacks_called = threading.Semaphore(0)
+
+        def callback(response):
+            callbacks_called.release()
+
+        def client_spans():
+            return [s for s in self.get_spans() if s.get_tag(constants.GRPC_SPAN_KIND_KEY) == "client"]
+
+        with mock.patch("ddtrace.contrib.grpc.client_interceptor._STREAM_METRICS_GRACE_PERIOD", 0.05):
+            with self.override_config("grpc", dict(stream_metrics=True)):
+                with grpc.insecure_channel("localhost:%d" % (_GRPC_PORT)) as channel:
+                    stub = HelloStub(channel)
+                    responses_iterators = []
+                    for _ in range(num_rpcs):
+                        responses_iterator = stub.SayHelloTwice(HelloRequest(name="test"))
+                        responses_iterator.add_done_callback(callback)
+                        next(responses_iterator)
+                        responses_iterator.cancel()
+                        responses_iterators.append(responses_iterator)
+                    for _ in range(num_rpcs):
+                        callbacks_called.acquire(timeout=1)
+
+                    # The spans are finished after the grace period even though
+                    # the responses iterators are neither drained nor released
+                    for _ in range(20):
+                        if len(client_spans()) == num_rpcs:
+                            break
+                        time.sleep(0.05)
+
+        spans = client_spans()
+        assert len(spans) == num_rpcs
+        for client_span in spans:
+            assert client_span.duration is not None
+            assert client_span.get_metric("grpc.stream.received.messages") == 1
+            assert client_span.get_tag(constants.GRPC_STATUS_CODE_KEY) == "StatusCode.CANCELLED"
+        # A single thread finishes the spans of all the RPCs
+        assert len([t for t in threading.enumerate() if t.name == "ddtrace.grpc.stream_metrics"]) == 1
+        assert len(responses_iterators) == num_rpcs
+
+    def test_stream_metrics_disabled(self):
+        self.test_bidi_stream()
+
+        for span in self.get_spans():
+            assert not [key for key in span.get_metrics() if key.startswith("grpc.stream.")]
+
     def test_priority_sampling(self):
         # DEV: Priority sampling is enabled by default
         # Setting priority sampling reset the writer, we need to re-override it
@@ -372,7 +484,7 @@ class GrpcTestCase(TracerTestCase):
         assert server_span.get_tag(ERROR_STACK) is None
 
     def test_client_cancellation(self):
-        # use an event to signal when the callbacks have been called from the response
+        # use a semaphore to signal when the callbacks have been called from the responses
         callback_called = threading.Event()
 
         def callback(response):
@@ -453,7 +565,7 @@ class GrpcTestCase(TracerTestCase):
         assert "grpc.StatusCode.INVALID_ARGUMENT" in server_span.get_tag(ERROR_STACK)
 
     def test_server_stream_exception(self):
-        # use an event to signal when the callbacks have been called from the response
+        # use a semaphore to signal when the callbacks have been called from the responses
         callback_called = threading.Event()
 
         def callback(response):
@@ -91,3 +91,43 @@ def test_set_grpc_method_meta(method, method_kind, calls):
     span = mock.MagicMock()
     utils.set_grpc_method_meta(span, method, method_kind)
     span.set_tag_str.assert_has_calls(calls)
+
+
+def test_stream_stats():
+    span = mock.Mock()
+    stats = utils._StreamStats()
+    with mock.patch("ddtrace.contrib.grpc.utils.monotonic_ns", side_effect=[0, 10, 110, 1110, 1130]):
+        for size in (1, 2, 3, 4, 5):
+            stats.add(size)
+    stats.set_metrics(span, "grpc.stream.sent.")
+
+    # intervals of 10, 100, 1000 and 20ns, the percentiles are the upper
+    # bounds of their power of two buckets
+    assert dict(_.args for _ in span.set_metric.call_args_list) == {
+        "grpc.stream.sent.messages": 5,
+        "grpc.stream.sent.bytes": 15,
+        "grpc.stream.sent.interval.p50": 127 / 1e9,
+        "grpc.stream.sent.interval.p99": 1000 / 1e9,
+        "grpc.stream.sent.interval.max": 1000 / 1e9,
+    }
+
+
+def test_stream_stats_single_message():
+    span = mock.Mock()
+    stats = utils._StreamStats()
+    stats.deserializer(None)(b"message")
+    stats.set_metrics(span, "grpc.stream.received.")
+
+    assert dict(_.args for _ in span.set_metric.call_args_list) == {
+        "grpc.stream.received.messages": 1,
+        "grpc.stream.received.bytes": 7,
+    }
+
+
+def test_stream_stats_serializer():
+    stats = utils._StreamStats()
+    serialize = stats.serializer(lambda message: message.encode("utf-8"))
+    assert serialize(u"\u00e9") == b"\xc3\xa9"
+    assert serialize(u"a") == b"a"
+    assert stats.messages == 2
+    assert stats.bytes == 3
@@ -687,6 +687,63 @@ async def test_bidi_streaming(server_info, tracer):
     _check_server_span(server_span, "grpc-aio-server", "SayHelloRepeatedly", "bidi_streaming")
 
 
+@pytest.mark.asyncio
+async def test_bidi_streaming_stream_metrics(server_info, tracer):
+    requests = [HelloRequest(name=name) for name in ["Alice", "Bob"]]
+    with override_config("grpc_aio_client", dict(stream_metrics=True)):
+        with override_config("grpc_aio_server", dict(stream_metrics=True)):
+            async with aio.insecure_channel(server_info.target) as channel:
+                stub = HelloStub(channel)
+                responses = [response async for response in stub.SayHelloRepeatedly(iter(requests))]
+                assert len(responses) == 3
+
+    spans = _get_spans(tracer)
+    assert len(spans) == 2
+    client_span, server_span = spans
+
+    _check_client_span(client_span, "grpc-aio-client", "SayHelloRepeatedly", "bidi_streaming")
+    _check_server_span(server_span, "grpc-aio-server", "SayHelloRepeatedly", "bidi_streaming")
+
+    requests_bytes = sum(r.ByteSize() for r in requests)
+    responses_bytes = sum(r.ByteSize() for r in responses)
+    assert client_span.get_metric("grpc.stream.sent.messages") == 2
+    assert client_span.get_metric("grpc.stream.sent.bytes") == requests_bytes
+    assert client_span.get_metric("grpc.stream.received.messages") == 3
+    assert client_span.get_metric("grpc.stream.received.bytes") == responses_bytes
+    assert server_span.get_metric("grpc.stream.received.messages") == 2
+    assert server_span.get_metric("grpc.stream.received.bytes") == requests_bytes
+    assert server_span.get_metric("grpc.stream.sent.messages") == 3
+    assert server_span.get_metric("grpc.stream.sent.bytes") == responses_bytes
+    assert 0 <= client_span.get_metric("grpc.stream.received.interval.p50")
+    assert client_span.get_metric("grpc.stream.received.interval.p99") <= client_span.get_metric(
+        "grpc.stream.received.interval.max"
+    )
+
+
+@pytest.mark.asyncio
+async def test_client_streaming_stream_metrics(server_info, tracer):
+    async def request_iterator():
+        for name in ["first", "second"]:
+            yield HelloRequest(name=name)
+
+    with override_config("grpc_aio_client", dict(stream_metrics=True)):
+        with override_config("grpc_aio_server", dict(stream_metrics=True)):
+            async with aio.insecure_channel(server_info.target) as channel:
+                stub = HelloStub(channel)
+                response = await stub.SayHelloLast(request_iterator())
+                assert response.message == "first;second"
+
+    spans = _get_spans(tracer)
+    assert len(spans) == 2
+    client_span, server_span = spans
+
+    assert client_span.get_metric("grpc.stream.sent.messages") == 2
+    assert server_span.get_metric("grpc.stream.received.messages") == 2
+    # Unary responses are not counted
+    assert client_span.get_metric("grpc.stream.received.messages") is None
+    assert server_span.get_metric("grpc.stream.sent.messages") is None
+
+
 @pytest.mark.skipif(
     sys.version_info >= (3, 11, 0), reason="Segfaults in Python 3.11, see https://github.com/grpc/grpc/issues/31441"
 )
@@ -75,6 +75,26 @@ class TestRedisPatch(TracerTestCase):
         assert span.resource == "GET cheese"
         assert span.get_metric(ANALYTICS_SAMPLE_RATE_KEY) is None
 
+    def test_conn_tags_cached(self):
+        self.r.get("cheese")
+        pool = self.r.connection_pool
+        conn_kwargs, conn_tags = pool._datadog_conn_tags
+        assert conn_kwargs is pool.connection_kwargs
+        self.r.get("cheese")
+        assert pool._datadog_conn_tags[1] is conn_tags
+
+        # The tags are computed again if the connection kwargs are replaced
+        pool.connection_kwargs = dict(pool.connection_kwargs)
+        self.r.get("cheese")
+        assert pool._datadog_conn_tags[0] is pool.connection_kwargs
+        assert pool._datadog_conn_tags[1] is not conn_tags
+
+        spans = self.get_spans()
+        assert len(spans) == 3
+        for span in spans:
+            assert span.get_tag("out.host") == "localhost"
+            assert span.get_metric("out.redis_db") == 0
+
     def test_analytics_without_rate(self):
         with self.override_config("redis", dict(analytics_enabled=True)):
             us = self.r.get("cheese")
@@ -163,6 +163,44 @@ def test_debugger_probe_new_delete(probe, trigger):
         assert snapshot["debugger.snapshot"]["probe"]["id"] == probe_id
 
 
+def test_debugger_probe_update_single_rewrite():
+    with debugger() as d:
+        old_probe = LineProbe(
+            probe_id="probe-old",
+            source_file="tests/submod/stuff.py",
+            line=36,
+            rate=1000,
+        )
+        new_probe = LineProbe(
+            probe_id="probe-new",
+            source_file="tests/submod/stuff.py",
+            line=36,
+            rate=1000,
+        )
+        d.add_probes(old_probe)
+        assert old_probe in d._probe_registry
+
+        with mock.patch.object(d._function_store, "update_hooks", wraps=d._function_store.update_hooks) as update_hooks:
+            with d._probe_update():
+                d.remove_probes(old_probe)
+                d.add_probes(new_probe)
+
+        # The ejection and the injection are applied with a single rewrite
+        (((_, eject, inject), _),) = update_hooks.call_args_list
+        assert [p.probe_id for _, _, p in eject] == ["probe-old"]
+        assert [p.probe_id for _, _, p in inject] == ["probe-new"]
+
+        assert old_probe not in d._probe_registry
+        assert new_probe in d._probe_registry
+
+        d.uploader.queue[:] = []
+        Stuff().instancestuff(42)
+        sleep(0.2)
+
+        snapshots = [s for p in d.uploader.payloads for s in p if "debugger.snapshot" in s]
+        assert {s["debugger.snapshot"]["probe"]["id"] for s in snapshots} == {"probe-new"}
+
+
 @pytest.mark.parametrize(
     "probe, trigger",
     [
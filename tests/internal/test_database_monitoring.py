@@ -85,3 +85,53 @@ def test_get_dbm_comment_full_mode():
     )
     # ensure that dbm tag is set (only required in full mode)
     assert dbspan.get_tag(_database_monitoring.DBM_TRACE_INJECTED_TAG) == "true"
+
+
+@pytest.mark.subprocess(
+    env=dict(
+        DD_DBM_PROPAGATION_MODE="full",
+        DD_SERVICE="orders-app",
+        DD_ENV="staging",
+    )
+)
+def test_get_dbm_comment_cached():
+    import mock
+
+    from ddtrace import config
+    from ddtrace import tracer
+    from ddtrace.settings import _database_monitoring
+
+    with mock.patch(
+        "ddtrace.settings._database_monitoring._generate_sql_comment",
+        wraps=_database_monitoring._generate_sql_comment,
+    ) as generate_sql_comment:
+        for _ in range(3):
+            dbspan = tracer.trace("dbname", service="orders-db")
+            sqlcomment = _database_monitoring._get_dbm_comment(dbspan)
+            assert sqlcomment == " /*dddbs='orders-db',dde='staging',ddps='orders-app',traceparent='%s'*/" % (
+                dbspan.context._traceparent,
+            )
+        # The comment is only generated once for the same service tags
+        assert generate_sql_comment.call_count == 1
+
+        _database_monitoring.dbm_config.propagation_mode = "service"
+        assert _database_monitoring._get_dbm_comment(dbspan) == " /*dddbs='orders-db',dde='staging',ddps='orders-app'*/"
+        assert generate_sql_comment.call_count == 1
+
+        # A change in the configuration is picked up
+        config.version = "v7343437-d7ac743"
+        assert (
+            _database_monitoring._get_dbm_comment(dbspan)
+            == " /*dddbs='orders-db',dde='staging',ddps='orders-app',ddpv='v7343437-d7ac743'*/"
+        )
+        assert generate_sql_comment.call_count == 2
+
+
+@pytest.mark.subprocess(env=dict(DD_DBM_PROPAGATION_MODE="full"))
+def test_get_dbm_comment_full_mode_no_service_tags():
+    from ddtrace import tracer
+    from ddtrace.settings import _database_monitoring
+
+    dbspan = tracer.trace("dbname", service=None)
+    sqlcomment = _database_monitoring._get_dbm_comment(dbspan)
+    assert sqlcomment == " /*traceparent='%s'*/" % (dbspan.context._traceparent,)
@@ -11,6 +11,7 @@ from ddtrace.internal.injection import eject_hook
 from ddtrace.internal.injection import eject_hooks
 from ddtrace.internal.injection import inject_hook
 from ddtrace.internal.injection import inject_hooks
+from ddtrace.internal.injection import update_hooks
 from ddtrace.internal.utils.inspection import linenos
 
 
@@ -175,6 +176,42 @@ def test_eject_hooks_same_line():
         hook.assert_not_called()
 
 
+def test_update_hooks():
+    old_hook, new_hook = mock.Mock("old_hook"), mock.Mock("new_hook")
+
+    lo = min(linenos(injection_target))
+    failed = inject_hooks(injection_target, [(old_hook, lo, old_hook)])
+    assert failed == []
+
+    code = injection_target.__code__
+    failed_eject, failed_inject = update_hooks(
+        injection_target, [(old_hook, lo, old_hook)], [(new_hook, lo + 1, new_hook)]
+    )
+    assert failed_eject == failed_inject == []
+    assert injection_target.__code__ is not code
+
+    assert injection_target(1, 2) == (2, 1)
+
+    old_hook.assert_not_called()
+    new_hook.assert_called_once_with(new_hook)
+
+    failed_eject, failed_inject = update_hooks(injection_target, [(new_hook, lo + 1, new_hook)], [])
+    assert failed_eject == failed_inject == []
+
+
+def test_update_hooks_all_invalid():
+    hook = mock.Mock()
+
+    lo = min(linenos(injection_target))
+    code = injection_target.__code__
+    failed_eject, failed_inject = update_hooks(injection_target, [(hook, lo, hook)], [(hook, lo + 200, hook)])
+    assert failed_eject == [(hook, lo, hook)]
+    assert failed_inject == [(hook, lo + 200, hook)]
+
+    # Nothing changed so the code object has not been rewritten
+    assert injection_target.__code__ is code
+
+
 def test_inject_out_of_bounds():
     with pytest.raises(InvalidLine):
         inject_hook(injection_target, lambda x: x, 0, 0)
@@ -141,3 +141,64 @@ def test_remoteconfig_semver():
         r"a-zA-Z-][0-9a-zA-Z-]*))*))?(?:\+([0-9a-zA-Z-]+(?:\.[0-9a-zA-Z-]+)*))?$",
         RemoteConfigClient()._client_tracer["tracer_version"],
     )
+
+
+def test_remoteconfig_unchanged_targets():
+    calls = []
+    client = RemoteConfigClient()
+    client.register_product(ASM_FEATURES_PRODUCT, lambda metadata, config: calls.append(config))
+
+    msg = get_mock_encoded_msg(b'{"asm":{"enabled":true}}')
+    client._process_response(msg)
+    assert calls == [{"asm": {"enabled": True}}]
+    assert len(client.cached_target_files) == 1
+
+    # The agent sends the same targets, without the cached target files
+    del msg["target_files"]
+    del msg["roots"]
+    with mock.patch.object(type(client.converter), "structure_attrs_fromdict") as structure:
+        client._process_response(msg)
+    structure.assert_not_called()
+    assert calls == [{"asm": {"enabled": True}}]
+
+
+def test_remoteconfig_target_files_cache():
+    calls = []
+    client = RemoteConfigClient()
+    client.register_product(ASM_FEATURES_PRODUCT, lambda metadata, config: calls.append((metadata, config)))
+
+    content = b'{"asm":{"enabled":true}}'
+    client._process_response(get_mock_encoded_msg(content))
+    assert list(client._target_files_cache) == [hashlib.sha256(content).hexdigest()]
+
+    # A new version of the target with the same content is loaded from the
+    # cache, as the agent does not send the cached target file again.
+    msg = get_mock_encoded_msg(content)
+    targets = json.loads(base64.b64decode(msg["targets"]))
+    targets["signed"]["version"] = 1
+    for target in targets["signed"]["targets"].values():
+        target["custom"]["v"] = 1
+    msg["targets"] = to_str(base64.b64encode(to_bytes(json.dumps(targets))))
+    del msg["target_files"]
+
+    client._process_response(msg)
+    metadata, config = calls[-1]
+    assert metadata.tuf_version == 1
+    assert config == {"asm": {"enabled": True}}
+    assert client._last_targets_version == 1
+
+
+def test_remoteconfig_payload():
+    client = RemoteConfigClient()
+    payload = client._get_payload()
+    # The payload is compact and only built again when the state changes
+    assert "\n" not in payload and ": " not in payload
+    assert client._get_payload() is payload
+    assert json.loads(payload)["client"]["products"] == []
+
+    client.register_product(ASM_FEATURES_PRODUCT, lambda metadata, config: None)
+    payload = client._get_payload()
+    assert json.loads(payload)["client"]["products"] == [ASM_FEATURES_PRODUCT]
+
+    client._set_error("error")
+    assert json.loads(client._get_payload())["client"]["state"]["error"] == "error"
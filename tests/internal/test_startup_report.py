@@ -0,0 +1,64 @@
+from ddtrace.internal import startup_report
+
+
+IMPORT_TIMES = """import time: self [us] | cumulative | imported package
+import time:       232 |        232 | _io
+import time:        12 |         12 |       ddtrace.vendor
+import time:       100 |        100 |         sqlite3.dbapi2
+import time:        50 |        150 |       sqlite3
+import time:        20 |        170 |     ddtrace.contrib.sqlite3.patch
+import time:        30 |        212 |   ddtrace.contrib.sqlite3
+import time:      1000 |       1000 |     ddtrace.tracer
+import time:       500 |       1500 |   ddtrace
+import time:        10 |       1722 | sitecustomize
+"""
+
+
+def test_parse_import_times():
+    io, sitecustomize = startup_report.parse_import_times(IMPORT_TIMES)
+
+    assert io == startup_report.ImportTime("_io", 232, 232)
+    assert sitecustomize.name == "sitecustomize"
+    assert sitecustomize.self_us == 10
+    assert sitecustomize.cumulative_us == 1722
+    assert [_.name for _ in sitecustomize.children] == ["ddtrace.contrib.sqlite3", "ddtrace"]
+    assert [_.name for _ in sitecustomize.walk()] == [
+        "sitecustomize",
+        "ddtrace.contrib.sqlite3",
+        "ddtrace.contrib.sqlite3.patch",
+        "ddtrace.vendor",
+        "sqlite3",
+        "sqlite3.dbapi2",
+        "ddtrace",
+        "ddtrace.tracer",
+    ]
+
+
+def test_integration_import_times():
+    (_, sitecustomize) = startup_report.parse_import_times(IMPORT_TIMES)
+
+    assert startup_report.integration_import_times(sitecustomize) == {"sqlite3": 212}
+
+
+def test_pretty_report():
+    (_, sitecustomize) = startup_report.parse_import_times(IMPORT_TIMES)
+
+    assert startup_report.pretty_report(sitecustomize, limit=2).splitlines() == [
+        "ddtrace-run startup report",
+        "Total import time: 1.7 ms",
+        "",
+        "Imports by module (cumulative):",
+        "        1.5 ms  ddtrace",
+        "        0.2 ms  ddtrace.contrib.sqlite3",
+        "",
+        "Imports by integration (cumulative):",
+        "        0.2 ms  sqlite3",
+        "",
+        "Slowest modules (self):",
+        "        1.0 ms  ddtrace.tracer",
+        "        0.5 ms  ddtrace",
+    ]
+
+
+def test_pretty_report_not_collected():
+    assert "Python 3.7+ is required" in startup_report.pretty_report(None)
@@ -0,0 +1,203 @@
+import socket
+import threading
+import time
+
+import mock
+import pytest
+from six.moves import BaseHTTPServer
+from six.moves import socketserver
+
+from ddtrace.internal import transport
+from ddtrace.internal.transport import AgentTransport
+from ddtrace.internal.transport import _PriorityGate
+
+
+class _KeepAliveHandler(BaseHTTPServer.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    clients = []
+
+    @staticmethod
+    def log_message(format, *args):  # noqa: A002
+        pass
+
+    def do_POST(self):
+        self.clients.append(self.client_address)
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        self.send_response(200 if self.path == "/ok" else 404)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class _ThreadingHTTPServer(socketserver.ThreadingMixIn, BaseHTTPServer.HTTPServer):
+    daemon_threads = True
+
+
+@pytest.fixture
+def server():
+    _KeepAliveHandler.clients = []
+    server = _ThreadingHTTPServer(("127.0.0.1", 0), _KeepAliveHandler)
+    thread = threading.Thread(target=server.serve_forever)
+    thread.daemon = True
+    thread.start()
+    try:
+        yield "http://127.0.0.1:%d" % server.server_address[1]
+    finally:
+        server.shutdown()
+        server.server_close()
+        thread.join()
+
+
+def test_transport_keep_alive(server):
+    t = AgentTransport(server)
+    try:
+        for _ in range(3):
+            response = t.request("POST", "/ok", b"hello")
+            assert response.status == 200
+            assert response.read() == b"hello"
+
+        # All the requests went through the same connection
+        assert len(set(_KeepAliveHandler.clients)) == 1
+        assert len(t._pool) == 1
+    finally:
+        t.close()
+    assert not t._pool
+
+
+def test_transport_no_reuse(server):
+    t = AgentTransport(server)
+    for _ in range(2):
+        assert t.request("POST", "/ok", b"hello", reuse=False).status == 200
+
+    assert len(set(_KeepAliveHandler.clients)) == 2
+    assert not t._pool
+
+
+def test_transport_idle_timeout(server):
+    t = AgentTransport(server, idle_timeout=0.0)
+    for _ in range(2):
+        assert t.request("POST", "/ok", b"hello").status == 200
+
+    # The idle connection has expired and has been replaced
+    assert len(set(_KeepAliveHandler.clients)) == 2
+    t.close()
+
+
+def test_transport_stale_connection(server):
+    t = AgentTransport(server)
+    assert t.request("POST", "/ok", b"hello").status == 200
+
+    # Simulate the agent closing the idle connection
+    ((conn, _),) = t._pool
+    conn.sock.shutdown(socket.SHUT_RDWR)
+
+    assert t.request("POST", "/ok", b"hello").status == 200
+    assert len(set(_KeepAliveHandler.clients)) == 2
+    t.close()
+
+
+def test_transport_metrics(server):
+    t = AgentTransport(server)
+    t.request("POST", "/ok", b"hello")
+    t.request("POST", "/ok", b"hi")
+    t.request("POST", "/notfound", b"hello")
+    t.close()
+
+    metrics = t.get_metrics()
+    assert metrics["/ok"]["requests"] == 2
+    assert metrics["/ok"]["errors"] == 0
+    assert metrics["/ok"]["sent_bytes"] == metrics["/ok"]["received_bytes"] == 7
+    assert metrics["/ok"]["latency"] > 0
+    assert metrics["/notfound"]["requests"] == metrics["/notfound"]["errors"] == 1
+
+
+def test_transport_metrics_threads(server):
+    t = AgentTransport(server)
+
+    def requests():
+        for _ in range(10):
+            t.request("POST", "/ok", b"hello")
+
+    threads = [threading.Thread(target=requests) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    t.close()
+
+    metrics = t.get_metrics()["/ok"]
+    assert metrics["requests"] == 80
+    assert metrics["sent_bytes"] == metrics["received_bytes"] == 400
+
+
+def test_transport_after_fork(server):
+    t = AgentTransport(server)
+    assert t.request("POST", "/ok", b"hello").status == 200
+    ((conn, _),) = t._pool
+    failing = mock.Mock()
+    failing.close.side_effect = OSError
+    t._pool.append((failing, 0))
+
+    t._after_fork()
+
+    # The connections are closed, ignoring errors
+    assert conn.sock is None
+    failing.close.assert_called_once_with()
+    assert not t._pool
+    assert not t.get_metrics()
+
+
+def test_transport_connection_error():
+    t = AgentTransport("http://127.0.0.1:1", max_concurrent_requests=1)
+    for _ in range(2):
+        with pytest.raises(transport.RETRYABLE_ERRORS):
+            t.request("POST", "/ok", b"hello")
+
+    # The gate is released on errors
+    assert t._gate._in_flight == 0
+    assert t.get_metrics()["/ok"]["errors"] == 2
+
+
+def test_get_transport():
+    t = transport.get_transport("http://localhost:8126")
+    assert transport.get_transport("http://localhost:8126") is t
+    assert transport.get_transport("unix:///var/run/datadog/apm.socket") is not t
+    assert "http://localhost:8126" in transport.get_metrics()
+
+
+def test_priority_gate():
+    gate = _PriorityGate(1)
+    order = []
+
+    gate.acquire(transport.PRIORITY_DEFAULT)
+
+    def request(priority):
+        gate.acquire(priority)
+        order.append(priority)
+        gate.release()
+
+    threads = []
+    for priority in (
+        transport.PRIORITY_TELEMETRY,
+        transport.PRIORITY_REMOTE_CONFIG,
+        transport.PRIORITY_STATS,
+        transport.PRIORITY_TRACES,
+    ):
+        thread = threading.Thread(target=request, args=(priority,))
+        thread.start()
+        threads.append(thread)
+        # Wait for the request to be queued
+        while len(gate._waiters) < len(threads):
+            time.sleep(0.01)
+
+    gate.release()
+    for thread in threads:
+        thread.join()
+
+    assert order == [
+        transport.PRIORITY_TRACES,
+        transport.PRIORITY_STATS,
+        transport.PRIORITY_REMOTE_CONFIG,
+        transport.PRIORITY_TELEMETRY,
+    ]
+    assert gate._in_flight == 0
@@ -0,0 +1,39 @@
+import asyncio
+import time
+
+from ddtrace.internal import nogevent
+from ddtrace.internal.runtime import event_loop
+from ddtrace.profiling import recorder
+from ddtrace.profiling.collector import asyncio as collector_asyncio
+
+
+def _block():
+    time.sleep(0.2)
+
+
+def test_slow_callback_events():
+    r = recorder.Recorder()
+    loop = asyncio.new_event_loop()
+    try:
+        event_loop.monitor_loop(loop, slow_callback_duration=0.05)
+        with collector_asyncio.AsyncioSlowCallbackCollector(r):
+
+            async def blocking_task():
+                _block()
+
+            task = loop.create_task(blocking_task())
+            loop.run_until_complete(task)
+    finally:
+        event_loop.stop_monitoring()
+        loop.close()
+
+    assert len(r.events[collector_asyncio.AsyncioSlowCallbackEvent]) == 1
+    event = r.events[collector_asyncio.AsyncioSlowCallbackEvent][0]
+    assert "blocking_task" in event.callback
+    assert event.duration_ns >= 0.2e9
+    assert event.thread_id == nogevent.thread_get_ident()
+    assert event.task_id == id(task)
+    assert event.task_name is not None
+    # The stack of the blocked loop was captured
+    assert event.frames[0][2] == "_block"
+    assert event.nframes >= len(event.frames)
@@ -6,6 +6,7 @@ import six
 
 from ddtrace import ext
 from ddtrace.profiling.collector import _lock
+from ddtrace.profiling.collector import asyncio as collector_asyncio
 from ddtrace.profiling.collector import memalloc
 from ddtrace.profiling.collector import stack_event
 from ddtrace.profiling.exporter import pprof
@@ -788,3 +789,27 @@ def test_pprof_exporter_empty():
     export, libs = exp.export({}, 0, 1)
     assert len(libs) > 0
     assert len(export.sample) == 0
+
+
+def test_pprof_exporter_asyncio_slow_callbacks():
+    event = collector_asyncio.AsyncioSlowCallbackEvent(
+        timestamp=1,
+        thread_id=67892304,
+        thread_native_id=123987,
+        thread_name="MainThread",
+        task_id=123,
+        task_name="Task-1",
+        callback="<Task pending name='Task-1'>",
+        duration_ns=200000000,
+        frames=[("foobar.py", 23, "func1", "")],
+        nframes=1,
+    )
+    exp = pprof.PprofExporter()
+    export, libs = exp.export({collector_asyncio.AsyncioSlowCallbackEvent: [event, event]}, 0, 1)
+    sample_types = [(export.string_table[st.type], export.string_table[st.unit]) for st in export.sample_type]
+    assert sample_types[-2:] == [
+        ("event-loop-slow-callbacks", "count"),
+        ("event-loop-slow-callback-time", "nanoseconds"),
+    ]
+    assert len(export.sample) == 1
+    assert list(export.sample[0].value[-2:]) == [2, 400000000]
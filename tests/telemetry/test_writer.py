@@ -1,3 +1,6 @@
+import gzip
+import io
+import json
 import time
 from typing import Any
 from typing import Dict
@@ -240,3 +243,48 @@ def _get_request_body(payload, payload_type, seq_id=1):
         "payload": payload,
         "request_type": payload_type,
     }
+
+
+def test_batch_events(telemetry_writer):
+    """asserts that the events queued between two flushes are sent in a single message-batch request"""
+    with mock.patch.object(telemetry_writer, "_send_request") as send_request:
+        send_request.return_value.status = 202
+        telemetry_writer.app_started_event()
+        telemetry_writer.add_integration("integration-t", True)
+        telemetry_writer.add_event({"test": "123"}, "test-event")
+        telemetry_writer.periodic()
+
+    requests = [call[0][0] for call in send_request.call_args_list]
+    assert len(requests) == 2
+    # app-started is always sent first, on its own
+    assert requests[0]["request_type"] == "app-started"
+    assert requests[1]["request_type"] == "message-batch"
+    assert [e["request_type"] for e in requests[1]["payload"]] == ["test-event", "app-integrations-change"]
+    assert requests[1]["payload"][0]["payload"] == {"test": "123"}
+    assert requests[1]["seq_id"] == 4
+
+
+def test_compression(telemetry_writer):
+    """asserts that telemetry requests are gzipped when compression is enabled"""
+    telemetry_writer._compression = True
+    with mock.patch.object(telemetry_writer._transport, "request") as request:
+        request.return_value.status = 202
+        telemetry_writer.add_event({"test": "123"}, "test-event")
+        telemetry_writer.periodic()
+
+    (_, _, body, headers), _ = request.call_args
+    assert json.loads(gzip.GzipFile(fileobj=io.BytesIO(body)).read().decode("utf-8")) == _get_request_body(
+        {"test": "123"}, "test-event"
+    )
+    assert headers["DD-Telemetry-Request-Type"] == "test-event"
+    assert headers["Content-Encoding"] == "gzip"
+
+
+def test_fork_integrations(telemetry_writer):
+    """asserts that integrations reported by the parent process are not reported again after a fork"""
+    telemetry_writer.add_integration("integration-t", True)
+    telemetry_writer._fork_writer()
+
+    telemetry_writer.add_integration("integration-t", True)
+    telemetry_writer.add_integration("integration-f", False)
+    assert [i["name"] for i in telemetry_writer._flush_integrations_queue()] == ["integration-f"]
@@ -0,0 +1,124 @@
+import threading
+import time
+
+import pytest
+
+from ddtrace.internal.runtime import event_loop
+from ddtrace.internal.runtime.constants import EVENT_LOOP_CALLBACKS
+from ddtrace.internal.runtime.constants import EVENT_LOOP_LAG_MAX
+from ddtrace.internal.runtime.constants import EVENT_LOOP_LAG_P50
+from ddtrace.internal.runtime.constants import EVENT_LOOP_LAG_P99
+from ddtrace.internal.runtime.constants import EVENT_LOOP_READY_QUEUE_MAX
+from ddtrace.internal.runtime.constants import EVENT_LOOP_SLOW_CALLBACKS
+
+
+asyncio = pytest.importorskip("asyncio")
+
+
+@pytest.fixture
+def loop():
+    loop = asyncio.new_event_loop()
+    try:
+        yield loop
+    finally:
+        event_loop.stop_monitoring()
+        loop.close()
+
+
+def _block(duration):
+    time.sleep(duration)
+
+
+def _run(loop, duration):
+    loop.run_until_complete(asyncio.sleep(duration))
+
+
+def test_monitor_loop_idempotent(loop):
+    monitor = event_loop.monitor_loop(loop)
+    assert event_loop.monitor_loop(loop) is monitor
+    assert loop._ddtrace_loop_monitor is monitor
+
+
+def test_event_loop_lag(loop):
+    monitor = event_loop.monitor_loop(loop, slow_callback_duration=1.0)
+    monitor.probe_interval = 0.01
+    _run(loop, 0.05)
+    loop.call_soon(_block, 0.1)
+    _run(loop, 0.05)
+
+    lag, callbacks, slow_callbacks, _ = monitor.collect()
+    assert lag
+    # The blocking callback delayed one of the probes
+    assert max(lag) >= 0.05
+    assert callbacks > 0
+    assert slow_callbacks == 0
+
+    # The counters are reset on collection
+    assert monitor.collect()[:3] == ([], 0, 0)
+
+
+def test_slow_callback(loop):
+    slow_callbacks = []
+    event_loop.add_slow_callback_listener(slow_callbacks.append)
+    try:
+        event_loop.monitor_loop(loop, slow_callback_duration=0.05)
+        loop.call_soon(_block, 0.3)
+        _run(loop, 0.01)
+    finally:
+        event_loop.remove_slow_callback_listener(slow_callbacks.append)
+
+    assert len(slow_callbacks) == 1
+    (slow_callback,) = slow_callbacks
+    assert "_block" in slow_callback.callback
+    assert slow_callback.duration >= 0.3
+    assert slow_callback.thread_id == threading.current_thread().ident
+    assert slow_callback.task_id is None
+    # The watchdog captured the stack of the loop while it was blocked
+    assert slow_callback.frames[0][2] == "_block"
+    assert slow_callback.nframes >= len(slow_callback.frames) > 1
+
+
+def test_collect_metrics(loop):
+    assert event_loop.collect_metrics() == []
+
+    monitor = event_loop.monitor_loop(loop, slow_callback_duration=0.05)
+    monitor.probe_interval = 0.01
+    loop.call_soon(_block, 0.1)
+    _run(loop, 0.05)
+
+    metrics = dict(event_loop.collect_metrics())
+    assert set(metrics) == {
+        EVENT_LOOP_CALLBACKS,
+        EVENT_LOOP_SLOW_CALLBACKS,
+        EVENT_LOOP_READY_QUEUE_MAX,
+        EVENT_LOOP_LAG_P50,
+        EVENT_LOOP_LAG_P99,
+        EVENT_LOOP_LAG_MAX,
+    }
+    assert metrics[EVENT_LOOP_SLOW_CALLBACKS] == 1
+    assert metrics[EVENT_LOOP_LAG_P50] <= metrics[EVENT_LOOP_LAG_P99] <= metrics[EVENT_LOOP_LAG_MAX]
+
+
+def test_stop_monitoring(loop):
+    original = asyncio.events.Handle._run
+    event_loop.monitor_loop(loop)
+    assert asyncio.events.Handle._run is not original
+    event_loop.stop_monitoring()
+    assert asyncio.events.Handle._run is original
+    assert not hasattr(loop, "_ddtrace_loop_monitor")
+    assert event_loop.collect_metrics() == []
+
+
+def test_monitor_running_loop_disabled(loop, monkeypatch):
+    monkeypatch.setattr(event_loop, "enabled", False)
+    loop.call_soon(lambda: setattr(loop, "_monitor", event_loop.monitor_running_loop()))
+    _run(loop, 0.01)
+    assert loop._monitor is None
+
+
+def test_monitor_running_loop(loop, monkeypatch):
+    monkeypatch.setattr(event_loop, "enabled", True)
+    assert event_loop.monitor_running_loop() is None
+    loop.call_soon(lambda: setattr(loop, "_monitor", event_loop.monitor_running_loop()))
+    _run(loop, 0.01)
+    assert loop._monitor is loop._ddtrace_loop_monitor
@@ -1,8 +1,19 @@
+import os
+
+import pytest
+
+from ddtrace.internal.runtime.constants import CPU_PERCENT
+from ddtrace.internal.runtime.constants import CPU_TIME_USER
+from ddtrace.internal.runtime.constants import FD_COUNT
 from ddtrace.internal.runtime.constants import GC_COUNT_GEN0
+from ddtrace.internal.runtime.constants import GC_PAUSE_TIME
 from ddtrace.internal.runtime.constants import GC_RUNTIME_METRICS
+from ddtrace.internal.runtime.constants import MEM_RSS
 from ddtrace.internal.runtime.constants import PSUTIL_RUNTIME_METRICS
+from ddtrace.internal.runtime.constants import THREAD_COUNT
 from ddtrace.internal.runtime.metric_collectors import GCRuntimeMetricCollector
 from ddtrace.internal.runtime.metric_collectors import PSUtilRuntimeMetricCollector
+from ddtrace.internal.runtime.metric_collectors import ProcRuntimeMetricCollector
 from ddtrace.internal.runtime.metric_collectors import RuntimeMetricCollector
 from tests.utils import BaseTestCase
 
@@ -29,6 +40,44 @@ class TestPSUtilRuntimeMetricCollector(BaseTestCase):
             self.assertIsNotNone(value)
 
 
+@pytest.mark.skipif(not ProcRuntimeMetricCollector.available, reason="procfs not available")
+class TestProcRuntimeMetricCollector(BaseTestCase):
+    def test_metrics(self):
+        collector = ProcRuntimeMetricCollector()
+        metrics = dict(collector.collect(PSUTIL_RUNTIME_METRICS))
+        assert set(metrics) == PSUTIL_RUNTIME_METRICS
+        assert metrics[THREAD_COUNT] >= 1
+        assert metrics[MEM_RSS] > 0
+        assert metrics[FD_COUNT] > 0
+        assert metrics[CPU_PERCENT] == 0.0
+
+        # Busy loop to consume some cpu time
+        sum(range(10 ** 7))
+
+        metrics = dict(collector.collect(PSUTIL_RUNTIME_METRICS))
+        assert metrics[CPU_TIME_USER] > 0
+        assert metrics[CPU_PERCENT] > 0
+
+    def test_fd_count(self):
+        collector = ProcRuntimeMetricCollector()
+        fd_count = dict(collector.collect([FD_COUNT]))[FD_COUNT]
+        r, w = os.pipe()
+        try:
+            assert dict(collector.collect([FD_COUNT]))[FD_COUNT] == fd_count + 2
+        finally:
+            os.close(r)
+            os.close(w)
+
+    def test_same_metrics_as_psutil(self):
+        psutil_collector = PSUtilRuntimeMetricCollector()
+        if not psutil_collector.enabled:
+            pytest.skip("psutil not available")
+        proc = dict(ProcRuntimeMetricCollector().collect(PSUTIL_RUNTIME_METRICS))
+        psutil = dict(psutil_collector.collect(PSUTIL_RUNTIME_METRICS))
+        assert proc[THREAD_COUNT] == psutil[THREAD_COUNT]
+        assert abs(proc[MEM_RSS] - psutil[MEM_RSS]) < 0.1 * psutil[MEM_RSS]
+
+
 class TestGCRuntimeMetricCollector(BaseTestCase):
     def test_metrics(self):
         collector = GCRuntimeMetricCollector()
@@ -58,3 +107,21 @@ class TestGCRuntimeMetricCollector(BaseTestCase):
         assert len(collected_after) == 1
         assert collected_after[0][0] == "runtime.python.gc.count.gen0"
         assert isinstance(collected_after[0][1], int)
+
+    @pytest.mark.skipif(GC_PAUSE_TIME not in GC_RUNTIME_METRICS, reason="GC callbacks not available")
+    def test_pause_time(self):
+        import gc
+
+        collector = GCRuntimeMetricCollector()
+        collector.collect([GC_PAUSE_TIME])
+
+        garbage = [[] for _ in range(100000)]
+        gc.collect()
+        del garbage
+
+        ((_, pause_time),) = collector.collect([GC_PAUSE_TIME])
+        assert pause_time > 0
+
+        # Only the time since the last collection is reported
+        ((_, pause_time_after),) = collector.collect([GC_PAUSE_TIME])
+        assert pause_time_after < pause_time
@@ -66,6 +66,21 @@ class GlobalConfigTestCase(TestCase):
         self.config._add("requests", dict(split_by_domain=False))
         assert self.config.requests["split_by_domain"] is True
 
+    def test_settings_merge_hooks(self):
+        """
+        When calling `config._add()`
+            when hooks and HTTP settings were set before
+                we keep the existing hooks and HTTP settings
+        """
+        hook = mock.Mock()
+        self.config.requests.hooks.on("request", hook)
+        self.config.requests.http.trace_headers(["x-header"])
+        self.config._add("requests", dict(split_by_domain=False))
+
+        self.config.requests.hooks.emit("request", "span")
+        hook.assert_called_once_with("span")
+        assert self.config.requests.http.header_is_traced("x-header")
+
     def test_settings_overwrite(self):
         """
         When calling `config._add(..., merge=False)`
@@ -76,6 +91,21 @@ class GlobalConfigTestCase(TestCase):
         self.config._add("requests", dict(split_by_domain=False), merge=False)
         assert self.config.requests["split_by_domain"] is False
 
+    def test_settings_version(self):
+        """
+        When changing the settings of an integration
+            the version of its configuration is incremented
+        """
+        settings = self.config.requests
+        version = settings._version
+        settings["split_by_domain"] = True
+        settings.service = "requests-service"
+        settings.update(distributed_tracing=False)
+        settings.setdefault("split_by_domain", False)
+        assert settings._version == version + 3
+        del settings["split_by_domain"]
+        assert settings._version == version + 4
+
     def test_settings_merge_deep(self):
         """
         When calling `config._add()`
@@ -53,3 +53,81 @@ class TestPatching(SubprocessTestCase):
     def test_patch_all_env_override_httplib_enabled(self):
         _monkey.patch_all()
         assert "httplib" in _monkey._PATCHED_MODULES
+
+    @run_in_subprocess(env_overrides=dict())
+    def test_patch_all_lazy(self):
+        import sys
+
+        assert "sqlite3" not in sys.modules
+
+        _monkey.patch_all()
+        # The integration is loaded only when its library is imported
+        assert "ddtrace.contrib.sqlite3" not in sys.modules
+        assert "sqlite3" not in sys.modules
+
+        import sqlite3
+
+        assert "sqlite3" in _monkey._PATCHED_MODULES
+        assert hasattr(sqlite3.connect, "__wrapped__")
+
+    @run_in_subprocess(env_overrides=dict())
+    def test_patch_all_lazy_config(self):
+        import sys
+
+        from ddtrace import config
+
+        _monkey.patch_all()
+        assert "sqlite3" not in sys.modules
+
+        # The default settings of the integration are available without importing its library
+        assert config.sqlite["_default_service"] == "sqlite"
+        assert "sqlite3" not in sys.modules
+        assert "ddtrace.contrib.sqlite3" not in sys.modules
+
+        import sqlite3
+
+        assert hasattr(sqlite3.connect, "__wrapped__")
+        assert config.sqlite["_default_service"] == "sqlite"
+
+    @run_in_subprocess()
+    def test_integration_defaults_no_import(self):
+        import sys
+
+        from ddtrace import config
+        from ddtrace.settings._integrations import INTEGRATION_DEFAULTS
+
+        modules = set(sys.modules)
+        for name in INTEGRATION_DEFAULTS:
+            assert getattr(config, name)
+
+        # Neither the integrations nor their libraries are imported
+        assert [m for m in set(sys.modules) - modules if not m.startswith("ddtrace.settings")] == []
+
+    @run_in_subprocess()
+    def test_patch_raise_exception_missing_library(self):
+        _monkey._MODULES_FOR_CONTRIB["sqlite3"] = ("sqlite3_dne",)
+
+        with self.assertRaises(_monkey.IntegrationNotAvailableException) as me:
+            _monkey.patch(sqlite3=True)
+
+        assert "missing required module: sqlite3_dne" in str(me.exception)
+        assert "sqlite3" not in _monkey._PATCHED_MODULES
+
+    @run_in_subprocess(env_overrides=dict())
+    def test_patch_all_lazy_already_imported(self):
+        import sqlite3  # noqa
+
+        _monkey.patch_all()
+        assert "sqlite3" in _monkey._PATCHED_MODULES
+
+    @run_in_subprocess(env_overrides=dict(DD_TRACE_LAZY_PATCHING_ENABLED="false"))
+    def test_patch_all_eager(self):
+        import sys
+
+        assert "sqlite3" not in sys.modules
+
+        _monkey.patch_all()
+        # The integrations and their libraries are imported immediately
+        assert "sqlite3" in _monkey._PATCHED_MODULES
+        assert "ddtrace.contrib.sqlite3" in sys.modules
+        assert "sqlite3" in sys.modules
@@ -32,7 +32,6 @@ if os.getenv("DD_PROFILE_TEST_GEVENT", False):
         def set(self):
             self.state = True
 
-
 else:
     Event = threading.Event
 
@@ -166,3 +165,192 @@ def test_awakeable_periodic_service():
     awake_me.stop()
 
     assert queue == list(range(n + 2))
+
+
+@pytest.fixture
+def scheduler_enabled(monkeypatch):
+    if os.getenv("DD_PROFILE_TEST_GEVENT", False):
+        pytest.skip("The periodic scheduler is not used with gevent")
+    monkeypatch.setattr(periodic, "_scheduler_enabled", True)
+
+
+def test_periodic_scheduler_services(scheduler_enabled):
+    calls = {"a": 0, "b": 0, "shutdown": 0}
+    threads = set()
+
+    class Service(periodic.PeriodicService):
+        def periodic(self):
+            threads.add(threading.current_thread())
+            calls[self.key] += 1
+
+        def on_shutdown(self):
+            calls["shutdown"] += 1
+
+    a, b = Service(0.01), Service(0.02)
+    a.key, b.key = "a", "b"
+    a.start()
+    b.start()
+    assert isinstance(a._worker, periodic.PeriodicTask)
+    assert a._worker.is_alive()
+    sleep(0.2)
+
+    metrics = periodic.get_scheduler_metrics()
+    assert metrics["tests.tracer.test_periodic:Service"]["runs"] > 0
+
+    a.stop()
+    b.stop()
+    a.join()
+    b.join()
+
+    assert not a._worker.is_alive()
+    assert calls["a"] > calls["b"] > 0
+    assert calls["shutdown"] == 2
+    # All the services ran on the same thread, which is ignored by the profiler
+    (thread,) = threads
+    assert thread.name == periodic._scheduler.name
+    assert thread._ddtrace_profiling_ignore
+    assert "tests.tracer.test_periodic:Service" not in periodic.get_scheduler_metrics()
+
+
+def test_periodic_scheduler_awakeable_service(scheduler_enabled):
+    queue = []
+    started = threading.Event()
+
+    class AwakeMe(periodic.AwakeablePeriodicService):
+        def periodic(self):
+            queue.append(len(queue))
+            started.set()
+
+    interval = 1
+
+    awake_me = AwakeMe(interval)
+
+    awake_me.start()
+    # Awakeable services run as soon as they start
+    started.wait()
+
+    # Each awake waits for a new run of the periodic function
+    n = 10
+    for _ in range(10):
+        awake_me.awake()
+    assert queue == list(range(n + 1))
+
+    # Sleep long enough to also trigger the periodic function with the timeout
+    sleep(1.1 * interval)
+
+    awake_me.stop()
+    awake_me.join()
+
+    assert queue == list(range(n + 2))
+
+
+def test_periodic_scheduler_interval(scheduler_enabled):
+    runs = []
+
+    class Service(periodic.PeriodicService):
+        def periodic(self):
+            runs.append(self.interval)
+
+    s = Service(10)
+    s.start()
+    # The new interval is used from the next run
+    s.interval = 0.01
+    s._worker.awake()
+    sleep(0.1)
+    s.stop()
+    s.join()
+
+    assert len(runs) > 2
+
+
+def test_periodic_scheduler_overrun(scheduler_enabled):
+    scheduler = periodic.PeriodicScheduler("test")
+    done = threading.Event()
+
+    def slow():
+        sleep(0.02)
+        done.set()
+
+    task = periodic.PeriodicTask(scheduler, 0.01, slow, name="slow", run_first=True)
+    task.start()
+    with pytest.raises(RuntimeError):
+        task.start()
+    done.wait()
+    task.stop()
+    task.join()
+
+    metrics = scheduler.get_metrics()
+    assert metrics == {}
+    assert task.runs >= 1
+    assert task.overruns == task.runs
+    assert task.busy >= 0.02 * task.runs
+    # The scheduler thread exits when there are no more tasks
+    assert scheduler._thread is None
+
+
+def test_periodic_scheduler_error(scheduler_enabled):
+    scheduler = periodic.PeriodicScheduler("test")
+    x = {}
+
+    def _run_periodic():
+        raise ValueError
+
+    def _on_shutdown():
+        x["DOWN"] = True
+
+    task = periodic.PeriodicTask(scheduler, 0.001, _run_periodic, on_shutdown=_on_shutdown)
+    task.start()
+    task.join()
+    assert not task.is_alive()
+    task.stop()
+    assert "DOWN" not in x
+
+
+def test_periodic_scheduler_stop_from_task(scheduler_enabled):
+    scheduler = periodic.PeriodicScheduler("test")
+    x = {}
+
+    def _run_periodic():
+        task.stop()
+        # Must not wait for itself
+        task.join()
+
+    def _on_shutdown():
+        x["DOWN"] = True
+
+    task = periodic.PeriodicTask(scheduler, 0.001, _run_periodic, on_shutdown=_on_shutdown)
+    task.start()
+    task.join()
+    assert x["DOWN"]
+    assert task.runs == 1
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="fork not available")
+def test_periodic_scheduler_fork(scheduler_enabled):
+    s = periodic.PeriodicService(0.01)
+    s.start()
+
+    pid = os.fork()
+    if pid == 0:
+        try:
+            # The parent tasks are gone in the child
+            assert not s._worker.is_alive()
+            s._worker.stop()
+            s._worker.join()
+
+            child = periodic.PeriodicService(0.01)
+            child.start()
+            assert child._worker.is_alive()
+            child.stop()
+            child.join()
+            assert not child._worker.is_alive()
+        except BaseException:
+            os._exit(1)
+        os._exit(0)
+
+    _, status = os.waitpid(pid, 0)
+    assert os.WEXITSTATUS(status) == 0
+
+    assert s._worker.is_alive()
+    s.stop()
+    s.join()
@@ -3,6 +3,7 @@ from unittest import TestCase
 import pytest
 
 from ddtrace import Pin
+from ddtrace.vendor import wrapt
 
 
 class PinTestCase(TestCase):
@@ -187,3 +188,50 @@ class PinTestCase(TestCase):
 
         assert global_pin._config["distributed_tracing"] is True
         assert pin._config["distributed_tracing"] is False
+
+    def test_pin_config_version(self):
+        # ensure changes of the configuration of a `Pin` can be detected
+        obj = self.Obj()
+        Pin.override(obj, service="metrics")
+        pin = Pin.get_from(obj)
+        version = pin._config._version
+        pin._config["distributed_tracing"] = True
+        assert pin._config._version > version
+
+        # a clone has its own configuration
+        clone = pin.clone()
+        version = pin._config._version
+        clone._config["distributed_tracing"] = False
+        assert pin._config._version == version
+
+    def test_pin_proxy(self):
+        # ensure a Pin attached to a proxy is not looked up on the wrapped object
+        obj = self.Obj()
+        Pin(service="wrapped").onto(obj)
+        proxy = wrapt.ObjectProxy(obj)
+        assert Pin.get_from(proxy) is None
+
+        pin = Pin(service="proxy")
+        pin.onto(proxy)
+        assert Pin.get_from(proxy) is pin
+        assert Pin.get_from(obj).service == "wrapped"
+
+    def test_getddpin(self):
+        # ensure objects can provide their own Pin
+        pin = Pin(service="metrics")
+
+        class Obj(object):
+            def __getddpin__(self):
+                return pin
+
+            def __setddpin__(self, pin):
+                pass
+
+        class Proxy(wrapt.ObjectProxy):
+            def __getddpin__(self):
+                return pin
+
+        assert Pin.get_from(Obj()) is pin
+        assert Pin.get_from(Proxy(self.Obj())) is pin
+        # the class itself does not provide a Pin
+        assert Pin.get_from(Obj) is None
@@ -26,6 +26,7 @@ from ddtrace.propagation.http import _HTTP_HEADER_TAGS
 from ddtrace.propagation.http import _HTTP_HEADER_TRACEPARENT
 from ddtrace.propagation.http import _HTTP_HEADER_TRACESTATE
 from ddtrace.propagation.http import _TraceContext
+from ddtrace.propagation.http import _extract_propagation_headers
 
 from ..utils import override_global_config
 
@@ -380,6 +381,54 @@ def test_get_wsgi_header(tracer):
     assert get_wsgi_header("x-datadog-trace-id") == "HTTP_X_DATADOG_TRACE_ID"
 
 
+def test_extract_propagation_headers():
+    headers = {
+        "Host": "localhost",
+        "X-Datadog-Trace-Id": "1234",
+        "HTTP_X_DATADOG_PARENT_ID": "5678",
+        "http_x_datadog_origin": "synthetics",
+        "TraceParent": b"00-4bf92f3577b34da6a3ce929d0e0e4736-00f067aa0ba902b7-01",
+        "X-Test-Header": "value",
+        "HTTP_X_TEST_HEADER": "value",
+    }
+
+    assert _extract_propagation_headers(headers) == {
+        HTTP_HEADER_TRACE_ID: "1234",
+        HTTP_HEADER_PARENT_ID: "5678",
+        HTTP_HEADER_ORIGIN: "synthetics",
+        _HTTP_HEADER_TRACEPARENT: "00-4bf92f3577b34da6a3ce929d0e0e4736-00f067aa0ba902b7-01",
+    }
+    assert _extract_propagation_headers({"Host": "localhost"}) == {}
+
+
+@pytest.mark.parametrize("x_datadog_tags", ["_dd.p.dm=-4,_dd.p.usr.id=baz64", "_dd.p.dm=-"])
+def test_extract_cached_tags_not_shared(x_datadog_tags):
+    headers = {
+        "x-datadog-trace-id": "1234",
+        "x-datadog-parent-id": "5678",
+        "x-datadog-tags": x_datadog_tags,
+    }
+
+    context = HTTPPropagator.extract(headers)
+    expected = dict(context._meta)
+    context._meta["_dd.p.test"] = "value"
+
+    # The tags decoded for the first context are not shared with the next ones
+    assert HTTPPropagator.extract(headers)._meta == expected
+
+
+def test_extract_cached_tracestate_not_shared():
+    headers = dict(TRACECONTEXT_HEADERS_VALID)
+
+    with override_global_config(dict(_propagation_style_extract=[_PROPAGATION_STYLE_W3C_TRACECONTEXT])):
+        context = HTTPPropagator.extract(headers)
+        expected = dict(context._meta)
+        context._meta["_dd.p.test"] = "value"
+        del context._meta["_dd.p.dm"]
+
+        assert HTTPPropagator.extract(headers)._meta == expected
+
+
 # for testing with other propagation styles
 TRACECONTEXT_HEADERS_VALID_BASIC = {
     _HTTP_HEADER_TRACEPARENT: "00-4bf92f3577b34da6a3ce929d0e0e4736-00f067aa0ba902b7-01",
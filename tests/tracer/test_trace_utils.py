@@ -253,6 +253,47 @@ class TestHeaders(object):
         )
         assert span.get_tag("http.response.headers.content-type") == "some;value"
 
+    def test_integration_header_tags_take_precedence(self, span, config, integration_config):
+        """
+        :type span: Span
+        :type integration_config: IntegrationConfig
+        """
+        config.http._header_tags = {"content-type": "global.content_type", "max-age": ""}
+        integration_config.http._header_tags = {"content-type": "int.content_type"}
+        trace_utils._store_response_headers(
+            {
+                "Content-Type": "some;value;content-type",
+                "Max-Age": "some;value;max_age",
+            },
+            span,
+            integration_config,
+        )
+        assert span.get_tag("int.content_type") == "some;value;content-type"
+        assert span.get_tag("global.content_type") is None
+        assert span.get_tag("http.response.headers.max-age") == "some;value;max_age"
+
+    def test_header_tag_plan_follows_the_configuration(self, config, integration_config):
+        """
+        :type integration_config: IntegrationConfig
+        """
+        assert integration_config._header_tag_plan(trace_utils.REQUEST) == {}
+
+        integration_config.http.trace_headers("Content-Type")
+        assert integration_config._header_tag_plan(trace_utils.REQUEST) == {
+            "content-type": "http.request.headers.content-type"
+        }
+
+        config.trace_headers("Max.Age")
+        assert integration_config._header_tag_plan(trace_utils.RESPONSE) == {
+            "content-type": "http.response.headers.content-type",
+            "max.age": "http.response.headers.max_age",
+        }
+
+        integration_config.http._reset()
+        assert integration_config._header_tag_plan(trace_utils.RESPONSE) == {
+            "max.age": "http.response.headers.max_age",
+        }
+
 
 @pytest.mark.parametrize(
     "pin,config_val,default,global_service,expected",
@@ -11,11 +11,14 @@ from ddtrace.internal.utils import ArgumentError
 from ddtrace.internal.utils import get_argument_value
 from ddtrace.internal.utils import set_argument_value
 from ddtrace.internal.utils import time
+from ddtrace.internal.utils.cache import LRUCache
+from ddtrace.internal.utils.cache import VersionedDict
 from ddtrace.internal.utils.cache import cached
 from ddtrace.internal.utils.cache import cachedmethod
 from ddtrace.internal.utils.cache import callonce
 from ddtrace.internal.utils.formats import asbool
 from ddtrace.internal.utils.formats import parse_tags_str
+from ddtrace.internal.utils.formats import stringify_cache_args
 from ddtrace.internal.utils.http import w3c_get_dd_list_member
 from ddtrace.internal.utils.importlib import func_name
 
@@ -325,6 +328,48 @@ def test_cachedmethod():
     cached_test_recipe(expensive, Foo().cheap, witness, cache_size)
 
 
+def test_lru_cache():
+    witness = mock.Mock(side_effect=lambda key: key * 2)
+    cache = LRUCache(2)
+
+    assert cache.get(1, witness) == 2
+    assert cache.get(2, witness) == 4
+    assert cache.get(1, witness) == 2
+    assert witness.call_count == 2
+
+    # 2 is the least recently used key, so it is evicted
+    assert cache.get(3, witness) == 6
+    assert list(cache) == [1, 3]
+    assert cache.get(1, witness) == 2
+    assert witness.call_count == 3
+
+    assert cache.get(2, witness) == 4
+    assert witness.call_count == 4
+    assert list(cache) == [1, 2]
+
+
+def test_versioned_dict():
+    d = VersionedDict(a=1)
+    assert d == {"a": 1}
+    assert d._version == 0
+
+    d["b"] = 2
+    del d["a"]
+    d.update(c=3)
+    assert d._version == 3
+
+    d.setdefault("b", 4)
+    assert d._version == 3
+    d.setdefault("d", 4)
+    assert d._version == 4
+
+    d.pop("d")
+    d.popitem()
+    d.clear()
+    assert d._version == 7
+    assert d == {}
+
+
 i = 0
 
 
@@ -498,3 +543,21 @@ def test_callonce_signature():
 def test_w3c_get_dd_list_member(context, expected_strs):
     for tag in expected_strs:
         assert tag in w3c_get_dd_list_member(context)
+
+
+@pytest.mark.parametrize(
+    "args,expected",
+    [
+        ([], ""),
+        (["GET", "key"], "GET key"),
+        ([b"SET", b"key", 42], "SET key 42"),
+        ([b"SET", b"key", b"\xff" * 10], "SET key " + "\\xff" * 10),
+        (["SET", "key", "v" * 101], "SET key " + "v" * 100 + "..."),
+        ([b"SET", b"key", b"v" * 10000], "SET key " + "v" * 100 + "..."),
+        ([b"SET", b"key", b"\xff" * 10000], "SET key " + ("\\xff" * 25) + "..."),
+        ([b"SET", b"key", u"é".encode("utf-8") * 10000], "SET key " + u"é" * 100 + "..."),
+        (["MGET"] + ["k" * 100] * 20, "MGET " + " ".join(["k" * 100] * 9) + " " + "k" * 96 + "..."),
+    ],
+)
+def test_stringify_cache_args(args, expected):
+    assert stringify_cache_args(args) == expected
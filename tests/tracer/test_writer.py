@@ -354,10 +354,24 @@ class _ResetAPIEndpointRequestHandlerTest(_BaseHTTPRequestHandler):
         return
 
 
+class _KeepAliveAPIEndpointRequestHandlerTest(_BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    clients = set()
+
+    def do_PUT(self):
+        self.clients.add(self.client_address)
+        self.rfile.read(int(self.headers["Content-Length"]))
+        self.send_response(200)
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"OK")
+
+
 _HOST = "0.0.0.0"
 _PORT = 8743
 _TIMEOUT_PORT = _PORT + 1
 _RESET_PORT = _TIMEOUT_PORT + 1
+_KEEP_ALIVE_PORT = _RESET_PORT + 1
 
 
 class UDSHTTPServer(socketserver.UnixStreamServer, BaseHTTPServer.HTTPServer):
@@ -430,6 +444,25 @@ def endpoint_test_reset_server():
         thread.join()
 
 
+class _ThreadingHTTPServer(socketserver.ThreadingMixIn, BaseHTTPServer.HTTPServer):
+    daemon_threads = True
+
+
+@pytest.fixture
+def endpoint_keep_alive_server():
+    _KeepAliveAPIEndpointRequestHandlerTest.clients = set()
+    server = _ThreadingHTTPServer((_HOST, _KEEP_ALIVE_PORT), _KeepAliveAPIEndpointRequestHandlerTest)
+    thread = threading.Thread(target=server.serve_forever)
+    thread.daemon = True
+    thread.start()
+    try:
+        yield thread
+    finally:
+        server.shutdown()
+        server.server_close()
+        thread.join()
+
+
 @pytest.fixture
 def endpoint_assert_path():
     handler = _APIEndpointRequestHandlerTest
@@ -655,22 +688,24 @@ def test_writer_reuse_connections_envvar(monkeypatch):
     assert writer._reuse_connections
 
 
-def test_writer_reuse_connections():
-    # Ensure connection is not reused
-    writer = AgentWriter(agent_url="http://localhost:9126", reuse_connections=True)
-    # Do an initial flush to get a connection
-    writer.flush_queue()
-    assert writer._conn is None
-    writer.flush_queue()
-    assert writer._conn is None
+def test_writer_reuse_connections(endpoint_keep_alive_server):
+    # Ensure connection is reused
+    writer = AgentWriter(agent_url="http://%s:%s" % (_HOST, _KEEP_ALIVE_PORT), reuse_connections=True)
+    try:
+        for _ in range(2):
+            writer._encoder.put([Span("foobar")])
+            writer.flush_queue(raise_exc=True)
+        assert len(_KeepAliveAPIEndpointRequestHandlerTest.clients) == 1
+        assert len(writer._transport._pool) == 1
+    finally:
+        writer._transport.close()
 
 
-def test_writer_reuse_connections_false():
-    # Ensure connection is reused
-    writer = AgentWriter(agent_url="http://localhost:9126", reuse_connections=False)
-    # Do an initial flush to get a connection
-    writer.flush_queue()
-    conn = writer._conn
-    # And another to potentially have it reset
-    writer.flush_queue()
-    assert writer._conn is conn
+def test_writer_reuse_connections_false(endpoint_keep_alive_server):
+    # Ensure connection is not reused
+    writer = AgentWriter(agent_url="http://%s:%s" % (_HOST, _KEEP_ALIVE_PORT), reuse_connections=False)
+    for _ in range(2):
+        writer._encoder.put([Span("foobar")])
+        writer.flush_queue(raise_exc=True)
+    assert len(_KeepAliveAPIEndpointRequestHandlerTest.clients) == 2
+    assert len(writer._transport._pool) == 0